@@ -0,0 +1,146 @@
+"""Baseline storage and regression detection.
+
+A baseline is a JSON file of per-case times and peak memory,
+keyed by history spec and case name. Timings are only comparable on the
+same machine, so baselines record the platform they were taken on.
+"""
+
+import json
+import platform
+import sys
+from dataclasses import dataclass
+from datetime import datetime
+from pathlib import Path
+from typing import Dict, List, Optional
+
+from measure import Measurement
+
+
+# Baseline file format version
+BASELINE_VERSION = 1
+
+# Default allowed slowdown/growth before a case counts as a regression
+DEFAULT_TIME_TOLERANCE = 0.25
+DEFAULT_MEMORY_TOLERANCE = 0.10
+
+# Times below this are too noisy to compare reliably
+MIN_COMPARABLE_MS = 1.0
+
+
+@dataclass
+class Regression:
+    """A case that got slower or bigger than its baseline allows."""
+
+    key: str
+    """Measurement key (history/case)."""
+
+    metric: str
+    """'time' or 'memory'."""
+
+    baseline: float
+    """Baseline value (ms or KB)."""
+
+    current: float
+    """Current value (ms or KB)."""
+
+    @property
+    def change(self) -> float:
+        """Relative change, e.g. 0.4 for 40% worse."""
+        if self.baseline == 0:
+            return 0.0
+        return self.current / self.baseline - 1.0
+
+
+def save_baseline(path: str, measurements: List[Measurement]) -> None:
+    """Write measurements as a baseline file.
+
+    Existing entries for other keys are kept, so baselines for different
+    history sizes can be accumulated across runs.
+
+    Args:
+        path: Baseline file path.
+        measurements: Successful measurements to store.
+    """
+    existing = load_baseline(path) or {}
+    for m in measurements:
+        if m.error:
+            continue
+        existing[m.key] = {
+            "min_ms": m.min_ms,
+            "median_ms": m.median_ms,
+            "peak_memory_kb": m.peak_memory_kb,
+        }
+
+    data = {
+        "version": BASELINE_VERSION,
+        "created_at": datetime.now().isoformat(),
+        "platform": platform.platform(),
+        "python": sys.version.split()[0],
+        "results": existing,
+    }
+
+    Path(path).parent.mkdir(parents=True, exist_ok=True)
+    with open(path, 'w', encoding='utf-8') as f:
+        json.dump(data, f, indent=2, sort_keys=True)
+
+
+def load_baseline(path: str) -> Optional[Dict[str, Dict[str, float]]]:
+    """Load baseline results keyed by measurement key.
+
+    Returns:
+        Results dict, or None if the file does not exist.
+
+    Raises:
+        ValueError: If the file has an unsupported format version.
+    """
+    if not Path(path).exists():
+        return None
+
+    with open(path, 'r', encoding='utf-8') as f:
+        data = json.load(f)
+
+    if data.get("version") != BASELINE_VERSION:
+        raise ValueError(f"Unsupported baseline version: {data.get('version')}")
+
+    return data.get("results", {})
+
+
+def find_regressions(
+    measurements: List[Measurement],
+    baseline: Dict[str, Dict[str, float]],
+    time_tolerance: float = DEFAULT_TIME_TOLERANCE,
+    memory_tolerance: float = DEFAULT_MEMORY_TOLERANCE
+) -> List[Regression]:
+    """Compare measurements to a baseline.
+
+    Times are compared by their minimum over repetitions, which is the
+    least noisy estimate of a case's cost (as with timeit). Cases missing
+    from the baseline are ignored. Memory is only compared when both runs
+    measured it.
+
+    Args:
+        measurements: Current measurements.
+        baseline: Results from load_baseline().
+        time_tolerance: Allowed relative slowdown of the minimum time.
+        memory_tolerance: Allowed relative growth of peak memory.
+
+    Returns:
+        List of regressions, empty if none.
+    """
+    regressions: List[Regression] = []
+
+    for m in measurements:
+        base = baseline.get(m.key)
+        if base is None or m.error:
+            continue
+
+        base_ms = base.get("min_ms", 0.0)
+        if base_ms >= MIN_COMPARABLE_MS and m.min_ms > base_ms * (1 + time_tolerance):
+            regressions.append(Regression(m.key, "time", base_ms, m.min_ms))
+
+        base_kb = base.get("peak_memory_kb", 0.0)
+        if base_kb > 0 and m.peak_memory_kb > 0 and \
+                m.peak_memory_kb > base_kb * (1 + memory_tolerance):
+            regressions.append(Regression(m.key, "memory", base_kb, m.peak_memory_kb))
+
+    return regressions
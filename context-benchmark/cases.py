@@ -0,0 +1,241 @@
+"""Benchmark cases for context-management primitives.
+
+Each case has a setup step (untimed) that prepares inputs from a history
+and returns the zero-argument callable that is measured.
+"""
+
+import json
+import tempfile
+from dataclasses import dataclass
+from datetime import datetime
+from pathlib import Path
+from typing import Any, Callable, Dict, List, Optional
+
+from shared import json_codec
+from shared.plugins.gc import (
+    GCConfig,
+    GCTriggerReason,
+    create_summary_message,
+    estimate_history_tokens,
+    flatten_turns,
+    load_gc_plugin,
+    split_into_turns,
+)
+from shared.plugins.model_provider.types import Message
+from shared.plugins.session import binary
+from shared.plugins.session.base import SessionState
+from shared.plugins.session.serializer import (
+    deserialize_history,
+    deserialize_session_state,
+    serialize_history,
+    serialize_session_state,
+)
+
+
+# Fixed summary returned by the stub summarizer, so plugin runs measure
+# the plugin's own work rather than an LLM
+STUB_SUMMARY = "Earlier turns discussed modules, tickets and screenshots."
+
+# GC plugins benchmarked by default
+DEFAULT_GC_PLUGINS = ["gc_truncate", "gc_summarize", "gc_hybrid"]
+
+
+@dataclass
+class BenchmarkCase:
+    """A primitive to measure."""
+
+    name: str
+    """Case identifier, e.g. 'split_into_turns' or 'collect:gc_truncate'."""
+
+    setup: Callable[[List[Message]], Callable[[], Any]]
+    """Prepares inputs from a history and returns the measured callable."""
+
+
+def _setup_split(history: List[Message]) -> Callable[[], Any]:
+    return lambda: split_into_turns(history)
+
+
+def _setup_estimate(history: List[Message]) -> Callable[[], Any]:
+    return lambda: estimate_history_tokens(history)
+
+
+def _setup_flatten(history: List[Message]) -> Callable[[], Any]:
+    turns = split_into_turns(history)
+    return lambda: flatten_turns(turns)
+
+
+def _setup_summary_path(history: List[Message]) -> Callable[[], Any]:
+    """Split, summarize all but the last turn, rebuild the history."""
+    def run() -> List[Message]:
+        turns = split_into_turns(history)
+        old_tokens = estimate_history_tokens(flatten_turns(turns[:-1]))
+        summary = create_summary_message(f"{STUB_SUMMARY} ({old_tokens} tokens)")
+        return [summary] + flatten_turns(turns[-1:])
+    return run
+
+
+def _make_state(history: List[Message]) -> SessionState:
+    now = datetime.now()
+    return SessionState(
+        session_id="20250101_000000",
+        history=history,
+        created_at=now,
+        updated_at=now,
+        turn_count=len(split_into_turns(history)),
+    )
+
+
+def _setup_session_save(history: List[Message]) -> Callable[[], Any]:
+    """Serialize a session the way FileSessionPlugin.save() does."""
+    state = _make_state(history)
+    return lambda: json_codec.dumps_document(serialize_session_state(state))
+
+
+def _setup_session_load(history: List[Message]) -> Callable[[], Any]:
+    """Parse and deserialize a saved session."""
+    data = json_codec.dumps_document(serialize_session_state(_make_state(history)))
+    return lambda: deserialize_session_state(json_codec.loads(data))
+
+
+def _setup_session_save_stdlib(history: List[Message]) -> Callable[[], Any]:
+    """Serialize a session with the stdlib json module (indented, as
+    snapshots were written before json_codec)."""
+    state = _make_state(history)
+    return lambda: json.dumps(
+        serialize_session_state(state), indent=2, ensure_ascii=False
+    ).encode('utf-8')
+
+
+def _setup_session_load_stdlib(history: List[Message]) -> Callable[[], Any]:
+    """Parse a saved session with the stdlib json module and deserialize it."""
+    data = json.dumps(serialize_session_state(_make_state(history)), indent=2, ensure_ascii=False)
+    return lambda: deserialize_session_state(json.loads(data))
+
+
+def _setup_session_save_binary(history: List[Message]) -> Callable[[], Any]:
+    """Serialize a session as a binary snapshot (blob store in a temp dir).
+
+    Blobs are written by the first run; later runs only hash them.
+    """
+    state = _make_state(history)
+    storage = tempfile.TemporaryDirectory()
+    blobs = binary.BlobStore(Path(storage.name))
+
+    def run() -> Any:
+        storage  # Keep the directory alive as long as the case
+        return binary.encode_snapshot(serialize_session_state(state, raw_bytes=True), blobs)
+    return run
+
+
+def _setup_session_load_binary(history: List[Message]) -> Callable[[], Any]:
+    """Read and deserialize a binary snapshot."""
+    storage = tempfile.TemporaryDirectory()
+    blobs = binary.BlobStore(Path(storage.name))
+    path = Path(storage.name) / "session.json"
+    data = serialize_session_state(_make_state(history), raw_bytes=True)
+    path.write_bytes(binary.encode_snapshot(data, blobs)[0])
+
+    def run() -> Any:
+        storage  # Keep the directory alive as long as the case
+        return deserialize_session_state(binary.read_snapshot(path, blobs)[0])
+    return run
+
+
+def _setup_build_history(history: List[Message]) -> Callable[[], Any]:
+    """Rebuild the history's objects from their serialized form.
+
+    Payload strings are shared with the serialized input, so the peak
+    memory is mostly per-object overhead.
+    """
+    data = serialize_history(history)
+    return lambda: deserialize_history(data)
+
+
+def _setup_to_sdk(history: List[Message]) -> Callable[[], Any]:
+    from shared.plugins.model_provider.google_genai.converters import history_to_sdk
+    return lambda: history_to_sdk(history)
+
+
+def _setup_from_sdk(history: List[Message]) -> Callable[[], Any]:
+    from shared.plugins.model_provider.google_genai.converters import (
+        history_from_sdk,
+        history_to_sdk,
+    )
+    sdk_history = history_to_sdk(history)
+    return lambda: history_from_sdk(sdk_history)
+
+
+def _make_collect_setup(plugin_name: str) -> Callable[[List[Message]], Callable[[], Any]]:
+    """Build a setup function running a GC plugin's collect()."""
+    def setup(history: List[Message]) -> Callable[[], Any]:
+        plugin = load_gc_plugin(plugin_name, {
+            "preserve_recent_turns": 5,
+            "summarizer": lambda text: STUB_SUMMARY,
+        })
+        gc_config = GCConfig(preserve_recent_turns=5, auto_trigger=False)
+        total = estimate_history_tokens(history)
+        context_usage = {
+            "model": "benchmark",
+            "context_limit": total,
+            "total_tokens": total,
+            "prompt_tokens": total,
+            "output_tokens": 0,
+            "turns": len(split_into_turns(history)),
+            "percent_used": 100.0,
+            "tokens_remaining": 0,
+        }
+        return lambda: plugin.collect(
+            history, context_usage, gc_config, GCTriggerReason.MANUAL
+        )
+    return setup
+
+
+PRIMITIVE_CASES: List[BenchmarkCase] = [
+    BenchmarkCase("split_into_turns", _setup_split),
+    BenchmarkCase("estimate_history_tokens", _setup_estimate),
+    BenchmarkCase("flatten_turns", _setup_flatten),
+    BenchmarkCase("summary_path", _setup_summary_path),
+    BenchmarkCase("session_save", _setup_session_save),
+    BenchmarkCase("session_load", _setup_session_load),
+    BenchmarkCase("session_save_stdlib", _setup_session_save_stdlib),
+    BenchmarkCase("session_load_stdlib", _setup_session_load_stdlib),
+    BenchmarkCase("session_save_binary", _setup_session_save_binary),
+    BenchmarkCase("session_load_binary", _setup_session_load_binary),
+    BenchmarkCase("build_history", _setup_build_history),
+    BenchmarkCase("history_to_sdk", _setup_to_sdk),
+    BenchmarkCase("history_from_sdk", _setup_from_sdk),
+]
+
+
+def get_cases(
+    names: Optional[List[str]] = None,
+    gc_plugins: Optional[List[str]] = None
+) -> List[BenchmarkCase]:
+    """Get the cases to run.
+
+    Args:
+        names: Primitive case names to include (None = all).
+        gc_plugins: GC plugins whose collect() to include (None = defaults).
+
+    Returns:
+        List of BenchmarkCase, primitives first.
+
+    Raises:
+        ValueError: If a case name is unknown.
+    """
+    by_name: Dict[str, BenchmarkCase] = {c.name: c for c in PRIMITIVE_CASES}
+
+    if names is None:
+        cases = list(PRIMITIVE_CASES)
+    else:
+        unknown = [n for n in names if n not in by_name]
+        if unknown:
+            raise ValueError(
+                f"Unknown case(s): {', '.join(unknown)}. Available: {', '.join(by_name)}"
+            )
+        cases = [by_name[n] for n in names]
+
+    for plugin_name in (DEFAULT_GC_PLUGINS if gc_plugins is None else gc_plugins):
+        cases.append(BenchmarkCase(f"collect:{plugin_name}", _make_collect_setup(plugin_name)))
+
+    return cases
@@ -0,0 +1,157 @@
+"""Synthetic conversation histories for micro-benchmarks.
+
+Histories are generated deterministically (seeded) in three shapes:
+
+- text: user/model text exchanges
+- tool: each turn runs a tool call round with a large JSON result
+- image: each turn carries an inline image (binary payload)
+
+Sizes are controlled by turn count and payload bytes per turn, so e.g.
+10,000 turns x 10 KB gives a ~100 MB history.
+"""
+
+import random
+from dataclasses import dataclass
+from typing import Callable, Dict, List
+
+from shared.plugins.model_provider.types import (
+    FunctionCall,
+    Message,
+    Part,
+    Role,
+    ToolResult,
+)
+
+
+# Supported history shapes
+SHAPES = ("text", "tool", "image")
+
+_WORDS = (
+    "context", "session", "deploy", "cluster", "budget", "review", "plugin",
+    "migration", "database", "latency", "request", "schema", "release",
+    "customer", "invoice", "pipeline", "summary", "decision", "project",
+    "timeline", "approval", "config", "runtime", "memory", "channel",
+    "permission", "history", "token", "model", "result", "error", "value",
+)
+
+# Pre-generated paragraphs reused across turns (generating 100 MB of fresh
+# random text would dominate setup time)
+_PARAGRAPH_POOL_SIZE = 64
+
+
+@dataclass
+class HistorySpec:
+    """Parameters of a synthetic history."""
+
+    shape: str
+    """History shape: 'text', 'tool' or 'image'."""
+
+    turns: int
+    """Number of user-initiated turns."""
+
+    payload_bytes: int
+    """Approximate payload size per turn in bytes."""
+
+    seed: int = 0
+    """Random seed; same spec always yields the same history."""
+
+    @property
+    def key(self) -> str:
+        """Stable identifier used in reports and baselines."""
+        return f"{self.shape}/{self.turns}x{self.payload_bytes}"
+
+
+class _TextSource:
+    """Deterministic text of a requested length."""
+
+    def __init__(self, rng: random.Random):
+        self._rng = rng
+        self._pool = [
+            " ".join(rng.choice(_WORDS) for _ in range(200)) + "."
+            for _ in range(_PARAGRAPH_POOL_SIZE)
+        ]
+
+    def text(self, size: int, prefix: str = "") -> str:
+        """Build text of about size characters starting with prefix."""
+        chunks = [prefix]
+        length = len(prefix)
+        while length < size:
+            paragraph = self._rng.choice(self._pool)
+            chunks.append(paragraph)
+            length += len(paragraph) + 1
+        return " ".join(chunks)[:max(size, len(prefix))]
+
+
+def _text_turn(i: int, spec: HistorySpec, source: _TextSource) -> List[Message]:
+    half = spec.payload_bytes // 2
+    return [
+        Message(role=Role.USER, parts=[
+            Part(text=source.text(half, f"Turn {i}: ticket T-{i} notes."))
+        ]),
+        Message(role=Role.MODEL, parts=[
+            Part(text=source.text(half, f"Reply {i}."))
+        ]),
+    ]
+
+
+def _tool_turn(i: int, spec: HistorySpec, source: _TextSource) -> List[Message]:
+    call_id = f"call_{i}"
+    result = {
+        "path": f"src/module_{i}.py",
+        "lines": i % 500,
+        "content": source.text(spec.payload_bytes, f"# module {i}"),
+    }
+    return [
+        Message(role=Role.USER, parts=[Part(text=f"Read module {i} and summarize it.")]),
+        Message(role=Role.MODEL, parts=[Part(function_call=FunctionCall(
+            id=call_id, name="readFile", args={"path": f"src/module_{i}.py"}
+        ))]),
+        Message(role=Role.USER, parts=[Part(function_response=ToolResult(
+            call_id=call_id, name="readFile", result=result, is_error=(i % 17 == 0)
+        ))]),
+        Message(role=Role.MODEL, parts=[Part(text=f"Module {i} defines helpers.")]),
+    ]
+
+
+def _image_turn(i: int, spec: HistorySpec, source: _TextSource) -> List[Message]:
+    rng = source._rng
+    data = b"\x89PNG\r\n\x1a\n" + rng.randbytes(max(0, spec.payload_bytes - 8))
+    return [
+        Message(role=Role.USER, parts=[
+            Part(text=f"Describe screenshot {i}."),
+            Part(inline_data={"mime_type": "image/png", "data": data}),
+        ]),
+        Message(role=Role.MODEL, parts=[Part(text=f"Screenshot {i} shows a form.")]),
+    ]
+
+
+_TURN_BUILDERS: Dict[str, Callable[[int, HistorySpec, _TextSource], List[Message]]] = {
+    "text": _text_turn,
+    "tool": _tool_turn,
+    "image": _image_turn,
+}
+
+
+def generate_history(spec: HistorySpec) -> List[Message]:
+    """Generate a synthetic history.
+
+    Args:
+        spec: Shape and size of the history.
+
+    Returns:
+        List of Message objects with spec.turns user-initiated turns.
+
+    Raises:
+        ValueError: If the shape is unknown.
+    """
+    builder = _TURN_BUILDERS.get(spec.shape)
+    if builder is None:
+        raise ValueError(f"Unknown history shape: {spec.shape}. Available: {', '.join(SHAPES)}")
+
+    rng = random.Random(spec.seed)
+    source = _TextSource(rng)
+
+    history: List[Message] = []
+    for i in range(spec.turns):
+        history.extend(builder(i, spec, source))
+    return history
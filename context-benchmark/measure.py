@@ -0,0 +1,93 @@
+"""Timing and memory measurement for benchmark cases."""
+
+import gc
+import statistics
+import time
+import tracemalloc
+from dataclasses import dataclass, field
+from typing import Any, Callable, List
+
+
+@dataclass
+class Measurement:
+    """Timing and memory results for one case on one history."""
+
+    case: str
+    """Case name."""
+
+    history: str
+    """History spec key (shape/turnsxbytes)."""
+
+    times_ms: List[float] = field(default_factory=list)
+    """Wall time of each timed repetition in milliseconds."""
+
+    peak_memory_kb: float = 0.0
+    """Peak memory allocated during one run (tracemalloc), in KB."""
+
+    error: str = ""
+    """Error message if the case failed."""
+
+    @property
+    def key(self) -> str:
+        """Identifier used in baselines."""
+        return f"{self.history}/{self.case}"
+
+    @property
+    def median_ms(self) -> float:
+        return statistics.median(self.times_ms) if self.times_ms else 0.0
+
+    @property
+    def min_ms(self) -> float:
+        return min(self.times_ms) if self.times_ms else 0.0
+
+
+def measure(
+    case: str,
+    history: str,
+    fn: Callable[[], Any],
+    repeat: int = 5,
+    measure_memory: bool = True
+) -> Measurement:
+    """Time a callable and measure its peak memory.
+
+    Timed repetitions run without tracemalloc (it slows allocation-heavy
+    code several times over); memory is measured in one extra run.
+    The garbage collector is disabled during timed runs so collection
+    pauses from earlier allocations do not land in a later sample.
+
+    Args:
+        case: Case name.
+        history: History spec key.
+        fn: Zero-argument callable to measure.
+        repeat: Number of timed repetitions.
+        measure_memory: Whether to run the extra tracemalloc pass.
+
+    Returns:
+        Measurement with the results, or with error set if fn raised.
+    """
+    result = Measurement(case=case, history=history)
+
+    try:
+        for _ in range(max(1, repeat)):
+            gc.collect()
+            gc.disable()
+            try:
+                start = time.perf_counter()
+                fn()
+                result.times_ms.append((time.perf_counter() - start) * 1000)
+            finally:
+                gc.enable()
+
+        if measure_memory:
+            gc.collect()
+            tracemalloc.start()
+            try:
+                fn()
+                _, peak = tracemalloc.get_traced_memory()
+            finally:
+                tracemalloc.stop()
+            result.peak_memory_kb = peak / 1024
+    except Exception as e:
+        result.error = f"{type(e).__name__}: {e}"
+
+    return result
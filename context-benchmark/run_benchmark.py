@@ -0,0 +1,218 @@
+#!/usr/bin/env python3
+"""CLI entry point for context-management micro-benchmarks.
+
+Usage:
+    .venv/bin/python context-benchmark/run_benchmark.py --quick
+    .venv/bin/python context-benchmark/run_benchmark.py --save-baseline baseline.json
+    .venv/bin/python context-benchmark/run_benchmark.py --baseline baseline.json
+"""
+
+import argparse
+import json
+import os
+import sys
+from typing import List
+
+# Add project root to path for imports
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from baseline import (
+    DEFAULT_MEMORY_TOLERANCE,
+    DEFAULT_TIME_TOLERANCE,
+    find_regressions,
+    load_baseline,
+    save_baseline,
+)
+from cases import DEFAULT_GC_PLUGINS, get_cases
+from generators import SHAPES, HistorySpec, generate_history
+from measure import Measurement, measure
+
+
+def _split(value: str) -> List[str]:
+    return [v.strip() for v in value.split(",") if v.strip()]
+
+
+def _print_table(measurements: List[Measurement]) -> None:
+    """Print measurements grouped by history."""
+    print("-" * 80)
+    print(f"{'History':<22} {'Case':<26} {'Median (ms)':>12} {'Min (ms)':>9} {'Peak (KB)':>9}")
+    print("-" * 80)
+    for m in measurements:
+        if m.error:
+            print(f"{m.history:<22} {m.case:<26} ERROR: {m.error}")
+        else:
+            print(f"{m.history:<22} {m.case:<26} {m.median_ms:>12.1f} "
+                  f"{m.min_ms:>9.1f} {m.peak_memory_kb:>9.0f}")
+    print()
+
+
+def main() -> int:
+    """Run the micro-benchmarks."""
+    parser = argparse.ArgumentParser(
+        description="Benchmark context-management primitives on large synthetic histories"
+    )
+
+    parser.add_argument(
+        "--shapes",
+        default=",".join(SHAPES),
+        help=f"Comma-separated history shapes (default: {','.join(SHAPES)})"
+    )
+    parser.add_argument(
+        "--turns",
+        default="10000",
+        help="Comma-separated turn counts (default: 10000)"
+    )
+    parser.add_argument(
+        "--payload-bytes",
+        type=int,
+        default=10240,
+        help="Payload bytes per turn (default: 10240, ~100 MB at 10k turns)"
+    )
+    parser.add_argument(
+        "--quick",
+        action="store_true",
+        help="Small histories (1000 turns x 1 KB) for a fast smoke run"
+    )
+    parser.add_argument(
+        "--cases",
+        default="all",
+        help="Comma-separated primitive cases, or 'all' (default: all)"
+    )
+    parser.add_argument(
+        "--gc-plugins",
+        default=",".join(DEFAULT_GC_PLUGINS),
+        help="Comma-separated GC plugins whose collect() to measure, or 'none'"
+    )
+    parser.add_argument(
+        "--repeat",
+        type=int,
+        default=5,
+        help="Timed repetitions per case (default: 5)"
+    )
+    parser.add_argument(
+        "--no-memory",
+        action="store_true",
+        help="Skip peak memory measurement"
+    )
+    parser.add_argument(
+        "--baseline",
+        default=None,
+        help="Baseline file to compare against; exits 1 on regression"
+    )
+    parser.add_argument(
+        "--save-baseline",
+        default=None,
+        help="Write (merge) results into this baseline file"
+    )
+    parser.add_argument(
+        "--time-tolerance",
+        type=float,
+        default=DEFAULT_TIME_TOLERANCE,
+        help=f"Allowed slowdown of the fastest run vs baseline (default: {DEFAULT_TIME_TOLERANCE})"
+    )
+    parser.add_argument(
+        "--memory-tolerance",
+        type=float,
+        default=DEFAULT_MEMORY_TOLERANCE,
+        help=f"Allowed peak memory growth vs baseline (default: {DEFAULT_MEMORY_TOLERANCE})"
+    )
+    parser.add_argument(
+        "--output",
+        default=None,
+        help="Path for JSON results (default: none)"
+    )
+
+    args = parser.parse_args()
+
+    if args.quick:
+        turn_counts = [1000]
+        payload_bytes = 1024
+    else:
+        turn_counts = [int(t) for t in _split(args.turns)]
+        payload_bytes = args.payload_bytes
+
+    case_names = None if args.cases == "all" else _split(args.cases)
+    gc_plugins = [] if args.gc_plugins == "none" else _split(args.gc_plugins)
+
+    try:
+        cases = get_cases(case_names, gc_plugins)
+        specs = [
+            HistorySpec(shape=shape, turns=turns, payload_bytes=payload_bytes)
+            for shape in _split(args.shapes)
+            for turns in turn_counts
+        ]
+        baseline = load_baseline(args.baseline) if args.baseline else None
+    except ValueError as e:
+        print(f"Error: {e}")
+        return 1
+
+    measurements: List[Measurement] = []
+
+    for spec in specs:
+        try:
+            history = generate_history(spec)
+        except ValueError as e:
+            print(f"Error: {e}")
+            return 1
+
+        print(f"History {spec.key}: {len(history)} messages")
+
+        for case in cases:
+            try:
+                fn = case.setup(history)
+            except Exception as e:
+                m = Measurement(case=case.name, history=spec.key,
+                                error=f"setup: {type(e).__name__}: {e}")
+            else:
+                m = measure(case.name, spec.key, fn, repeat=args.repeat,
+                            measure_memory=not args.no_memory)
+            measurements.append(m)
+
+        # Release the history before generating the next one
+        del history
+
+    print()
+    _print_table(measurements)
+
+    if args.output:
+        with open(args.output, 'w', encoding='utf-8') as f:
+            json.dump([
+                {
+                    "history": m.history,
+                    "case": m.case,
+                    "times_ms": m.times_ms,
+                    "min_ms": m.min_ms,
+                    "median_ms": m.median_ms,
+                    "peak_memory_kb": m.peak_memory_kb,
+                    "error": m.error or None,
+                }
+                for m in measurements
+            ], f, indent=2)
+        print(f"Results written to: {args.output}")
+
+    if args.save_baseline:
+        save_baseline(args.save_baseline, measurements)
+        print(f"Baseline written to: {args.save_baseline}")
+
+    failed = any(m.error for m in measurements)
+
+    if baseline is not None:
+        regressions = find_regressions(
+            measurements, baseline,
+            time_tolerance=args.time_tolerance,
+            memory_tolerance=args.memory_tolerance
+        )
+        if regressions:
+            print("Regressions:")
+            for r in regressions:
+                unit = "ms" if r.metric == "time" else "KB"
+                print(f"  {r.key} {r.metric}: {r.baseline:.1f}{unit} -> "
+                      f"{r.current:.1f}{unit} (+{r.change:.0%})")
+            return 1
+        print("No regressions against baseline")
+
+    return 1 if failed else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -20,6 +20,11 @@ class BenchmarkConfig:
     gc_threshold_percent: float = 80.0
     preserve_recent_turns: int = 5
 
+    # Eviction policies to run each plugin with ('recent', 'value').
+    # Running both shows the retention gain of value-aware planning at
+    # the same token footprint.
+    eviction_policies: List[str] = field(default_factory=lambda: ["recent"])
+
     # Plugin-specific configuration overrides
     plugin_configs: Dict[str, Dict[str, Any]] = field(default_factory=dict)
 
@@ -28,6 +33,9 @@ class BenchmarkConfig:
     location: str = ""
     model_name: str = "gemini-2.5-flash"
 
+    # Summary memoization (persistent across runs when a path is set)
+    summary_cache_path: Optional[str] = None
+
     # Quality testing
     enable_fact_retention: bool = True
     fact_question_count: int = 10
@@ -39,15 +47,47 @@ class BenchmarkConfig:
     # Runtime options
     verbose: bool = False
 
+    # Run without network access using deterministic stub LLM calls
+    offline: bool = False
+
+    # Number of scenario x plugin runs executed concurrently
+    workers: int = 1
+
+    # Maximum LLM calls per minute across all workers (None = unlimited)
+    rate_limit_per_minute: Optional[float] = None
+
+    # Measure peak memory of collect(). None = only when workers == 1:
+    # profiled collects are serialized across workers, and tracemalloc is
+    # process-wide, so in parallel runs the peak also counts other
+    # threads' allocations
+    profile_memory: Optional[bool] = None
+
+    @property
+    def measures_memory(self) -> bool:
+        """Whether collect() peak memory is measured in this run."""
+        if self.profile_memory is None:
+            return self.workers <= 1
+        return self.profile_memory
+
     def validate(self) -> None:
         """Validate configuration."""
-        if not self.project_id:
-            raise ValueError("project_id is required")
-        if not self.location:
-            raise ValueError("location is required")
+        if not self.offline:
+            if not self.project_id:
+                raise ValueError("project_id is required")
+            if not self.location:
+                raise ValueError("location is required")
         if not self.plugins:
             raise ValueError("At least one plugin must be specified")
         if self.gc_threshold_percent <= 0 or self.gc_threshold_percent > 100:
             raise ValueError("gc_threshold_percent must be between 0 and 100")
+        if not self.eviction_policies:
+            raise ValueError("At least one eviction policy must be specified")
+        for policy in self.eviction_policies:
+            if policy not in ("recent", "value"):
+                raise ValueError(f"Unknown eviction policy: {policy}")
         if self.preserve_recent_turns < 0:
             raise ValueError("preserve_recent_turns must be non-negative")
+        if self.workers < 1:
+            raise ValueError("workers must be at least 1")
+        if self.rate_limit_per_minute is not None and self.rate_limit_per_minute <= 0:
+            raise ValueError("rate_limit_per_minute must be positive")
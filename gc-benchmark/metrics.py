@@ -101,6 +101,12 @@ class PluginRunMetrics:
     gc_duration_ms: float
     """GC operation duration in milliseconds."""
 
+    collect_cpu_ms: float = 0.0
+    """CPU time of collect() on the collecting thread (excludes waiting on a remote summarizer)."""
+
+    collect_peak_memory_kb: float = 0.0
+    """Peak memory allocated during collect(), 0 if not profiled."""
+
     # Quality (optional)
     quality_metrics: Optional[QualityMetrics] = None
     """Quality metrics if fact retention testing was enabled."""
@@ -208,6 +214,12 @@ class PluginSummary:
     avg_gc_duration_ms: float
     """Average GC duration in milliseconds."""
 
+    avg_collect_cpu_ms: float = 0.0
+    """Average collect() CPU time in milliseconds (successful runs)."""
+
+    avg_collect_peak_memory_kb: float = 0.0
+    """Average collect() peak memory in KB (successful runs)."""
+
     # Per-scenario breakdown
     scenario_results: Dict[str, PluginRunMetrics] = field(default_factory=dict)
     """Individual scenario results."""
@@ -250,6 +262,12 @@ class BenchmarkSummary:
     quality_testing_enabled: bool
     """Whether fact retention testing was performed."""
 
+    offline: bool = False
+    """Whether stub LLM calls were used instead of a real model."""
+
+    workers: int = 1
+    """Number of concurrent benchmark workers."""
+
     def get_winner(self) -> str:
         """Get the top-ranked plugin."""
         if not self.overall_ranking:
@@ -296,6 +314,12 @@ def calculate_plugin_summary(
     durations = [r.gc_duration_ms for r in results]
     avg_duration = sum(durations) / len(durations) if durations else 0.0
 
+    cpu_times = [r.collect_cpu_ms for r in successful]
+    avg_cpu = sum(cpu_times) / len(cpu_times) if cpu_times else 0.0
+
+    peaks = [r.collect_peak_memory_kb for r in successful]
+    avg_peak = sum(peaks) / len(peaks) if peaks else 0.0
+
     scenario_results = {r.scenario_name: r for r in results}
 
     return PluginSummary(
@@ -308,6 +332,8 @@ def calculate_plugin_summary(
         retention_by_scenario=retention_by_scenario,
         success_rate=success_rate,
         avg_gc_duration_ms=avg_duration,
+        avg_collect_cpu_ms=avg_cpu,
+        avg_collect_peak_memory_kb=avg_peak,
         scenario_results=scenario_results
     )
 
@@ -0,0 +1,117 @@
+"""Deterministic stand-ins for LLM calls, for offline benchmark runs.
+
+The stub summarizer and answerer let the full scenario x plugin matrix run
+without network access or Vertex credentials, with reproducible results.
+Retention numbers from an offline run measure what information survives
+in the post-GC context (extractively), not how well a real model recalls
+it, so they are useful for comparing plugins and for regression checks
+rather than as absolute quality figures.
+"""
+
+import re
+from typing import List, Set
+
+from shared.plugins.model_provider.types import Message
+
+
+# Words ignored when matching questions to context sentences
+_STOP_WORDS = frozenset({
+    "what", "which", "when", "where", "who", "whom", "whose", "why", "how",
+    "the", "and", "for", "are", "was", "were", "our", "your", "this", "that",
+    "with", "from", "have", "has", "had", "does", "did", "will", "would",
+    "about", "based", "conversation", "above", "please", "answer", "question",
+    "briefly", "directly", "just", "relevant", "fact", "explanation", "needed",
+})
+
+_SENTENCE_SPLIT = re.compile(r"(?<=[.!?])\s+|\n+")
+_WORD = re.compile(r"[a-z0-9$]+")
+
+# Marker placed before the question by QualityTester._ask_fact_question
+_QUESTION_MARKER = "briefly and directly:"
+
+
+def _content_words(text: str) -> Set[str]:
+    """Lowercased words of a text that carry meaning for matching."""
+    return {
+        w for w in _WORD.findall(text.lower())
+        if len(w) > 2 and w not in _STOP_WORDS
+    }
+
+
+def _history_sentences(history: List[Message]) -> List[str]:
+    """All text sentences in a history, in order."""
+    sentences: List[str] = []
+    for message in history:
+        for part in message.parts or []:
+            if part.text:
+                sentences.extend(
+                    s.strip() for s in _SENTENCE_SPLIT.split(part.text) if s.strip()
+                )
+    return sentences
+
+
+class StubSummarizer:
+    """Extractive summarizer: keeps the first sentence of each user line.
+
+    Deterministic and instantaneous. User messages in the benchmark
+    scenarios carry most facts, so this behaves like a lossy summary
+    that keeps some facts and drops others.
+    """
+
+    def __init__(self, max_chars: int = 2000, sentences_per_line: int = 1):
+        """Initialize the stub summarizer.
+
+        Args:
+            max_chars: Maximum summary length in characters.
+            sentences_per_line: Sentences kept from each user line.
+        """
+        self._max_chars = max_chars
+        self._sentences_per_line = sentences_per_line
+
+    def __call__(self, conversation: str) -> str:
+        """Summarize formatted conversation text ("ROLE: text" lines)."""
+        kept: List[str] = []
+        length = 0
+
+        for line in conversation.splitlines():
+            role, _, text = line.partition(": ")
+            if role != "USER" or not text or text.startswith("["):
+                continue
+
+            sentences = [s for s in _SENTENCE_SPLIT.split(text) if s.strip()]
+            snippet = " ".join(sentences[:self._sentences_per_line]).strip()
+            if length + len(snippet) > self._max_chars:
+                break
+
+            kept.append(snippet)
+            length += len(snippet) + 1
+
+        return " ".join(kept)
+
+
+class StubAnswerer:
+    """Answers fact questions by retrieving the best matching sentence.
+
+    Implements the QualityTester generate function signature
+    (history, prompt) -> str. The answer is the context sentence with the
+    highest content-word overlap with the question, preferring later
+    sentences on ties; with no overlap it answers "unknown".
+    """
+
+    def __call__(self, history: List[Message], prompt: str) -> str:
+        """Answer the question embedded in a QualityTester prompt."""
+        question = prompt
+        if _QUESTION_MARKER in prompt:
+            question = prompt.split(_QUESTION_MARKER, 1)[1].split("\n\n")[1]
+
+        question_words = _content_words(question)
+        best_sentence = ""
+        best_score = 0
+
+        for sentence in _history_sentences(history):
+            score = len(question_words & _content_words(sentence))
+            if score >= best_score and score > 0:
+                best_sentence = sentence
+                best_score = score
+
+        return best_sentence or "unknown"
@@ -0,0 +1,114 @@
+"""Concurrency helpers for the benchmark runner.
+
+- RateLimiter: thread-safe token bucket shared by all LLM calls
+- profile_collect: measures a plugin's own collect() CPU time and peak
+  memory
+"""
+
+import threading
+import time
+import tracemalloc
+from typing import Any, Callable, Optional, Tuple
+
+
+class RateLimiter:
+    """Token bucket limiting calls per minute across threads."""
+
+    def __init__(self, calls_per_minute: Optional[float] = None):
+        """Initialize the limiter.
+
+        Args:
+            calls_per_minute: Maximum sustained call rate. None or <= 0
+                disables limiting.
+        """
+        self._rate = (calls_per_minute / 60.0) if calls_per_minute and calls_per_minute > 0 else None
+        # Allow short bursts of up to one second worth of calls (min 1)
+        self._capacity = max(1.0, self._rate) if self._rate else 0.0
+        self._tokens = self._capacity
+        self._last = time.monotonic()
+        self._lock = threading.Lock()
+
+    def acquire(self) -> None:
+        """Block until a call is allowed."""
+        if self._rate is None:
+            return
+
+        while True:
+            with self._lock:
+                now = time.monotonic()
+                self._tokens = min(
+                    self._capacity,
+                    self._tokens + (now - self._last) * self._rate
+                )
+                self._last = now
+
+                if self._tokens >= 1.0:
+                    self._tokens -= 1.0
+                    return
+
+                wait = (1.0 - self._tokens) / self._rate
+
+            time.sleep(wait)
+
+    def wrap(self, fn: Callable[..., Any]) -> Callable[..., Any]:
+        """Return fn rate limited by this limiter."""
+        def limited(*args, **kwargs):
+            self.acquire()
+            return fn(*args, **kwargs)
+        return limited
+
+
+# tracemalloc is process-wide, so memory-profiled sections must not overlap
+_PROFILE_LOCK = threading.Lock()
+
+
+def profile_collect(
+    fn: Callable[[], Any],
+    measure_memory: bool = True
+) -> Tuple[Any, float, float, float]:
+    """Run a collect() call and measure its cost.
+
+    CPU time is the calling thread's CPU time, so it excludes time spent
+    waiting on a (possibly remote) summarizer and is not inflated by other
+    worker threads. Peak memory is measured with tracemalloc; since that
+    is process-wide, profiled sections are serialized, which also
+    serializes any remote summarizer call made inside them, and the peak
+    includes allocations of other threads (e.g. fact retention) running
+    meanwhile. Only measure memory in single-worker runs for reliable
+    numbers.
+
+    Args:
+        fn: Zero-argument callable performing the collection.
+        measure_memory: Whether to measure peak memory.
+
+    Returns:
+        Tuple of (fn result, wall_ms, cpu_ms, peak_memory_kb). peak_memory_kb
+        is 0.0 when memory is not measured.
+    """
+    if not measure_memory:
+        wall_start = time.perf_counter()
+        cpu_start = time.thread_time()
+        result = fn()
+        cpu_ms = (time.thread_time() - cpu_start) * 1000
+        wall_ms = (time.perf_counter() - wall_start) * 1000
+        return result, wall_ms, cpu_ms, 0.0
+
+    with _PROFILE_LOCK:
+        started_tracing = not tracemalloc.is_tracing()
+        if started_tracing:
+            tracemalloc.start()
+        tracemalloc.reset_peak()
+        baseline, _ = tracemalloc.get_traced_memory()
+
+        wall_start = time.perf_counter()
+        cpu_start = time.thread_time()
+        try:
+            result = fn()
+        finally:
+            cpu_ms = (time.thread_time() - cpu_start) * 1000
+            wall_ms = (time.perf_counter() - wall_start) * 1000
+            _, peak = tracemalloc.get_traced_memory()
+            if started_tracing:
+                tracemalloc.stop()
+
+    return result, wall_ms, cpu_ms, max(0, peak - baseline) / 1024
@@ -41,6 +41,8 @@ class ConsoleReporter:
         print(f"  Duration: {summary.total_duration_s:.1f}s")
         print(f"  LLM Calls: {summary.total_llm_calls}")
         print(f"  Quality Testing: {'Enabled' if summary.quality_testing_enabled else 'Disabled'}")
+        print(f"  Mode: {'Offline (stub LLM)' if summary.offline else 'Live'}, "
+              f"{summary.workers} worker(s)")
         print()
 
     def _print_scenario_table(self, summary: BenchmarkSummary) -> None:
@@ -94,6 +96,13 @@ class ConsoleReporter:
                       f"{ps.avg_gc_duration_ms:>14.1f}")
         print()
 
+        print(f"{'Plugin':<20} {'Avg CPU (ms)':>14} {'Avg Peak Mem (KB)':>18}")
+        print("-" * 80)
+        for name, ps in sorted(summary.plugin_summaries.items()):
+            print(f"{name:<20} {ps.avg_collect_cpu_ms:>14.1f} "
+                  f"{ps.avg_collect_peak_memory_kb:>18.1f}")
+        print()
+
     def _print_quality_breakdown(self, summary: BenchmarkSummary) -> None:
         """Print quality metrics breakdown."""
         print("-" * 80)
@@ -193,7 +202,9 @@ class JsonReporter:
                 "preserve_recent_turns": summary.preserve_recent_turns,
                 "total_duration_s": summary.total_duration_s,
                 "total_llm_calls": summary.total_llm_calls,
-                "quality_testing_enabled": summary.quality_testing_enabled
+                "quality_testing_enabled": summary.quality_testing_enabled,
+                "offline": summary.offline,
+                "workers": summary.workers
             },
             "scenarios": self._serialize_scenarios(summary),
             "plugin_summaries": self._serialize_plugin_summaries(summary),
@@ -223,6 +234,8 @@ class JsonReporter:
                     "compression_ratio": metrics.compression_ratio,
                     "items_collected": metrics.items_collected,
                     "gc_duration_ms": metrics.gc_duration_ms,
+                    "collect_cpu_ms": metrics.collect_cpu_ms,
+                    "collect_peak_memory_kb": metrics.collect_peak_memory_kb,
                     "error": metrics.error
                 }
 
@@ -250,7 +263,9 @@ class JsonReporter:
                 "avg_retention_rate": ps.avg_retention_rate,
                 "retention_by_scenario": ps.retention_by_scenario,
                 "success_rate": ps.success_rate,
-                "avg_gc_duration_ms": ps.avg_gc_duration_ms
+                "avg_gc_duration_ms": ps.avg_gc_duration_ms,
+                "avg_collect_cpu_ms": ps.avg_collect_cpu_ms,
+                "avg_collect_peak_memory_kb": ps.avg_collect_peak_memory_kb
             }
             for name, ps in summary.plugin_summaries.items()
         }
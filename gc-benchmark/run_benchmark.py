@@ -4,6 +4,7 @@
 Usage:
     .venv/bin/python gc-benchmark/run_benchmark.py --env-file .env
     .venv/bin/python gc-benchmark/run_benchmark.py --no-quality --plugins gc_truncate
+    .venv/bin/python gc-benchmark/run_benchmark.py --offline --workers 4
 """
 
 import argparse
@@ -52,6 +53,51 @@ def main() -> int:
         default=5,
         help="Number of recent turns to preserve (default: 5)"
     )
+    parser.add_argument(
+        "--eviction-policy",
+        choices=["recent", "value", "both"],
+        default="recent",
+        help="Turn eviction policy: recent, value, or both to compare (default: recent)"
+    )
+    parser.add_argument(
+        "--summary-cache",
+        default=None,
+        help="Path to a persistent summary cache reused across runs (default: none)"
+    )
+    parser.add_argument(
+        "--offline",
+        action="store_true",
+        help="Use deterministic stub LLM calls; no network or credentials needed"
+    )
+    parser.add_argument(
+        "--workers",
+        type=int,
+        default=1,
+        help="Number of scenario/plugin runs executed concurrently (default: 1)"
+    )
+    parser.add_argument(
+        "--rate-limit",
+        type=float,
+        default=None,
+        help="Maximum LLM calls per minute across all workers (default: unlimited)"
+    )
+    memory_profile = parser.add_mutually_exclusive_group()
+    memory_profile.add_argument(
+        "--memory-profile",
+        dest="memory_profile",
+        action="store_const",
+        const=True,
+        help="Measure peak memory of collect() even with --workers > 1 "
+             "(serializes collects; peaks include other workers' allocations)"
+    )
+    memory_profile.add_argument(
+        "--no-memory-profile",
+        dest="memory_profile",
+        action="store_const",
+        const=False,
+        help="Skip peak memory measurement of collect() "
+             "(default: measured only with --workers 1)"
+    )
     parser.add_argument(
         "--env-file",
         default=".env",
@@ -78,19 +124,20 @@ def main() -> int:
     # Load environment
     if os.path.exists(args.env_file):
         load_dotenv(args.env_file)
-    else:
+    elif not args.offline:
         print(f"Warning: Environment file '{args.env_file}' not found")
 
-    # Check required environment variables
-    project_id = os.environ.get("PROJECT_ID")
-    location = os.environ.get("LOCATION")
+    # Check required environment variables (not needed offline)
+    project_id = os.environ.get("PROJECT_ID", "")
+    location = os.environ.get("LOCATION", "")
 
-    if not project_id:
-        print("Error: PROJECT_ID environment variable is required")
-        return 1
-    if not location:
-        print("Error: LOCATION environment variable is required")
-        return 1
+    if not args.offline:
+        if not project_id:
+            print("Error: PROJECT_ID environment variable is required")
+            return 1
+        if not location:
+            print("Error: LOCATION environment variable is required")
+            return 1
 
     # Parse plugins and scenarios
     if args.plugins == "all":
@@ -103,6 +150,11 @@ def main() -> int:
     else:
         scenarios = [s.strip() for s in args.scenarios.split(",")]
 
+    if args.eviction_policy == "both":
+        eviction_policies = ["recent", "value"]
+    else:
+        eviction_policies = [args.eviction_policy]
+
     # Determine output formats
     output_formats = ["console"]
     if not args.console_only:
@@ -114,13 +166,19 @@ def main() -> int:
         scenarios=scenarios,
         gc_threshold_percent=args.threshold,
         preserve_recent_turns=args.preserve_turns,
+        eviction_policies=eviction_policies,
+        summary_cache_path=args.summary_cache,
         project_id=project_id,
         location=location,
         model_name=os.environ.get("MODEL_NAME", "gemini-2.5-flash"),
         enable_fact_retention=not args.no_quality,
         output_formats=output_formats,
         output_path=args.output,
-        verbose=args.verbose
+        verbose=args.verbose,
+        offline=args.offline,
+        workers=args.workers,
+        rate_limit_per_minute=args.rate_limit,
+        profile_memory=args.memory_profile
     )
 
     # Run benchmark
@@ -2,17 +2,25 @@
 
 import sys
 import os
+import threading
 import time
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
-from typing import Any, Callable, Dict, List, Optional
+from typing import Any, Callable, Dict, List, Optional, Tuple
 
 # Add parent directory to path for shared imports
 sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 
-from google.genai import types
-
 from shared.jaato_client import JaatoClient
-from shared.plugins.gc import GCConfig, GCPlugin, GCTriggerReason, load_gc_plugin
+from shared.plugins.model_provider.google_genai.converters import history_from_sdk
+from shared.plugins.model_provider.types import Message
+from shared.plugins.gc import (
+    GCConfig,
+    GCPlugin,
+    GCTriggerReason,
+    SummaryCache,
+    load_gc_plugin,
+)
 
 from config import BenchmarkConfig
 from metrics import (
@@ -23,13 +31,21 @@ from metrics import (
     calculate_overall_ranking,
     calculate_plugin_summary,
 )
+from offline import StubAnswerer, StubSummarizer
+from parallel import RateLimiter, profile_collect
 from quality import QualityTester
 from reporters import ConsoleReporter, JsonReporter, Reporter
 from scenarios import BenchmarkScenario, ScenarioFactory
 
 
 class BenchmarkRunner:
-    """Main orchestrator for GC plugin benchmarks."""
+    """Main orchestrator for GC plugin benchmarks.
+
+    Scenario x plugin runs are executed on a thread pool (config.workers).
+    In live mode each worker thread gets its own JaatoClient, and all LLM
+    calls share one rate limiter. In offline mode the summarizer and the
+    fact-retention answerer are deterministic stubs (see offline.py).
+    """
 
     def __init__(self, config: BenchmarkConfig):
         """Initialize benchmark runner.
@@ -42,25 +58,40 @@ class BenchmarkRunner:
         self._quality_tester: Optional[QualityTester] = None
         self._reporters: List[Reporter] = []
         self._llm_call_count = 0
+        self._summary_cache: Optional[SummaryCache] = None
+
+        # Per-thread clients for parallel live runs
+        self._local = threading.local()
+        self._clients: List[JaatoClient] = []
+        self._lock = threading.Lock()
+        self._rate_limiter = RateLimiter(config.rate_limit_per_minute)
 
     def initialize(self) -> None:
         """Initialize LLM client and reporters."""
         self._config.validate()
 
-        # Connect to Vertex AI
-        if self._config.verbose:
-            print(f"Connecting to {self._config.model_name}...")
+        if self._config.offline:
+            if self._config.verbose:
+                print("Offline mode: using stub summarizer and answerer")
+        else:
+            # Connect to Vertex AI (also verifies credentials up front)
+            if self._config.verbose:
+                print(f"Connecting to {self._config.model_name}...")
 
-        self._client = JaatoClient()
-        self._client.connect(
-            self._config.project_id,
-            self._config.location,
-            self._config.model_name
-        )
+            self._client = self._get_client()
+
+        # Reuse summaries of identical turns across plugins and runs
+        if self._config.summary_cache_path:
+            self._summary_cache = SummaryCache(self._config.summary_cache_path)
 
         # Create quality tester with a generate function
         if self._config.enable_fact_retention:
-            self._quality_tester = QualityTester(self._generate_with_history)
+            if self._config.offline:
+                self._quality_tester = QualityTester(StubAnswerer())
+            else:
+                self._quality_tester = QualityTester(
+                    self._rate_limiter.wrap(self._generate_with_history)
+                )
 
         # Create reporters
         for fmt in self._config.output_formats:
@@ -84,27 +115,33 @@ class BenchmarkRunner:
         plugins = self._load_plugins()
 
         if self._config.verbose:
-            print(f"Running {len(scenarios)} scenarios with {len(plugins)} plugins")
-
+            print(f"Running {len(scenarios)} scenarios with {len(plugins)} plugins "
+                  f"on {self._config.workers} worker(s)")
+
+        tasks: List[Tuple[BenchmarkScenario, str, GCPlugin]] = [
+            (scenario, plugin_name, plugin)
+            for scenario in scenarios
+            for plugin_name, plugin in plugins.items()
+        ]
+
+        if self._config.workers > 1:
+            with ThreadPoolExecutor(
+                max_workers=self._config.workers,
+                thread_name_prefix="gc-benchmark"
+            ) as pool:
+                run_metrics = list(pool.map(lambda task: self._run_task(*task), tasks))
+        else:
+            run_metrics = [self._run_task(*task) for task in tasks]
+
+        # Assemble in scenario/plugin order regardless of completion order
         results: Dict[str, ScenarioComparison] = {}
-
-        for scenario in scenarios:
-            if self._config.verbose:
-                print(f"\nScenario: {scenario.name}")
-
-            scenario_results: Dict[str, PluginRunMetrics] = {}
-
-            for plugin_name, plugin in plugins.items():
-                if self._config.verbose:
-                    print(f"  Plugin: {plugin_name}")
-
-                metrics = self._run_single(plugin, scenario)
-                scenario_results[plugin_name] = metrics
-
-            results[scenario.name] = ScenarioComparison(
-                scenario_name=scenario.name,
-                plugin_results=scenario_results
-            )
+        for (scenario, plugin_name, _), metrics in zip(tasks, run_metrics):
+            if scenario.name not in results:
+                results[scenario.name] = ScenarioComparison(
+                    scenario_name=scenario.name,
+                    plugin_results={}
+                )
+            results[scenario.name].plugin_results[plugin_name] = metrics
 
         # Calculate summaries
         plugin_summaries = self._calculate_summaries(results, plugins.keys())
@@ -122,7 +159,9 @@ class BenchmarkRunner:
             total_duration_s=total_duration,
             total_llm_calls=self._llm_call_count,
             timestamp=datetime.now().isoformat(),
-            quality_testing_enabled=self._config.enable_fact_retention
+            quality_testing_enabled=self._config.enable_fact_retention,
+            offline=self._config.offline,
+            workers=self._config.workers
         )
 
         # Report results
@@ -131,14 +170,42 @@ class BenchmarkRunner:
 
         return summary
 
+    def _run_task(
+        self,
+        scenario: BenchmarkScenario,
+        plugin_name: str,
+        plugin: GCPlugin
+    ) -> PluginRunMetrics:
+        """Run one scenario/plugin pair, never raising."""
+        if self._config.verbose:
+            print(f"  Running {plugin_name} on {scenario.name}")
+
+        try:
+            return self._run_single(plugin_name, plugin, scenario)
+        except Exception as e:
+            return PluginRunMetrics(
+                plugin_name=plugin_name,
+                scenario_name=scenario.name,
+                success=False,
+                tokens_before=0,
+                tokens_after=0,
+                tokens_freed=0,
+                items_collected=0,
+                trigger_reason=GCTriggerReason.MANUAL.value,
+                gc_duration_ms=0.0,
+                error=str(e)
+            )
+
     def _run_single(
         self,
+        plugin_name: str,
         plugin: GCPlugin,
         scenario: BenchmarkScenario
     ) -> PluginRunMetrics:
         """Run a single plugin on a single scenario.
 
         Args:
+            plugin_name: Label for this plugin run (includes eviction policy).
             plugin: The GC plugin to test.
             scenario: The scenario to run.
 
@@ -155,21 +222,23 @@ class BenchmarkRunner:
         # Build context usage dict (simulated)
         context_usage = self._make_context_usage(scenario)
 
-        # Time the GC operation
+        # Time and profile the GC operation
         start_time = time.perf_counter()
         try:
-            new_history, result = plugin.collect(
-                scenario.history,
-                context_usage,
-                gc_config,
-                GCTriggerReason.MANUAL
+            (new_history, result), gc_duration, cpu_ms, peak_kb = profile_collect(
+                lambda: plugin.collect(
+                    scenario.history,
+                    context_usage,
+                    gc_config,
+                    GCTriggerReason.MANUAL
+                ),
+                measure_memory=self._config.measures_memory
             )
-            gc_duration = (time.perf_counter() - start_time) * 1000
             error = result.error
         except Exception as e:
             gc_duration = (time.perf_counter() - start_time) * 1000
             return PluginRunMetrics(
-                plugin_name=plugin.name,
+                plugin_name=plugin_name,
                 scenario_name=scenario.name,
                 success=False,
                 tokens_before=0,
@@ -201,7 +270,7 @@ class BenchmarkRunner:
                 print(f"    Retention rate: {quality_metrics.retention_rate:.0%}")
 
         return PluginRunMetrics(
-            plugin_name=plugin.name,
+            plugin_name=plugin_name,
             scenario_name=scenario.name,
             success=result.success,
             tokens_before=result.tokens_before,
@@ -210,47 +279,76 @@ class BenchmarkRunner:
             items_collected=result.items_collected,
             trigger_reason=result.trigger_reason.value,
             gc_duration_ms=gc_duration,
+            collect_cpu_ms=cpu_ms,
+            collect_peak_memory_kb=peak_kb,
             quality_metrics=quality_metrics,
             details=result.details,
             error=error
         )
 
     def _load_scenarios(self) -> List[BenchmarkScenario]:
-        """Load benchmark scenarios based on config."""
+        """Load benchmark scenarios based on config.
+
+        Scenario histories are built as SDK Content objects; they are
+        converted to provider-agnostic Messages, which is what GC plugins
+        and JaatoClient operate on.
+        """
         if "all" in self._config.scenarios:
-            return ScenarioFactory.get_all_scenarios()
+            scenarios = ScenarioFactory.get_all_scenarios()
+        else:
+            scenarios = [
+                ScenarioFactory.get_scenario(name)
+                for name in self._config.scenarios
+            ]
 
-        scenarios = []
-        for name in self._config.scenarios:
-            scenarios.append(ScenarioFactory.get_scenario(name))
+        for scenario in scenarios:
+            if scenario.history and not isinstance(scenario.history[0], Message):
+                scenario.history = history_from_sdk(scenario.history)
         return scenarios
 
     def _load_plugins(self) -> Dict[str, GCPlugin]:
-        """Load and configure GC plugins."""
+        """Load and configure GC plugins.
+
+        Each plugin is loaded once per configured eviction policy. Runs
+        with a non-default policy are labelled 'name[policy]' so results
+        for the same plugin can be compared side by side.
+        """
         plugins: Dict[str, GCPlugin] = {}
 
         for name in self._config.plugins:
-            if self._config.verbose:
-                print(f"Loading plugin: {name}")
+            for policy in self._config.eviction_policies:
+                label = name if policy == "recent" else f"{name}[{policy}]"
+
+                if self._config.verbose:
+                    print(f"Loading plugin: {label}")
 
-            plugin = load_gc_plugin(name)
+                plugin = load_gc_plugin(name)
 
-            # Get plugin-specific config
-            plugin_config = self._config.plugin_configs.get(name, {})
+                # Get plugin-specific config
+                plugin_config = dict(self._config.plugin_configs.get(name, {}))
+                plugin_config.setdefault("eviction_policy", policy)
 
-            # For summarize/hybrid, inject real summarizer
-            if name in ("gc_summarize", "gc_hybrid"):
-                plugin_config["summarizer"] = self._create_summarizer()
+                # For summarize/hybrid, inject real (or stub) summarizer
+                if name in ("gc_summarize", "gc_hybrid"):
+                    if self._config.offline:
+                        plugin_config["summarizer"] = StubSummarizer()
+                    else:
+                        plugin_config["summarizer"] = self._rate_limiter.wrap(
+                            self._create_summarizer()
+                        )
+                    if self._summary_cache is not None:
+                        plugin_config["summary_cache"] = self._summary_cache
+                        plugin_config["summarizer_model"] = self._config.model_name
 
-            plugin.initialize(plugin_config)
-            plugins[name] = plugin
+                plugin.initialize(plugin_config)
+                plugins[label] = plugin
 
         return plugins
 
     def _create_summarizer(self) -> Callable[[str], str]:
         """Create a summarizer function using the LLM."""
         def summarize(text: str) -> str:
-            self._llm_call_count += 1
+            self._count_llm_call()
 
             prompt = (
                 "Summarize the following conversation concisely. "
@@ -259,16 +357,17 @@ class BenchmarkRunner:
                 "Summary:"
             )
 
-            # Use a fresh client for summarization to avoid state issues
-            response = self._client.send_message(prompt, on_output=lambda s, t, m: None)
-            self._client.reset_session()
+            # Reset the worker's client around the call to avoid state issues
+            client = self._get_client()
+            response = client.send_message(prompt, on_output=lambda s, t, m: None)
+            client.reset_session()
             return response
 
         return summarize
 
     def _generate_with_history(
         self,
-        history: List[types.Content],
+        history: List[Message],
         prompt: str
     ) -> str:
         """Generate a response using history as context.
@@ -280,19 +379,44 @@ class BenchmarkRunner:
         Returns:
             Model response string.
         """
-        self._llm_call_count += 1
+        self._count_llm_call()
+        client = self._get_client()
 
         # Reset session and inject history
-        self._client.reset_session(history)
+        client.reset_session(history)
 
         # Send the prompt
-        response = self._client.send_message(prompt, on_output=lambda s, t, m: None)
+        response = client.send_message(prompt, on_output=lambda s, t, m: None)
 
         # Reset again to clean state
-        self._client.reset_session()
+        client.reset_session()
 
         return response
 
+    def _get_client(self) -> JaatoClient:
+        """Get the calling thread's connected client, creating it if needed.
+
+        JaatoClient sessions are stateful (reset/inject history per call),
+        so each worker thread uses its own client.
+        """
+        client = getattr(self._local, "client", None)
+        if client is None:
+            client = JaatoClient()
+            client.connect(
+                self._config.project_id,
+                self._config.location,
+                self._config.model_name
+            )
+            self._local.client = client
+            with self._lock:
+                self._clients.append(client)
+        return client
+
+    def _count_llm_call(self) -> None:
+        """Count an LLM call (thread-safe)."""
+        with self._lock:
+            self._llm_call_count += 1
+
     def _make_context_usage(self, scenario: BenchmarkScenario) -> Dict[str, Any]:
         """Create a context usage dict for a scenario.
 
@@ -340,5 +464,7 @@ class BenchmarkRunner:
 
     def shutdown(self) -> None:
         """Clean up resources."""
-        if self._client:
-            self._client.disconnect()
+        for client in self._clients:
+            client.disconnect()
+        self._clients = []
+        self._client = None
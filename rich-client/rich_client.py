@@ -490,7 +490,10 @@ class RichClient:
         try:
             session_config = load_session_config()
             session_plugin = create_session_plugin()
-            session_plugin.initialize({'storage_path': session_config.storage_path})
+            session_plugin.initialize({
+                **session_config.plugin_config,
+                'storage_path': session_config.storage_path,
+            })
             self._jaato.set_session_plugin(session_plugin, session_config)
 
             if self.registry:
@@ -962,11 +965,13 @@ class RichClient:
 
         # For main agent, also get turn boundaries
         turn_boundaries = []
+        paged_turns = 0
         if selected_agent.agent_id == "main" and self._jaato:
             turn_boundaries = self._jaato.get_turn_boundaries()
+            paged_turns = self._jaato.get_paged_turn_count()
 
         count = len(history)
-        total_turns = len(turn_accounting) if turn_accounting else len(turn_boundaries)
+        total_turns = len(turn_accounting) if turn_accounting else paged_turns + len(turn_boundaries)
 
         lines = [
             ("=" * 60, ""),
@@ -983,7 +988,7 @@ class RichClient:
             self._display.show_lines(lines)
             return
 
-        current_turn = 0
+        current_turn = paged_turns
         turn_index = 0
 
         for i, content in enumerate(history):
@@ -1175,7 +1180,7 @@ class RichClient:
         try:
             from session_exporter import SessionExporter
             exporter = SessionExporter()
-            history = self._jaato.get_history()
+            history = self._jaato.get_full_history()
             result = exporter.export_to_yaml(history, self._original_inputs, filename)
 
             if result.get('success'):
@@ -7,11 +7,12 @@ execution with support for:
 - Output callbacks for real-time feedback
 """
 
+import contextvars
 import json
 import os
 import subprocess
 from concurrent.futures import ThreadPoolExecutor, TimeoutError as FuturesTimeoutError
-from typing import Any, Callable, Dict, Optional, Tuple, TYPE_CHECKING
+from typing import Any, Callable, Dict, List, Optional, Tuple, TYPE_CHECKING
 
 from shared.token_accounting import TokenLedger
 from shared.plugins.base import OutputCallback
@@ -44,6 +45,9 @@ class ToolExecutor:
         self._map: Dict[str, Callable[[Dict[str, Any]], Any]] = {}
         self._permission_plugin: Optional['PermissionPlugin'] = None
         self._permission_context: Dict[str, Any] = {}
+        # Permission decisions made for the current round by preauthorize():
+        # (name, args, (allowed, perm_info))
+        self._preauthorized: List[Tuple[str, Dict[str, Any], Tuple[bool, Dict[str, Any]]]] = []
         self._ledger: Optional[TokenLedger] = ledger
 
         # Registry reference for plugin lookups (set via set_registry)
@@ -77,6 +81,47 @@ class ToolExecutor:
         """
         self._permission_plugin = plugin
         self._permission_context = context or {}
+        self._preauthorized = []
+
+    def preauthorize(self, calls: List[Tuple[str, Dict[str, Any]]]) -> None:
+        """Check the permissions of a round of tool calls together.
+
+        For the function calls of one model response: the permission
+        plugin asks its channel once for every call that needs approval
+        (PermissionPlugin.check_permissions), and the execute() calls for
+        these same args objects use the decisions instead of asking in
+        turn. Calls not covered are checked by execute() as usual.
+
+        Args:
+            calls: (name, args) of each function call of the round.
+        """
+        self._preauthorized = []
+        plugin = self._permission_plugin
+        if plugin is None or not hasattr(plugin, 'check_permissions'):
+            return
+        # askPermission itself is always allowed
+        checked = [(name, args) for name, args in calls if name != 'askPermission']
+        if len(checked) < 2:
+            return
+        try:
+            results = plugin.check_permissions(checked, self._permission_context)
+            self._preauthorized = [
+                (name, args, (allowed, perm_info))
+                for (name, args), (allowed, perm_info) in zip(checked, results)
+            ]
+        except Exception:
+            # execute() checks (and reports) each call
+            self._preauthorized = []
+
+    def _take_preauthorized(
+        self, name: str, args: Dict[str, Any]
+    ) -> Optional[Tuple[bool, Dict[str, Any]]]:
+        """Remove and return the preauthorized decision of a call, if any."""
+        for i, (call_name, call_args, decision) in enumerate(self._preauthorized):
+            if call_name == name and call_args is args:
+                del self._preauthorized[i]
+                return decision
+        return None
 
     def set_registry(self, registry: Optional['PluginRegistry']) -> None:
         """Set the plugin registry for plugin lookups.
@@ -203,8 +248,8 @@ class ToolExecutor:
         """
         pool = self._get_auto_background_pool()
 
-        # Submit to thread pool
-        future = pool.submit(self._execute_sync, name, args)
+        # Submit to thread pool, keeping the calling session's plugin context
+        future = pool.submit(contextvars.copy_context().run, self._execute_sync, name, args)
 
         try:
             # Wait up to threshold seconds
@@ -269,9 +314,13 @@ class ToolExecutor:
         # Note: askPermission tool itself is always allowed
         if self._permission_plugin is not None and name != 'askPermission':
             try:
-                allowed, perm_info = self._permission_plugin.check_permission(
-                    name, args, self._permission_context
-                )
+                decision = self._take_preauthorized(name, args)
+                if decision is not None:
+                    allowed, perm_info = decision
+                else:
+                    allowed, perm_info = self._permission_plugin.check_permission(
+                        name, args, self._permission_context
+                    )
                 # Build permission metadata for result injection
                 permission_meta = {
                     'decision': 'allowed' if allowed else 'denied',
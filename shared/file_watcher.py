@@ -0,0 +1,312 @@
+"""Shared watcher for file-based response channels.
+
+File channels (permission, references) write a request file and wait for
+another process to write the matching response file. Rather than each
+waiting request polling its response path, one watcher thread serves all
+pending waits: on Linux it blocks on inotify events of the watched
+directories (through ctypes, no extra dependency), elsewhere, or when
+inotify is unavailable, it checks the pending paths every poll interval.
+inotify does not see files written by other hosts on network file
+systems; use a polling watcher there.
+
+Files change hands by rename, so neither side reads a partial file:
+write_json_atomic() writes a temporary file and renames it into place,
+and claim_json() renames a response to a private name before reading it,
+so exactly one reader gets it.
+"""
+
+import ctypes
+import ctypes.util
+import json
+import os
+import select
+import struct
+import sys
+import threading
+import time
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Tuple
+
+
+# Default seconds between checks of a polling watcher
+DEFAULT_POLL_INTERVAL = 0.5
+
+# Seconds between existence checks of an inotify watcher (safety net for
+# directories that could not be watched, and lost events)
+_RESCAN_INTERVAL = 5.0
+
+# Seconds a claimed response may take to become valid JSON (a responder
+# that writes in place may still be writing when it is claimed)
+_CLAIM_GRACE = 1.0
+_CLAIM_RETRY_DELAY = 0.05
+
+# inotify constants (linux/inotify.h)
+_IN_CLOSE_WRITE = 0x00000008
+_IN_MOVED_TO = 0x00000080
+_IN_Q_OVERFLOW = 0x00004000
+_IN_IGNORED = 0x00008000
+_IN_ONLYDIR = 0x01000000
+_WATCH_MASK = _IN_CLOSE_WRITE | _IN_MOVED_TO | _IN_ONLYDIR
+_EVENT_HEADER = struct.Struct("iIII")  # wd, mask, cookie, name length
+
+
+class _Inotify:
+    """Minimal ctypes binding of the Linux inotify API."""
+
+    def __init__(self, libc: Any, fd: int):
+        self._libc = libc
+        self.fd = fd
+
+    @classmethod
+    def create(cls) -> Optional['_Inotify']:
+        """Return an inotify instance, or None where inotify is unavailable."""
+        if not sys.platform.startswith("linux"):
+            return None
+        try:
+            libc = ctypes.CDLL(ctypes.util.find_library("c") or "libc.so.6", use_errno=True)
+            fd = libc.inotify_init1(os.O_NONBLOCK | os.O_CLOEXEC)
+        except (OSError, AttributeError):
+            return None
+        return cls(libc, fd) if fd >= 0 else None
+
+    def add_watch(self, directory: Path) -> int:
+        """Watch a directory for files closed after writing or moved in."""
+        wd = self._libc.inotify_add_watch(self.fd, os.fsencode(directory), _WATCH_MASK)
+        if wd < 0:
+            errno = ctypes.get_errno()
+            raise OSError(errno, os.strerror(errno), str(directory))
+        return wd
+
+    def read_events(self) -> List[Tuple[int, int, str]]:
+        """Read the pending events as (wd, mask, name) tuples."""
+        try:
+            data = os.read(self.fd, 65536)
+        except BlockingIOError:
+            return []
+        events = []
+        offset = 0
+        while offset + _EVENT_HEADER.size <= len(data):
+            wd, mask, _cookie, length = _EVENT_HEADER.unpack_from(data, offset)
+            offset += _EVENT_HEADER.size
+            name = data[offset:offset + length].rstrip(b"\0")
+            offset += length
+            events.append((wd, mask, os.fsdecode(name)))
+        return events
+
+
+class FileWatcher:
+    """Waits for files to appear, for any number of waiting threads.
+
+    wait_for() registers the path with the watcher thread and blocks
+    until the thread sees the file, or the timeout. With inotify the
+    thread sleeps until a file in a watched directory is written or
+    moved in; otherwise it checks the pending paths every poll interval
+    (the shortest one asked for by the pending waits).
+    """
+
+    def __init__(self, use_inotify: bool = True, poll_interval: float = DEFAULT_POLL_INTERVAL):
+        """Initialize the watcher (the thread starts with the first wait).
+
+        Args:
+            use_inotify: Use inotify where available.
+            poll_interval: Default seconds between checks when polling.
+        """
+        self.poll_interval = poll_interval
+        self._inotify = _Inotify.create() if use_inotify else None
+        self._cond = threading.Condition()
+        self._waiters: Dict[Path, List[Tuple[threading.Event, float]]] = {}
+        # Watched directories (kept until removed, there are few of them)
+        self._watches: Dict[Path, int] = {}
+        self._dirs_by_wd: Dict[int, Path] = {}
+        self._unwatched = 0  # Waits in directories that could not be watched
+        self._thread: Optional[threading.Thread] = None
+
+    @property
+    def mode(self) -> str:
+        """How the watcher notices files: "inotify" or "poll"."""
+        return "inotify" if self._inotify else "poll"
+
+    def wait_for(
+        self,
+        path: Path,
+        timeout: Optional[float],
+        poll_interval: Optional[float] = None
+    ) -> bool:
+        """Wait until a file exists.
+
+        Args:
+            path: File to wait for.
+            timeout: Seconds to wait at most (None = no limit).
+            poll_interval: Seconds between checks when polling
+                (defaults to the watcher's).
+
+        Returns:
+            True if the file appeared (it may be gone again if another
+            reader claimed it), False on timeout.
+        """
+        path = Path(os.path.abspath(path))
+        waiter = (threading.Event(), poll_interval or self.poll_interval)
+        watched = self._register(path, waiter)
+        try:
+            if path.exists():
+                return True
+            return waiter[0].wait(timeout)
+        finally:
+            self._unregister(path, waiter, watched)
+
+    def _register(self, path: Path, waiter: Tuple[threading.Event, float]) -> bool:
+        with self._cond:
+            self._waiters.setdefault(path, []).append(waiter)
+            watched = True
+            if self._inotify is not None and path.parent not in self._watches:
+                try:
+                    wd = self._inotify.add_watch(path.parent)
+                    self._watches[path.parent] = wd
+                    self._dirs_by_wd[wd] = path.parent
+                except OSError:
+                    watched = False
+            if not watched:
+                self._unwatched += 1
+            if self._thread is None:
+                target = self._run_inotify if self._inotify is not None else self._run_polling
+                self._thread = threading.Thread(target=target, name="file-watcher", daemon=True)
+                self._thread.start()
+            self._cond.notify_all()
+        return watched
+
+    def _unregister(self, path: Path, waiter: Tuple[threading.Event, float], watched: bool) -> None:
+        with self._cond:
+            waiters = self._waiters.get(path, [])
+            if waiter in waiters:
+                waiters.remove(waiter)
+            if not waiters:
+                self._waiters.pop(path, None)
+            if not watched:
+                self._unwatched -= 1
+
+    def _signal(self, path: Path) -> None:
+        # Caller holds self._cond
+        for event, _ in self._waiters.get(path, ()):
+            event.set()
+
+    def _rescan(self) -> None:
+        with self._cond:
+            paths = list(self._waiters)
+        found = [path for path in paths if path.exists()]
+        with self._cond:
+            for path in found:
+                self._signal(path)
+
+    def _run_polling(self) -> None:
+        while True:
+            with self._cond:
+                self._cond.wait_for(lambda: self._waiters)
+                interval = min(i for waiters in self._waiters.values() for _, i in waiters)
+            self._rescan()
+            with self._cond:
+                self._cond.wait(interval)
+
+    def _run_inotify(self) -> None:
+        fd = self._inotify.fd
+        while True:
+            with self._cond:
+                timeout = (
+                    min(i for waiters in self._waiters.values() for _, i in waiters)
+                    if self._unwatched else _RESCAN_INTERVAL
+                )
+            readable, _, _ = select.select([fd], [], [], timeout)
+            if not readable:
+                self._rescan()
+                continue
+            overflow = False
+            with self._cond:
+                for wd, mask, name in self._inotify.read_events():
+                    if mask & _IN_Q_OVERFLOW:
+                        overflow = True
+                    elif mask & _IN_IGNORED:
+                        # Directory removed: watch it again if it comes back
+                        directory = self._dirs_by_wd.pop(wd, None)
+                        if directory is not None:
+                            self._watches.pop(directory, None)
+                    elif wd in self._dirs_by_wd:
+                        self._signal(self._dirs_by_wd[wd] / name)
+            if overflow:
+                self._rescan()
+
+
+_watchers: Dict[bool, FileWatcher] = {}
+_watchers_lock = threading.Lock()
+
+
+def get_watcher(use_inotify: bool = True) -> FileWatcher:
+    """Return the watcher shared by all file channels, creating it on first use.
+
+    Args:
+        use_inotify: Use inotify where available; False returns the
+            shared polling watcher (for network file systems).
+    """
+    with _watchers_lock:
+        if use_inotify not in _watchers:
+            _watchers[use_inotify] = FileWatcher(use_inotify=use_inotify)
+        return _watchers[use_inotify]
+
+
+def write_json_atomic(path: Path, data: Any) -> None:
+    """Write a JSON file under a temporary name and rename it into place.
+
+    The temporary name starts with a dot and does not end in .json, so
+    readers listing *.json files never see it.
+    """
+    path = Path(path)
+    tmp = path.with_name(f".{path.name}.tmp")
+    with open(tmp, 'w', encoding='utf-8') as f:
+        json.dump(data, f, indent=2)
+    os.replace(tmp, path)
+
+
+def claim_json(path: Path) -> Any:
+    """Take a JSON file: rename it to a private name, read it and delete it.
+
+    Only one reader can rename the file, so each response is read once
+    even when several processes wait on the same directory.
+
+    Returns:
+        The parsed JSON.
+
+    Raises:
+        FileNotFoundError: If the file is gone (claimed by another reader).
+        json.JSONDecodeError: If the file is not valid JSON.
+        OSError: If the file cannot be read.
+    """
+    path = Path(path)
+    claimed = path.with_name(f".{path.name}.{os.getpid()}-{threading.get_ident()}.claimed")
+    deadline = time.monotonic() + _CLAIM_GRACE
+    while True:
+        try:
+            os.rename(path, claimed)
+            break
+        except PermissionError:
+            # Windows: the responder still has the file open
+            if time.monotonic() >= deadline:
+                raise
+            time.sleep(_CLAIM_RETRY_DELAY)
+    try:
+        while True:
+            try:
+                with open(claimed, 'r', encoding='utf-8') as f:
+                    return json.load(f)
+            except json.JSONDecodeError:
+                # A responder writing in place may not be done yet
+                if time.monotonic() >= deadline:
+                    raise
+                time.sleep(_CLAIM_RETRY_DELAY)
+    finally:
+        claimed.unlink(missing_ok=True)
+
+
+__all__ = [
+    'FileWatcher',
+    'get_watcher',
+    'write_json_atomic',
+    'claim_json',
+]
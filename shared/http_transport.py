@@ -0,0 +1,273 @@
+"""Shared HTTP transport for webhook channels.
+
+Webhook channels (permission, todo, references) post JSON to external
+endpoints. requests.post() opens a new connection, with its TCP and TLS
+handshakes, on every call; the shared transport keeps one
+requests.Session whose connection pool keeps connections to each host
+alive between requests, and bounds the number of requests in flight.
+
+Requests whose answer is needed (permission decisions, reference
+selections) are posted with HttpTransport.post(). Fire-and-forget events
+(todo progress) go through an EventSender, which posts them from a
+background thread, batching the events queued meanwhile and retrying
+failed deliveries, so the caller never waits for the network.
+
+Requires requests (optional dependency).
+"""
+
+import threading
+import time
+from collections import deque
+from typing import Any, Deque, Dict, List, Optional
+
+try:
+    import requests
+    from requests.adapters import HTTPAdapter
+    HAS_REQUESTS = True
+except ImportError:
+    HAS_REQUESTS = False
+
+
+# Connections kept alive per host
+DEFAULT_POOL_SIZE = 10
+
+# Requests running at the same time, at most (others wait for a slot)
+DEFAULT_MAX_IN_FLIGHT = 8
+
+# Events an EventSender holds before dropping new ones
+DEFAULT_QUEUE_SIZE = 1000
+
+# Delivery attempts after a failure, and the delay before the first one
+# (doubled for each further attempt)
+DEFAULT_RETRIES = 3
+DEFAULT_RETRY_BACKOFF = 0.5
+
+# Status codes worth retrying; other errors are final
+_RETRY_STATUSES = frozenset({408, 425, 429, 500, 502, 503, 504})
+
+
+class HttpTransport:
+    """Pooled HTTP client with a bound on requests in flight.
+
+    Thread-safe: requests from several threads share the pooled
+    connections, at most max_in_flight at a time.
+    """
+
+    def __init__(
+        self,
+        pool_size: int = DEFAULT_POOL_SIZE,
+        max_in_flight: int = DEFAULT_MAX_IN_FLIGHT
+    ):
+        """Initialize the transport.
+
+        Args:
+            pool_size: Connections kept alive per host.
+            max_in_flight: Requests running at the same time, at most.
+
+        Raises:
+            RuntimeError: If requests is not installed.
+        """
+        if not HAS_REQUESTS:
+            raise RuntimeError("requests library required for HttpTransport")
+        self.max_in_flight = max_in_flight
+        self._session = requests.Session()
+        adapter = HTTPAdapter(pool_connections=pool_size, pool_maxsize=pool_size)
+        self._session.mount("http://", adapter)
+        self._session.mount("https://", adapter)
+        self._slots = threading.BoundedSemaphore(max_in_flight)
+
+    def post(
+        self,
+        url: str,
+        json: Any = None,
+        headers: Optional[Dict[str, str]] = None,
+        timeout: Optional[float] = None
+    ) -> "requests.Response":
+        """POST a JSON body over a pooled connection.
+
+        Waits for a free slot while max_in_flight requests are running;
+        the wait counts against the timeout.
+
+        Raises:
+            requests.Timeout: If no slot frees up within the timeout, or
+                the request times out.
+            requests.RequestException: If the request fails.
+        """
+        started = time.monotonic()
+        if not self._slots.acquire(timeout=timeout):
+            raise requests.Timeout(f"No free connection slot within {timeout}s")
+        try:
+            remaining = None
+            if timeout is not None:
+                remaining = timeout - (time.monotonic() - started)
+                if remaining <= 0:
+                    raise requests.Timeout(f"No time left within {timeout}s after waiting for a slot")
+            return self._session.post(url, json=json, headers=headers, timeout=remaining)
+        finally:
+            self._slots.release()
+
+    def close(self) -> None:
+        """Close the pooled connections."""
+        self._session.close()
+
+
+_shared_transport: Optional[HttpTransport] = None
+_shared_lock = threading.Lock()
+
+
+def get_transport() -> HttpTransport:
+    """Return the transport shared by all webhook channels, creating it on first use."""
+    global _shared_transport
+    with _shared_lock:
+        if _shared_transport is None:
+            _shared_transport = HttpTransport()
+        return _shared_transport
+
+
+class EventSender:
+    """Posts fire-and-forget events from a background thread.
+
+    send() queues an event and returns at once. The sender thread posts
+    the events in order: one POST per event, or with batch_size > 1 the
+    events queued meanwhile together as {"events": [...]}. A failed
+    delivery (connection error, timeout, 429, 5xx) is retried with
+    exponential backoff and then dropped. While max_queue events are
+    waiting, new events are dropped, so an unreachable endpoint cannot
+    grow memory.
+    """
+
+    def __init__(
+        self,
+        url: str,
+        headers: Optional[Dict[str, str]] = None,
+        timeout: float = 10,
+        transport: Optional[HttpTransport] = None,
+        batch_size: int = 1,
+        max_queue: int = DEFAULT_QUEUE_SIZE,
+        retries: int = DEFAULT_RETRIES,
+        retry_backoff: float = DEFAULT_RETRY_BACKOFF
+    ):
+        """Initialize the sender (the thread starts with the first event).
+
+        Args:
+            url: Endpoint to post events to.
+            headers: Request headers.
+            timeout: Timeout of each POST in seconds.
+            transport: HTTP transport (defaults to the shared one).
+            batch_size: Events posted together, at most (1 = no batching).
+            max_queue: Events waiting to be sent, at most.
+            retries: Delivery attempts after a failure.
+            retry_backoff: Seconds before the first retry.
+        """
+        self.url = url
+        self.headers = headers or {}
+        self.timeout = timeout
+        self.batch_size = max(batch_size, 1)
+        self.max_queue = max_queue
+        self.retries = retries
+        self.retry_backoff = retry_backoff
+        self.sent = 0  # Events delivered
+        self.failed = 0  # Events given up on after retries
+        self.dropped = 0  # Events not queued (queue full) or discarded on close
+        self._transport = transport or get_transport()
+        self._queue: Deque[Any] = deque()
+        self._pending = 0  # Events queued or being delivered
+        self._cond = threading.Condition()
+        self._closed = False
+        self._thread: Optional[threading.Thread] = None
+
+    def send(self, event: Any) -> bool:
+        """Queue an event for delivery.
+
+        Returns:
+            True if queued, False if dropped (queue full or sender closed).
+        """
+        with self._cond:
+            if self._closed or len(self._queue) >= self.max_queue:
+                self.dropped += 1
+                return False
+            self._queue.append(event)
+            self._pending += 1
+            if self._thread is None:
+                self._thread = threading.Thread(
+                    target=self._run, name="event-sender", daemon=True
+                )
+                self._thread.start()
+            self._cond.notify_all()
+        return True
+
+    def flush(self, timeout: Optional[float] = None) -> bool:
+        """Wait until every queued event was delivered or given up on.
+
+        Returns:
+            True if nothing is left to send, False on timeout.
+        """
+        with self._cond:
+            return self._cond.wait_for(lambda: self._pending == 0, timeout)
+
+    def close(self, timeout: float = 5.0) -> None:
+        """Send the queued events, waiting up to timeout, and stop.
+
+        Events still queued after the timeout are discarded.
+        """
+        self.flush(timeout)
+        with self._cond:
+            self._closed = True
+            self._cond.notify_all()
+        if self._thread is not None:
+            self._thread.join(timeout)
+
+    def _run(self) -> None:
+        while True:
+            with self._cond:
+                self._cond.wait_for(lambda: self._queue or self._closed)
+                if self._closed:
+                    self.dropped += len(self._queue)
+                    self._pending -= len(self._queue)
+                    self._queue.clear()
+                    self._cond.notify_all()
+                    return
+                batch = [
+                    self._queue.popleft()
+                    for _ in range(min(self.batch_size, len(self._queue)))
+                ]
+
+            delivered = self._deliver(batch)
+
+            with self._cond:
+                if delivered:
+                    self.sent += len(batch)
+                else:
+                    self.failed += len(batch)
+                self._pending -= len(batch)
+                self._cond.notify_all()
+
+    def _deliver(self, batch: List[Any]) -> bool:
+        body = {"events": batch} if self.batch_size > 1 else batch[0]
+        delay = self.retry_backoff
+        for attempt in range(self.retries + 1):
+            if attempt:
+                # Back off, but stop retrying once closed
+                with self._cond:
+                    if self._cond.wait_for(lambda: self._closed, delay):
+                        return False
+                delay *= 2
+            try:
+                response = self._transport.post(
+                    self.url, json=body, headers=self.headers, timeout=self.timeout
+                )
+            except requests.RequestException:
+                continue
+            if 200 <= response.status_code < 300:
+                return True
+            if response.status_code not in _RETRY_STATUSES:
+                return False
+        return False
+
+
+__all__ = [
+    'HttpTransport',
+    'EventSender',
+    'get_transport',
+    'HAS_REQUESTS',
+]
@@ -364,6 +364,20 @@ class JaatoClient:
             return []
         return self._session.get_history()
 
+    def get_full_history(self) -> List[Message]:
+        """Get the conversation history including turns left on disk.
+
+        Same as get_history() unless the session was resumed paged (see
+        SessionConfig.resume_recent_turns); then the older turns are read
+        from disk. Use this for exports.
+
+        Returns:
+            List of Message objects for the whole session.
+        """
+        if not self._session:
+            return []
+        return self._session.get_full_history()
+
     def get_turn_accounting(self) -> List[Dict[str, Any]]:
         """Get token usage and timing per turn.
 
@@ -422,11 +436,24 @@ class JaatoClient:
             return []
         return self._session.get_turn_boundaries()
 
+    def get_paged_turn_count(self) -> int:
+        """Get the number of turns a paged resume left on disk.
+
+        Turn IDs used by revert_to_turn() count these turns first.
+
+        Returns:
+            Number of older turns not in get_history() (0 if not paged).
+        """
+        if not self._session:
+            return 0
+        return self._session.get_paged_turn_count()
+
     def revert_to_turn(self, turn_id: int) -> Dict[str, Any]:
         """Revert the conversation to a specific turn.
 
         Args:
-            turn_id: 1-based turn number to revert to.
+            turn_id: 1-based turn number to revert to, counted from the
+                start of the session (including paged-out turns).
 
         Returns:
             Dict with reversion status.
@@ -438,6 +465,24 @@ class JaatoClient:
             raise RuntimeError("Session not configured.")
         return self._session.revert_to_turn(turn_id)
 
+    def fork(self, session_id: Optional[str] = None) -> JaatoSession:
+        """Branch the conversation into a new session.
+
+        The current session is left unchanged (see JaatoSession.fork()).
+
+        Args:
+            session_id: ID to save the branch under (generated if None).
+
+        Returns:
+            The new JaatoSession.
+
+        Raises:
+            RuntimeError: If the session is not configured.
+        """
+        if not self._session:
+            raise RuntimeError("Session not configured.")
+        return self._session.fork(session_id)
+
     def get_user_commands(self) -> Dict[str, UserCommand]:
         """Get available user commands.
 
@@ -13,6 +13,7 @@ from .plugins.model_provider.base import ProviderConfig
 from .plugins.model_provider import load_provider
 
 if TYPE_CHECKING:
+    from .plugins.plugin_context import PluginContext
     from .plugins.registry import PluginRegistry
     from .plugins.permission import PermissionPlugin
     from .plugins.model_provider.base import ModelProviderPlugin
@@ -31,6 +32,13 @@ class JaatoRuntime:
     Sessions created from this runtime share these resources while
     maintaining their own conversation history and tool configurations.
 
+    Threading: connect() and configure_plugins() (and exposing plugins in
+    the registry) set up the shared environment and must not run while
+    sessions are active. After that, sessions may run send_message() in
+    parallel threads, one thread per session at a time. Sessions given a
+    PluginContext keep their own plugin state (see plugins/plugin_context);
+    sessions without one share the root context, as the main agent does.
+
     Usage:
         # Create and configure runtime
         runtime = JaatoRuntime()
@@ -42,7 +50,8 @@ class JaatoRuntime:
         sub_session = runtime.create_session(
             model="gemini-2.5-flash",
             tools=["cli", "web_search"],
-            system_instructions="You are a research assistant."
+            system_instructions="You are a research assistant.",
+            plugin_context=PluginContext("researcher")
         )
     """
 
@@ -235,7 +244,8 @@ class JaatoRuntime:
         self,
         model: str,
         tools: Optional[List[str]] = None,
-        system_instructions: Optional[str] = None
+        system_instructions: Optional[str] = None,
+        plugin_context: Optional['PluginContext'] = None
     ) -> 'JaatoSession':
         """Create a new session from this runtime.
 
@@ -249,6 +259,9 @@ class JaatoRuntime:
                    exposed plugins from the registry.
             system_instructions: Optional additional system instructions to
                                 prepend to the base instructions.
+            plugin_context: Optional per-session plugin state, for sessions
+                           running alongside others (e.g. subagents). If
+                           None, the session uses the root context.
 
         Returns:
             JaatoSession configured with the specified settings.
@@ -265,7 +278,7 @@ class JaatoRuntime:
         from .jaato_session import JaatoSession
 
         # Create session with runtime reference
-        session = JaatoSession(self, model)
+        session = JaatoSession(self, model, plugin_context)
 
         # Configure session tools
         session.configure(
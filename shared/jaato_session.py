@@ -6,13 +6,25 @@ while sharing resources from the parent JaatoRuntime.
 
 import re
 from datetime import datetime
-from typing import Any, Callable, Dict, List, Optional, TYPE_CHECKING
+from typing import Any, Callable, Dict, List, Optional, Tuple, TYPE_CHECKING
 
 from .ai_tool_runner import ToolExecutor
 from .token_accounting import TokenLedger
 from .plugins.base import UserCommand, OutputCallback
-from .plugins.gc import GCConfig, GCPlugin, GCResult, GCTriggerReason
-from .plugins.session import SessionPlugin, SessionConfig, SessionState, SessionInfo
+from .plugins.plugin_context import PluginContext, ROOT_CONTEXT, use_plugin_context
+from .plugins.gc import (
+    GCConfig,
+    GCPlugin,
+    GCResult,
+    GCTriggerReason,
+    compact_tool_results,
+    create_summary_message,
+    estimate_history_tokens,
+    estimate_message_tokens,
+    split_into_turns,
+)
+from .plugins.session import ForkPoint, SessionPlugin, SessionConfig, SessionState, SessionInfo
+from .plugins.session.fork import make_fork_point
 from .plugins.model_provider.types import (
     Attachment,
     FunctionCall,
@@ -28,6 +40,7 @@ if TYPE_CHECKING:
     from .jaato_runtime import JaatoRuntime
     from .plugins.model_provider.base import ModelProviderPlugin
     from .plugins.subagent.ui_hooks import AgentUIHooks
+    from .plugins.session.paging import HistoryPager
 
 # Pattern to match @references in prompts
 AT_REFERENCE_PATTERN = re.compile(r'@([\w./\-]+(?:\.\w+)?)')
@@ -44,7 +57,10 @@ class JaatoSession:
     - Turn accounting
 
     Sessions share the runtime's resources (registry, permissions, ledger)
-    but maintain independent state.
+    but maintain independent state. A session with a PluginContext also
+    has its own plugin state (current TODO plan, session plugin counters,
+    output callbacks, ...), activated while the session calls into
+    plugins, so it can run in parallel with other sessions.
 
     Usage:
         # Created via runtime.create_session()
@@ -59,7 +75,12 @@ class JaatoSession:
         history = session.get_history()
     """
 
-    def __init__(self, runtime: 'JaatoRuntime', model: str):
+    def __init__(
+        self,
+        runtime: 'JaatoRuntime',
+        model: str,
+        plugin_context: Optional[PluginContext] = None
+    ):
         """Initialize a session.
 
         Note: Use runtime.create_session() instead of calling this directly.
@@ -67,9 +88,12 @@ class JaatoSession:
         Args:
             runtime: Parent JaatoRuntime providing shared resources.
             model: Model name to use for this session.
+            plugin_context: Per-session plugin state, or None to use the
+                root context.
         """
         self._runtime = runtime
         self._model_name = model
+        self._plugin_context = plugin_context
 
         # Provider for this session (created during configure())
         self._provider: Optional['ModelProviderPlugin'] = None
@@ -95,6 +119,20 @@ class JaatoSession:
         self._session_plugin: Optional[SessionPlugin] = None
         self._session_config: Optional[SessionConfig] = None
 
+        # Paged resume: older turns left on disk, and the first loaded
+        # message as saved and as sent with the resume summary prepended
+        self._paged_history: Optional['HistoryPager'] = None
+        self._paged_first: Optional[Message] = None
+        self._paged_head: Optional[Message] = None
+
+        # Branch created by fork(): the ID it is saved under, and where it
+        # forked off its parent, with the last (and first, unless paged
+        # out) shared message to detect when its history stops sharing
+        # the parent's prefix
+        self._fork_session_id: Optional[str] = None
+        self._fork: Optional[ForkPoint] = None
+        self._fork_ends: Tuple[Optional[Message], Optional[Message]] = (None, None)
+
         # Agent type context (for permission checks)
         self._agent_type: str = "main"
         self._agent_name: Optional[str] = None
@@ -113,6 +151,11 @@ class JaatoSession:
         """Get the parent runtime."""
         return self._runtime
 
+    @property
+    def plugin_context(self) -> Optional[PluginContext]:
+        """Get the session's plugin context (None for the root context)."""
+        return self._plugin_context
+
     @property
     def is_configured(self) -> bool:
         """Check if session is configured and ready."""
@@ -256,17 +299,18 @@ class JaatoSession:
         if not self._provider:
             raise RuntimeError("Session not configured. Call configure() first.")
 
-        # Check and perform GC if needed
-        if self._gc_plugin and self._gc_config and self._gc_config.check_before_send:
-            self._maybe_collect_before_send()
+        with use_plugin_context(self._plugin_context):
+            # Check and perform GC if needed
+            if self._gc_plugin and self._gc_config and self._gc_config.check_before_send:
+                self._maybe_collect_before_send()
 
-        # Run prompt enrichment if registry is available
-        processed_message = self._enrich_and_clean_prompt(message)
+            # Run prompt enrichment if registry is available
+            processed_message = self._enrich_and_clean_prompt(message)
 
-        response = self._run_chat_loop(processed_message, on_output)
+            response = self._run_chat_loop(processed_message, on_output)
 
-        # Notify session plugin
-        self._notify_session_turn_complete()
+            # Notify session plugin
+            self._notify_session_turn_complete()
 
         return response
 
@@ -327,6 +371,10 @@ class JaatoSession:
 
                 tool_results: List[ToolResult] = []
 
+                # Ask for the permissions of all calls of the round at once
+                if self._executor and len(function_calls) > 1:
+                    self._executor.preauthorize([(fc.name, fc.args) for fc in function_calls])
+
                 for fc in function_calls:
                     name = fc.name
                     args = fc.args
@@ -373,6 +421,9 @@ class JaatoSession:
                     tool_result = self._build_tool_result(fc, executor_result)
                     tool_results.append(tool_result)
 
+                # Free context between rounds if the loop is filling it up
+                self._maybe_collect_during_tool_loop(response, tool_results)
+
                 # Send tool results back
                 response = self._provider.send_tool_results(tool_results)
                 self._record_token_usage(response)
@@ -533,7 +584,11 @@ class JaatoSession:
 
     def get_turn_boundaries(self) -> List[int]:
         """Get indices where each turn starts in the history."""
-        history = self.get_history()
+        return self._turn_boundaries(self.get_history())
+
+    @staticmethod
+    def _turn_boundaries(history: List[Message]) -> List[int]:
+        """Get indices where each turn starts in a history."""
         boundaries = []
 
         for i, msg in enumerate(history):
@@ -542,10 +597,39 @@ class JaatoSession:
 
         return boundaries
 
+    def get_paged_turn_count(self) -> int:
+        """Get the number of turns a paged resume left on disk.
+
+        Turn IDs (see revert_to_turn) count these turns first, so the
+        first turn in the history is turn get_paged_turn_count() + 1.
+        """
+        pager = self._get_paged_history(self.get_history())
+        return pager.turn_count if pager else 0
+
+    def get_full_history(self) -> List[Message]:
+        """Get the conversation history including turns left on disk.
+
+        Same as get_history() unless the session was resumed paged, in
+        which case the older turns are read from disk (e.g. for exports).
+        """
+        history = self.get_history()
+        pager = self._get_paged_history(history)
+        if not pager:
+            return history
+        return pager.load() + [self._paged_first] + history[1:]
+
     def revert_to_turn(self, turn_id: int) -> Dict[str, Any]:
-        """Revert the conversation to a specific turn."""
-        boundaries = self.get_turn_boundaries()
-        total_turns = len(boundaries)
+        """Revert the conversation to a specific turn.
+
+        Turn IDs count from the start of the session, including turns a
+        paged resume left on disk; reverting to one of those pages the
+        older turns back in first.
+        """
+        history = self.get_history()
+        pager = self._get_paged_history(history)
+        paged_turns = pager.turn_count if pager else 0
+        boundaries = self._turn_boundaries(history)
+        total_turns = paged_turns + len(boundaries)
 
         if turn_id < 1:
             raise ValueError(f"Turn ID must be >= 1, got {turn_id}")
@@ -561,12 +645,12 @@ class JaatoSession:
                 'message': f"Already at turn {turn_id}, no changes made."
             }
 
-        history = self.get_history()
+        if turn_id <= paged_turns:
+            history = self._page_in(history)
+            boundaries = self._turn_boundaries(history)
+            paged_turns = 0
 
-        if turn_id < total_turns:
-            truncate_at = boundaries[turn_id]
-        else:
-            truncate_at = len(history)
+        truncate_at = boundaries[turn_id - paged_turns]
 
         truncated_history = list(history[:truncate_at])
         turns_removed = total_turns - turn_id
@@ -576,8 +660,10 @@ class JaatoSession:
 
         self._create_provider_session(truncated_history)
 
-        if self._session_plugin and hasattr(self._session_plugin, 'set_turn_count'):
-            self._session_plugin.set_turn_count(turn_id)
+        if (self._session_plugin and not self._fork_session_id and
+                hasattr(self._session_plugin, 'set_turn_count')):
+            with use_plugin_context(self._plugin_context):
+                self._session_plugin.set_turn_count(turn_id)
 
         return {
             'success': True,
@@ -586,6 +672,68 @@ class JaatoSession:
             'message': f"Reverted to turn {turn_id} (removed {turns_removed} turn(s))."
         }
 
+    def fork(self, session_id: Optional[str] = None) -> 'JaatoSession':
+        """Branch the conversation into a new session.
+
+        Unlike revert_to_turn(), this session is left as it is. The branch
+        starts with the same history and continues independently, with
+        its own provider chat and turn accounting. Messages are never
+        modified in place, so the branch shares them instead of copying.
+
+        With a session plugin, this session is saved first. The branch is
+        saved under its own ID with save_session(); the file store keeps
+        it as a delta against this session. The branch does not take over
+        the plugin's current session or its lifecycle hooks. It gets its
+        own plugin context, a copy of this session's, so it can run in
+        parallel with this session.
+
+        Args:
+            session_id: ID to save the branch under (generated if None).
+
+        Returns:
+            The new session.
+
+        Raises:
+            RuntimeError: If this session is not configured.
+        """
+        if not self._provider:
+            raise RuntimeError("Session not configured.")
+
+        history = self.get_history()
+        parent_id = self.save_session() if self._session_plugin else None
+
+        # The branch starts with a copy of this session's plugin state
+        context = (self._plugin_context or ROOT_CONTEXT).copy(self._agent_id)
+        branch = JaatoSession(self._runtime, self._model_name, context)
+        branch.set_agent_context(self._agent_type, self._agent_name)
+        branch.configure(self._tool_plugins)
+        branch._system_instruction = self._system_instruction
+        branch._tools = list(self._tools) if self._tools is not None else None
+        branch._user_commands = dict(self._user_commands)
+        branch._turn_accounting = [dict(turn) for turn in self._turn_accounting]
+
+        if self._gc_plugin:
+            branch.set_gc_plugin(self._gc_plugin, self._gc_config)
+
+        if self._session_plugin:
+            branch._session_plugin = self._session_plugin
+            branch._session_config = self._session_config
+            if hasattr(self._session_plugin, 'get_executors'):
+                for name, fn in self._session_plugin.get_executors().items():
+                    branch._executor.register(name, fn)
+
+        branch._paged_history = self._paged_history
+        branch._paged_first = self._paged_first
+        branch._paged_head = self._paged_head
+
+        branch._fork_session_id = session_id or datetime.now().strftime("%Y%m%d_%H%M%S_%f")
+        if parent_id and history and not self._get_paged_history(history):
+            branch._fork = make_fork_point(parent_id, history)
+            branch._fork_ends = (history[0], history[-1])
+
+        branch._create_provider_session(list(history))
+        return branch
+
     def get_user_commands(self) -> Dict[str, UserCommand]:
         """Get available user commands."""
         return dict(self._user_commands)
@@ -605,7 +753,8 @@ class JaatoSession:
         cmd = self._user_commands[command_name]
         args = args or {}
 
-        _ok, result = self._executor.execute(command_name, args)
+        with use_plugin_context(self._plugin_context):
+            _ok, result = self._executor.execute(command_name, args)
 
         if cmd.share_with_model and self._provider:
             self._inject_command_into_history(command_name, args, result)
@@ -656,7 +805,8 @@ class JaatoSession:
         if not self._provider:
             raise RuntimeError("Session not configured.")
 
-        return self._run_chat_loop_with_parts(parts, on_output)
+        with use_plugin_context(self._plugin_context):
+            return self._run_chat_loop_with_parts(parts, on_output)
 
     def _run_chat_loop_with_parts(
         self,
@@ -700,6 +850,10 @@ class JaatoSession:
 
                 tool_results: List[ToolResult] = []
 
+                # Ask for the permissions of all calls of the round at once
+                if self._executor and len(function_calls) > 1:
+                    self._executor.preauthorize([(fc.name, fc.args) for fc in function_calls])
+
                 for fc in function_calls:
                     name = fc.name
                     args = fc.args
@@ -744,6 +898,8 @@ class JaatoSession:
                     tool_result = self._build_tool_result(fc, executor_result)
                     tool_results.append(tool_result)
 
+                self._maybe_collect_during_tool_loop(response, tool_results)
+
                 response = self._provider.send_tool_results(tool_results)
                 self._record_token_usage(response)
                 self._accumulate_turn_tokens(response, turn_data)
@@ -826,6 +982,106 @@ class JaatoSession:
 
         return None
 
+    def _get_tool_loop_context_usage(
+        self,
+        response: ProviderResponse,
+        pending_results: List[ToolResult]
+    ) -> Dict[str, Any]:
+        """Estimate context usage for the next send inside a tool loop.
+
+        The next request's prompt is the current context (last response's
+        prompt plus output) plus the tool results about to be sent.
+        Completed-turn accounting does not include the in-flight turn, so
+        it cannot be used here.
+        """
+        usage = self.get_context_usage()
+
+        pending_tokens = estimate_message_tokens(Message(
+            role=Role.USER,
+            parts=[Part.from_function_response(r) for r in pending_results]
+        ))
+
+        current_tokens = response.usage.prompt_tokens + response.usage.output_tokens
+        if current_tokens <= 0:
+            current_tokens = estimate_history_tokens(self.get_history())
+
+        in_flight = current_tokens + pending_tokens
+        context_limit = usage['context_limit']
+
+        usage.update({
+            'total_tokens': in_flight,
+            'prompt_tokens': in_flight,
+            'output_tokens': 0,
+            'percent_used': (in_flight / context_limit * 100) if context_limit > 0 else 0,
+            'tokens_remaining': max(0, context_limit - in_flight),
+        })
+        return usage
+
+    def _maybe_collect_during_tool_loop(
+        self,
+        response: ProviderResponse,
+        pending_results: List[ToolResult]
+    ) -> Optional[GCResult]:
+        """Check and perform GC between tool-result rounds of a turn.
+
+        Older turns are handled by the GC plugin as usual (the in-flight
+        turn is the most recent one and is therefore preserved). On top of
+        that, outputs of this turn's older tool-result rounds are replaced
+        by stubs. If anything changed, the provider chat is re-created with
+        the compacted history before the pending results are sent.
+        """
+        if not self._gc_plugin or not self._gc_config:
+            return None
+        if not self._gc_config.check_during_tool_loop:
+            return None
+
+        context_usage = self._get_tool_loop_context_usage(response, pending_results)
+        should_gc, reason = self._gc_plugin.should_collect(context_usage, self._gc_config)
+
+        if not should_gc or not reason:
+            return None
+
+        history = self.get_history()
+        new_history, result = self._gc_plugin.collect(
+            history, context_usage, self._gc_config, GCTriggerReason.TOOL_LOOP
+        )
+        if not result.success:
+            new_history = history
+
+        # Compact older tool results of the in-flight (last) turn
+        turns = split_into_turns(new_history)
+        compacted = 0
+        if turns:
+            current_start = len(new_history) - len(turns[-1].contents)
+            current_turn, compacted = compact_tool_results(
+                new_history[current_start:],
+                self._gc_config.preserve_recent_tool_rounds
+            )
+            new_history = new_history[:current_start] + current_turn
+
+        if not compacted and (not result.success or result.items_collected == 0):
+            return result
+
+        if not result.success:
+            # Plugin failed, but compacting this turn's results still helps
+            result = GCResult(
+                success=True,
+                items_collected=compacted,
+                tokens_before=estimate_history_tokens(history),
+                tokens_after=0,
+                plugin_name=self._gc_plugin.name,
+                trigger_reason=GCTriggerReason.TOOL_LOOP,
+                details={'plugin_error': result.error},
+            )
+
+        result.tokens_after = estimate_history_tokens(new_history)
+        result.details['tool_results_compacted'] = compacted
+
+        self.reset_session(new_history)
+        self._gc_history.append(result)
+
+        return result
+
     # ==================== Session Persistence ====================
 
     def set_session_plugin(
@@ -838,7 +1094,8 @@ class JaatoSession:
         self._session_config = config or SessionConfig()
 
         if hasattr(plugin, 'set_session'):
-            plugin.set_session(self)
+            with use_plugin_context(self._plugin_context):
+                plugin.set_session(self)
 
         if hasattr(plugin, 'get_user_commands'):
             for cmd in plugin.get_user_commands():
@@ -858,7 +1115,8 @@ class JaatoSession:
                 self._create_provider_session(history)
 
         if self._session_config.auto_resume_last:
-            state = self._session_plugin.on_session_start(self._session_config)
+            with use_plugin_context(self._plugin_context):
+                state = self._session_plugin.on_session_start(self._session_config)
             if state:
                 self._restore_session_state(state)
 
@@ -878,20 +1136,37 @@ class JaatoSession:
         if not self._session_plugin:
             raise RuntimeError("No session plugin configured.")
 
-        state = self._get_session_state(session_id, user_inputs)
-        self._session_plugin.save(state)
+        with use_plugin_context(self._plugin_context):
+            state = self._get_session_state(session_id, user_inputs)
+            self._session_plugin.save(state)
+
+            # The store may keep a fork in full (e.g. its parent changed)
+            if state.fork is None:
+                self._fork = None
 
-        if hasattr(self._session_plugin, 'set_current_session_id'):
-            self._session_plugin.set_current_session_id(state.session_id)
+            # A branch's current session is kept in its own plugin context
+            if hasattr(self._session_plugin, 'set_current_session_id'):
+                self._session_plugin.set_current_session_id(state.session_id)
+            if self._fork_session_id:
+                self._fork_session_id = state.session_id
 
         return state.session_id
 
     def resume_session(self, session_id: str) -> SessionState:
-        """Resume a previously saved session."""
+        """Resume a previously saved session.
+
+        With SessionConfig.resume_recent_turns set and a plugin supporting
+        it, only the last turns are loaded (paged resume).
+        """
         if not self._session_plugin:
             raise RuntimeError("No session plugin configured.")
 
-        state = self._session_plugin.load(session_id)
+        recent_turns = self._session_config.resume_recent_turns if self._session_config else None
+        with use_plugin_context(self._plugin_context):
+            if recent_turns and hasattr(self._session_plugin, 'load_recent'):
+                state = self._session_plugin.load_recent(session_id, recent_turns)
+            else:
+                state = self._session_plugin.load(session_id)
         self._restore_session_state(state)
         return state
 
@@ -905,7 +1180,8 @@ class JaatoSession:
         """Delete a saved session."""
         if not self._session_plugin:
             raise RuntimeError("No session plugin configured.")
-        return self._session_plugin.delete(session_id)
+        with use_plugin_context(self._plugin_context):
+            return self._session_plugin.delete(session_id)
 
     def _get_session_state(
         self,
@@ -913,6 +1189,8 @@ class JaatoSession:
         user_inputs: Optional[List[str]] = None
     ) -> SessionState:
         """Build a SessionState from current state."""
+        if not session_id:
+            session_id = self._fork_session_id
         if not session_id:
             if (self._session_plugin and
                     hasattr(self._session_plugin, 'get_current_session_id')):
@@ -923,13 +1201,20 @@ class JaatoSession:
         now = datetime.now()
         turn_accounting = self.get_turn_accounting()
 
+        # After a paged resume, save only the loaded part (as it was saved)
+        history = self.get_history()
+        paged = self._get_paged_history(history)
+        if paged:
+            history = [self._paged_first] + history[1:]
+        fork = self._get_fork_point(history, paged.message_count if paged else 0)
+
         description = None
         if self._session_plugin and hasattr(self._session_plugin, '_session_description'):
             description = self._session_plugin._session_description
 
         return SessionState(
             session_id=session_id,
-            history=self.get_history(),
+            history=history,
             created_at=now,
             updated_at=now,
             turn_count=len(turn_accounting),
@@ -939,16 +1224,101 @@ class JaatoSession:
             location=self._runtime.location,
             model=self._model_name,
             description=description,
+            paged=paged,
+            fork=fork,
         )
 
     def _restore_session_state(self, state: SessionState) -> None:
-        """Restore session state from a SessionState."""
-        self.reset_session(state.history)
+        """Restore session state from a SessionState.
+
+        For a paged state, the summary of the turns left on disk is
+        prepended to the first loaded message.
+        """
+        self._paged_history = None
+        history = state.history
+
+        if state.paged and history:
+            first = history[0]
+            summary = create_summary_message(state.paged.summary)
+            self._paged_history = state.paged
+            self._paged_first = first
+            self._paged_head = Message(role=first.role, parts=summary.parts + list(first.parts))
+            history = [self._paged_head] + history[1:]
+
+        self.reset_session(history)
         self._turn_accounting = list(state.turn_accounting)
 
+        # A resumed fork keeps being saved as a delta while it can
+        self._fork = state.fork
+        self._fork_ends = (None, None)
+        if state.fork:
+            offset = state.paged.message_count if state.paged else 0
+            last = state.fork.message_count - 1 - offset
+            self._fork_ends = (
+                None if offset else state.history[0],
+                state.history[last] if last >= 0 else None,
+            )
+
+    def _get_fork_point(self, history: List[Message], offset: int) -> Optional[ForkPoint]:
+        """Get the fork point if the history still starts with the shared prefix.
+
+        GC and revert_to_turn replace the start of the history or cut it
+        short; the session is then no longer a delta of its parent.
+
+        Args:
+            history: History as saved (first message without a paged
+                resume summary).
+            offset: Number of messages a paged resume left on disk.
+        """
+        fork = self._fork
+        if fork is None:
+            return None
+
+        first, last = self._fork_ends
+        end = fork.message_count - 1 - offset
+        if (
+            offset + len(history) >= fork.message_count and
+            (first is None or (history and history[0] == first)) and
+            (last is None or (end >= 0 and history[end] == last))
+        ):
+            return fork
+
+        self._fork = None
+        self._fork_ends = (None, None)
+        return None
+
+    def _get_paged_history(self, history: List[Message]) -> Optional['HistoryPager']:
+        """Get the pager of a paged resume if the history still builds on it.
+
+        GC, reset or a revert past the first loaded message replace the
+        head of the history; the older turns are then no longer part of
+        the conversation and paging ends.
+        """
+        if self._paged_history is None:
+            return None
+        if history and history[0] == self._paged_head:
+            return self._paged_history
+        self._paged_history = None
+        self._paged_first = None
+        self._paged_head = None
+        return None
+
+    def _page_in(self, history: List[Message]) -> List[Message]:
+        """Load the turns left on disk back into the live session.
+
+        Returns:
+            The full history now in the provider session.
+        """
+        full_history = self._paged_history.load() + [self._paged_first] + history[1:]
+        self._paged_history = None
+        self._paged_first = None
+        self._paged_head = None
+        self._create_provider_session(full_history)
+        return full_history
+
     def _notify_session_turn_complete(self) -> None:
         """Notify session plugin that a turn completed."""
-        if not self._session_plugin or not self._session_config:
+        if not self._session_plugin or not self._session_config or self._fork_session_id:
             return
 
         state = self._get_session_state()
@@ -960,9 +1330,10 @@ class JaatoSession:
 
     def close_session(self) -> None:
         """Close the current session."""
-        if self._session_plugin and self._session_config:
+        if self._session_plugin and self._session_config and not self._fork_session_id:
             state = self._get_session_state()
-            self._session_plugin.on_session_end(state, self._session_config)
+            with use_plugin_context(self._plugin_context):
+                self._session_plugin.on_session_end(state, self._session_config)
 
 
 __all__ = ['JaatoSession']
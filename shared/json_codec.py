@@ -0,0 +1,116 @@
+"""JSON encoding for persistence paths (sessions, memories, ledgers, todo
+plans, artifact registry, MCP logs).
+
+Uses orjson when installed, then msgspec, and the stdlib json module
+otherwise. Every backend takes and returns UTF-8 bytes and produces the
+same JSON: compact, non-ASCII characters unescaped, non-string dict keys
+converted to strings. Values the fast backend cannot encode (e.g.
+integers beyond 64 bits) are encoded with the stdlib instead.
+
+Documents written as whole files (dumps_document) are compact unless the
+JAATO_JSON_PRETTY environment variable is set, for debugging.
+
+Decoding errors are raised as json.JSONDecodeError whatever the backend.
+"""
+
+import json
+import os
+from typing import Any, Callable, Optional, Union
+
+try:
+    import orjson
+    HAS_ORJSON = True
+except ImportError:
+    HAS_ORJSON = False
+
+try:
+    import msgspec
+    HAS_MSGSPEC = True
+except ImportError:
+    HAS_MSGSPEC = False
+
+
+# Backend in use: 'orjson', 'msgspec' or 'json'
+BACKEND = "orjson" if HAS_ORJSON else "msgspec" if HAS_MSGSPEC else "json"
+
+# Indent whole-file documents (debug option)
+PRETTY = os.environ.get('JAATO_JSON_PRETTY', '').lower() in ('1', 'true', 'yes')
+
+JSONDecodeError = json.JSONDecodeError
+
+Default = Optional[Callable[[Any], Any]]
+
+
+def _std_dumps(obj: Any, default: Default, sort_keys: bool, indent: Optional[int]) -> bytes:
+    separators = None if indent else (',', ':')
+    return json.dumps(
+        obj, ensure_ascii=False, separators=separators, default=default,
+        sort_keys=sort_keys, indent=indent
+    ).encode('utf-8')
+
+
+def _encode(obj: Any, default: Default, sort_keys: bool, indent: bool) -> bytes:
+    if HAS_ORJSON:
+        option = orjson.OPT_NON_STR_KEYS
+        if sort_keys:
+            option |= orjson.OPT_SORT_KEYS
+        if indent:
+            option |= orjson.OPT_INDENT_2
+        try:
+            return orjson.dumps(obj, default=default, option=option)
+        except TypeError:
+            pass
+    elif HAS_MSGSPEC:
+        try:
+            encoded = msgspec.json.encode(
+                obj, enc_hook=default, order="sorted" if sort_keys else None
+            )
+            return msgspec.json.format(encoded, indent=2) if indent else encoded
+        except (TypeError, msgspec.EncodeError):
+            pass
+    return _std_dumps(obj, default, sort_keys, 2 if indent else None)
+
+
+def dumps(obj: Any, default: Default = None, sort_keys: bool = False) -> bytes:
+    """Encode a value as compact JSON (suitable for JSON lines).
+
+    Args:
+        obj: Value to encode.
+        default: Called for objects the encoder does not support; returns
+            an encodable replacement or raises TypeError.
+        sort_keys: Sort dict keys.
+
+    Returns:
+        UTF-8 encoded JSON.
+
+    Raises:
+        TypeError: If a value cannot be encoded.
+    """
+    return _encode(obj, default, sort_keys, False)
+
+
+def dumps_document(obj: Any, default: Default = None) -> bytes:
+    """Encode a value written as a whole file.
+
+    Compact, or indented when JAATO_JSON_PRETTY is set.
+    """
+    return _encode(obj, default, False, PRETTY)
+
+
+def loads(data: Union[bytes, bytearray, memoryview, str]) -> Any:
+    """Decode JSON.
+
+    Raises:
+        json.JSONDecodeError: If the data is not valid JSON.
+    """
+    if HAS_ORJSON:
+        return orjson.loads(data)
+    if HAS_MSGSPEC:
+        try:
+            return msgspec.json.decode(data)
+        except msgspec.DecodeError as e:
+            text = data if isinstance(data, str) else bytes(data).decode('utf-8', 'replace')
+            raise JSONDecodeError(str(e), text, 0) from e
+    if not isinstance(data, str):
+        data = bytes(data)
+    return json.loads(data)
@@ -14,7 +14,6 @@ Example workflow:
 The plugin persists state to a JSON file so artifacts survive session restarts.
 """
 
-import json
 import os
 from typing import Any, Callable, Dict, List, Optional
 
@@ -24,6 +23,7 @@ from .models import (
     ArtifactType,
     ReviewStatus,
 )
+from ... import json_codec
 from ..model_provider.types import ToolSchema
 from ..base import UserCommand
 
@@ -125,10 +125,10 @@ class ArtifactTrackerPlugin:
             return
 
         try:
-            with open(self._storage_path, 'r') as f:
-                data = json.load(f)
+            with open(self._storage_path, 'rb') as f:
+                data = json_codec.loads(f.read())
                 self._registry = ArtifactRegistry.from_dict(data)
-        except (json.JSONDecodeError, IOError) as e:
+        except (json_codec.JSONDecodeError, IOError) as e:
             print(f"Warning: Failed to load artifact tracker state: {e}")
             self._registry = ArtifactRegistry()
 
@@ -138,8 +138,8 @@ class ArtifactTrackerPlugin:
             return
 
         try:
-            with open(self._storage_path, 'w') as f:
-                json.dump(self._registry.to_dict(), f, indent=2)
+            with open(self._storage_path, 'wb') as f:
+                f.write(json_codec.dumps_document(self._registry.to_dict()))
         except IOError as e:
             print(f"Warning: Failed to save artifact tracker state: {e}")
 
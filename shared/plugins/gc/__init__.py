@@ -9,6 +9,10 @@ GC plugins implement different strategies:
 - Summarization: Compress old turns into summaries
 - Hybrid: Combine truncation and summarization
 
+Which turns are kept is decided by an eviction policy: 'recent' (keep the
+N most recent turns) or 'value' (score turns and keep the most valuable
+ones under a token budget, see planner.py).
+
 Usage:
     from shared.plugins.gc import GCPlugin, GCConfig, GCResult, discover_gc_plugins
 
@@ -37,7 +41,9 @@ from .base import (
     GCTriggerReason,
 )
 from .utils import (
+    COMPACTED_TOOL_RESULT_TEMPLATE,
     Turn,
+    compact_tool_results,
     create_gc_notification_message,
     create_summary_message,
     estimate_message_tokens,
@@ -47,6 +53,16 @@ from .utils import (
     get_preserved_indices,
     split_into_turns,
 )
+from .summary_cache import SummaryCache, summary_cache_from_config
+from .planner import (
+    DEFAULT_VALUE_WEIGHTS,
+    EVICTION_POLICY_RECENT,
+    EVICTION_POLICY_VALUE,
+    TurnScore,
+    plan_preserved_indices,
+    score_turns,
+    select_preserved_indices,
+)
 
 
 # Entry point group for GC plugins
@@ -129,4 +145,17 @@ __all__ = [
     "create_summary_message",
     "create_gc_notification_message",
     "get_preserved_indices",
+    "compact_tool_results",
+    "COMPACTED_TOOL_RESULT_TEMPLATE",
+    # Summary memoization
+    "SummaryCache",
+    "summary_cache_from_config",
+    # Eviction planning
+    "TurnScore",
+    "score_turns",
+    "plan_preserved_indices",
+    "select_preserved_indices",
+    "DEFAULT_VALUE_WEIGHTS",
+    "EVICTION_POLICY_RECENT",
+    "EVICTION_POLICY_VALUE",
 ]
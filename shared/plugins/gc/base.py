@@ -18,6 +18,7 @@ class GCTriggerReason(Enum):
     MANUAL = "manual"            # Explicitly requested by caller
     TURN_LIMIT = "turn_limit"    # Maximum turn count exceeded
     PRE_MESSAGE = "pre_message"  # Triggered before sending a message
+    TOOL_LOOP = "tool_loop"      # Triggered between tool-result rounds
 
 
 @dataclass
@@ -80,6 +81,14 @@ class GCConfig:
     check_before_send: bool = True
     """Whether to check and possibly trigger GC before each send_message."""
 
+    check_during_tool_loop: bool = True
+    """Whether to check and possibly trigger GC between tool-result rounds
+    of a single turn (before each send of tool results)."""
+
+    preserve_recent_tool_rounds: int = 2
+    """Tool-result rounds of the current turn kept intact by intra-turn GC.
+    Older rounds of the current turn have their outputs replaced by stubs."""
+
     # Preservation settings
     preserve_recent_turns: int = 5
     """Number of recent turns to always preserve."""
@@ -0,0 +1,435 @@
+"""Value-aware eviction planning for Context Garbage Collection.
+
+The default preservation policy (get_preserved_indices) keeps the N most
+recent turns plus pinned turns and evicts everything else, regardless of
+how large or how important each turn is. This module provides an
+alternative policy that scores every turn and selects the subset worth
+keeping under a token budget:
+
+- Size: estimated tokens of the turn (the knapsack weight)
+- References: how many later turns mention terms introduced by the turn
+- Tool outcomes: successful tool results are worth more than failed ones
+- Plan state: turns that create or update a plan (todo tools)
+- Pins and the latest turn(s): always kept, regardless of budget
+
+Selection is a 0/1 knapsack over the optional turns, solved with dynamic
+programming on scaled token weights (greedy by value density for very
+large inputs).
+
+Any GC plugin can opt into this policy through select_preserved_indices(),
+driven by its plugin config:
+
+    plugin.initialize({
+        "eviction_policy": "value",
+        "target_percent": 50.0,   # Target occupancy after GC
+    })
+"""
+
+import math
+import re
+from dataclasses import dataclass
+from typing import Any, Dict, Iterable, List, Optional, Set
+
+from .utils import Turn, get_preserved_indices
+
+
+# Eviction policy names accepted in plugin config ('eviction_policy')
+EVICTION_POLICY_RECENT = "recent"
+EVICTION_POLICY_VALUE = "value"
+
+# Default weights for the turn value function
+DEFAULT_VALUE_WEIGHTS: Dict[str, float] = {
+    "base": 1.0,          # Every turn has some value
+    "reference": 3.0,     # Per later turn referencing this turn's terms
+    "tool_success": 0.5,  # Per successful tool result
+    "tool_error": -0.5,   # Per failed tool result
+    "plan_state": 5.0,    # Turn creates/updates plan or todo state
+    "recency": 1.0,       # Scaled by relative position (0..1)
+}
+
+# Tool names that carry plan/todo state (see shared.plugins.todo)
+DEFAULT_PLAN_TOOL_NAMES = frozenset({
+    "createPlan",
+    "startPlan",
+    "updateStep",
+    "getPlanStatus",
+    "completePlan",
+})
+
+# Recent turns always kept by the value policy (the current exchange)
+DEFAULT_MIN_RECENT_TURNS = 1
+
+# Terms appearing in more than this fraction of turns are not discriminative
+_COMMON_TERM_RATIO = 0.5
+
+# Upper bound on DP table cells before falling back to greedy selection
+_MAX_DP_CELLS = 2_000_000
+_MAX_DP_BUCKETS = 4096
+
+# Salient terms: capitalized words, words with digits, identifiers/paths
+_TERM_PATTERN = re.compile(
+    r"[A-Z][A-Za-z0-9_]{2,}"        # Names, CamelCase identifiers
+    r"|[\w$]*\d[\w,.$%-]*"           # Numbers, dates, amounts, versions
+    r"|\w+(?:[_./]\w+)+"             # snake_case, dotted names, paths
+)
+
+_STOP_TERMS = frozenset({
+    "The", "This", "That", "These", "Those", "What", "When", "Where",
+    "Which", "Who", "Why", "How", "Yes", "Great", "Sure", "Okay",
+    "Thanks", "Thank", "Please", "Let", "Here", "There", "And", "But",
+    "For", "With", "You", "Your", "Our", "Can", "Could", "Would",
+    "Should", "Will", "USER", "MODEL",
+})
+
+
+@dataclass
+class TurnScore:
+    """Value assessment for a single conversation turn."""
+
+    index: int
+    """Turn index (0-based)."""
+
+    tokens: int
+    """Estimated token count (the cost of keeping this turn)."""
+
+    references: int = 0
+    """Number of later turns that reference terms from this turn."""
+
+    tool_successes: int = 0
+    """Number of successful tool results in this turn."""
+
+    tool_errors: int = 0
+    """Number of failed tool results in this turn."""
+
+    has_plan_state: bool = False
+    """Whether this turn creates or updates plan/todo state."""
+
+    pinned: bool = False
+    """Whether this turn must be kept regardless of budget."""
+
+    value: float = 0.0
+    """Combined value score (higher = more worth keeping)."""
+
+    @property
+    def density(self) -> float:
+        """Value per token, used for greedy selection."""
+        return self.value / max(1, self.tokens)
+
+
+def _extract_terms(turn: Turn) -> Set[str]:
+    """Collect salient terms from all text and tool parts of a turn."""
+    terms: Set[str] = set()
+
+    for message in turn.contents:
+        for part in message.parts or []:
+            texts: List[str] = []
+            if part.text:
+                texts.append(part.text)
+            elif part.function_call:
+                fc = part.function_call
+                if fc.args:
+                    texts.append(str(fc.args))
+
+            for text in texts:
+                for match in _TERM_PATTERN.findall(text):
+                    term = match.rstrip(",.-")
+                    if len(term) >= 2 and term not in _STOP_TERMS:
+                        terms.add(term)
+
+    return terms
+
+
+def _tool_outcomes(turn: Turn, plan_tool_names: Iterable[str]) -> tuple:
+    """Count tool successes/errors and detect plan state in a turn.
+
+    Returns:
+        Tuple of (successes, errors, has_plan_state).
+    """
+    successes = 0
+    errors = 0
+    has_plan_state = False
+
+    for message in turn.contents:
+        for part in message.parts or []:
+            if part.function_call:
+                if part.function_call.name in plan_tool_names:
+                    has_plan_state = True
+            elif part.function_response:
+                fr = part.function_response
+                if fr.name in plan_tool_names:
+                    has_plan_state = True
+                # Provider-agnostic ToolResult uses 'result', SDK types 'response'
+                result = getattr(fr, 'result', None)
+                if result is None:
+                    result = getattr(fr, 'response', None)
+                failed = getattr(fr, 'is_error', False) or (
+                    isinstance(result, dict) and 'error' in result
+                )
+                if failed:
+                    errors += 1
+                else:
+                    successes += 1
+
+    return successes, errors, has_plan_state
+
+
+def score_turns(
+    turns: List[Turn],
+    pinned_indices: Optional[Iterable[int]] = None,
+    weights: Optional[Dict[str, float]] = None,
+    plan_tool_names: Optional[Iterable[str]] = None,
+) -> List[TurnScore]:
+    """Score each turn by how valuable it is to keep in context.
+
+    Args:
+        turns: Turns from split_into_turns().
+        pinned_indices: Turn indices that must never be evicted.
+        weights: Overrides for DEFAULT_VALUE_WEIGHTS.
+        plan_tool_names: Tool names that carry plan/todo state.
+
+    Returns:
+        List of TurnScore objects, one per turn, in turn order.
+    """
+    w = dict(DEFAULT_VALUE_WEIGHTS)
+    if weights:
+        w.update(weights)
+    plan_tools = frozenset(plan_tool_names or DEFAULT_PLAN_TOOL_NAMES)
+    pinned = set(pinned_indices or [])
+    total = len(turns)
+
+    # term -> positions (in turn order) of turns that mention it
+    term_turns: Dict[str, List[int]] = {}
+    for position, turn in enumerate(turns):
+        for term in _extract_terms(turn):
+            term_turns.setdefault(term, []).append(position)
+
+    max_occurrences = max(2, int(total * _COMMON_TERM_RATIO))
+
+    # For each turn, the set of later turns that reference any of its terms.
+    # A term "belongs" to the turn that introduced it (first occurrence).
+    referencing: List[Set[int]] = [set() for _ in range(total)]
+    for positions in term_turns.values():
+        if len(positions) < 2 or len(positions) > max_occurrences:
+            continue
+        referencing[positions[0]].update(positions[1:])
+
+    scores: List[TurnScore] = []
+    for position, turn in enumerate(turns):
+        successes, errors, has_plan_state = _tool_outcomes(turn, plan_tools)
+        score = TurnScore(
+            index=turn.index,
+            tokens=max(1, turn.estimated_tokens),
+            references=len(referencing[position]),
+            tool_successes=successes,
+            tool_errors=errors,
+            has_plan_state=has_plan_state,
+            pinned=turn.index in pinned,
+        )
+
+        value = (
+            w["base"]
+            + w["reference"] * score.references
+            + w["tool_success"] * successes
+            + w["tool_error"] * errors
+            + w["recency"] * ((position + 1) / total)
+        )
+        if has_plan_state:
+            value += w["plan_state"]
+
+        # Evictable turns always keep a small positive value so that spare
+        # budget is still used rather than left empty.
+        score.value = max(0.01, value)
+        scores.append(score)
+
+    return scores
+
+
+def _select_greedy(items: List[TurnScore], budget: int) -> Set[int]:
+    """Select items by value density until the budget is exhausted."""
+    selected: Set[int] = set()
+    remaining = budget
+    for item in sorted(items, key=lambda s: s.density, reverse=True):
+        if item.tokens <= remaining:
+            selected.add(item.index)
+            remaining -= item.tokens
+    return selected
+
+
+def _select_knapsack(items: List[TurnScore], budget: int) -> Set[int]:
+    """Solve 0/1 knapsack (maximize value, total tokens <= budget).
+
+    Token weights are scaled into at most _MAX_DP_BUCKETS buckets and
+    rounded up, so the selection never exceeds the real budget.
+    """
+    if budget <= 0 or not items:
+        return set()
+
+    # Everything fits - no need to choose
+    if sum(item.tokens for item in items) <= budget:
+        return {item.index for item in items}
+
+    resolution = max(1, math.ceil(budget / _MAX_DP_BUCKETS))
+    capacity = budget // resolution
+    weights = [math.ceil(item.tokens / resolution) for item in items]
+
+    if len(items) * (capacity + 1) > _MAX_DP_CELLS:
+        return _select_greedy(items, budget)
+
+    best = [0.0] * (capacity + 1)
+    taken: List[bytearray] = []
+    for item, weight in zip(items, weights):
+        row = bytearray(capacity + 1)
+        if weight <= capacity:
+            for c in range(capacity, weight - 1, -1):
+                candidate = best[c - weight] + item.value
+                if candidate > best[c]:
+                    best[c] = candidate
+                    row[c] = 1
+        taken.append(row)
+
+    # Reconstruct the chosen set
+    selected: Set[int] = set()
+    c = capacity
+    for i in range(len(items) - 1, -1, -1):
+        if taken[i][c]:
+            selected.add(items[i].index)
+            c -= weights[i]
+
+    return selected
+
+
+def plan_preserved_indices(
+    turns: List[Turn],
+    budget_tokens: int,
+    preserve_recent: int = 0,
+    pinned_indices: Optional[List[int]] = None,
+    weights: Optional[Dict[str, float]] = None,
+    plan_tool_names: Optional[Iterable[str]] = None,
+) -> set:
+    """Choose which turns to keep so that value is maximized within budget.
+
+    Recent and pinned turns are mandatory and are kept even if they alone
+    exceed the budget. The remaining budget is filled with the optional
+    turns that carry the most value.
+
+    Args:
+        turns: Turns from split_into_turns().
+        budget_tokens: Target estimated token count for kept turns.
+        preserve_recent: Number of recent turns that are always kept.
+        pinned_indices: Turn indices that are always kept.
+        weights: Overrides for DEFAULT_VALUE_WEIGHTS.
+        plan_tool_names: Tool names that carry plan/todo state.
+
+    Returns:
+        Set of turn indices that should not be collected.
+    """
+    mandatory = get_preserved_indices(len(turns), preserve_recent, pinned_indices)
+    scores = score_turns(turns, pinned_indices, weights, plan_tool_names)
+
+    mandatory_tokens = sum(s.tokens for s in scores if s.index in mandatory)
+    optional = [s for s in scores if s.index not in mandatory]
+
+    selected = _select_knapsack(optional, budget_tokens - mandatory_tokens)
+    return set(mandatory) | selected
+
+
+def resolve_budget_tokens(
+    turns: List[Turn],
+    preserved_by_recency: set,
+    options: Dict[str, Any],
+    context_usage: Optional[Dict[str, Any]] = None,
+) -> int:
+    """Determine the estimated-token budget for kept turns.
+
+    Resolution order:
+    1. options['target_tokens'] - absolute budget in estimated tokens
+    2. options['target_percent'] - percent of the context limit, converted
+       into estimator units using the ratio of estimated to reported tokens
+    3. Tokens the recency policy would keep (same footprint, better value)
+
+    Args:
+        turns: Turns from split_into_turns().
+        preserved_by_recency: Indices the recency policy would keep.
+        options: Plugin configuration.
+        context_usage: Current context window usage statistics.
+
+    Returns:
+        Budget in estimated tokens.
+    """
+    if options.get('target_tokens') is not None:
+        return int(options['target_tokens'])
+
+    estimated_total = sum(t.estimated_tokens for t in turns)
+    usage = context_usage or {}
+    target_percent = options.get('target_percent')
+    context_limit = usage.get('context_limit')
+
+    if target_percent is not None and context_limit:
+        reported_total = usage.get('total_tokens') or 0
+        ratio = estimated_total / reported_total if reported_total > 0 else 1.0
+        return int(context_limit * (target_percent / 100.0) * ratio)
+
+    return sum(
+        t.estimated_tokens for t in turns if t.index in preserved_by_recency
+    )
+
+
+def select_preserved_indices(
+    turns: List[Turn],
+    preserve_recent: int,
+    pinned_indices: Optional[List[int]],
+    options: Optional[Dict[str, Any]] = None,
+    context_usage: Optional[Dict[str, Any]] = None,
+) -> set:
+    """Select preserved turn indices according to the configured policy.
+
+    This is the eviction policy entry point for GC plugins. With the
+    default 'recent' policy it is equivalent to get_preserved_indices().
+
+    With the 'value' policy, preserve_recent only sizes the default budget
+    (the footprint the 'recent' policy would keep); the turns that are
+    always kept are the last 'min_recent_turns' turns plus pinned turns.
+
+    Args:
+        turns: Turns from split_into_turns().
+        preserve_recent: Number of recent turns to preserve.
+        pinned_indices: Additional indices to always preserve.
+        options: Plugin configuration with:
+            - eviction_policy: 'recent' (default) or 'value'
+            - min_recent_turns: int - Recent turns always kept (value
+              policy, default: 1)
+            - target_tokens: int - Absolute budget (value policy)
+            - target_percent: float - Target occupancy (value policy)
+            - value_weights: Dict[str, float] - Overrides for weights
+            - plan_tool_names: List[str] - Tools carrying plan state
+        context_usage: Current context window usage statistics.
+
+    Returns:
+        Set of turn indices that should not be collected.
+
+    Raises:
+        ValueError: If eviction_policy is not recognized.
+    """
+    options = options or {}
+    policy = options.get('eviction_policy', EVICTION_POLICY_RECENT)
+
+    by_recency = get_preserved_indices(len(turns), preserve_recent, pinned_indices)
+
+    if policy == EVICTION_POLICY_RECENT:
+        return by_recency
+
+    if policy != EVICTION_POLICY_VALUE:
+        raise ValueError(
+            f"Unknown eviction_policy '{policy}'. "
+            f"Expected '{EVICTION_POLICY_RECENT}' or '{EVICTION_POLICY_VALUE}'."
+        )
+
+    budget = resolve_budget_tokens(turns, by_recency, options, context_usage)
+    return plan_preserved_indices(
+        turns,
+        budget,
+        preserve_recent=options.get('min_recent_turns', DEFAULT_MIN_RECENT_TURNS),
+        pinned_indices=pinned_indices,
+        weights=options.get('value_weights'),
+        plan_tool_names=options.get('plan_tool_names'),
+    )
@@ -0,0 +1,267 @@
+"""Summary memoization for summarizing GC plugins.
+
+Summarizing GC plugins (gc_summarize, gc_hybrid) call an LLM to compress
+old turns. The exact same turns are often summarized again: after
+revert_to_turn, after resuming a session and re-triggering GC, and across
+benchmark runs. SummaryCache memoizes summaries keyed by a hash of the
+formatted turn text, the summarization prompt and the model, so repeated
+collections skip the summarizer call entirely.
+
+The cache is an LRU bounded by entry count and (optionally) total summary
+size. When given a path it is persisted as a JSON file, written atomically
+on every update. Processes sharing a path see each other's summaries: the
+file is re-read when it changed, on a miss and before each write, and its
+new entries are merged in. There is no file lock, so an entry written by
+another process between that re-read and the write can still be lost,
+which only costs one more summarizer call.
+
+Usage:
+    cache = SummaryCache(".jaato/gc_summary_cache.json", max_entries=256)
+    plugin.initialize({
+        "summarizer": my_summarizer,
+        "summary_cache": cache,
+        "summarizer_model": "gemini-2.5-flash",
+    })
+"""
+
+import hashlib
+import json
+import os
+import tempfile
+import threading
+from collections import OrderedDict
+from pathlib import Path
+from typing import Any, Dict, Optional, Union
+
+
+# Cache file format version
+SUMMARY_CACHE_VERSION = 1
+
+# Default bound on the number of cached summaries
+DEFAULT_MAX_ENTRIES = 256
+
+
+class SummaryCache:
+    """Size-bounded LRU cache of summaries, optionally persisted to disk."""
+
+    def __init__(
+        self,
+        path: Optional[Union[str, Path]] = None,
+        max_entries: int = DEFAULT_MAX_ENTRIES,
+        max_bytes: Optional[int] = None
+    ):
+        """Initialize the cache.
+
+        Args:
+            path: JSON file to persist the cache to. None keeps it in memory.
+            max_entries: Maximum number of cached summaries.
+            max_bytes: Optional bound on the total UTF-8 size of summaries.
+        """
+        self._path = Path(path) if path else None
+        self._max_entries = max(1, max_entries)
+        self._max_bytes = max_bytes
+        self._entries: "OrderedDict[str, str]" = OrderedDict()
+        self._total_bytes = 0
+        self._lock = threading.Lock()
+        self._hits = 0
+        self._misses = 0
+        self._file_stamp: Optional[tuple] = None  # (mtime_ns, size) last read or written
+
+        if self._path:
+            self._load()
+
+    @staticmethod
+    def make_key(
+        conversation: str,
+        prompt: Optional[str] = None,
+        model: Optional[str] = None
+    ) -> str:
+        """Build a cache key from the summarizer inputs.
+
+        Args:
+            conversation: Formatted turn text passed to the summarizer.
+            prompt: Summarization prompt template in use.
+            model: Identifier of the model producing the summary.
+
+        Returns:
+            Hex SHA-256 digest identifying this summarization request.
+        """
+        digest = hashlib.sha256()
+        for component in (model or "", prompt or "", conversation):
+            encoded = component.encode("utf-8")
+            # Length-prefix each component so boundaries are unambiguous
+            digest.update(len(encoded).to_bytes(8, "big"))
+            digest.update(encoded)
+        return digest.hexdigest()
+
+    def get(self, key: str) -> Optional[str]:
+        """Look up a summary, marking it as recently used.
+
+        Args:
+            key: Key from make_key().
+
+        Returns:
+            The cached summary, or None on a miss.
+        """
+        with self._lock:
+            summary = self._entries.get(key)
+            if summary is None and self._path:
+                # Another process may have cached it meanwhile
+                self._load()
+                summary = self._entries.get(key)
+            if summary is None:
+                self._misses += 1
+                return None
+            self._entries.move_to_end(key)
+            self._hits += 1
+            return summary
+
+    def put(self, key: str, summary: str) -> None:
+        """Store a summary, evicting least recently used entries if needed.
+
+        Args:
+            key: Key from make_key().
+            summary: Summary text to cache.
+        """
+        with self._lock:
+            if self._path:
+                self._load()  # Keep other processes' entries
+            previous = self._entries.pop(key, None)
+            if previous is not None:
+                self._total_bytes -= _size(previous)
+
+            self._entries[key] = summary
+            self._total_bytes += _size(summary)
+            self._evict()
+
+            if self._path:
+                self._save()
+
+    def clear(self) -> None:
+        """Remove all cached summaries."""
+        with self._lock:
+            self._entries.clear()
+            self._total_bytes = 0
+            if self._path:
+                self._save()
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def __contains__(self, key: str) -> bool:
+        return key in self._entries
+
+    @property
+    def stats(self) -> Dict[str, Any]:
+        """Cache statistics (entries, bytes, hits, misses)."""
+        return {
+            "entries": len(self._entries),
+            "bytes": self._total_bytes,
+            "hits": self._hits,
+            "misses": self._misses,
+        }
+
+    def _evict(self) -> None:
+        """Drop least recently used entries until within bounds."""
+        while len(self._entries) > self._max_entries:
+            _, summary = self._entries.popitem(last=False)
+            self._total_bytes -= _size(summary)
+
+        if self._max_bytes is not None:
+            # Always keep the newest entry, even if it alone is too large
+            while self._total_bytes > self._max_bytes and len(self._entries) > 1:
+                _, summary = self._entries.popitem(last=False)
+                self._total_bytes -= _size(summary)
+
+    def _load(self) -> None:
+        """Merge in the entries of the cache file if it changed since last read.
+
+        Entries not held yet are added as least recently used; unreadable
+        files are ignored.
+        """
+        stamp = self._stamp()
+        if stamp is None or stamp == self._file_stamp:
+            return
+
+        try:
+            with open(self._path, 'r', encoding='utf-8') as f:
+                data = json.load(f)
+        except (OSError, json.JSONDecodeError):
+            return
+        self._file_stamp = stamp
+
+        if not isinstance(data, dict) or data.get("version") != SUMMARY_CACHE_VERSION:
+            return
+
+        # Entries are stored least recently used first
+        for key, summary in reversed(data.get("entries", [])):
+            if key not in self._entries:
+                self._entries[key] = summary
+                self._entries.move_to_end(key, last=False)
+                self._total_bytes += _size(summary)
+        self._evict()
+
+    def _stamp(self) -> Optional[tuple]:
+        try:
+            stat = self._path.stat()
+        except OSError:
+            return None
+        return (stat.st_mtime_ns, stat.st_size)
+
+    def _save(self) -> None:
+        """Atomically write entries to the cache file."""
+        data = {
+            "version": SUMMARY_CACHE_VERSION,
+            "entries": list(self._entries.items()),
+        }
+
+        # A cache that cannot be written must never break garbage collection
+        try:
+            self._path.parent.mkdir(parents=True, exist_ok=True)
+            fd, tmp_path = tempfile.mkstemp(
+                dir=self._path.parent, prefix=self._path.name, suffix=".tmp"
+            )
+        except OSError:
+            return
+
+        try:
+            with os.fdopen(fd, 'w', encoding='utf-8') as f:
+                json.dump(data, f)
+            os.replace(tmp_path, self._path)
+            self._file_stamp = self._stamp()
+        except OSError:
+            try:
+                os.unlink(tmp_path)
+            except OSError:
+                pass
+
+
+def _size(summary: str) -> int:
+    """UTF-8 size of a summary in bytes."""
+    return len(summary.encode("utf-8"))
+
+
+def summary_cache_from_config(config: Dict[str, Any]) -> Optional[SummaryCache]:
+    """Build the summary cache requested by a GC plugin config.
+
+    Args:
+        config: Plugin configuration with either:
+            - summary_cache: SummaryCache - Shared cache instance
+            - summary_cache_path: str - Path for a persistent cache
+            - summary_cache_max_entries: int - Bound for a new cache
+
+    Returns:
+        The SummaryCache to use, or None if caching is not configured.
+    """
+    cache = config.get('summary_cache')
+    if cache is not None:
+        return cache
+
+    path = config.get('summary_cache_path')
+    if path:
+        return SummaryCache(
+            path,
+            max_entries=config.get('summary_cache_max_entries', DEFAULT_MAX_ENTRIES)
+        )
+
+    return None
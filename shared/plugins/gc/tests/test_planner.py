@@ -0,0 +1,240 @@
+"""Tests for value-aware GC eviction planning."""
+
+import pytest
+
+from shared.plugins.gc import (
+    GCConfig,
+    GCTriggerReason,
+    plan_preserved_indices,
+    score_turns,
+    select_preserved_indices,
+    split_into_turns,
+)
+from shared.plugins.gc.planner import _select_knapsack, TurnScore
+from shared.plugins.gc_truncate import create_plugin as create_truncate
+from shared.plugins.gc_hybrid import create_plugin as create_hybrid
+from jaato import Message, Part, Role, FunctionCall, ToolResult
+
+
+def make_message(role: str, text: str) -> Message:
+    """Helper to create Message objects."""
+    r = Role.USER if role == "user" else Role.MODEL
+    return Message(role=r, parts=[Part(text=text)])
+
+
+def make_history(texts: list) -> list:
+    """Create a history with one user+model pair per text."""
+    history = []
+    for i, text in enumerate(texts):
+        history.append(make_message("user", text))
+        history.append(make_message("model", f"Noted {i}."))
+    return history
+
+
+def make_tool_turn(user_text: str, tool_name: str, is_error: bool = False) -> list:
+    """Create a turn with a function call and its result."""
+    return [
+        make_message("user", user_text),
+        Message(role=Role.MODEL, parts=[
+            Part.from_function_call(FunctionCall(id="1", name=tool_name, args={}))
+        ]),
+        Message(role=Role.USER, parts=[
+            Part.from_function_response(ToolResult(
+                call_id="1", name=tool_name, result={"ok": True}, is_error=is_error
+            ))
+        ]),
+        make_message("model", "Done."),
+    ]
+
+
+class TestScoreTurns:
+    def test_empty(self):
+        assert score_turns([]) == []
+
+    def test_references_from_later_turns(self):
+        history = make_history([
+            "The project codename is Phoenix.",
+            "unrelated chatter",
+            "more unrelated chatter",
+            "How is Phoenix going?",
+            "small talk",
+            "Remind me about Phoenix",
+        ])
+        scores = score_turns(split_into_turns(history))
+
+        assert scores[0].references == 2
+        assert scores[1].references == 0
+        assert scores[0].value > scores[1].value
+
+    def test_tool_outcomes(self):
+        history = (
+            make_tool_turn("read it", "readFile")
+            + make_tool_turn("read again", "readFile", is_error=True)
+        )
+        scores = score_turns(split_into_turns(history))
+
+        assert scores[0].tool_successes == 1
+        assert scores[0].tool_errors == 0
+        assert scores[1].tool_successes == 0
+        assert scores[1].tool_errors == 1
+
+    def test_plan_state(self):
+        history = make_tool_turn("plan it", "createPlan") + make_history(["hi"])
+        scores = score_turns(split_into_turns(history))
+
+        assert scores[0].has_plan_state
+        assert not scores[1].has_plan_state
+
+    def test_custom_plan_tool_names(self):
+        history = make_tool_turn("plan it", "myPlanner")
+        scores = score_turns(split_into_turns(history), plan_tool_names=["myPlanner"])
+        assert scores[0].has_plan_state
+
+    def test_pinned_flag(self):
+        history = make_history(["a", "b"])
+        scores = score_turns(split_into_turns(history), pinned_indices=[1])
+        assert not scores[0].pinned
+        assert scores[1].pinned
+
+    def test_weights_override(self):
+        history = make_history(["a", "b"])
+        turns = split_into_turns(history)
+        default = score_turns(turns)
+        boosted = score_turns(turns, weights={"base": 10.0})
+        assert boosted[0].value > default[0].value
+
+
+class TestKnapsack:
+    def test_everything_fits(self):
+        items = [TurnScore(index=i, tokens=10, value=1.0) for i in range(3)]
+        assert _select_knapsack(items, 100) == {0, 1, 2}
+
+    def test_zero_budget(self):
+        items = [TurnScore(index=0, tokens=10, value=1.0)]
+        assert _select_knapsack(items, 0) == set()
+
+    def test_prefers_value_over_density(self):
+        # Greedy-by-density would take item 0 and then have no room for 1
+        items = [
+            TurnScore(index=0, tokens=6, value=7.0),
+            TurnScore(index=1, tokens=5, value=5.0),
+            TurnScore(index=2, tokens=5, value=5.0),
+        ]
+        assert _select_knapsack(items, 10) == {1, 2}
+
+    def test_never_exceeds_budget(self):
+        items = [TurnScore(index=i, tokens=97 + i, value=float(i % 5 + 1))
+                 for i in range(200)]
+        budget = 5000
+        selected = _select_knapsack(items, budget)
+        assert sum(items[i].tokens for i in selected) <= budget
+
+
+class TestPlanPreservedIndices:
+    def test_recent_and_pinned_always_kept(self):
+        history = make_history([f"message {i}" for i in range(10)])
+        turns = split_into_turns(history)
+
+        kept = plan_preserved_indices(
+            turns, budget_tokens=0, preserve_recent=2, pinned_indices=[3]
+        )
+        assert kept == {3, 8, 9}
+
+    def test_keeps_referenced_turn_over_filler(self):
+        history = make_history([
+            "Budget is $75,000 for Phoenix.",
+            "filler one",
+            "filler two",
+            "filler three",
+            "Is $75,000 enough for Phoenix?",
+        ])
+        turns = split_into_turns(history)
+        budget = turns[0].estimated_tokens + turns[4].estimated_tokens
+
+        kept = plan_preserved_indices(turns, budget_tokens=budget, preserve_recent=1)
+        assert 0 in kept
+        assert 4 in kept
+
+
+class TestSelectPreservedIndices:
+    def test_recent_policy_matches_default(self):
+        turns = split_into_turns(make_history([f"m {i}" for i in range(6)]))
+        kept = select_preserved_indices(turns, 2, [0], {})
+        assert kept == {0, 4, 5}
+
+    def test_unknown_policy(self):
+        turns = split_into_turns(make_history(["a"]))
+        with pytest.raises(ValueError):
+            select_preserved_indices(turns, 1, None, {"eviction_policy": "lru"})
+
+    def test_value_policy_default_budget_matches_recent_footprint(self):
+        turns = split_into_turns(make_history([f"m {i}" for i in range(8)]))
+        kept = select_preserved_indices(
+            turns, 2, None, {"eviction_policy": "value", "preserve_recent_turns": 2}
+        )
+        # Equal-sized turns: same footprint means same number of turns
+        assert len(kept) == 2
+
+    def test_target_percent(self):
+        turns = split_into_turns(make_history([f"m {i}" for i in range(10)]))
+        total = sum(t.estimated_tokens for t in turns)
+        usage = {"context_limit": total * 2, "total_tokens": total}
+
+        kept = select_preserved_indices(
+            turns, 1, None,
+            {"eviction_policy": "value", "target_percent": 25.0},
+            usage
+        )
+        kept_tokens = sum(t.estimated_tokens for t in turns if t.index in kept)
+        assert kept_tokens <= total // 2
+
+
+class TestPluginIntegration:
+    def test_truncate_value_policy_keeps_referenced_turn(self):
+        history = make_history([
+            "Our database is PostgreSQL 15.",
+            "filler one",
+            "filler two",
+            "filler three",
+            "filler four",
+            "Tune PostgreSQL 15 settings",
+        ])
+        plugin = create_truncate()
+        plugin.initialize({
+            "preserve_recent_turns": 1,
+            "eviction_policy": "value",
+            "target_tokens": 30,
+        })
+
+        new_history, result = plugin.collect(
+            history, {"percent_used": 90.0}, GCConfig(), GCTriggerReason.MANUAL
+        )
+
+        assert result.success
+        assert result.details["eviction_policy"] == "value"
+        assert new_history[0].parts[0].text == "Our database is PostgreSQL 15."
+        assert new_history[-2].parts[0].text == "Tune PostgreSQL 15 settings"
+
+    def test_hybrid_value_policy_summarizes_unkept(self):
+        history = make_history([
+            "Deploy target is Kubernetes.",
+            "filler one",
+            "filler two",
+            "Scale the Kubernetes cluster",
+        ])
+        plugin = create_hybrid()
+        plugin.initialize({
+            "preserve_recent_turns": 1,
+            "eviction_policy": "value",
+            "target_tokens": 20,
+            "summarizer": lambda text: "summary",
+        })
+
+        new_history, result = plugin.collect(
+            history, {"percent_used": 90.0}, GCConfig(), GCTriggerReason.MANUAL
+        )
+
+        assert result.success
+        assert result.details["turns_summarized"] == 2
+        assert "summary" in new_history[0].parts[0].text
+        assert new_history[1].parts[0].text == "Deploy target is Kubernetes."
@@ -0,0 +1,188 @@
+"""Tests for GC summary memoization."""
+
+import json
+
+import pytest
+
+from shared.plugins.gc import GCConfig, GCTriggerReason, SummaryCache
+from shared.plugins.gc_hybrid import create_plugin as create_hybrid
+from shared.plugins.gc_summarize import create_plugin as create_summarize
+from jaato import Message, Part, Role
+
+
+def make_history(num_turns: int) -> list:
+    """Create a history with N turns (user+model pairs)."""
+    history = []
+    for i in range(num_turns):
+        history.append(Message(role=Role.USER, parts=[Part(text=f"User message {i}")]))
+        history.append(Message(role=Role.MODEL, parts=[Part(text=f"Model response {i}")]))
+    return history
+
+
+class CountingSummarizer:
+    """Summarizer that records how often it is called."""
+
+    def __init__(self):
+        self.calls = 0
+
+    def __call__(self, conversation: str) -> str:
+        self.calls += 1
+        return f"Summary #{self.calls}"
+
+
+class TestSummaryCache:
+    def test_get_miss_and_hit(self):
+        cache = SummaryCache()
+        key = SummaryCache.make_key("text", "prompt", "model")
+
+        assert cache.get(key) is None
+        cache.put(key, "summary")
+        assert cache.get(key) == "summary"
+        assert cache.stats["hits"] == 1
+        assert cache.stats["misses"] == 1
+
+    def test_key_components(self):
+        base = SummaryCache.make_key("text", "prompt", "model")
+
+        assert base == SummaryCache.make_key("text", "prompt", "model")
+        assert base != SummaryCache.make_key("text2", "prompt", "model")
+        assert base != SummaryCache.make_key("text", "prompt2", "model")
+        assert base != SummaryCache.make_key("text", "prompt", "model2")
+        # Component boundaries are unambiguous
+        assert (SummaryCache.make_key("ab", "c", None)
+                != SummaryCache.make_key("b", "ac", None))
+
+    def test_lru_eviction_by_entries(self):
+        cache = SummaryCache(max_entries=2)
+        cache.put("a", "1")
+        cache.put("b", "2")
+        cache.get("a")  # 'b' is now least recently used
+        cache.put("c", "3")
+
+        assert "a" in cache
+        assert "b" not in cache
+        assert "c" in cache
+
+    def test_eviction_by_bytes(self):
+        cache = SummaryCache(max_bytes=10)
+        cache.put("a", "x" * 6)
+        cache.put("b", "y" * 6)
+
+        assert "a" not in cache
+        assert "b" in cache
+        assert cache.stats["bytes"] == 6
+
+    def test_persistence(self, tmp_path):
+        path = tmp_path / "cache.json"
+        cache = SummaryCache(path)
+        cache.put("a", "summary a")
+
+        reloaded = SummaryCache(path)
+        assert reloaded.get("a") == "summary a"
+
+    def test_corrupt_file_ignored(self, tmp_path):
+        path = tmp_path / "cache.json"
+        path.write_text("{not json")
+
+        cache = SummaryCache(path)
+        assert len(cache) == 0
+
+        cache.put("a", "1")
+        assert json.loads(path.read_text())["entries"] == [["a", "1"]]
+
+    def test_processes_sharing_a_path_merge_entries(self, tmp_path):
+        path = tmp_path / "cache.json"
+        first = SummaryCache(path)
+        second = SummaryCache(path)
+
+        first.put("a", "summary a")
+        second.put("b", "summary b")
+
+        assert second.get("a") == "summary a"
+        assert first.get("b") == "summary b"
+        reloaded = SummaryCache(path)
+        assert reloaded.get("a") == "summary a"
+        assert reloaded.get("b") == "summary b"
+
+    def test_clear(self, tmp_path):
+        cache = SummaryCache(tmp_path / "cache.json")
+        cache.put("a", "1")
+        cache.clear()
+
+        assert len(cache) == 0
+        assert len(SummaryCache(tmp_path / "cache.json")) == 0
+
+
+class TestPluginMemoization:
+    @pytest.mark.parametrize("create_plugin", [create_summarize, create_hybrid])
+    def test_repeated_collect_reuses_summary(self, create_plugin):
+        summarizer = CountingSummarizer()
+        plugin = create_plugin()
+        plugin.initialize({
+            "preserve_recent_turns": 2,
+            "summarizer": summarizer,
+            "summary_cache": SummaryCache(),
+        })
+        history = make_history(6)
+        config = GCConfig(preserve_recent_turns=2)
+
+        first, result1 = plugin.collect(history, {}, config, GCTriggerReason.MANUAL)
+        second, result2 = plugin.collect(history, {}, config, GCTriggerReason.MANUAL)
+
+        assert summarizer.calls == 1
+        assert not result1.details["summary_cache_hit"]
+        assert result2.details["summary_cache_hit"]
+        assert first[0].parts[0].text == second[0].parts[0].text
+
+    def test_different_model_misses(self):
+        summarizer = CountingSummarizer()
+        cache = SummaryCache()
+        history = make_history(6)
+        config = GCConfig(preserve_recent_turns=2)
+
+        for model in ("model-a", "model-b"):
+            plugin = create_summarize()
+            plugin.initialize({
+                "preserve_recent_turns": 2,
+                "summarizer": summarizer,
+                "summary_cache": cache,
+                "summarizer_model": model,
+            })
+            plugin.collect(history, {}, config, GCTriggerReason.MANUAL)
+
+        assert summarizer.calls == 2
+
+    def test_cache_path_shared_across_instances(self, tmp_path):
+        summarizer = CountingSummarizer()
+        history = make_history(6)
+        config = GCConfig(preserve_recent_turns=2)
+
+        for _ in range(2):
+            plugin = create_summarize()
+            plugin.initialize({
+                "preserve_recent_turns": 2,
+                "summarizer": summarizer,
+                "summary_cache_path": str(tmp_path / "cache.json"),
+            })
+            plugin.collect(history, {}, config, GCTriggerReason.MANUAL)
+
+        assert summarizer.calls == 1
+
+    def test_summarizer_error_not_cached(self):
+        def failing(conversation: str) -> str:
+            raise RuntimeError("boom")
+
+        cache = SummaryCache()
+        plugin = create_summarize()
+        plugin.initialize({
+            "preserve_recent_turns": 2,
+            "summarizer": failing,
+            "summary_cache": cache,
+        })
+
+        _, result = plugin.collect(
+            make_history(6), {}, GCConfig(preserve_recent_turns=2), GCTriggerReason.MANUAL
+        )
+
+        assert not result.success
+        assert len(cache) == 0
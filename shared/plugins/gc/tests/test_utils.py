@@ -12,6 +12,7 @@ from shared.plugins.gc.utils import (
     create_summary_message,
     create_gc_notification_message,
     get_preserved_indices,
+    compact_tool_results,
 )
 from jaato import Message, Part, Role, FunctionCall, ToolResult
 
@@ -242,3 +243,60 @@ class TestGetPreservedIndices:
         )
 
         assert preserved == {2}
+
+
+def make_tool_round(call_id: str, result: dict) -> list:
+    """Helper to create a function call + function response pair."""
+    return [
+        Message(role=Role.MODEL, parts=[
+            Part.from_function_call(FunctionCall(id=call_id, name="readFile", args={}))
+        ]),
+        Message(role=Role.USER, parts=[
+            Part.from_function_response(ToolResult(
+                call_id=call_id, name="readFile", result=result
+            ))
+        ]),
+    ]
+
+
+class TestCompactToolResults:
+    def test_compacts_older_rounds(self):
+        turn = [make_message("user", "Read files")]
+        for i in range(4):
+            turn.extend(make_tool_round(f"c{i}", {"content": "x" * 1000}))
+
+        new_turn, compacted = compact_tool_results(turn, preserve_recent_rounds=1)
+
+        assert compacted == 3
+        assert len(new_turn) == len(turn)
+        assert estimate_turn_tokens(new_turn) < estimate_turn_tokens(turn)
+        # Most recent round untouched, older ones keep call pairing
+        assert new_turn[-1] is turn[-1]
+        fr = new_turn[2].parts[0].function_response
+        assert fr.call_id == "c0"
+        assert fr.name == "readFile"
+        assert "removed by context GC" in fr.result["result"]
+
+    def test_does_not_modify_input(self):
+        turn = [make_message("user", "Read")] + make_tool_round("c0", {"content": "x"})
+
+        compact_tool_results(turn, preserve_recent_rounds=0)
+
+        assert turn[2].parts[0].function_response.result == {"content": "x"}
+
+    def test_nothing_to_compact(self):
+        turn = [make_message("user", "Read")] + make_tool_round("c0", {"content": "x"})
+
+        new_turn, compacted = compact_tool_results(turn, preserve_recent_rounds=2)
+
+        assert compacted == 0
+        assert new_turn == turn
+
+    def test_already_compacted_not_counted(self):
+        turn = [make_message("user", "Read")] + make_tool_round("c0", {"content": "x"})
+
+        once, first = compact_tool_results(turn, preserve_recent_rounds=0)
+        _, second = compact_tool_results(once, preserve_recent_rounds=0)
+
+        assert first == 1
+        assert second == 0
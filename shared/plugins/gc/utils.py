@@ -4,9 +4,9 @@ Provides helpers for turn splitting, token estimation, and history manipulation.
 """
 
 from dataclasses import dataclass
-from typing import List, Optional
+from typing import List, Optional, Tuple
 
-from ..model_provider.types import Message, Part, Role
+from ..model_provider.types import Message, Part, Role, ToolResult
 
 
 @dataclass
@@ -239,3 +239,67 @@ def get_preserved_indices(
                 preserved.add(idx)
 
     return preserved
+
+
+# Replacement result for tool outputs removed by intra-turn GC
+COMPACTED_TOOL_RESULT_TEMPLATE = (
+    "[Result of {name} removed by context GC to free space. "
+    "Call the tool again if this output is still needed.]"
+)
+
+
+def compact_tool_results(
+    messages: List[Message],
+    preserve_recent_rounds: int,
+    template: str = COMPACTED_TOOL_RESULT_TEMPLATE
+) -> Tuple[List[Message], int]:
+    """Replace the outputs of older tool-result rounds with short stubs.
+
+    Used to free space inside a single long-running turn, where turn-level
+    GC cannot help because the current turn is always preserved. Each
+    message carrying function_response parts is one round. The function
+    responses of all but the most recent rounds keep their call_id and
+    name (so call/response pairing stays valid for the provider) but have
+    their result and attachments replaced.
+
+    Args:
+        messages: Messages of the turn to compact.
+        preserve_recent_rounds: Number of most recent rounds left intact.
+        template: Stub text, formatted with the tool {name}.
+
+    Returns:
+        Tuple of (new_messages, results_compacted). Messages that are not
+        modified are shared with the input list.
+    """
+    round_positions = [
+        i for i, message in enumerate(messages)
+        if message.parts and any(p.function_response is not None for p in message.parts)
+    ]
+
+    if preserve_recent_rounds > 0:
+        round_positions = round_positions[:-preserve_recent_rounds]
+
+    new_messages = list(messages)
+    compacted = 0
+
+    for position in round_positions:
+        message = messages[position]
+        new_parts: List[Part] = []
+
+        for part in message.parts:
+            fr = part.function_response
+            if fr is None or fr.result == {"result": template.format(name=fr.name)}:
+                new_parts.append(part)
+                continue
+
+            new_parts.append(Part.from_function_response(ToolResult(
+                call_id=fr.call_id,
+                name=fr.name,
+                result={"result": template.format(name=fr.name)},
+                is_error=fr.is_error,
+            )))
+            compacted += 1
+
+        new_messages[position] = Message(role=message.role, parts=new_parts)
+
+    return new_messages, compacted
@@ -13,6 +13,8 @@ from typing import Any, Callable, Dict, List, Optional, Tuple
 from ..model_provider.types import Message
 
 from ..gc import (
+    EVICTION_POLICY_RECENT,
+    EVICTION_POLICY_VALUE,
     GCConfig,
     GCPlugin,
     GCResult,
@@ -21,7 +23,10 @@ from ..gc import (
     create_summary_message,
     estimate_history_tokens,
     flatten_turns,
+    select_preserved_indices,
+    SummaryCache,
     split_into_turns,
+    summary_cache_from_config,
 )
 
 
@@ -39,6 +44,10 @@ class HybridGCPlugin:
         summarizer: Callable (str) -> str for summarization (required for summarization)
         notify_on_gc: Whether to inject notification message (default: False)
         notification_template: Custom notification message template
+        summary_cache / summary_cache_path: Memoize summaries (see gc.summary_cache)
+        summarizer_model: Model identifier included in the summary cache key
+        eviction_policy: 'recent' (default) or 'value' (see gc.planner)
+        target_tokens / target_percent: Token budget for the 'value' policy
 
     When summarizer is not provided, this behaves like truncation but with
     configurable preservation of more recent turns.
@@ -63,6 +72,7 @@ class HybridGCPlugin:
         self._initialized = False
         self._config: Dict[str, Any] = {}
         self._summarizer: Optional[Callable[[str], str]] = None
+        self._summary_cache: Optional[SummaryCache] = None
 
     @property
     def name(self) -> str:
@@ -79,15 +89,23 @@ class HybridGCPlugin:
                 - summarizer: Callable[[str], str] - Summary generator function
                 - notify_on_gc: bool - Inject notification message
                 - notification_template: str - Custom notification template
+                - summary_cache: SummaryCache - Shared summary memoization cache
+                - summary_cache_path: str - Path for a persistent summary cache
+                - summarizer_model: str - Model identifier for summary cache keys
+                - eviction_policy: str - 'recent' (default) or 'value'
+                - target_tokens: int - Budget for kept turns ('value' policy)
+                - target_percent: float - Target occupancy ('value' policy)
         """
         self._config = config or {}
         self._summarizer = self._config.get('summarizer')
+        self._summary_cache = summary_cache_from_config(self._config)
         self._initialized = True
 
     def shutdown(self) -> None:
         """Clean up resources."""
         self._config = {}
         self._summarizer = None
+        self._summary_cache = None
         self._initialized = False
 
     def should_collect(
@@ -180,11 +198,28 @@ class HybridGCPlugin:
         middle_turns = turns[middle_start:recent_start]
         recent_turns = turns[recent_start:]
 
+        # Value-aware policy: the young generation is the set of most
+        # valuable turns (always including the recent ones) instead of a
+        # contiguous tail; everything else is collected.
+        policy = self._config.get('eviction_policy', EVICTION_POLICY_RECENT)
+        if policy == EVICTION_POLICY_VALUE:
+            kept_indices = select_preserved_indices(
+                turns,
+                preserve_recent,
+                config.pinned_turn_indices,
+                self._config,
+                context_usage
+            )
+            recent_turns = [t for t in turns if t.index in kept_indices]
+            ancient_turns = []
+            middle_turns = [t for t in turns if t.index not in kept_indices]
+
         # Process based on what we have
         new_history_parts: List[Message] = []
         turns_truncated = len(ancient_turns)
         turns_summarized = 0
         summary_text = ""
+        cache_hit = False
 
         # If we have middle turns and a summarizer, summarize them
         turns_to_summarize = ancient_turns + middle_turns
@@ -192,7 +227,7 @@ class HybridGCPlugin:
             conversation_text = self._format_turns_for_summary(turns_to_summarize)
 
             try:
-                summary_text = self._summarizer(conversation_text)
+                summary_text, cache_hit = self._summarize(conversation_text)
                 summary_content = create_summary_message(summary_text)
                 new_history_parts.append(summary_content)
                 turns_summarized = len(turns_to_summarize)
@@ -232,7 +267,9 @@ class HybridGCPlugin:
                 "turns_summarized": turns_summarized,
                 "preserve_recent": preserve_recent,
                 "summarize_middle": summarize_middle,
+                "eviction_policy": policy,
                 "had_summarizer": self._summarizer is not None,
+                "summary_cache_hit": cache_hit,
             }
         )
 
@@ -253,6 +290,31 @@ class HybridGCPlugin:
 
         return new_history_parts, result
 
+    def _summarize(self, conversation_text: str) -> Tuple[str, bool]:
+        """Summarize text, reusing a memoized summary when available.
+
+        Args:
+            conversation_text: Formatted turns to summarize.
+
+        Returns:
+            Tuple of (summary_text, cache_hit).
+        """
+        if self._summary_cache is None:
+            return self._summarizer(conversation_text), False
+
+        key = self._summary_cache.make_key(
+            conversation_text,
+            self._config.get('summarize_prompt'),
+            self._config.get('summarizer_model')
+        )
+        cached = self._summary_cache.get(key)
+        if cached is not None:
+            return cached, True
+
+        summary_text = self._summarizer(conversation_text)
+        self._summary_cache.put(key, summary_text)
+        return summary_text, False
+
     def _format_turns_for_summary(self, turns: List[Turn]) -> str:
         """Format turns into a text string for summarization.
 
@@ -21,8 +21,10 @@ from ..gc import (
     create_summary_message,
     estimate_history_tokens,
     flatten_turns,
-    get_preserved_indices,
+    select_preserved_indices,
+    SummaryCache,
     split_into_turns,
+    summary_cache_from_config,
 )
 
 
@@ -53,6 +55,10 @@ class SummarizeGCPlugin:
         max_summary_tokens: Target max tokens for summary (default: 500)
         notify_on_gc: Whether to inject notification message (default: False)
         notification_template: Custom notification message template
+        summary_cache / summary_cache_path: Memoize summaries (see gc.summary_cache)
+        summarizer_model: Model identifier included in the summary cache key
+        eviction_policy: 'recent' (default) or 'value' (see gc.planner)
+        target_tokens / target_percent: Token budget for the 'value' policy
 
     Example:
         plugin = SummarizeGCPlugin()
@@ -68,6 +74,7 @@ class SummarizeGCPlugin:
         self._initialized = False
         self._config: Dict[str, Any] = {}
         self._summarizer: Optional[Callable[[str], str]] = None
+        self._summary_cache: Optional[SummaryCache] = None
 
     @property
     def name(self) -> str:
@@ -85,6 +92,13 @@ class SummarizeGCPlugin:
                 - max_summary_tokens: int - Target max tokens for summary
                 - notify_on_gc: bool - Inject notification message (default: False)
                 - notification_template: str - Custom notification template
+                - summary_cache: SummaryCache - Shared summary memoization cache
+                - summary_cache_path: str - Path for a persistent summary cache
+                - summarizer_model: str - Model identifier for summary cache keys
+                - eviction_policy: str - 'recent' (default) or 'value'
+                - target_tokens: int - Budget for kept turns ('value' policy)
+                - target_percent: float - Target occupancy ('value' policy)
+                - value_weights: Dict[str, float] - Turn value weight overrides
 
         Note:
             A summarizer function MUST be provided for this plugin to work.
@@ -92,12 +106,14 @@ class SummarizeGCPlugin:
         """
         self._config = config or {}
         self._summarizer = self._config.get('summarizer')
+        self._summary_cache = summary_cache_from_config(self._config)
         self._initialized = True
 
     def shutdown(self) -> None:
         """Clean up resources."""
         self._config = {}
         self._summarizer = None
+        self._summary_cache = None
         self._initialized = False
 
     def should_collect(
@@ -178,10 +194,12 @@ class SummarizeGCPlugin:
         )
 
         # Get indices to preserve
-        preserved_indices = get_preserved_indices(
-            total_turns,
+        preserved_indices = select_preserved_indices(
+            turns,
             preserve_count,
-            config.pinned_turn_indices
+            config.pinned_turn_indices,
+            self._config,
+            context_usage
         )
 
         # Nothing to collect if all turns are preserved
@@ -210,7 +228,7 @@ class SummarizeGCPlugin:
         conversation_text = self._format_turns_for_summary(turns_to_summarize)
 
         try:
-            summary_text = self._summarizer(conversation_text)
+            summary_text, cache_hit = self._summarize(conversation_text)
         except Exception as e:
             return history, GCResult(
                 success=False,
@@ -242,7 +260,9 @@ class SummarizeGCPlugin:
                 "turns_after": len(turns_to_preserve) + 1,  # +1 for summary
                 "turns_summarized": len(turns_to_summarize),
                 "preserve_count": preserve_count,
+                "eviction_policy": self._config.get('eviction_policy', 'recent'),
                 "summary_length": len(summary_text),
+                "summary_cache_hit": cache_hit,
             }
         )
 
@@ -261,6 +281,31 @@ class SummarizeGCPlugin:
 
         return new_history, result
 
+    def _summarize(self, conversation_text: str) -> Tuple[str, bool]:
+        """Summarize text, reusing a memoized summary when available.
+
+        Args:
+            conversation_text: Formatted turns to summarize.
+
+        Returns:
+            Tuple of (summary_text, cache_hit).
+        """
+        if self._summary_cache is None:
+            return self._summarizer(conversation_text), False
+
+        key = self._summary_cache.make_key(
+            conversation_text,
+            self._config.get('summarize_prompt', DEFAULT_SUMMARIZE_PROMPT),
+            self._config.get('summarizer_model')
+        )
+        cached = self._summary_cache.get(key)
+        if cached is not None:
+            return cached, True
+
+        summary_text = self._summarizer(conversation_text)
+        self._summary_cache.put(key, summary_text)
+        return summary_text, False
+
     def _format_turns_for_summary(self, turns: List[Turn]) -> str:
         """Format turns into a text string for summarization.
 
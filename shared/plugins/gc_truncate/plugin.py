@@ -20,7 +20,7 @@ from ..gc import (
     create_gc_notification_message,
     estimate_history_tokens,
     flatten_turns,
-    get_preserved_indices,
+    select_preserved_indices,
     split_into_turns,
 )
 
@@ -37,6 +37,8 @@ class TruncateGCPlugin:
         preserve_recent_turns: Override default from GCConfig
         notify_on_gc: Whether to inject notification message (default: False)
         notification_template: Custom notification message template
+        eviction_policy: 'recent' (default) or 'value' (see gc.planner)
+        target_tokens / target_percent: Token budget for the 'value' policy
 
     Example:
         plugin = TruncateGCPlugin()
@@ -64,6 +66,10 @@ class TruncateGCPlugin:
                 - preserve_recent_turns: int - Override preservation count
                 - notify_on_gc: bool - Inject notification message (default: False)
                 - notification_template: str - Custom notification template
+                - eviction_policy: str - 'recent' (default) or 'value'
+                - target_tokens: int - Budget for kept turns ('value' policy)
+                - target_percent: float - Target occupancy ('value' policy)
+                - value_weights: Dict[str, float] - Turn value weight overrides
         """
         self._config = config or {}
         self._initialized = True
@@ -138,10 +144,12 @@ class TruncateGCPlugin:
         )
 
         # Get indices to preserve
-        preserved_indices = get_preserved_indices(
-            total_turns,
+        preserved_indices = select_preserved_indices(
+            turns,
             preserve_count,
-            config.pinned_turn_indices
+            config.pinned_turn_indices,
+            self._config,
+            context_usage
         )
 
         # Nothing to collect if all turns are preserved
@@ -182,6 +190,7 @@ class TruncateGCPlugin:
                 "turns_before": total_turns,
                 "turns_after": len(kept_turns),
                 "preserve_count": preserve_count,
+                "eviction_policy": self._config.get('eviction_policy', 'recent'),
                 "preserved_indices": list(preserved_indices),
             }
         )
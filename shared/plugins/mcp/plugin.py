@@ -12,6 +12,7 @@ from dataclasses import dataclass, field
 from datetime import datetime
 from typing import Dict, List, Any, Callable, Optional, Tuple
 
+from ... import json_codec
 from ..base import UserCommand, CommandParameter, CommandCompletion
 from ..model_provider.types import ToolSchema
 
@@ -754,11 +755,11 @@ Examples:
 
             # Validate it's actually JSON-RPC 2.0
             try:
-                data = json.loads(line)
+                data = json_codec.loads(line)
                 if not isinstance(data, dict) or data.get('jsonrpc') != '2.0':
                     log_event(LOG_DEBUG, "Filtered non-JSONRPC message", details=line[:100])
                     raise SkipMessage(line)
-            except json.JSONDecodeError:
+            except json_codec.JSONDecodeError:
                 log_event(LOG_DEBUG, "Filtered invalid JSON", details=line[:100])
                 raise SkipMessage(line)
 
@@ -1,7 +1,7 @@
 """Indexer for memory plugin keyword extraction and matching."""
 
 import re
-from typing import Dict, List, Set
+from typing import Dict, Iterable, List, Optional, Set
 
 from .models import Memory, MemoryMetadata
 
@@ -16,6 +16,35 @@ STOPWORDS = {
     "she", "it", "we", "they", "them", "their", "my", "your", "our"
 }
 
+# Length of the character n-grams indexed for substring matching
+NGRAM_SIZE = 3
+
+
+def _ngrams(text: str) -> Set[str]:
+    """Return the distinct character n-grams of a string."""
+    return {text[i:i + NGRAM_SIZE] for i in range(len(text) - NGRAM_SIZE + 1)}
+
+
+def _candidates(postings: Dict[str, Set[str]], text: str) -> Set[str]:
+    """Return the entries containing every n-gram of text.
+
+    Every entry containing text as a substring is among the candidates;
+    callers verify them. text must be at least NGRAM_SIZE long.
+    """
+    sets = []
+    for gram in _ngrams(text):
+        posting = postings.get(gram)
+        if not posting:
+            return set()
+        sets.append(posting)
+    sets.sort(key=len)
+    result = set(sets[0])
+    for posting in sets[1:]:
+        result &= posting
+        if not result:
+            break
+    return result
+
 
 class MemoryIndexer:
     """Keyword extraction and tag indexing for efficient memory lookup.
@@ -23,12 +52,20 @@ class MemoryIndexer:
     The indexer maintains in-memory data structures for fast matching:
     - tag_index: Maps tags to memory IDs
     - memories: Maps memory IDs to metadata (lightweight, no full content)
+    - tag_ngrams / description_ngrams: Character trigram inverted indexes
+      of tags and descriptions, so substring matches are found from a
+      few posting lists instead of scanning every tag
     """
 
     def __init__(self):
         """Initialize empty index."""
         self._tag_index: Dict[str, List[str]] = {}  # tag -> [memory_id, ...]
         self._memories: Dict[str, MemoryMetadata] = {}  # id -> metadata
+        self._tag_ngrams: Dict[str, Set[str]] = {}  # trigram -> {tag, ...}
+        self._description_ngrams: Dict[str, Set[str]] = {}  # trigram -> {memory_id, ...}
+        self._descriptions: Dict[str, str] = {}  # id -> lowercase description
+        self._max_tag_length = 0
+        self._removed = 0  # Memories removed since description postings were rebuilt
 
     def build_index(self, memories: List[Memory]) -> None:
         """Build index from existing memories.
@@ -45,12 +82,17 @@ class MemoryIndexer:
         Args:
             memory: Memory object to index
         """
+        # Re-indexing an updated memory: drop its old tags first
+        if memory.id in self._memories:
+            self.remove_memory(memory.id)
+
         # Store lightweight metadata
         metadata = MemoryMetadata(
             id=memory.id,
             description=memory.description,
             tags=memory.tags,
-            timestamp=memory.timestamp
+            timestamp=memory.timestamp,
+            expires_at=memory.expires_at
         )
         self._memories[memory.id] = metadata
 
@@ -59,9 +101,56 @@ class MemoryIndexer:
             tag_lower = tag.lower()
             if tag_lower not in self._tag_index:
                 self._tag_index[tag_lower] = []
+                self._max_tag_length = max(self._max_tag_length, len(tag_lower))
+                for gram in _ngrams(tag_lower):
+                    self._tag_ngrams.setdefault(gram, set()).add(tag_lower)
             if memory.id not in self._tag_index[tag_lower]:
                 self._tag_index[tag_lower].append(memory.id)
 
+        # Index description trigrams (candidates are verified against
+        # _descriptions, so stale postings of a re-indexed memory are harmless)
+        description = memory.description.lower()
+        self._descriptions[memory.id] = description
+        for gram in _ngrams(description):
+            self._description_ngrams.setdefault(gram, set()).add(memory.id)
+
+    def remove_memory(self, memory_id: str) -> None:
+        """Remove a memory from the index.
+
+        Args:
+            memory_id: ID of the memory to remove
+        """
+        metadata = self._memories.pop(memory_id, None)
+        if metadata is None:
+            return
+        self._descriptions.pop(memory_id, None)
+        for tag in metadata.tags:
+            tag_lower = tag.lower()
+            ids = self._tag_index.get(tag_lower)
+            if ids is None or memory_id not in ids:
+                continue
+            ids.remove(memory_id)
+            if not ids:
+                del self._tag_index[tag_lower]
+                for gram in _ngrams(tag_lower):
+                    tags = self._tag_ngrams.get(gram)
+                    if tags is not None:
+                        tags.discard(tag_lower)
+                        if not tags:
+                            del self._tag_ngrams[gram]
+        # Description postings of the memory are left for verification to
+        # skip; drop them all once removed memories dominate
+        self._removed += 1
+        if self._removed > len(self._memories):
+            self._rebuild_description_ngrams()
+
+    def _rebuild_description_ngrams(self) -> None:
+        self._description_ngrams.clear()
+        for memory_id, description in self._descriptions.items():
+            for gram in _ngrams(description):
+                self._description_ngrams.setdefault(gram, set()).add(memory_id)
+        self._removed = 0
+
     def extract_keywords(self, prompt: str) -> List[str]:
         """Extract potential keywords from a prompt.
 
@@ -89,13 +178,15 @@ class MemoryIndexer:
         return keywords
 
     def find_matches(self, keywords: List[str], limit: int = 5) -> List[MemoryMetadata]:
-        """Find memories with tags matching the provided keywords.
+        """Find memories with tags or descriptions matching the keywords.
 
         Matching strategy:
         1. Exact tag matches (keyword == tag)
         2. Partial matches (keyword in tag or tag in keyword)
+        3. Description matches (keyword in description)
 
-        Results are sorted by recency (most recent first).
+        Tag matches come first, then description-only matches, each
+        sorted by recency (most recent first).
 
         Args:
             keywords: List of keywords to match against tags
@@ -104,34 +195,60 @@ class MemoryIndexer:
         Returns:
             List of MemoryMetadata objects (lightweight, no full content)
         """
-        matched_ids: Set[str] = set()
-
         # Normalize keywords to lowercase for matching
-        keywords_lower = [kw.lower() for kw in keywords]
+        keywords_lower = {kw.lower() for kw in keywords if kw}
+
+        tag_ids: Set[str] = set()
+        for tag in self._matching_tags(keywords_lower):
+            tag_ids.update(self._tag_index[tag])
 
-        # Exact tag matches first
+        description_ids: Set[str] = set()
         for kw in keywords_lower:
-            if kw in self._tag_index:
-                matched_ids.update(self._tag_index[kw])
-
-        # Partial matches (substring matching)
-        for tag in self._tag_index:
-            for kw in keywords_lower:
-                # Check if keyword is substring of tag or vice versa
-                if kw in tag or tag in kw:
-                    matched_ids.update(self._tag_index[tag])
-                    break  # Don't need to check other keywords for this tag
-
-        # Get metadata and sort by recency (newest first)
-        matches = [
-            self._memories[mid]
-            for mid in matched_ids
-            if mid in self._memories
-        ]
-        matches.sort(key=lambda m: m.timestamp, reverse=True)
+            if len(kw) < NGRAM_SIZE:
+                continue
+            description_ids.update(
+                mid for mid in _candidates(self._description_ngrams, kw)
+                if kw in self._descriptions.get(mid, "")
+            )
+        description_ids -= tag_ids
+
+        matches = []
+        for ids in (tag_ids, description_ids):
+            # Get metadata and sort by recency (newest first)
+            group = [self._memories[mid] for mid in ids if mid in self._memories]
+            group.sort(key=lambda m: m.timestamp, reverse=True)
+            matches.extend(group)
 
         return matches[:limit]
 
+    def _matching_tags(self, keywords: Iterable[str]) -> Set[str]:
+        """Return the tags equal to, containing or contained in a keyword."""
+        tags: Set[str] = set()
+        for kw in keywords:
+            # Tags within the keyword: look up each of its substrings
+            longest = min(len(kw), self._max_tag_length)
+            for size in range(1, longest + 1):
+                for start in range(len(kw) - size + 1):
+                    part = kw[start:start + size]
+                    if part in self._tag_index:
+                        tags.add(part)
+
+            # Tags containing the keyword: trigram candidates, verified
+            if len(kw) >= NGRAM_SIZE:
+                candidates = _candidates(self._tag_ngrams, kw)
+            else:
+                candidates = self._tag_index.keys()
+            tags.update(tag for tag in candidates if kw in tag)
+        return tags
+
+    def get_metadata(self, memory_id: str) -> Optional[MemoryMetadata]:
+        """Return the metadata of an indexed memory, or None."""
+        return self._memories.get(memory_id)
+
+    def find_all(self) -> List[MemoryMetadata]:
+        """Return the metadata of every indexed memory."""
+        return list(self._memories.values())
+
     def get_all_tags(self) -> List[str]:
         """Return all unique tags in the index.
 
@@ -152,3 +269,8 @@ class MemoryIndexer:
         """Clear all index data."""
         self._tag_index.clear()
         self._memories.clear()
+        self._tag_ngrams.clear()
+        self._description_ngrams.clear()
+        self._descriptions.clear()
+        self._max_tag_length = 0
+        self._removed = 0
@@ -0,0 +1,147 @@
+"""Access statistics, expiry and eviction for memories."""
+
+import os
+from datetime import datetime
+from pathlib import Path
+from typing import Dict, Iterable, List, Optional, Tuple
+
+from ... import json_codec
+from .models import MemoryMetadata
+
+
+# Statistics file name suffix (next to the JSONL file)
+STATS_SUFFIX = ".stats"
+
+# Default age (days since last access) at which a memory's eviction
+# score is halved
+DEFAULT_EVICTION_HALF_LIFE_DAYS = 30.0
+
+# Write the statistics file after this many unsaved accesses
+_SAVE_EVERY = 32
+
+
+def _parse_time(timestamp: Optional[str]) -> Optional[datetime]:
+    if not timestamp:
+        return None
+    try:
+        return datetime.fromisoformat(timestamp)
+    except ValueError:
+        return None
+
+
+class AccessStats:
+    """Retrieval counts and times of memories.
+
+    Kept apart from the memory lines so recording an access does not
+    rewrite the memory. Held in memory and written as one small JSON
+    document (``<store>.stats``) every few accesses and on save(); when
+    several processes share a store, the last one to write wins.
+    """
+
+    def __init__(self, store_path: Path):
+        """Initialize and load the statistics.
+
+        Args:
+            store_path: Path of the memory JSONL file.
+        """
+        self.path = Path(store_path).with_name(Path(store_path).name + STATS_SUFFIX)
+        self._stats: Dict[str, Tuple[int, str]] = {}  # id -> (hits, last accessed)
+        self._unsaved = 0
+        try:
+            data = json_codec.loads(self.path.read_bytes())
+            self._stats = {mid: (int(hits), last) for mid, (hits, last) in data.items()}
+        except (FileNotFoundError, json_codec.JSONDecodeError, AttributeError, TypeError, ValueError):
+            pass
+
+    def get(self, memory_id: str) -> Optional[Tuple[int, str]]:
+        """Return (hits, last accessed ISO timestamp) of a memory, or None."""
+        return self._stats.get(memory_id)
+
+    def record(self, memory_id: str, hits: int, when: str) -> None:
+        """Record a memory's retrieval count and time."""
+        self._stats[memory_id] = (hits, when)
+        self._unsaved += 1
+        if self._unsaved >= _SAVE_EVERY:
+            self.save()
+
+    def remove(self, memory_id: str) -> None:
+        """Forget a deleted memory's statistics."""
+        if self._stats.pop(memory_id, None) is not None:
+            self._unsaved += 1
+
+    def save(self) -> None:
+        """Write the statistics file if there are unsaved changes."""
+        if not self._unsaved:
+            return
+        tmp = self.path.with_name(self.path.name + ".tmp")
+        tmp.write_bytes(json_codec.dumps_document(self._stats))
+        os.replace(tmp, self.path)
+        self._unsaved = 0
+
+
+def is_expired(expires_at: Optional[str], now: datetime) -> bool:
+    """Whether a memory's expiry time (ISO timestamp or None) has passed."""
+    expiry = _parse_time(expires_at)
+    return expiry is not None and expiry <= now
+
+
+def eviction_score(
+    hits: int,
+    last_used: Optional[str],
+    created: str,
+    now: datetime,
+    half_life_days: float = DEFAULT_EVICTION_HALF_LIFE_DAYS
+) -> float:
+    """Score how much a memory is worth keeping (LFU/LRU hybrid).
+
+    The retrieval count (frequency) is discounted by the time since the
+    memory was last retrieved, or created if never (recency): a memory
+    retrieved often long ago loses out to one retrieved recently.
+
+    Returns:
+        (1 + hits) * 0.5 ** (idle days / half_life_days)
+    """
+    since = _parse_time(last_used) or _parse_time(created)
+    idle_days = max((now - since).total_seconds() / 86400, 0.0) if since else 0.0
+    return (1 + hits) * 0.5 ** (idle_days / half_life_days)
+
+
+def select_evictions(
+    memories: Iterable[MemoryMetadata],
+    stats: AccessStats,
+    max_memories: Optional[int],
+    now: datetime,
+    half_life_days: float = DEFAULT_EVICTION_HALF_LIFE_DAYS
+) -> List[Tuple[str, str]]:
+    """Choose the memories to archive.
+
+    Args:
+        memories: Metadata of every stored memory.
+        stats: Access statistics of the memories.
+        max_memories: Number of memories to keep at most (None = no limit).
+        now: Current time.
+        half_life_days: Recency half-life of eviction_score.
+
+    Returns:
+        List of (memory_id, reason): expired memories ('expired'), then
+        the lowest scoring ones above max_memories ('evicted').
+    """
+    selected = []
+    live = []
+    for metadata in memories:
+        if is_expired(metadata.expires_at, now):
+            selected.append((metadata.id, "expired"))
+        else:
+            live.append(metadata)
+
+    if max_memories is not None and len(live) > max_memories:
+        def score(metadata: MemoryMetadata) -> Tuple[float, str]:
+            hits, last_used = stats.get(metadata.id) or (0, None)
+            return (
+                eviction_score(hits, last_used, metadata.timestamp, now, half_life_days),
+                metadata.timestamp
+            )
+
+        live.sort(key=score)
+        selected.extend((m.id, "evicted") for m in live[:len(live) - max_memories])
+    return selected
@@ -16,6 +16,8 @@ class Memory:
         timestamp: ISO format timestamp when memory was created
         usage_count: Number of times this memory has been retrieved
         last_accessed: ISO format timestamp of last retrieval (optional)
+        expires_at: ISO format timestamp after which the memory is
+            archived (optional, no expiry if None)
     """
     id: str
     content: str
@@ -24,6 +26,7 @@ class Memory:
     timestamp: str
     usage_count: int = 0
     last_accessed: Optional[str] = None
+    expires_at: Optional[str] = None
 
 
 @dataclass
@@ -37,8 +40,10 @@ class MemoryMetadata:
         description: Brief summary of what this memory contains
         tags: Keywords for retrieval and matching
         timestamp: ISO format timestamp when memory was created
+        expires_at: ISO format timestamp when memory expires (optional)
     """
     id: str
     description: str
     tags: List[str]
     timestamp: str
+    expires_at: Optional[str] = None
@@ -1,13 +1,15 @@
 """Memory plugin for model self-curated persistent memory across sessions."""
 
-from datetime import datetime
-from typing import Any, Callable, Dict, List, Optional
+from datetime import datetime, timedelta
+from typing import Any, Callable, Dict, List, Optional, Tuple
 
-from ..base import PromptEnrichmentResult
+from ..base import CommandCompletion, PromptEnrichmentResult, UserCommand
 from ..model_provider.types import ToolSchema
 from .indexer import MemoryIndexer
+from .lifecycle import DEFAULT_EVICTION_HALF_LIFE_DAYS, is_expired, select_evictions
 from .models import Memory
-from .storage import MemoryStorage
+from .storage import DEFAULT_SEMANTIC_WEIGHT, MemoryStorage
+from .vectors import DEFAULT_DIMENSIONS
 
 
 class MemoryPlugin:
@@ -28,6 +30,9 @@ class MemoryPlugin:
         self._name = "memory"
         self._storage: Optional[MemoryStorage] = None
         self._indexer: Optional[MemoryIndexer] = None
+        self._max_memories: Optional[int] = None
+        self._default_ttl_days: Optional[float] = None
+        self._eviction_half_life_days = DEFAULT_EVICTION_HALF_LIFE_DAYS
 
     @property
     def name(self) -> str:
@@ -41,21 +46,52 @@ class MemoryPlugin:
             config: Optional configuration dict with keys:
                 - storage_path: Path to JSONL file (default: .jaato/memories.jsonl)
                 - enrichment_limit: Max hints to show in prompt (default: 5)
+                - field_weights: BM25 weights of the "tags", "description"
+                  and "content" fields (default: 3.0, 2.0, 1.0)
+                - recency_half_life_days: Half-life of the ranking boost for
+                  recent memories (default: 30, None disables it)
+                - semantic_search: Also rank by similarity of hashed feature
+                  vectors, offline (default: False, requires numpy)
+                - semantic_weight: Share of the score given to vector
+                  similarity (default: 0.5)
+                - vector_dimensions: Hash buckets per vector (default: 1024)
+                - max_memories: Memories to keep at most; the coldest ones
+                  are archived (default: None, no limit)
+                - default_ttl_days: Expiry of memories stored without a
+                  ttl_days argument (default: None, never)
+                - eviction_half_life_days: Idle time that halves a memory's
+                  eviction score (default: 30)
         """
         config = config or {}
         storage_path = config.get("storage_path", ".jaato/memories.jsonl")
 
-        self._storage = MemoryStorage(storage_path)
+        self._storage = MemoryStorage(
+            storage_path,
+            field_weights=config.get("field_weights"),
+            recency_half_life_days=config.get("recency_half_life_days", 30.0),
+            semantic_search=config.get("semantic_search", False),
+            semantic_weight=config.get("semantic_weight", DEFAULT_SEMANTIC_WEIGHT),
+            vector_dimensions=config.get("vector_dimensions", DEFAULT_DIMENSIONS)
+        )
         self._indexer = MemoryIndexer()
 
+        self._max_memories = config.get("max_memories")
+        self._default_ttl_days = config.get("default_ttl_days")
+        self._eviction_half_life_days = config.get(
+            "eviction_half_life_days", DEFAULT_EVICTION_HALF_LIFE_DAYS
+        )
+
         # Build index from existing memories
         existing_memories = self._storage.load_all()
         self._indexer.build_index(existing_memories)
+        self._enforce_limits()
 
     def shutdown(self) -> None:
         """Shutdown the plugin and clean up resources."""
         if self._indexer:
             self._indexer.clear()
+        if self._storage:
+            self._storage.close()
         self._storage = None
         self._indexer = None
 
@@ -98,6 +134,13 @@ class MemoryPlugin:
                                 "Keywords for retrieval. Use specific, searchable terms "
                                 "(e.g., ['authentication', 'oauth', 'jwt'] not ['auth stuff'])"
                             )
+                        },
+                        "ttl_days": {
+                            "type": "number",
+                            "description": (
+                                "Optional: days after which the memory expires, for "
+                                "information that will go stale (e.g., a release date)"
+                            )
                         }
                     },
                     "required": ["content", "description", "tags"]
@@ -150,6 +193,8 @@ class MemoryPlugin:
             "store_memory": self._execute_store,
             "retrieve_memories": self._execute_retrieve,
             "list_memory_tags": self._execute_list_tags,
+            # User commands
+            "memory": self.execute_memory_command,
         }
 
     def get_system_instructions(self) -> Optional[str]:
@@ -180,21 +225,138 @@ class MemoryPlugin:
         """Return list of auto-approved tools.
 
         All memory tools are safe - read-only or self-directed writes.
+        The 'memory' user command is invoked directly by the user.
 
         Returns:
             List of tool names that don't require permission
         """
-        return ["store_memory", "retrieve_memories", "list_memory_tags"]
+        return ["store_memory", "retrieve_memories", "list_memory_tags", "memory"]
+
+    def get_user_commands(self) -> List[UserCommand]:
+        """Return user-facing commands for memory store maintenance."""
+        return [
+            UserCommand(
+                name="memory",
+                description="Manage stored memories: stats, evict, forget <memory_id>",
+                share_with_model=False,
+            )
+        ]
+
+    def get_command_completions(
+        self, command: str, args: List[str]
+    ) -> List[CommandCompletion]:
+        """Return completion options for memory command arguments."""
+        if command != "memory":
+            return []
+
+        subcommands = [
+            CommandCompletion("stats", "Show memory counts and most used memories"),
+            CommandCompletion("evict", "Archive expired memories and those over the limit"),
+            CommandCompletion("forget", "Archive a memory by ID"),
+        ]
+        if not args:
+            return subcommands
+        if len(args) == 1:
+            partial = args[0].lower()
+            return [c for c in subcommands if c.value.startswith(partial)]
+        if len(args) == 2 and args[0].lower() == "forget" and self._indexer:
+            return [
+                CommandCompletion(m.id, m.description)
+                for m in self._indexer.find_all()
+                if m.id.startswith(args[1])
+            ]
+        return []
 
-    def get_user_commands(self) -> List:
-        """Return user-facing commands.
+    def execute_memory_command(self, args: Dict[str, Any]) -> str:
+        """Execute the memory user command.
 
-        Memory plugin is model-driven, no direct user commands needed.
+        Subcommands:
+            stats               - Show memory counts and most used memories
+            evict               - Archive expired memories and the coldest
+                                  ones above max_memories
+            forget <memory_id>  - Archive a memory
+
+        Args:
+            args: Dict with 'args' key containing list of command arguments
 
         Returns:
-            Empty list
+            Formatted string output for display to user
         """
-        return []
+        if not self._storage or not self._indexer:
+            return "Memory plugin not initialized"
+
+        cmd_args = args.get("args", [])
+        subcommand = cmd_args[0].lower() if cmd_args else "stats"
+
+        if subcommand == "stats":
+            return self._memory_stats()
+        elif subcommand == "evict":
+            archived = self._enforce_limits()
+            if not archived:
+                return "No memories to archive"
+            expired = sum(1 for _, reason in archived if reason == "expired")
+            return (
+                f"Archived {len(archived)} memories ({expired} expired, "
+                f"{len(archived) - expired} over the limit) to {self._storage.archive_path}"
+            )
+        elif subcommand == "forget":
+            if len(cmd_args) < 2:
+                return "Usage: memory forget <memory_id>"
+            memory_id = cmd_args[1]
+            if not self._storage.archive(memory_id, "forgotten"):
+                return f"Memory not found: {memory_id}"
+            self._indexer.remove_memory(memory_id)
+            return f"Archived memory {memory_id} to {self._storage.archive_path}"
+        else:
+            return (
+                f"Unknown subcommand: {subcommand}\n"
+                "Usage: memory [stats|evict|forget <memory_id>]"
+            )
+
+    def _memory_stats(self) -> str:
+        memories = self._indexer.find_all()
+        now = datetime.now()
+        expired = sum(1 for m in memories if is_expired(m.expires_at, now))
+        limit = self._max_memories if self._max_memories is not None else "none"
+
+        lines = [
+            f"Memories: {len(memories)} (limit: {limit}, expired: {expired})",
+            f"Storage: {self._storage.path} "
+            f"({self._storage.garbage_ratio():.0%} superseded lines)",
+        ]
+        used = []
+        for m in memories:
+            stats = self._storage.stats.get(m.id)
+            if stats is not None:
+                used.append((stats[0], stats[1], m))
+        used.sort(key=lambda item: item[0], reverse=True)
+        if used:
+            lines.append("Most retrieved:")
+            for hits, last, m in used[:5]:
+                lines.append(f"  {m.id}: {hits} retrievals, last {last} - {m.description}")
+        return "\n".join(lines)
+
+    def _enforce_limits(self) -> List[Tuple[str, str]]:
+        """Archive expired memories and the coldest ones above max_memories.
+
+        Returns:
+            List of (memory_id, reason) of archived memories
+        """
+        if not self._storage or not self._indexer:
+            return []
+        selected = select_evictions(
+            self._indexer.find_all(),
+            self._storage.stats,
+            self._max_memories,
+            datetime.now(),
+            self._eviction_half_life_days,
+        )
+        archived = []
+        for memory_id, reason in selected:
+            if self._storage.archive(memory_id, reason):
+                archived.append((memory_id, reason))
+            self._indexer.remove_memory(memory_id)
+        return archived
 
     # ===== Prompt Enrichment Protocol =====
 
@@ -210,8 +372,9 @@ class MemoryPlugin:
         """Analyze prompt and inject hints about available memories.
 
         This is the key method that:
-        1. Extracts keywords/concepts from the user prompt
-        2. Queries the index for matching memories
+        1. Ranks memories against the prompt (BM25, plus vector
+           similarity with semantic search)
+        2. Adds tag/description keyword matches the ranking missed
         3. Injects lightweight hints (NOT full content)
 
         Args:
@@ -226,11 +389,23 @@ class MemoryPlugin:
                 metadata={"error": "Plugin not initialized"}
             )
 
-        # Extract potential keywords
-        keywords = self._indexer.extract_keywords(prompt)
-
-        # Find matching memories (just metadata, not full content)
-        matches = self._indexer.find_matches(keywords, limit=5)
+        limit = 5
+
+        # Ranked matches first, then partial keyword matches (just
+        # metadata, not full content)
+        now = datetime.now()
+        matches = []
+        for mid, _ in self._storage.rank(prompt, limit=limit):
+            metadata = self._indexer.get_metadata(mid)
+            if metadata is not None and not is_expired(metadata.expires_at, now):
+                matches.append(metadata)
+        if len(matches) < limit:
+            keywords = self._indexer.extract_keywords(prompt)
+            ranked_ids = {m.id for m in matches}
+            for metadata in self._indexer.find_matches(keywords, limit=limit):
+                if (metadata.id not in ranked_ids and not is_expired(metadata.expires_at, now)
+                        and len(matches) < limit):
+                    matches.append(metadata)
 
         if not matches:
             return PromptEnrichmentResult(
@@ -274,14 +449,19 @@ class MemoryPlugin:
                 "message": "Memory plugin not initialized"
             }
 
+        now = datetime.now()
+        ttl_days = args.get("ttl_days", self._default_ttl_days)
+        expires_at = (now + timedelta(days=ttl_days)).isoformat() if ttl_days else None
+
         # Create memory object
         memory = Memory(
-            id=f"mem_{datetime.now().strftime('%Y%m%d_%H%M%S_%f')[:20]}",
+            id=f"mem_{now.strftime('%Y%m%d_%H%M%S_%f')[:20]}",
             content=args["content"],
             description=args["description"],
             tags=args["tags"],
-            timestamp=datetime.now().isoformat(),
-            usage_count=0
+            timestamp=now.isoformat(),
+            usage_count=0,
+            expires_at=expires_at
         )
 
         # Save to storage
@@ -290,6 +470,9 @@ class MemoryPlugin:
         # Update index
         self._indexer.index_memory(memory)
 
+        # Keep the store within max_memories
+        self._enforce_limits()
+
         return {
             "status": "success",
             "memory_id": memory.id,
@@ -315,8 +498,19 @@ class MemoryPlugin:
         tags = args["tags"]
         limit = args.get("limit", 3)
 
-        # Search storage by tags
-        memories = self._storage.search_by_tags(tags, limit=limit)
+        # Search storage by tags (ranked). Expired hits are archived and
+        # the search repeated, so they do not take the place of valid
+        # memories further down the ranking.
+        now = datetime.now()
+        while True:
+            memories = self._storage.search_by_tags(tags, limit=limit)
+            expired = [m.id for m in memories if is_expired(m.expires_at, now)]
+            if not expired:
+                break
+            for memory_id in expired:
+                self._storage.archive(memory_id, "expired")
+                if self._indexer:
+                    self._indexer.remove_memory(memory_id)
 
         if not memories:
             return {
@@ -325,10 +519,7 @@ class MemoryPlugin:
             }
 
         # Update usage statistics
-        for mem in memories:
-            mem.usage_count += 1
-            mem.last_accessed = datetime.now().isoformat()
-            self._storage.update(mem)
+        self._storage.record_access(memories)
 
         return {
             "status": "success",
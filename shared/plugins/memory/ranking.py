@@ -0,0 +1,272 @@
+"""BM25 ranking for memory retrieval."""
+
+import math
+import os
+import re
+from collections import Counter
+from datetime import datetime
+from pathlib import Path
+from typing import Callable, Dict, List, Optional, Set, Tuple
+
+from ... import json_codec
+from .indexer import STOPWORDS
+from .models import Memory
+
+
+# Indexed fields and their default weights
+DEFAULT_FIELD_WEIGHTS = {"tags": 3.0, "description": 2.0, "content": 1.0}
+
+# BM25 term frequency saturation and length normalization
+K1 = 1.2
+B = 0.75
+
+# Share of a memory's score that decays with age (the rest is kept)
+RECENCY_WEIGHT = 0.3
+
+# Index file name suffix (next to the JSONL file)
+INDEX_SUFFIX = ".bm25"
+
+# Rewrite the index file once it holds this many lines per indexed memory
+_COMPACT_RATIO = 2
+
+
+def tokenize(text: str) -> List[str]:
+    """Split text into lowercase index terms, without stopwords."""
+    return [w for w in re.findall(r'\w+', text.lower()) if w not in STOPWORDS]
+
+
+def _field_terms(memory: Memory) -> Dict[str, Dict[str, int]]:
+    return {
+        "tags": dict(Counter(t for tag in memory.tags for t in tokenize(tag))),
+        "description": dict(Counter(tokenize(memory.description))),
+        "content": dict(Counter(tokenize(memory.content))),
+    }
+
+
+def index_is_fresh(index_path: Path, store_path: Path) -> bool:
+    """Whether an index file was written after the last store change.
+
+    Derived indexes are written (or touched) after every store write, so
+    a store newer than its index was changed by someone else.
+    """
+    try:
+        index_mtime = index_path.stat().st_mtime_ns
+    except FileNotFoundError:
+        return False
+    try:
+        return index_mtime >= store_path.stat().st_mtime_ns
+    except FileNotFoundError:
+        return False
+
+
+def _parse_time(timestamp: str) -> Optional[datetime]:
+    try:
+        return datetime.fromisoformat(timestamp)
+    except (TypeError, ValueError):
+        return None
+
+
+class BM25Index:
+    """BM25F index over memory tags, description and content.
+
+    Holds per-memory term frequencies, so ranking never reads the memory
+    store. The index is persisted as JSON lines, one per indexed memory
+    version or deletion (the last line of an ID wins), and extended as
+    memories are saved. Each write also touches the file, so an index older than the
+    store means the store was changed by someone else and the index is
+    rebuilt from it.
+    """
+
+    def __init__(
+        self,
+        store_path: Path,
+        field_weights: Optional[Dict[str, float]] = None,
+        recency_half_life_days: Optional[float] = 30.0
+    ):
+        """Initialize the index.
+
+        Args:
+            store_path: Path of the memory JSONL file.
+            field_weights: Weight of each field's term frequencies
+                (defaults to DEFAULT_FIELD_WEIGHTS).
+            recency_half_life_days: Age at which the decaying share of a
+                score is halved; None or 0 disables recency decay.
+        """
+        self.store_path = Path(store_path)
+        self.path = self.store_path.with_name(self.store_path.name + INDEX_SUFFIX)
+        self._weights = {**DEFAULT_FIELD_WEIGHTS, **(field_weights or {})}
+        self._half_life = recency_half_life_days
+        self._docs: Dict[str, Dict[str, Dict[str, int]]] = {}  # id -> field -> term -> tf
+        self._lengths: Dict[str, Dict[str, int]] = {}  # id -> field -> term count
+        self._timestamps: Dict[str, Optional[datetime]] = {}
+        self._postings: Dict[str, Set[str]] = {}  # term -> {memory_id, ...}
+        self._length_totals: Dict[str, int] = {field: 0 for field in DEFAULT_FIELD_WEIGHTS}
+        self._lines = 0
+
+    def load(self, load_memories: Callable[[], List[Memory]]) -> None:
+        """Load the persisted index, rebuilding it if missing or stale.
+
+        Args:
+            load_memories: Returns every stored memory, for rebuilding.
+        """
+        self._reset()
+        if index_is_fresh(self.path, self.store_path):
+            try:
+                with open(self.path, 'rb') as f:
+                    for line in f:
+                        if line.strip():
+                            entry = json_codec.loads(line)
+                            if entry.get("deleted"):
+                                self._remove(entry["id"])
+                            else:
+                                self._add(entry["id"], entry["fields"], entry["timestamp"])
+                            self._lines += 1
+                return
+            except (json_codec.JSONDecodeError, KeyError, TypeError, OSError):
+                self._reset()
+        for memory in load_memories():
+            self._add(memory.id, _field_terms(memory), memory.timestamp)
+        self._rewrite()
+
+    def add(self, memory: Memory) -> None:
+        """Index a saved memory (new or updated) and persist the change."""
+        fields = _field_terms(memory)
+        if self._docs.get(memory.id) == fields:
+            self._timestamps[memory.id] = _parse_time(memory.timestamp)
+            self.touch()
+            return
+        self._add(memory.id, fields, memory.timestamp)
+        if self._lines + 1 > _COMPACT_RATIO * len(self._docs):
+            self._rewrite()
+            return
+        with open(self.path, 'ab') as f:
+            f.write(self._encode(memory.id))
+        self._lines += 1
+
+    def remove(self, memory_id: str) -> None:
+        """Drop a deleted memory from the index and persist the change."""
+        if memory_id not in self._docs:
+            return
+        self._remove(memory_id)
+        with open(self.path, 'ab') as f:
+            f.write(json_codec.dumps({"id": memory_id, "deleted": True}) + b'\n')
+        self._lines += 1
+
+    def touch(self) -> None:
+        """Mark the index as up to date with the store.
+
+        For store rewrites that leave the indexed memories unchanged
+        (compaction).
+        """
+        try:
+            os.utime(self.path)
+        except FileNotFoundError:
+            self._rewrite()
+
+    def search(self, query: str, limit: int = 5) -> List[Tuple[str, float]]:
+        """Rank memories against a query.
+
+        Args:
+            query: Free text (a prompt, or tags joined with spaces).
+            limit: Maximum number of results.
+
+        Returns:
+            List of (memory_id, score), best first. Memories sharing no
+            term with the query are not returned.
+        """
+        terms = set(tokenize(query))
+        candidates: Set[str] = set()
+        for term in terms:
+            candidates.update(self._postings.get(term, ()))
+        if not candidates:
+            return []
+
+        count = len(self._docs)
+        averages = {
+            field: (total / count) or 1.0 for field, total in self._length_totals.items()
+        }
+        idf = {
+            term: math.log(1 + (count - len(self._postings[term]) + 0.5)
+                           / (len(self._postings[term]) + 0.5))
+            for term in terms if term in self._postings
+        }
+        now = datetime.now()
+
+        scored = []
+        for mid in candidates:
+            doc = self._docs[mid]
+            lengths = self._lengths[mid]
+            score = 0.0
+            for term, term_idf in idf.items():
+                tf = 0.0
+                for field, terms_tf in doc.items():
+                    if term in terms_tf:
+                        norm = 1 - B + B * lengths[field] / averages[field]
+                        tf += self._weights.get(field, 0.0) * terms_tf[term] / norm
+                if tf:
+                    score += term_idf * tf * (K1 + 1) / (K1 + tf)
+            score *= self._recency(self._timestamps.get(mid), now)
+            scored.append((score, self._timestamps.get(mid) or datetime.min, mid))
+
+        scored.sort(reverse=True)
+        return [(mid, score) for score, _, mid in scored[:limit]]
+
+    def __len__(self) -> int:
+        return len(self._docs)
+
+    def __contains__(self, memory_id: str) -> bool:
+        return memory_id in self._docs
+
+    def _recency(self, timestamp: Optional[datetime], now: datetime) -> float:
+        if not self._half_life or timestamp is None:
+            return 1.0
+        age_days = max((now - timestamp).total_seconds() / 86400, 0.0)
+        return 1 - RECENCY_WEIGHT + RECENCY_WEIGHT * 0.5 ** (age_days / self._half_life)
+
+    def _add(self, mid: str, fields: Dict[str, Dict[str, int]], timestamp: str) -> None:
+        self._remove(mid)
+        self._docs[mid] = fields
+        self._lengths[mid] = {field: sum(terms_tf.values()) for field, terms_tf in fields.items()}
+        self._timestamps[mid] = _parse_time(timestamp)
+        for field, terms_tf in fields.items():
+            self._length_totals[field] = self._length_totals.get(field, 0) + self._lengths[mid][field]
+            for term in terms_tf:
+                self._postings.setdefault(term, set()).add(mid)
+
+    def _remove(self, mid: str) -> None:
+        fields = self._docs.pop(mid, None)
+        if fields is None:
+            return
+        self._timestamps.pop(mid, None)
+        lengths = self._lengths.pop(mid)
+        for field, terms_tf in fields.items():
+            self._length_totals[field] -= lengths[field]
+            for term in terms_tf:
+                posting = self._postings.get(term)
+                if posting is not None:
+                    posting.discard(mid)
+                    if not posting:
+                        del self._postings[term]
+
+    def _reset(self) -> None:
+        self._docs.clear()
+        self._lengths.clear()
+        self._timestamps.clear()
+        self._postings.clear()
+        self._length_totals = {field: 0 for field in DEFAULT_FIELD_WEIGHTS}
+        self._lines = 0
+
+    def _encode(self, mid: str) -> bytes:
+        timestamp = self._timestamps[mid]
+        return json_codec.dumps({
+            "id": mid,
+            "timestamp": timestamp.isoformat() if timestamp else None,
+            "fields": self._docs[mid],
+        }) + b'\n'
+
+    def _rewrite(self) -> None:
+        tmp = self.path.with_name(self.path.name + ".tmp")
+        with open(tmp, 'wb') as f:
+            f.write(b''.join(self._encode(mid) for mid in self._docs))
+        os.replace(tmp, self.path)
+        self._lines = len(self._docs)
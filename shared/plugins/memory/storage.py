@@ -1,29 +1,146 @@
 """Storage backend for memory plugin."""
 
-import json
+import os
+import tempfile
+import threading
+from contextlib import contextmanager
 from dataclasses import asdict
+from datetime import datetime
 from pathlib import Path
-from typing import List, Optional
+from typing import Any, BinaryIO, Dict, Iterator, List, Optional, Tuple
 
+try:
+    import fcntl
+    HAS_FCNTL = True
+except ImportError:
+    HAS_FCNTL = False
+
+from ... import json_codec
+from .lifecycle import AccessStats
 from .models import Memory
+from .ranking import BM25Index
+from .vectors import DEFAULT_DIMENSIONS, VectorIndex
+
+
+# Offset index file name suffix (next to the JSONL file)
+OFFSETS_SUFFIX = ".offsets"
+
+# Suffix of the archive file (replaces the .jsonl suffix)
+ARCHIVE_SUFFIX = ".archive.jsonl"
+
+# Compact once superseded and deleted lines make up this share of the file...
+COMPACTION_RATIO = 0.5
+
+# ...and the file is at least this large
+COMPACTION_MIN_BYTES = 64 * 1024
+
+# Default share of a search score given to semantic similarity
+DEFAULT_SEMANTIC_WEIGHT = 0.5
+
+# Candidates taken from each ranking per result when combining them
+_CANDIDATES_PER_RESULT = 4
+
+# Persist the offset index after this many appends (the tail written
+# since is rescanned on load)
+_PERSIST_EVERY = 64
 
 
 class MemoryStorage:
     """JSONL-based storage for memories.
 
-    Each memory is stored as a JSON line in the file.
-    This format allows for easy appending and sequential reading.
+    Each memory is stored as a JSON line in the file. The file is
+    append-only: an update appends the new version of the memory, which
+    supersedes the earlier line with the same ID, and a delete appends a
+    tombstone line ({"id": ..., "deleted": true}). Superseded lines are
+    dropped by compaction, which rewrites the file in the background once
+    they make up COMPACTION_RATIO of it.
+
+    An offset index (ID -> byte offset and length of the live line) is
+    kept in memory and persisted next to the file, so reads seek straight
+    to a memory instead of parsing the file. Lines appended by other
+    processes are picked up by scanning only the tail of the file past
+    the indexed size.
+
+    All writes go through one appender holding a thread lock and, where
+    available, an exclusive flock on the file, so concurrent sessions and
+    processes never interleave lines.
+
+    Retrieval counts and times are recorded in AccessStats rather than by
+    rewriting memories, and overlaid on the memories read. Archived
+    memories are moved to a separate JSONL file.
+
+    Searches are ranked by a BM25 index persisted next to the file (see
+    BM25Index), loaded on first use and updated on save/update. With
+    semantic search, BM25 scores are combined with the cosine similarity
+    of hashed feature vectors (see VectorIndex).
     """
 
-    def __init__(self, path: str):
+    def __init__(
+        self,
+        path: str,
+        field_weights: Optional[Dict[str, float]] = None,
+        recency_half_life_days: Optional[float] = 30.0,
+        background_compaction: bool = True,
+        semantic_search: bool = False,
+        semantic_weight: float = DEFAULT_SEMANTIC_WEIGHT,
+        vector_dimensions: int = DEFAULT_DIMENSIONS
+    ):
         """Initialize storage with file path.
 
         Args:
             path: Path to JSONL file for storing memories
+            field_weights: BM25 weights of the tags, description and
+                content fields
+            recency_half_life_days: Half-life of the recency boost in
+                search ranking (None disables it)
+            background_compaction: Compact on a background thread when
+                garbage passes COMPACTION_RATIO (otherwise only compact()
+                compacts)
+            semantic_search: Also rank by vector similarity (needs numpy)
+            semantic_weight: Share of the combined score given to vector
+                similarity (the rest is the normalized BM25 score)
+            vector_dimensions: Number of hash buckets per vector
+
+        Raises:
+            ValueError: If semantic_search is set without numpy installed.
         """
         self.path = Path(path)
         # Ensure parent directory exists
         self.path.parent.mkdir(parents=True, exist_ok=True)
+        self.offsets_path = self.path.with_name(self.path.name + OFFSETS_SUFFIX)
+        self.archive_path = self.path.with_suffix(ARCHIVE_SUFFIX)
+        self.stats = AccessStats(self.path)
+        self._background_compaction = background_compaction
+        self._index = BM25Index(self.path, field_weights, recency_half_life_days)
+        self._index_loaded = False
+        self._vectors = VectorIndex(self.path, vector_dimensions) if semantic_search else None
+        self._vectors_loaded = False
+        self._semantic_weight = semantic_weight
+
+        self._lock = threading.RLock()
+        self._offsets: Dict[str, Tuple[int, int]] = {}  # id -> (offset, length)
+        self._size = 0  # Bytes of the file covered by _offsets
+        self._garbage = 0  # Bytes of superseded, deleted and invalid lines
+        self._inode: Optional[int] = None
+        self._unpersisted = 0
+        self._compaction: Optional[threading.Thread] = None
+        self._load_offsets()
+
+    @property
+    def index(self) -> BM25Index:
+        """The search index, loaded (or rebuilt) on first access."""
+        if not self._index_loaded:
+            self._index.load(self.load_all)
+            self._index_loaded = True
+        return self._index
+
+    @property
+    def vectors(self) -> Optional[VectorIndex]:
+        """The vector index (None without semantic search), loaded on first access."""
+        if self._vectors is not None and not self._vectors_loaded:
+            self._vectors.load(self.load_all)
+            self._vectors_loaded = True
+        return self._vectors
 
     def save(self, memory: Memory) -> None:
         """Append memory to JSONL file.
@@ -31,8 +148,11 @@ class MemoryStorage:
         Args:
             memory: Memory object to store
         """
-        with open(self.path, 'a', encoding='utf-8') as f:
-            f.write(json.dumps(asdict(memory)) + '\n')
+        with self._lock:
+            self._append(memory.id, json_codec.dumps(asdict(memory)) + b'\n')
+            self.index.add(memory)
+            if self.vectors is not None:
+                self.vectors.add(memory)
 
     def load_all(self) -> List[Memory]:
         """Load all memories from file.
@@ -40,78 +160,148 @@ class MemoryStorage:
         Returns:
             List of Memory objects, or empty list if file doesn't exist
         """
-        if not self.path.exists():
-            return []
+        with self._lock:
+            self._sync()
+            if not self._offsets:
+                return []
+            data = self.path.read_bytes()
+            offsets = list(self._offsets.values())
 
         memories = []
-        with open(self.path, 'r', encoding='utf-8') as f:
-            for line in f:
-                line = line.strip()
-                if line:  # Skip empty lines
-                    try:
-                        memories.append(Memory(**json.loads(line)))
-                    except (json.JSONDecodeError, TypeError) as e:
-                        # Log but continue - don't let one bad line break everything
-                        print(f"[MemoryStorage] Warning: Skipping invalid line: {e}")
-                        continue
+        for offset, length in offsets:
+            try:
+                memories.append(self._with_stats(Memory(**json_codec.loads(data[offset:offset + length]))))
+            except (json_codec.JSONDecodeError, TypeError) as e:
+                # Log but continue - don't let one bad line break everything
+                print(f"[MemoryStorage] Warning: Skipping invalid line: {e}")
         return memories
 
+    def rank(self, query: str, limit: int = 3) -> List[Tuple[str, float]]:
+        """Rank memories against a free-text query without loading them.
+
+        Memories are ranked by BM25 over their tags, description and
+        content, with a boost for recent memories. With semantic search,
+        the BM25 score (normalized to the best match) and the vector
+        similarity are combined by semantic_weight.
+
+        Args:
+            query: Text to search for
+            limit: Maximum number of results
+
+        Returns:
+            List of (memory_id, score), best first
+        """
+        with self._lock:
+            if self.vectors is None:
+                return self.index.search(query, limit=limit)
+            pool = limit * _CANDIDATES_PER_RESULT
+            lexical = self.index.search(query, limit=pool)
+            semantic = self.vectors.search(query, limit=pool)
+
+        best = lexical[0][1] if lexical and lexical[0][1] > 0 else 1.0
+        scores: Dict[str, float] = {}
+        for mid, score in lexical:
+            scores[mid] = (1 - self._semantic_weight) * score / best
+        for mid, similarity in semantic:
+            scores[mid] = scores.get(mid, 0.0) + self._semantic_weight * similarity
+        ranked = sorted(scores.items(), key=lambda item: item[1], reverse=True)
+        return ranked[:limit]
+
+    def search(self, query: str, limit: int = 3) -> List[Memory]:
+        """Find the memories best matching a free-text query (see rank).
+
+        Args:
+            query: Text to search for
+            limit: Maximum number of memories to return
+
+        Returns:
+            List of Memory objects, sorted by relevance
+        """
+        return self.get_by_ids([mid for mid, _ in self.rank(query, limit=limit)])
+
     def search_by_tags(self, tags: List[str], limit: int = 3) -> List[Memory]:
         """Find memories matching any of the provided tags.
 
-        Memories are scored by tag overlap and sorted by:
-        1. Number of matching tags (descending)
-        2. Recency (most recent first)
-
         Args:
             tags: List of tags to search for
             limit: Maximum number of memories to return
 
         Returns:
             List of Memory objects matching the tags, sorted by relevance
+            (see search)
         """
-        all_memories = self.load_all()
+        return self.search(" ".join(tags), limit=limit)
 
-        # Score by tag overlap
-        scored = []
-        for mem in all_memories:
-            overlap = len(set(mem.tags) & set(tags))
-            if overlap > 0:
-                scored.append((overlap, mem))
+    def update(self, memory: Memory) -> None:
+        """Update an existing memory (or store it if it is not stored).
 
-        # Sort by score desc, then by recency (timestamp desc)
-        scored.sort(key=lambda x: (x[0], x[1].timestamp), reverse=True)
+        Appends the new version; the old line is dropped at the next
+        compaction.
 
-        return [mem for _, mem in scored[:limit]]
+        Args:
+            memory: Memory object with updated fields
+        """
+        self.save(memory)
 
-    def update(self, memory: Memory) -> None:
-        """Update an existing memory.
+    def delete(self, memory_id: str) -> bool:
+        """Delete a memory by appending a tombstone.
 
-        This is inefficient for JSONL (requires rewriting entire file),
-        but acceptable for small memory stores. For larger stores,
-        consider using a proper database.
+        Args:
+            memory_id: Unique identifier of the memory
+
+        Returns:
+            True if the memory was stored
+        """
+        with self._lock:
+            self._sync()
+            if memory_id not in self._offsets:
+                return False
+            line = json_codec.dumps({"id": memory_id, "deleted": True}) + b'\n'
+            self._append(memory_id, line, deleted=True)
+            self.index.remove(memory_id)
+            if self.vectors is not None:
+                self.vectors.remove(memory_id)
+            self.stats.remove(memory_id)
+        return True
+
+    def archive(self, memory_id: str, reason: str) -> bool:
+        """Move a memory to the archive file.
+
+        The archived line is the memory with "archived_at" and
+        "archive_reason" added.
 
         Args:
-            memory: Memory object with updated fields
+            memory_id: Unique identifier of the memory
+            reason: Why it is archived (e.g. 'expired', 'evicted')
+
+        Returns:
+            True if the memory was stored
         """
-        all_memories = self.load_all()
+        with self._lock:
+            memory = self.get_by_id(memory_id)
+            if memory is None:
+                return False
+            record = asdict(memory)
+            record["archived_at"] = datetime.now().isoformat()
+            record["archive_reason"] = reason
+            with open(self.archive_path, 'ab') as f:
+                f.write(json_codec.dumps(record) + b'\n')
+            return self.delete(memory_id)
 
-        # Find and update the memory
-        updated = False
-        for i, mem in enumerate(all_memories):
-            if mem.id == memory.id:
-                all_memories[i] = memory
-                updated = True
-                break
+    def record_access(self, memories: List[Memory]) -> None:
+        """Record a retrieval of memories in their access statistics.
 
-        if not updated:
-            # Memory not found - append it
-            all_memories.append(memory)
+        Updates usage_count and last_accessed of the given objects.
 
-        # Rewrite entire file
-        with open(self.path, 'w', encoding='utf-8') as f:
-            for mem in all_memories:
-                f.write(json.dumps(asdict(mem)) + '\n')
+        Args:
+            memories: Memories just retrieved
+        """
+        now = datetime.now().isoformat()
+        with self._lock:
+            for memory in memories:
+                memory.usage_count += 1
+                memory.last_accessed = now
+                self.stats.record(memory.id, memory.usage_count, now)
 
     def get_by_id(self, memory_id: str) -> Optional[Memory]:
         """Retrieve a specific memory by ID.
@@ -122,10 +312,57 @@ class MemoryStorage:
         Returns:
             Memory object if found, None otherwise
         """
-        for mem in self.load_all():
-            if mem.id == memory_id:
-                return mem
-        return None
+        memories = self.get_by_ids([memory_id])
+        return memories[0] if memories else None
+
+    def get_by_ids(self, memory_ids: List[str]) -> List[Memory]:
+        """Retrieve several memories by ID.
+
+        Args:
+            memory_ids: Unique identifiers of the memories
+
+        Returns:
+            Memory objects in the order of memory_ids (missing IDs are
+            skipped)
+        """
+        memories = self._read(memory_ids)
+        if memories is None:
+            # The file was compacted by another process since it was
+            # indexed: index it again
+            with self._lock:
+                self._reset_offsets(None)
+            memories = self._read(memory_ids, verify=False)
+        return memories
+
+    def _read(self, memory_ids: List[str], verify: bool = True) -> Optional[List[Memory]]:
+        """Read memories at their indexed offsets.
+
+        Returns None if verify is set and a line is not the memory the
+        index points to.
+        """
+        with self._lock:
+            self._sync()
+            found = [(mid, self._offsets[mid]) for mid in memory_ids if mid in self._offsets]
+            if not found:
+                return []
+            records = []
+            with open(self.path, 'rb') as f:
+                for mid, (offset, length) in found:
+                    f.seek(offset)
+                    records.append((mid, f.read(length)))
+
+        memories = []
+        for mid, line in records:
+            try:
+                memory = self._with_stats(Memory(**json_codec.loads(line)))
+            except (json_codec.JSONDecodeError, TypeError):
+                memory = None
+            if memory is None or memory.id != mid:
+                if verify:
+                    return None
+                continue
+            memories.append(memory)
+        return memories
 
     def count(self) -> int:
         """Return total number of stored memories.
@@ -133,4 +370,229 @@ class MemoryStorage:
         Returns:
             Number of memories in storage
         """
-        return len(self.load_all())
+        with self._lock:
+            self._sync()
+            return len(self._offsets)
+
+    def garbage_ratio(self) -> float:
+        """Return the share of the file taken by superseded lines."""
+        with self._lock:
+            return self._garbage / self._size if self._size else 0.0
+
+    def compact(self) -> None:
+        """Rewrite the file with only the live version of each memory."""
+        with self._lock, self._locked_file() as f:
+            self._sync()
+            f.seek(0)
+            data = f.read(self._size)
+
+            chunks = []
+            offsets: Dict[str, Tuple[int, int]] = {}
+            position = 0
+            for mid, (offset, length) in self._offsets.items():
+                chunks.append(data[offset:offset + length])
+                offsets[mid] = (position, length)
+                position += length
+
+            fd, tmp_path = tempfile.mkstemp(
+                dir=self.path.parent, prefix=self.path.name, suffix=".tmp"
+            )
+            try:
+                with os.fdopen(fd, 'wb') as tmp:
+                    tmp.write(b''.join(chunks))
+                os.replace(tmp_path, self.path)
+            except BaseException:
+                try:
+                    os.unlink(tmp_path)
+                except OSError:
+                    pass
+                raise
+
+            self._offsets = offsets
+            self._size = position
+            self._garbage = 0
+            self._inode = self.path.stat().st_ino
+            self._persist_offsets()
+            # The rewrite leaves the indexed memories unchanged
+            if self._index_loaded:
+                self._index.touch()
+            if self._vectors_loaded:
+                self._vectors.touch()
+
+    def close(self) -> None:
+        """Wait for a running compaction and persist the offset index and statistics."""
+        compaction = self._compaction
+        if compaction is not None:
+            compaction.join()
+        with self._lock:
+            if self._unpersisted:
+                self._persist_offsets()
+            self.stats.save()
+
+    def _with_stats(self, memory: Memory) -> Memory:
+        """Overlay a memory's access statistics (newer than its line)."""
+        stats = self.stats.get(memory.id)
+        if stats is not None:
+            memory.usage_count, memory.last_accessed = stats
+        return memory
+
+    # ===== Offset index =====
+
+    def _append(self, memory_id: str, line: bytes, deleted: bool = False) -> None:
+        """Append one line (a memory or a tombstone) and index it."""
+        with self._lock, self._locked_file() as f:
+            self._sync()
+            end = f.seek(0, os.SEEK_END)
+            if end != self._size:
+                # A partial last line (e.g. hand-edited file without a
+                # final newline) must not run into the new line
+                f.write(b'\n')
+                self._garbage += end + 1 - self._size
+                end += 1
+            f.write(line)
+            f.flush()
+            self._apply(memory_id, end, len(line), deleted)
+            self._size = end + len(line)
+            self._unpersisted += 1
+            if self._unpersisted >= _PERSIST_EVERY:
+                self._persist_offsets()
+        self._maybe_compact()
+
+    @contextmanager
+    def _locked_file(self) -> Iterator[BinaryIO]:
+        """Open the file for appending with an exclusive lock.
+
+        Reopens if the file was replaced (compacted by another process)
+        while waiting for the lock.
+        """
+        while True:
+            f = open(self.path, 'a+b')
+            if HAS_FCNTL:
+                fcntl.flock(f.fileno(), fcntl.LOCK_EX)
+                try:
+                    replaced = os.fstat(f.fileno()).st_ino != self.path.stat().st_ino
+                except FileNotFoundError:
+                    replaced = True
+                if replaced:
+                    f.close()
+                    continue
+            try:
+                yield f
+            finally:
+                f.close()  # Releases the flock
+            return
+
+    def _sync(self) -> None:
+        """Bring the offset index up to date with the file (caller holds the lock)."""
+        try:
+            stat = self.path.stat()
+        except FileNotFoundError:
+            self._reset_offsets(None)
+            return
+        if stat.st_ino != self._inode or stat.st_size < self._size:
+            self._reset_offsets(stat.st_ino)
+        if stat.st_size > self._size:
+            self._scan()
+
+    def _scan(self) -> None:
+        """Index the complete lines past the indexed size."""
+        with open(self.path, 'rb') as f:
+            f.seek(self._size)
+            data = f.read()
+        position = 0
+        while True:
+            end = data.find(b'\n', position)
+            if end < 0:
+                break  # Incomplete line, possibly still being written
+            line = data[position:end + 1]
+            record = None
+            if line.strip():
+                try:
+                    record = json_codec.loads(line)
+                    if not isinstance(record.get("id"), str):
+                        raise TypeError("no memory ID")
+                except (json_codec.JSONDecodeError, AttributeError, TypeError) as e:
+                    print(f"[MemoryStorage] Warning: Skipping invalid line: {e}")
+                    record = None
+            if record is not None:
+                self._apply(record["id"], self._size + position, len(line), bool(record.get("deleted")))
+            else:
+                self._garbage += len(line)
+            position = end + 1
+        self._size += position
+        self._unpersisted += 1 if position else 0
+
+    def _apply(self, memory_id: str, offset: int, length: int, deleted: bool) -> None:
+        """Index a line (a memory version or a tombstone, newline included)."""
+        previous = self._offsets.get(memory_id)
+        if previous is not None:
+            self._garbage += previous[1]
+        if deleted:
+            self._offsets.pop(memory_id, None)
+            self._garbage += length
+        else:
+            self._offsets[memory_id] = (offset, length)
+
+    def _reset_offsets(self, inode: Optional[int]) -> None:
+        self._offsets = {}
+        self._size = 0
+        self._garbage = 0
+        self._inode = inode
+
+    def _load_offsets(self) -> None:
+        """Load the persisted offset index, then scan the file tail."""
+        with self._lock:
+            try:
+                state: Dict[str, Any] = json_codec.loads(self.offsets_path.read_bytes())
+                self._offsets = {mid: (o, n) for mid, (o, n) in state["offsets"].items()}
+                self._size = state["size"]
+                self._garbage = state["garbage"]
+                self._inode = state["inode"]
+            except (FileNotFoundError, json_codec.JSONDecodeError, KeyError, TypeError, ValueError):
+                self._reset_offsets(None)
+            self._sync()
+            if self._unpersisted:
+                self._persist_offsets()
+
+    def _persist_offsets(self) -> None:
+        data = json_codec.dumps({
+            "inode": self._inode,
+            "size": self._size,
+            "garbage": self._garbage,
+            "offsets": self._offsets,
+        })
+        tmp = self.offsets_path.with_name(self.offsets_path.name + ".tmp")
+        tmp.write_bytes(data)
+        os.replace(tmp, self.offsets_path)
+        self._unpersisted = 0
+
+    def _needs_compaction(self) -> bool:
+        # Caller holds self._lock
+        return self._size >= COMPACTION_MIN_BYTES and self._garbage >= COMPACTION_RATIO * self._size
+
+    def _maybe_compact(self) -> None:
+        with self._lock:
+            if (not self._background_compaction
+                    or not self._needs_compaction()
+                    or self._compaction is not None):
+                return
+            self._compaction = threading.Thread(
+                target=self._run_compaction, name="memory-compaction", daemon=True
+            )
+            self._compaction.start()
+
+    def _run_compaction(self) -> None:
+        # Writes skip _maybe_compact while the thread is set, so check
+        # again for garbage appended meanwhile before leaving
+        while True:
+            try:
+                self.compact()
+            except OSError as e:
+                print(f"[MemoryStorage] Warning: compaction failed: {e}")
+                with self._lock:
+                    self._compaction = None
+                return
+            with self._lock:
+                if not self._needs_compaction():
+                    self._compaction = None
+                    return
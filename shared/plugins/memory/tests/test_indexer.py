@@ -0,0 +1,70 @@
+"""Tests for MemoryIndexer."""
+
+import unittest
+
+from ..indexer import MemoryIndexer
+from ..models import Memory
+
+
+def _memory(mid, tags, description="", timestamp="2024-01-01T00:00:00"):
+    return Memory(id=mid, content="", description=description, tags=tags, timestamp=timestamp)
+
+
+class TestMemoryIndexer(unittest.TestCase):
+    """Test cases for keyword matching."""
+
+    def setUp(self):
+        self.indexer = MemoryIndexer()
+
+    def _ids(self, keywords, limit=10):
+        return [m.id for m in self.indexer.find_matches(keywords, limit=limit)]
+
+    def test_exact_and_partial_tag_matches(self):
+        self.indexer.index_memory(_memory("exact", ["auth"]))
+        self.indexer.index_memory(_memory("longer", ["authentication"]))
+        self.indexer.index_memory(_memory("shorter", ["db"]))
+        self.indexer.index_memory(_memory("other", ["database"]))
+
+        self.assertEqual(set(self._ids(["auth"])), {"exact", "longer"})
+        self.assertEqual(set(self._ids(["authentication"])), {"exact", "longer"})
+        self.assertEqual(set(self._ids(["dbschema"])), {"shorter"})
+        self.assertEqual(self._ids(["Database"]), ["other"])
+
+    def test_trigrams_are_verified(self):
+        # Every trigram of "abcde" occurs in the tag, but not the keyword
+        self.indexer.index_memory(_memory("m1", ["abcdxbcde"]))
+
+        self.assertEqual(self._ids(["abcde"]), [])
+
+    def test_short_keywords(self):
+        self.indexer.index_memory(_memory("m1", ["io"]))
+        self.indexer.index_memory(_memory("m2", ["asyncio"]))
+
+        self.assertEqual(set(self._ids(["io"])), {"m1", "m2"})
+
+    def test_description_matches_follow_tag_matches(self):
+        self.indexer.index_memory(_memory(
+            "described", ["misc"], "Notes on the subagent runtime", "2024-02-01T00:00:00"
+        ))
+        self.indexer.index_memory(_memory("tagged", ["subagent"], "", "2024-01-01T00:00:00"))
+
+        self.assertEqual(self._ids(["subagent"]), ["tagged", "described"])
+
+    def test_tag_matches_sorted_by_recency(self):
+        self.indexer.index_memory(_memory("old", ["cache"], timestamp="2024-01-01T00:00:00"))
+        self.indexer.index_memory(_memory("new", ["caching"], timestamp="2024-03-01T00:00:00"))
+
+        self.assertEqual(self._ids(["cach"]), ["new", "old"])
+        self.assertEqual(self._ids(["cach"], limit=1), ["new"])
+
+    def test_clear(self):
+        self.indexer.index_memory(_memory("m1", ["auth"], "authentication flow"))
+
+        self.indexer.clear()
+
+        self.assertEqual(self._ids(["auth"]), [])
+        self.assertEqual(self.indexer.get_memory_count(), 0)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,170 @@
+"""Tests for memory access statistics, expiry and eviction."""
+
+import json
+import shutil
+import tempfile
+import unittest
+from datetime import datetime, timedelta
+from pathlib import Path
+
+from ..lifecycle import AccessStats, eviction_score, select_evictions
+from ..models import Memory, MemoryMetadata
+from ..plugin import MemoryPlugin
+
+
+NOW = datetime(2024, 6, 1)
+
+
+def _metadata(mid, days_old=0, expires_in=None):
+    expires_at = (NOW + timedelta(days=expires_in)).isoformat() if expires_in is not None else None
+    return MemoryMetadata(id=mid, description=mid, tags=[],
+                          timestamp=(NOW - timedelta(days=days_old)).isoformat(),
+                          expires_at=expires_at)
+
+
+class TestEviction(unittest.TestCase):
+    """Test cases for choosing memories to archive."""
+
+    def setUp(self):
+        self.temp_dir = tempfile.TemporaryDirectory()
+        self.stats = AccessStats(Path(self.temp_dir.name) / "memories.jsonl")
+
+    def tearDown(self):
+        self.temp_dir.cleanup()
+
+    def test_score_combines_frequency_and_recency(self):
+        created = (NOW - timedelta(days=100)).isoformat()
+        recent = (NOW - timedelta(days=1)).isoformat()
+        stale = (NOW - timedelta(days=90)).isoformat()
+
+        self.assertGreater(eviction_score(1, recent, created, NOW), eviction_score(5, stale, created, NOW))
+        self.assertGreater(eviction_score(5, recent, created, NOW), eviction_score(1, recent, created, NOW))
+        self.assertAlmostEqual(eviction_score(0, None, NOW.isoformat(), NOW), 1.0)
+
+    def test_expired_memories_are_selected(self):
+        memories = [_metadata("expired", expires_in=-1), _metadata("valid", expires_in=1), _metadata("forever")]
+
+        self.assertEqual(select_evictions(memories, self.stats, None, NOW), [("expired", "expired")])
+
+    def test_coldest_memories_are_evicted(self):
+        memories = [_metadata("old"), _metadata("used"), _metadata("new")]
+        memories[0].timestamp = (NOW - timedelta(days=60)).isoformat()
+        memories[1].timestamp = memories[0].timestamp
+        self.stats.record("used", 3, (NOW - timedelta(days=2)).isoformat())
+
+        self.assertEqual(select_evictions(memories, self.stats, 2, NOW), [("old", "evicted")])
+
+    def test_stats_are_persisted(self):
+        self.stats.record("m1", 2, NOW.isoformat())
+        self.stats.save()
+
+        reloaded = AccessStats(Path(self.temp_dir.name) / "memories.jsonl")
+
+        self.assertEqual(reloaded.get("m1"), (2, NOW.isoformat()))
+
+
+class TestMemoryPluginLifecycle(unittest.TestCase):
+    """Test cases for TTLs, limits and the memory command."""
+
+    def setUp(self):
+        self.temp_dir = tempfile.mkdtemp()
+        self.addCleanup(shutil.rmtree, self.temp_dir, ignore_errors=True)
+        self.storage_path = Path(self.temp_dir) / "memories.jsonl"
+
+    def _plugin(self, **config):
+        plugin = MemoryPlugin()
+        plugin.initialize({"storage_path": str(self.storage_path), **config})
+        self.addCleanup(plugin.shutdown)
+        return plugin
+
+    def _store(self, plugin, tag, **args):
+        return plugin.get_executors()["store_memory"]({
+            "content": f"{tag} content", "description": f"{tag} notes", "tags": [tag], **args
+        })["memory_id"]
+
+    def _archived(self):
+        archive = self.storage_path.with_suffix(".archive.jsonl")
+        if not archive.exists():
+            return []
+        return [json.loads(line) for line in archive.read_text().splitlines()]
+
+    def test_expired_memories_are_archived(self):
+        plugin = self._plugin()
+        self._store(plugin, "roadmap", ttl_days=30)
+        memory_id = self._store(plugin, "release", ttl_days=1e-9)
+        executors = plugin.get_executors()
+
+        self.assertEqual(executors["retrieve_memories"]({"tags": ["release"]})["status"], "no_results")
+        self.assertEqual(plugin.enrich_prompt("When is the release?").metadata["memory_matches"], 0)
+        self.assertEqual([(m["id"], m["archive_reason"]) for m in self._archived()], [(memory_id, "expired")])
+        self.assertEqual(executors["list_memory_tags"]({})["tags"], ["roadmap"])
+
+    def test_expired_hits_do_not_shorten_retrieval(self):
+        plugin = self._plugin()
+        yesterday = (datetime.now() - timedelta(days=1)).isoformat()
+        for memory in [
+            Memory("expired", "deploy deploy deploy", "deploy notes", ["deploy"], yesterday, expires_at=yesterday),
+            Memory("valid1", "deploy content", "deploy notes", ["deploy"], yesterday),
+            Memory("valid2", "deploy content", "deploy notes", ["deploy"], yesterday),
+        ]:
+            plugin._storage.save(memory)
+            plugin._indexer.index_memory(memory)
+
+        result = plugin.get_executors()["retrieve_memories"]({"tags": ["deploy"], "limit": 2})
+
+        self.assertEqual(sorted(m["id"] for m in result["memories"]), ["valid1", "valid2"])
+        self.assertEqual([(m["id"], m["archive_reason"]) for m in self._archived()], [("expired", "expired")])
+
+    def test_default_ttl(self):
+        plugin = self._plugin(default_ttl_days=7)
+        memory_id = self._store(plugin, "release")
+
+        expires_at = plugin._storage.get_by_id(memory_id).expires_at
+        self.assertAlmostEqual(
+            datetime.fromisoformat(expires_at) - datetime.now(), timedelta(days=7), delta=timedelta(minutes=1)
+        )
+
+    def test_max_memories_keeps_used_memories(self):
+        plugin = self._plugin(max_memories=2)
+        self._store(plugin, "first")
+        self._store(plugin, "second")
+        plugin.get_executors()["retrieve_memories"]({"tags": ["first"]})
+
+        self._store(plugin, "third")
+
+        self.assertEqual([m["tags"] for m in self._archived()], [["second"]])
+        self.assertEqual(sorted(plugin.get_executors()["list_memory_tags"]({})["tags"]), ["first", "third"])
+
+    def test_retrieval_does_not_rewrite_memories(self):
+        plugin = self._plugin()
+        self._store(plugin, "cache")
+        size = self.storage_path.stat().st_size
+
+        for _ in range(3):
+            result = plugin.get_executors()["retrieve_memories"]({"tags": ["cache"]})
+
+        self.assertEqual(result["memories"][0]["usage_count"], 3)
+        self.assertEqual(self.storage_path.stat().st_size, size)
+        plugin.shutdown()
+        self.assertEqual(self._plugin().get_executors()["retrieve_memories"](
+            {"tags": ["cache"]})["memories"][0]["usage_count"], 4)
+
+    def test_memory_command(self):
+        plugin = self._plugin()
+        memory_id = self._store(plugin, "schema")
+        command = plugin.get_executors()["memory"]
+
+        self.assertIn("Memories: 1", command({"args": []}))
+        self.assertEqual(command({"args": ["evict"]}), "No memories to archive")
+        self._store(plugin, "other")
+        plugin._max_memories = 1
+        self.assertIn("(0 expired, 1 over the limit)", command({"args": ["evict"]}))
+        memory_id = plugin._indexer.find_all()[0].id
+        self.assertIn("Archived memory", command({"args": ["forget", memory_id]}))
+        self.assertIn("not found", command({"args": ["forget", memory_id]}))
+        self.assertIn("Unknown subcommand", command({"args": ["bogus"]}))
+        self.assertEqual([c.value for c in plugin.get_command_completions("memory", ["e"])], ["evict"])
+
+
+if __name__ == "__main__":
+    unittest.main()
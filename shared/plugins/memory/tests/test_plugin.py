@@ -150,6 +150,28 @@ class TestMemoryPlugin(unittest.TestCase):
         result2 = executors["retrieve_memories"]({"tags": ["test"]})
         self.assertEqual(result2["memories"][0]["usage_count"], 2)
 
+    def test_retrieve_is_ranked(self):
+        """Test that retrieval ranks tag matches above content matches."""
+        executors = self.plugin.get_executors()
+        executors["store_memory"]({
+            "content": "Tokens are cached in redis",
+            "description": "Session storage",
+            "tags": ["storage"]
+        })
+        executors["store_memory"]({
+            "content": "Cache invalidation rules",
+            "description": "Redis usage",
+            "tags": ["redis", "cache"]
+        })
+
+        result = executors["retrieve_memories"]({"tags": ["redis"]})
+
+        self.assertEqual(result["count"], 2)
+        self.assertEqual(result["memories"][0]["description"], "Redis usage")
+
+        enriched = self.plugin.enrich_prompt("Where are tokens cached?")
+        self.assertEqual(enriched.metadata["memory_matches"], 2)
+
 
 if __name__ == "__main__":
     unittest.main()
@@ -0,0 +1,117 @@
+"""Tests for BM25 memory ranking."""
+
+import os
+import tempfile
+import unittest
+from datetime import datetime, timedelta
+from pathlib import Path
+from unittest.mock import patch
+
+from ..models import Memory
+from ..ranking import BM25Index, tokenize
+from ..storage import MemoryStorage
+
+
+def _memory(mid, tags, description="", content="", days_old=0):
+    timestamp = (datetime.now() - timedelta(days=days_old)).isoformat()
+    return Memory(id=mid, content=content, description=description, tags=tags, timestamp=timestamp)
+
+
+class TestBM25Ranking(unittest.TestCase):
+    """Test cases for ranking memories."""
+
+    def setUp(self):
+        self.temp_dir = tempfile.TemporaryDirectory()
+        self.path = Path(self.temp_dir.name) / "memories.jsonl"
+        self.storage = MemoryStorage(str(self.path))
+
+    def tearDown(self):
+        self.temp_dir.cleanup()
+
+    def test_tokenize(self):
+        self.assertEqual(tokenize("How does the JWT_auth flow work?"), ["jwt_auth", "flow", "work"])
+
+    def test_fields_are_weighted(self):
+        self.storage.save(_memory("content", ["misc"], "Notes", "oauth tokens are refreshed"))
+        self.storage.save(_memory("tagged", ["oauth"], "Notes", "See the docs"))
+
+        ranked = self.storage.index.search("oauth")
+
+        self.assertEqual([mid for mid, _ in ranked], ["tagged", "content"])
+
+    def test_rare_terms_rank_higher(self):
+        for i in range(5):
+            self.storage.save(_memory(f"common{i}", ["python"]))
+        self.storage.save(_memory("rare", ["asyncio"]))
+        self.storage.save(_memory("both", ["python", "asyncio"]))
+
+        ranked = [mid for mid, _ in self.storage.index.search("python asyncio")]
+
+        self.assertEqual(set(ranked[:2]), {"both", "rare"})
+
+    def test_recency_breaks_ties(self):
+        self.storage.save(_memory("old", ["cache"], days_old=300))
+        self.storage.save(_memory("new", ["cache"]))
+
+        self.assertEqual([m.id for m in self.storage.search("cache")], ["new", "old"])
+
+    def test_search_by_tags_returns_full_memories(self):
+        self.storage.save(_memory("m1", ["database"], "Schema notes", "users table"))
+
+        memories = self.storage.search_by_tags(["database"])
+
+        self.assertEqual([m.content for m in memories], ["users table"])
+        self.assertEqual(self.storage.search_by_tags(["unrelated"]), [])
+
+    def test_update_reindexes_memory(self):
+        memory = _memory("m1", ["redis"])
+        self.storage.save(memory)
+
+        memory.tags = ["memcached"]
+        self.storage.update(memory)
+
+        self.assertEqual(self.storage.search("redis"), [])
+        self.assertEqual([m.id for m in self.storage.search("memcached")], ["m1"])
+
+    def test_persisted_index_is_reused(self):
+        self.storage.save(_memory("m1", ["oauth"]))
+
+        storage = MemoryStorage(str(self.path))
+        with patch.object(storage, "load_all", side_effect=AssertionError("store reparsed")):
+            ranked = storage.index.search("oauth")
+
+        self.assertEqual([mid for mid, _ in ranked], ["m1"])
+
+    def test_stale_index_is_rebuilt(self):
+        self.storage.save(_memory("m1", ["oauth"]))
+        index_path = self.storage.index.path
+        # Simulate the store being changed after the index was written
+        with open(self.path, 'ab') as f:
+            f.write(b'{"id": "m2", "content": "", "description": "", "tags": ["oauth"],'
+                    b' "timestamp": "2024-01-01T00:00:00"}\n')
+        stat = index_path.stat()
+        os.utime(index_path, ns=(stat.st_atime_ns, self.path.stat().st_mtime_ns - 1))
+
+        storage = MemoryStorage(str(self.path))
+
+        self.assertEqual(len(storage.index), 2)
+
+    def test_index_file_is_compacted(self):
+        self.path.touch()
+        index = BM25Index(self.path)
+        index.load(list)
+        memory = _memory("m1", ["a1"])
+        for i in range(10):
+            memory.tags = [f"tag{i}"]
+            index.add(memory)
+
+        lines = index.path.read_bytes().count(b"\n")
+        self.assertLessEqual(lines, 2)
+
+        reloaded = BM25Index(self.path)
+        reloaded.load(list)
+        self.assertEqual([mid for mid, _ in reloaded.search("tag9")], ["m1"])
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,142 @@
+"""Tests for MemoryStorage."""
+
+import tempfile
+import threading
+import unittest
+from pathlib import Path
+from unittest.mock import patch
+
+from .. import storage as storage_module
+from ..models import Memory
+from ..storage import MemoryStorage
+
+
+def _memory(mid, content="content", tags=None):
+    return Memory(
+        id=mid, content=content, description=f"About {mid}",
+        tags=tags or ["test"], timestamp="2024-01-01T00:00:00"
+    )
+
+
+class TestMemoryStorage(unittest.TestCase):
+    """Test cases for the offset-indexed JSONL store."""
+
+    def setUp(self):
+        self.temp_dir = tempfile.TemporaryDirectory()
+        self.path = Path(self.temp_dir.name) / "memories.jsonl"
+        self.storage = MemoryStorage(str(self.path), background_compaction=False)
+
+    def tearDown(self):
+        self.storage.close()
+        self.temp_dir.cleanup()
+
+    def test_save_and_get(self):
+        self.storage.save(_memory("m1", "first"))
+        self.storage.save(_memory("m2", "second"))
+
+        self.assertEqual(self.storage.get_by_id("m2").content, "second")
+        self.assertIsNone(self.storage.get_by_id("missing"))
+        self.assertEqual([m.id for m in self.storage.get_by_ids(["m2", "x", "m1"])], ["m2", "m1"])
+        self.assertEqual(self.storage.count(), 2)
+
+    def test_update_appends_new_version(self):
+        memory = _memory("m1", "old")
+        self.storage.save(memory)
+        self.storage.save(_memory("m2"))
+
+        memory.content = "new"
+        self.storage.update(memory)
+
+        self.assertEqual(self.storage.get_by_id("m1").content, "new")
+        self.assertEqual([m.id for m in self.storage.load_all()], ["m1", "m2"])
+        self.assertEqual(self.path.read_bytes().count(b"\n"), 3)
+        self.assertGreater(self.storage.garbage_ratio(), 0)
+
+    def test_delete_appends_tombstone(self):
+        self.storage.save(_memory("m1"))
+
+        self.assertTrue(self.storage.delete("m1"))
+        self.assertFalse(self.storage.delete("m1"))
+
+        self.assertIsNone(self.storage.get_by_id("m1"))
+        self.assertEqual(self.storage.search("test"), [])
+        reopened = MemoryStorage(str(self.path))
+        self.assertEqual(reopened.count(), 0)
+
+    def test_compact_keeps_live_versions(self):
+        memory = _memory("m1")
+        for i in range(5):
+            memory.content = f"version {i}"
+            self.storage.update(memory)
+        self.storage.save(_memory("m2"))
+        self.storage.delete("m2")
+        size = self.path.stat().st_size
+
+        self.storage.compact()
+
+        self.assertLess(self.path.stat().st_size, size)
+        self.assertEqual(self.path.read_bytes().count(b"\n"), 1)
+        self.assertEqual(self.storage.garbage_ratio(), 0)
+        self.assertEqual(self.storage.get_by_id("m1").content, "version 4")
+        self.assertEqual(MemoryStorage(str(self.path)).get_by_id("m1").content, "version 4")
+
+    def test_persisted_offsets_avoid_rescanning(self):
+        self.storage.save(_memory("m1"))
+        self.storage.close()
+
+        with patch.object(MemoryStorage, "_scan", side_effect=AssertionError("rescanned")):
+            reopened = MemoryStorage(str(self.path))
+            self.assertEqual(reopened.get_by_id("m1").id, "m1")
+
+    def test_sees_writes_of_other_instances(self):
+        other = MemoryStorage(str(self.path))
+        self.storage.save(_memory("m1"))
+
+        other.save(_memory("m2"))
+        self.assertEqual(other.get_by_id("m1").id, "m1")
+        self.assertEqual(self.storage.get_by_id("m2").id, "m2")
+
+        other.update(_memory("m1", "changed"))
+        other.compact()
+        self.assertEqual(self.storage.get_by_id("m1").content, "changed")
+        self.assertEqual(self.storage.count(), 2)
+
+    def test_partial_last_line_is_not_joined(self):
+        self.storage.save(_memory("m1"))
+        with open(self.path, "ab") as f:
+            f.write(b'{"id": "broken"')
+
+        self.storage.save(_memory("m2"))
+
+        self.assertEqual([m.id for m in self.storage.load_all()], ["m1", "m2"])
+
+    def test_concurrent_saves_do_not_interleave(self):
+        def save_many(prefix):
+            for i in range(50):
+                self.storage.save(_memory(f"{prefix}{i}", "x" * 2000))
+
+        threads = [threading.Thread(target=save_many, args=(f"t{n}_",)) for n in range(4)]
+        for t in threads:
+            t.start()
+        for t in threads:
+            t.join()
+
+        self.assertEqual(len(MemoryStorage(str(self.path)).load_all()), 200)
+
+    def test_background_compaction(self):
+        storage = MemoryStorage(str(self.path))
+        memory = _memory("m1", "x" * 100)
+        with patch.object(storage_module, "COMPACTION_MIN_BYTES", 1024):
+            for i in range(30):
+                memory.usage_count = i
+                storage.update(memory)
+            storage.close()
+
+            # Compacted, and no compaction is due after the last write
+            self.assertLess(len(self.path.read_bytes().splitlines()), 30)
+            self.assertFalse(storage._needs_compaction())
+        self.assertEqual(storage.get_by_id("m1").usage_count, 29)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,115 @@
+"""Tests for offline vector similarity search."""
+
+import tempfile
+import unittest
+from pathlib import Path
+
+from ..models import Memory
+from ..storage import MemoryStorage
+from ..vectors import HAS_NUMPY, VectorIndex
+
+
+def _memory(mid, tags, description="", content=""):
+    return Memory(id=mid, content=content, description=description, tags=tags,
+                  timestamp="2024-01-01T00:00:00")
+
+
+@unittest.skipUnless(HAS_NUMPY, "requires numpy")
+class TestVectorIndex(unittest.TestCase):
+    """Test cases for the hashed feature vector index."""
+
+    def setUp(self):
+        self.temp_dir = tempfile.TemporaryDirectory()
+        self.path = Path(self.temp_dir.name) / "memories.jsonl"
+        self.path.touch()
+        self.index = VectorIndex(self.path, dimensions=256)
+        self.index.load(list)
+
+    def tearDown(self):
+        self.temp_dir.cleanup()
+
+    def _ids(self, query, limit=5):
+        return [mid for mid, _ in self.index.search(query, limit)]
+
+    def test_similar_wording_matches(self):
+        self.index.add(_memory("spawn", ["subagents"], "Spawning subagents efficiently"))
+        self.index.add(_memory("db", ["database"], "Schema migrations"))
+
+        self.assertEqual(self._ids("how is a subagent spawned?")[0], "spawn")
+
+    def test_grows_and_reloads(self):
+        for i in range(100):
+            self.index.add(_memory(f"m{i}", [f"topic{i}"], f"Notes about topic{i}"))
+
+        reloaded = VectorIndex(self.path, dimensions=256)
+        reloaded.load(lambda: self.fail("vectors rebuilt"))
+
+        self.assertEqual(len(reloaded), 100)
+        self.assertEqual([mid for mid, _ in reloaded.search("topic42", 1)], ["m42"])
+
+    def test_update_and_remove(self):
+        memory = _memory("m1", ["redis"])
+        self.index.add(memory)
+        memory.tags = ["kafka"]
+        self.index.add(memory)
+        self.index.add(_memory("m2", ["redis"]))
+
+        self.assertEqual(self._ids("kafka")[0], "m1")
+        self.index.remove("m2")
+        self.assertNotIn("m2", self._ids("redis"))
+
+        reloaded = VectorIndex(self.path, dimensions=256)
+        reloaded.load(list)
+        self.assertEqual(len(reloaded), 1)
+
+    def test_dimension_change_rebuilds(self):
+        self.index.add(_memory("m1", ["redis"]))
+
+        reloaded = VectorIndex(self.path, dimensions=128)
+        reloaded.load(lambda: [_memory("m1", ["redis"])])
+
+        self.assertEqual([mid for mid, _ in reloaded.search("redis")], ["m1"])
+
+
+@unittest.skipUnless(HAS_NUMPY, "requires numpy")
+class TestSemanticStorage(unittest.TestCase):
+    """Test cases for combined BM25 and vector ranking."""
+
+    def setUp(self):
+        self.temp_dir = tempfile.TemporaryDirectory()
+        path = str(Path(self.temp_dir.name) / "memories.jsonl")
+        self.storage = MemoryStorage(path, semantic_search=True, vector_dimensions=256)
+
+    def tearDown(self):
+        self.storage.close()
+        self.temp_dir.cleanup()
+
+    def test_semantic_matches_extend_lexical_ones(self):
+        self.storage.save(_memory("exact", ["caching"], "Caching layer"))
+        self.storage.save(_memory("inflected", ["cached"], "What gets cached"))
+        self.storage.save(_memory("other", ["logging"], "Log rotation"))
+
+        ranked = [mid for mid, _ in self.storage.rank("caching", limit=3)]
+
+        self.assertEqual(ranked[:2], ["exact", "inflected"])
+        self.assertNotIn("other", ranked)
+
+    def test_deleted_memories_are_not_ranked(self):
+        self.storage.save(_memory("m1", ["caching"]))
+        self.storage.delete("m1")
+
+        self.assertEqual(self.storage.rank("caching"), [])
+
+
+@unittest.skipIf(HAS_NUMPY, "numpy is installed")
+class TestWithoutNumpy(unittest.TestCase):
+    """Semantic search needs numpy."""
+
+    def test_semantic_search_raises(self):
+        with tempfile.TemporaryDirectory() as temp_dir:
+            with self.assertRaises(ValueError):
+                MemoryStorage(str(Path(temp_dir) / "m.jsonl"), semantic_search=True)
+
+
+if __name__ == "__main__":
+    unittest.main()
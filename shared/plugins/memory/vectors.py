@@ -0,0 +1,267 @@
+"""Offline vector similarity search for memories.
+
+Memories are embedded with feature hashing: the words of their tags,
+description and content, and the character trigrams of those words, are
+hashed into a fixed number of signed buckets. No model, network access or
+GPU is involved, and trigrams let differently inflected words
+("subagent", "subagents") share most features.
+
+Vectors are stored L2-normalized in a float32 matrix memory-mapped from
+``<store>.vectors``; the ID of each row is kept in ``<store>.vectors.ids``
+(JSON lines, the last line of a row wins). A query is weighted by the
+inverse document frequency of its buckets and scored against every row
+with one matrix-vector product.
+
+Requires numpy (optional dependency).
+"""
+
+import math
+import os
+import zlib
+from collections import Counter
+from pathlib import Path
+from typing import Callable, Dict, List, Optional, Tuple
+
+try:
+    import numpy as np
+    HAS_NUMPY = True
+except ImportError:
+    HAS_NUMPY = False
+
+from ... import json_codec
+from .models import Memory
+from .ranking import index_is_fresh, tokenize
+
+
+# Default number of hash buckets (vector dimensions)
+DEFAULT_DIMENSIONS = 1024
+
+# File name suffixes (next to the JSONL file)
+VECTORS_SUFFIX = ".vectors"
+IDS_SUFFIX = ".vectors.ids"
+
+# Weight of a word's character trigrams relative to the word itself
+TRIGRAM_WEIGHT = 0.5
+
+# Rows allocated when the matrix is created (doubled when full)
+_INITIAL_ROWS = 64
+
+# Rewrite the IDs file once it holds this many lines per row in use
+_COMPACT_RATIO = 2
+
+
+def _features(text: str) -> Counter:
+    """Count the hashed features of a text: words and their trigrams."""
+    features: Counter = Counter()
+    for word in tokenize(text):
+        features[word] += 1.0
+        marked = f"<{word}>"
+        for i in range(len(marked) - 2):
+            features["#" + marked[i:i + 3]] += TRIGRAM_WEIGHT
+    return features
+
+
+def _memory_text(memory: Memory) -> str:
+    # Tags twice: they are the most deliberate description of a memory
+    return " ".join(memory.tags * 2 + [memory.description, memory.content])
+
+
+class VectorIndex:
+    """Memory-mapped matrix of hashed feature vectors."""
+
+    def __init__(self, store_path: Path, dimensions: int = DEFAULT_DIMENSIONS):
+        """Initialize the index.
+
+        Args:
+            store_path: Path of the memory JSONL file.
+            dimensions: Number of hash buckets per vector.
+
+        Raises:
+            ValueError: If numpy is not installed.
+        """
+        if not HAS_NUMPY:
+            raise ValueError("Semantic memory search requires numpy (pip install numpy)")
+        self.store_path = Path(store_path)
+        self.path = self.store_path.with_name(self.store_path.name + VECTORS_SUFFIX)
+        self.ids_path = self.store_path.with_name(self.store_path.name + IDS_SUFFIX)
+        self.dimensions = dimensions
+        self._matrix: Optional["np.memmap"] = None
+        self._row_ids: List[Optional[str]] = []  # row -> memory ID (None = free)
+        self._rows: Dict[str, int] = {}  # memory ID -> row
+        self._free: List[int] = []
+        self._df = np.zeros(dimensions, dtype=np.int64)  # rows using each bucket
+        self._lines = 0
+
+    def embed(self, text: str) -> "np.ndarray":
+        """Hash a text into a (not normalized) term frequency vector."""
+        vector = np.zeros(self.dimensions, dtype=np.float32)
+        for feature, count in _features(text).items():
+            h = zlib.crc32(feature.encode('utf-8'))
+            sign = 1.0 if (h // self.dimensions) & 1 else -1.0
+            vector[h % self.dimensions] += sign * (1.0 + math.log(count) if count >= 1 else count)
+        return vector
+
+    def load(self, load_memories: Callable[[], List[Memory]]) -> None:
+        """Load the persisted vectors, rebuilding them if missing or stale.
+
+        Args:
+            load_memories: Returns every stored memory, for rebuilding.
+        """
+        if index_is_fresh(self.ids_path, self.store_path) and self._load():
+            return
+        self._create(max(_INITIAL_ROWS, 1))
+        for memory in load_memories():
+            self._set_row(memory.id, self.embed(_memory_text(memory)))
+        self._matrix.flush()
+        self._rewrite_ids()
+
+    def add(self, memory: Memory) -> None:
+        """Embed a saved memory (new or updated) and persist it."""
+        row = self._set_row(memory.id, self.embed(_memory_text(memory)))
+        self._matrix.flush()
+        self._write_id(row)
+
+    def remove(self, memory_id: str) -> None:
+        """Drop a deleted memory's vector and persist the change."""
+        row = self._rows.pop(memory_id, None)
+        if row is None:
+            return
+        self._df -= self._matrix[row] != 0
+        self._matrix[row] = 0
+        self._row_ids[row] = None
+        self._free.append(row)
+        self._write_id(row)
+
+    def touch(self) -> None:
+        """Mark the index as up to date with the store."""
+        try:
+            os.utime(self.ids_path)
+        except FileNotFoundError:
+            self._rewrite_ids()
+
+    def search(self, query: str, limit: int = 5) -> List[Tuple[str, float]]:
+        """Find the memories most similar to a query.
+
+        Args:
+            query: Free text.
+            limit: Maximum number of results.
+
+        Returns:
+            List of (memory_id, cosine similarity), best first. Only
+            positive similarities are returned.
+        """
+        if not self._rows:
+            return []
+        vector = self.embed(query)
+        count = len(self._rows)
+        vector *= (np.log((count + 1) / (self._df + 1)) + 1).astype(np.float32)
+        norm = np.linalg.norm(vector)
+        if not norm:
+            return []
+
+        scores = self._matrix[:len(self._row_ids)] @ (vector / norm)
+        k = min(limit, len(scores))
+        top = np.argpartition(-scores, k - 1)[:k]
+        top = top[np.argsort(-scores[top])]
+        return [
+            (self._row_ids[row], float(scores[row]))
+            for row in top
+            if scores[row] > 0 and self._row_ids[row] is not None
+        ]
+
+    def __len__(self) -> int:
+        return len(self._rows)
+
+    def __contains__(self, memory_id: str) -> bool:
+        return memory_id in self._rows
+
+    def _set_row(self, memory_id: str, vector: "np.ndarray") -> int:
+        norm = np.linalg.norm(vector)
+        if norm:
+            vector = vector / norm
+
+        row = self._rows.get(memory_id)
+        if row is not None:
+            self._df -= self._matrix[row] != 0
+        elif self._free:
+            row = self._free.pop()
+        else:
+            row = len(self._row_ids)
+            if row >= self._matrix.shape[0]:
+                self._grow(2 * self._matrix.shape[0])
+            self._row_ids.append(None)
+
+        self._matrix[row] = vector
+        self._df += vector != 0
+        self._row_ids[row] = memory_id
+        self._rows[memory_id] = row
+        return row
+
+    def _create(self, capacity: int) -> None:
+        self._row_ids = []
+        self._rows = {}
+        self._free = []
+        self._df = np.zeros(self.dimensions, dtype=np.int64)
+        with open(self.path, 'wb') as f:
+            f.truncate(capacity * self.dimensions * 4)
+        self._matrix = np.memmap(self.path, dtype=np.float32, mode='r+',
+                                 shape=(capacity, self.dimensions))
+
+    def _grow(self, capacity: int) -> None:
+        self._matrix.flush()
+        self._matrix = None
+        with open(self.path, 'r+b') as f:
+            f.truncate(capacity * self.dimensions * 4)
+        self._matrix = np.memmap(self.path, dtype=np.float32, mode='r+',
+                                 shape=(capacity, self.dimensions))
+
+    def _load(self) -> bool:
+        """Load the IDs file and map the matrix; False if they don't match."""
+        row_ids: Dict[int, Optional[str]] = {}
+        lines = 0
+        try:
+            with open(self.ids_path, 'rb') as f:
+                header = json_codec.loads(f.readline())
+                if header.get("dimensions") != self.dimensions:
+                    return False
+                for line in f:
+                    if line.strip():
+                        entry = json_codec.loads(line)
+                        row_ids[entry["row"]] = entry["id"]
+                        lines += 1
+            size = self.path.stat().st_size
+        except (OSError, json_codec.JSONDecodeError, KeyError, TypeError, AttributeError):
+            return False
+
+        capacity = size // (self.dimensions * 4)
+        used = max(row_ids, default=-1) + 1
+        if used > capacity or capacity == 0:
+            return False
+
+        self._matrix = np.memmap(self.path, dtype=np.float32, mode='r+',
+                                 shape=(capacity, self.dimensions))
+        self._row_ids = [row_ids.get(row) for row in range(used)]
+        self._rows = {mid: row for row, mid in enumerate(self._row_ids) if mid is not None}
+        self._free = [row for row, mid in enumerate(self._row_ids) if mid is None]
+        self._df = np.count_nonzero(self._matrix[:used], axis=0).astype(np.int64)
+        self._lines = lines
+        return True
+
+    def _write_id(self, row: int) -> None:
+        if self._lines + 1 > _COMPACT_RATIO * max(len(self._rows), 1):
+            self._rewrite_ids()
+            return
+        with open(self.ids_path, 'ab') as f:
+            f.write(json_codec.dumps({"row": row, "id": self._row_ids[row]}) + b'\n')
+        self._lines += 1
+
+    def _rewrite_ids(self) -> None:
+        lines = [json_codec.dumps({"dimensions": self.dimensions}) + b'\n']
+        lines.extend(
+            json_codec.dumps({"row": row, "id": mid}) + b'\n'
+            for row, mid in enumerate(self._row_ids) if mid is not None
+        )
+        tmp = self.ids_path.with_name(self.ids_path.name + ".tmp")
+        tmp.write_bytes(b''.join(lines))
+        os.replace(tmp, self.ids_path)
+        self._lines = len(lines) - 1
@@ -0,0 +1 @@
+# Tests for provider-agnostic model types
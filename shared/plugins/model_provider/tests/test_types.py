@@ -0,0 +1,74 @@
+"""Tests for provider-agnostic model types."""
+
+import copy
+import pytest
+
+from ..types import (
+    Attachment,
+    FunctionCall,
+    LazyToolResult,
+    Message,
+    Part,
+    Role,
+    ToolResult,
+)
+
+
+class TestSlots:
+    """Tests for the slotted conversation types."""
+
+    @pytest.mark.parametrize("obj", [
+        Message(role=Role.USER),
+        Part(text="hi"),
+        FunctionCall(id="c1", name="read"),
+        ToolResult(call_id="c1", name="read", result=None),
+        Attachment(mime_type="image/png", data=b""),
+    ])
+    def test_no_instance_dict(self, obj):
+        assert not hasattr(obj, "__dict__")
+        with pytest.raises(AttributeError):
+            obj.extra = 1
+
+    def test_names_are_interned(self):
+        name = "".join(["read", "_file"])
+        call = FunctionCall(id="c1", name=name)
+        result = ToolResult(call_id="c1", name="".join(["read", "_file"]), result=None)
+        attachment = Attachment(mime_type="".join(["image/", "png"]), data=b"")
+
+        assert call.name is result.name
+        assert attachment.mime_type is Attachment(mime_type="image/png", data=b"").mime_type
+
+
+class TestLazyToolResult:
+    """Tests for results decoded on first access."""
+
+    def test_decodes_once_on_access(self):
+        calls = []
+        result = LazyToolResult("c1", "read", lambda: calls.append(1) or {"ok": True})
+
+        assert calls == []
+        assert result.pending is not None
+        assert result.result == {"ok": True}
+        assert result.result == {"ok": True}
+        assert calls == [1]
+        assert result.pending is None
+
+    def test_equals_plain_result(self):
+        lazy = LazyToolResult("c1", "read", lambda: [1, 2], is_error=True)
+        plain = ToolResult(call_id="c1", name="read", result=[1, 2], is_error=True)
+
+        assert lazy == plain
+        assert plain == lazy
+        assert lazy != ToolResult(call_id="c1", name="read", result=[1], is_error=True)
+
+    def test_assignment_replaces_loader(self):
+        result = LazyToolResult("c1", "read", lambda: pytest.fail("decoded"))
+        result.result = "new"
+
+        assert result.result == "new"
+
+    def test_copy_is_plain_result(self):
+        copied = copy.deepcopy(LazyToolResult("c1", "read", lambda: {"a": 1}))
+
+        assert type(copied) is ToolResult
+        assert copied.result == {"a": 1}
@@ -5,11 +5,19 @@ SDK types (e.g., google.genai.types.Content, google.genai.types.FunctionDeclarat
 
 These types are used throughout the plugin system and JaatoClient to enable
 support for multiple AI providers (Google GenAI, Anthropic, etc.).
+
+Conversation types (Message, Part, FunctionCall, ToolResult, Attachment)
+are slotted: long sessions, subagent histories and GC copies hold very
+many of them, and slots avoid a per-instance __dict__. Tool names and MIME
+types are interned, so repeated names share one string. Messages in a
+history are never modified in place (checkpoints and forks share them),
+so code that needs a different message builds a new one.
 """
 
+import sys
 from dataclasses import dataclass, field
 from enum import Enum
-from typing import Any, Dict, List, Optional, Union
+from typing import Any, Callable, Dict, List, Optional, Union
 
 
 class Role(str, Enum):
@@ -19,6 +27,11 @@ class Role(str, Enum):
     TOOL = "tool"
 
 
+def _intern(name: Any) -> Any:
+    """Intern a name string (other values are returned as is)."""
+    return sys.intern(name) if type(name) is str else name
+
+
 @dataclass
 class ToolSchema:
     """Provider-agnostic tool/function declaration.
@@ -36,7 +49,7 @@ class ToolSchema:
     parameters: Dict[str, Any] = field(default_factory=dict)
 
 
-@dataclass
+@dataclass(slots=True)
 class FunctionCall:
     """A function/tool call requested by the model.
 
@@ -49,8 +62,11 @@ class FunctionCall:
     name: str
     args: Dict[str, Any] = field(default_factory=dict)
 
+    def __post_init__(self) -> None:
+        self.name = _intern(self.name)
 
-@dataclass
+
+@dataclass(slots=True)
 class Attachment:
     """Multimodal attachment for tool results.
 
@@ -66,8 +82,11 @@ class Attachment:
     data: bytes
     display_name: Optional[str] = None
 
+    def __post_init__(self) -> None:
+        self.mime_type = _intern(self.mime_type)
 
-@dataclass
+
+@dataclass(slots=True)
 class ToolResult:
     """Result of executing a tool/function.
 
@@ -84,8 +103,77 @@ class ToolResult:
     is_error: bool = False
     attachments: Optional[List['Attachment']] = None
 
+    def __post_init__(self) -> None:
+        self.name = _intern(self.name)
 
-@dataclass
+    def __eq__(self, other: Any) -> bool:
+        # Compares equal to a LazyToolResult with the same content
+        if not isinstance(other, ToolResult):
+            return NotImplemented
+        return (
+            self.call_id == other.call_id and
+            self.name == other.name and
+            self.is_error == other.is_error and
+            self.result == other.result and
+            self.attachments == other.attachments
+        )
+
+
+# Slot holding a ToolResult's result, used by LazyToolResult's property
+_RESULT_SLOT = ToolResult.result
+
+
+class LazyToolResult(ToolResult):
+    """A ToolResult whose result is decoded on first access.
+
+    Used when loading saved sessions, so large results are only parsed
+    when something reads them.
+    """
+
+    __slots__ = ('_load',)
+
+    def __init__(
+        self,
+        call_id: str,
+        name: str,
+        load: Callable[[], Any],
+        is_error: bool = False,
+        attachments: Optional[List['Attachment']] = None
+    ):
+        """Initialize the result.
+
+        Args:
+            call_id: ID of the FunctionCall this result corresponds to.
+            name: Name of the function that was called.
+            load: Returns the decoded result; called at most once.
+            is_error: Whether this result represents an error.
+            attachments: Optional multimodal attachments.
+        """
+        ToolResult.__init__(self, call_id, name, None, is_error, attachments)
+        self._load = load
+
+    @property
+    def result(self) -> Any:
+        if self._load is not None:
+            _RESULT_SLOT.__set__(self, self._load())
+            self._load = None
+        return _RESULT_SLOT.__get__(self)
+
+    @result.setter
+    def result(self, value: Any) -> None:
+        _RESULT_SLOT.__set__(self, value)
+        self._load = None
+
+    @property
+    def pending(self) -> Optional[Callable[[], Any]]:
+        """The loader of a result not decoded yet, or None."""
+        return self._load
+
+    def __reduce__(self) -> Any:
+        return (ToolResult, (self.call_id, self.name, self.result, self.is_error, self.attachments))
+
+
+@dataclass(slots=True)
 class Part:
     """A part of a message content.
 
@@ -118,7 +206,7 @@ class Part:
         return cls(function_response=result)
 
 
-@dataclass
+@dataclass(slots=True)
 class Message:
     """A message in a conversation.
 
@@ -30,6 +30,7 @@ from typing import Dict, List, Any, Callable, Optional
 
 from ..model_provider.types import ToolSchema
 from ..base import PromptEnrichmentResult, UserCommand
+from ..plugin_context import SessionLocal, clear_session_state
 
 
 # Image file extensions we recognize
@@ -63,12 +64,13 @@ class MultimodalPlugin:
         "gemini-4*",
     ]
 
+    # Images detected by the calling session's last prompt enrichment
+    _detected_images = SessionLocal(factory=dict)
+
     def __init__(self):
         self._base_path: Path = Path.cwd()
         self._max_image_size_mb: float = 10.0
         self._initialized = False
-        # Track detected images from last prompt enrichment
-        self._detected_images: Dict[str, Path] = {}
 
     @property
     def name(self) -> str:
@@ -95,7 +97,7 @@ class MultimodalPlugin:
 
     def shutdown(self) -> None:
         """Shutdown the multimodal plugin."""
-        self._detected_images.clear()
+        clear_session_state(self)
         self._initialized = False
 
     # ==================== Prompt Enrichment ====================
@@ -15,6 +15,7 @@ PLUGIN_KIND = "tool"
 from .policy import PermissionPolicy, PermissionDecision, PolicyMatch
 from .config_loader import load_config, validate_config, PermissionConfig
 from .channels import Channel, ConsoleChannel, WebhookChannel, ChannelResponse
+from .approvals import Approval, ApprovalStore
 from .plugin import PermissionPlugin, create_plugin
 from .sanitization import (
     SanitizationConfig,
@@ -42,6 +43,9 @@ __all__ = [
     'ConsoleChannel',
     'WebhookChannel',
     'ChannelResponse',
+    # Remembered approvals
+    'Approval',
+    'ApprovalStore',
     # Plugin
     'PermissionPlugin',
     'create_plugin',
@@ -0,0 +1,289 @@
+"""Approvals remembered across sessions.
+
+When a user answers "always" to a permission prompt, the approval normally
+lasts until the session ends (session whitelist). With an ApprovalStore it
+is also persisted, scoped to the project and the agent that asked, and
+expires after a while. Later sessions check the store before asking a
+channel, so a repeated approval costs no prompt or webhook round trip.
+
+Store file (JSON document, rewritten atomically under an exclusive lock
+of a sidecar ".lock" file, so concurrent updates do not lose approvals):
+    {"approvals": [{"pattern": "git *", "project": "/path/to/project",
+                    "agent_type": "main", "agent_name": null,
+                    "created_at": "...Z", "expires_at": "...Z",
+                    "reason": "..."}, ...]}
+"""
+
+import fnmatch
+import os
+import tempfile
+import threading
+from contextlib import contextmanager
+from dataclasses import asdict, dataclass
+from datetime import datetime, timedelta, timezone
+from pathlib import Path
+from typing import Any, Dict, Iterator, List, Optional
+
+try:
+    import fcntl
+    HAS_FCNTL = True
+except ImportError:
+    HAS_FCNTL = False
+
+from ... import json_codec
+
+
+# Default store location (next to the user-level permissions.json)
+DEFAULT_APPROVALS_PATH = Path.home() / ".config" / "jaato" / "approvals.json"
+
+# Default lifetime of a remembered approval
+DEFAULT_APPROVAL_TTL_DAYS = 30.0
+
+
+def normalize_pattern(pattern: str) -> str:
+    """Collapse runs of whitespace, so "git  *" and "git *" are one approval."""
+    return " ".join(pattern.split())
+
+
+def _utc_now() -> datetime:
+    return datetime.now(timezone.utc)
+
+
+def _format_time(when: datetime) -> str:
+    return when.astimezone(timezone.utc).replace(tzinfo=None).isoformat() + "Z"
+
+
+def _parse_time(timestamp: Optional[str]) -> Optional[datetime]:
+    """Parse an ISO 8601 timestamp; naive times are taken as UTC."""
+    if not timestamp:
+        return None
+    try:
+        when = datetime.fromisoformat(timestamp.replace("Z", "+00:00"))
+    except ValueError:
+        return None
+    return when if when.tzinfo else when.replace(tzinfo=timezone.utc)
+
+
+@dataclass
+class Approval:
+    """A remembered approval for tool calls matching a pattern."""
+
+    pattern: str  # Tool name or glob pattern, like session whitelist entries
+    project: str  # Project (workspace directory) it applies to
+    agent_type: str = "main"  # "main" or "subagent"
+    agent_name: Optional[str] = None  # Subagent profile, None for the main agent
+    created_at: str = ""
+    expires_at: Optional[str] = None  # None = never expires
+    reason: str = ""
+
+    def is_expired(self, now: datetime) -> bool:
+        expiry = _parse_time(self.expires_at)
+        return expiry is not None and expiry <= now
+
+    def matches(self, tool_name: str, signature: str) -> bool:
+        """Whether the approval covers a call (tool name or signature)."""
+        return (
+            fnmatch.fnmatch(tool_name, self.pattern)
+            or fnmatch.fnmatch(normalize_pattern(signature), self.pattern)
+        )
+
+    def to_dict(self) -> Dict[str, Any]:
+        return asdict(self)
+
+    @classmethod
+    def from_dict(cls, data: Dict[str, Any]) -> 'Approval':
+        return cls(
+            pattern=data["pattern"],
+            project=data["project"],
+            agent_type=data.get("agent_type", "main"),
+            agent_name=data.get("agent_name"),
+            created_at=data.get("created_at", ""),
+            expires_at=data.get("expires_at"),
+            reason=data.get("reason", ""),
+        )
+
+
+class ApprovalStore:
+    """Persistent, scoped approvals with expiry.
+
+    The file is re-read when another process changed it, so sessions
+    running side by side see each other's approvals.
+    """
+
+    def __init__(
+        self,
+        path: Optional[Path] = None,
+        ttl_days: Optional[float] = DEFAULT_APPROVAL_TTL_DAYS
+    ):
+        """Initialize the store.
+
+        Args:
+            path: Store file (defaults to DEFAULT_APPROVALS_PATH).
+            ttl_days: Lifetime of new approvals; None or 0 = no expiry.
+        """
+        self.path = Path(path).expanduser() if path else DEFAULT_APPROVALS_PATH
+        self.lock_path = self.path.with_name(self.path.name + ".lock")
+        self.ttl_days = ttl_days
+        self._approvals: List[Approval] = []
+        self._mtime_ns: Optional[int] = None
+        self._lock = threading.Lock()
+
+    def find(
+        self,
+        tool_name: str,
+        signature: str,
+        project: str,
+        agent_type: str = "main",
+        agent_name: Optional[str] = None
+    ) -> Optional[Approval]:
+        """Find an unexpired approval covering a tool call.
+
+        Args:
+            tool_name: Name of the tool.
+            signature: Call signature (see PermissionPolicy).
+            project: Project the call is made in.
+            agent_type: Type of the calling agent.
+            agent_name: Subagent profile of the calling agent, if any.
+
+        Returns:
+            The matching approval, or None.
+        """
+        now = _utc_now()
+        with self._lock:
+            self._reload()
+            for approval in self._approvals:
+                if (approval.project == project
+                        and approval.agent_type == agent_type
+                        and approval.agent_name == agent_name
+                        and not approval.is_expired(now)
+                        and approval.matches(tool_name, signature)):
+                    return approval
+        return None
+
+    def add(
+        self,
+        pattern: str,
+        project: str,
+        agent_type: str = "main",
+        agent_name: Optional[str] = None,
+        expires_at: Optional[str] = None,
+        reason: str = ""
+    ) -> Approval:
+        """Remember an approval, replacing one with the same pattern and scope.
+
+        Args:
+            pattern: Tool name or glob pattern.
+            project: Project it applies to.
+            agent_type: Type of the agent it applies to.
+            agent_name: Subagent profile it applies to, if any.
+            expires_at: ISO 8601 expiry time; defaults to now + ttl_days.
+            reason: Why it was granted (for auditing).
+
+        Returns:
+            The stored approval.
+        """
+        now = _utc_now()
+        if expires_at is None and self.ttl_days:
+            expires_at = _format_time(now + timedelta(days=self.ttl_days))
+        approval = Approval(
+            pattern=normalize_pattern(pattern),
+            project=project,
+            agent_type=agent_type,
+            agent_name=agent_name,
+            created_at=_format_time(now),
+            expires_at=expires_at,
+            reason=reason,
+        )
+        with self._lock, self._file_lock():
+            self._reload(force=True)
+            self._approvals = [
+                a for a in self._approvals
+                if not a.is_expired(now) and not self._same_scope(a, approval)
+            ]
+            self._approvals.append(approval)
+            self._write()
+        return approval
+
+    def revoke(self, pattern: str, project: Optional[str] = None) -> int:
+        """Forget the approvals with a pattern.
+
+        Args:
+            pattern: Pattern of the approvals to forget.
+            project: Only forget approvals of this project (None = all).
+
+        Returns:
+            Number of approvals forgotten.
+        """
+        pattern = normalize_pattern(pattern)
+        with self._lock, self._file_lock():
+            self._reload(force=True)
+            kept = [
+                a for a in self._approvals
+                if a.pattern != pattern or (project is not None and a.project != project)
+            ]
+            removed = len(self._approvals) - len(kept)
+            if removed:
+                self._approvals = kept
+                self._write()
+        return removed
+
+    def list(self, project: Optional[str] = None) -> List[Approval]:
+        """Return the unexpired approvals, optionally of one project."""
+        now = _utc_now()
+        with self._lock:
+            self._reload()
+            return [
+                a for a in self._approvals
+                if not a.is_expired(now) and (project is None or a.project == project)
+            ]
+
+    @staticmethod
+    def _same_scope(a: Approval, b: Approval) -> bool:
+        return (a.pattern, a.project, a.agent_type, a.agent_name) == \
+            (b.pattern, b.project, b.agent_type, b.agent_name)
+
+    @contextmanager
+    def _file_lock(self) -> Iterator[None]:
+        """Hold an exclusive lock of the sidecar lock file (across processes)."""
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        with open(self.lock_path, 'a+b') as f:
+            if HAS_FCNTL:
+                fcntl.flock(f.fileno(), fcntl.LOCK_EX)
+            yield  # Closing the file releases the flock
+
+    def _reload(self, force: bool = False) -> None:
+        # Caller holds self._lock; force re-reads even if the modification
+        # time did not change (writes within the file system's time
+        # resolution)
+        try:
+            mtime_ns = self.path.stat().st_mtime_ns
+        except FileNotFoundError:
+            self._approvals = []
+            self._mtime_ns = None
+            return
+        if mtime_ns == self._mtime_ns and not force:
+            return
+        try:
+            data = json_codec.loads(self.path.read_bytes())
+            self._approvals = [Approval.from_dict(a) for a in data.get("approvals", [])]
+        except (OSError, ValueError, KeyError, TypeError, AttributeError):
+            self._approvals = []
+        self._mtime_ns = mtime_ns
+
+    def _write(self) -> None:
+        # Caller holds self._lock and the file lock
+        data = json_codec.dumps_document({"approvals": [a.to_dict() for a in self._approvals]})
+        fd, tmp_path = tempfile.mkstemp(
+            dir=self.path.parent, prefix=self.path.name, suffix=".tmp"
+        )
+        try:
+            with os.fdopen(fd, 'wb') as f:
+                f.write(data)
+            os.replace(tmp_path, self.path)
+        except BaseException:
+            try:
+                os.unlink(tmp_path)
+            except OSError:
+                pass
+            raise
+        self._mtime_ns = self.path.stat().st_mtime_ns
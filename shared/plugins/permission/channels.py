@@ -18,6 +18,10 @@ from enum import Enum
 from pathlib import Path
 from typing import Any, Callable, Dict, List, Optional, TYPE_CHECKING
 
+from ...file_watcher import claim_json, get_watcher, write_json_atomic
+from ...http_transport import get_transport
+from ..plugin_context import SessionLocal
+
 if TYPE_CHECKING:
     from ..base import PermissionDisplayInfo, OutputCallback
 
@@ -150,6 +154,24 @@ class Channel(ABC):
         """
         ...
 
+    def request_permissions(
+        self, permission_requests: List[PermissionRequest]
+    ) -> List[ChannelResponse]:
+        """Request permission for several tool calls at once.
+
+        Used for the calls of one model response that all need approval,
+        so they are presented together. Channels that can do this in one
+        interaction (one prompt, one HTTP request) override this; the
+        default asks for each request in turn.
+
+        Args:
+            permission_requests: The permission requests to evaluate
+
+        Returns:
+            One ChannelResponse per request, in the same order
+        """
+        return [self.request_permission(request) for request in permission_requests]
+
     def initialize(self, config: Optional[Dict[str, Any]] = None) -> None:
         """Initialize the channel with optional configuration."""
         pass
@@ -175,6 +197,9 @@ class ConsoleChannel(Channel):
 
     This channel is designed for interactive terminal sessions where a human
     can review and approve/deny tool execution requests.
+
+    Output callbacks are set per calling session (see plugin_context), so
+    each session's prompts go to its own output.
     """
 
     # ANSI color codes for display
@@ -186,11 +211,14 @@ class ConsoleChannel(Channel):
     ANSI_YELLOW = "\033[33m"
     ANSI_CYAN = "\033[36m"
 
+    # Output callback of the calling session, and the output function
+    # wrapping it
+    _output_callback = SessionLocal(default=None)
+    _callback_output_func = SessionLocal(default=None)
+
     def __init__(self):
         self._input_func: Callable[[], str] = input
-        self._output_func: Callable[[str], None] = print
         self._default_output_func: Callable[[str], None] = print
-        self._output_callback: Optional['OutputCallback'] = None
         self._skip_readline_history: bool = True
         self._use_colors: bool = True  # Can be disabled for non-terminal output
 
@@ -226,6 +254,11 @@ class ConsoleChannel(Channel):
             # Fallback if readline operations fail
             return self._input_func()
 
+    @property
+    def _output_func(self) -> Callable[[str], None]:
+        """Output function: the session's callback, or the configured default."""
+        return self._callback_output_func or self._default_output_func
+
     @property
     def name(self) -> str:
         return "console"
@@ -243,7 +276,6 @@ class ConsoleChannel(Channel):
             if "input_func" in config:
                 self._input_func = config["input_func"]
             if "output_func" in config:
-                self._output_func = config["output_func"]
                 self._default_output_func = config["output_func"]
             if "skip_readline_history" in config:
                 self._skip_readline_history = config["skip_readline_history"]
@@ -264,10 +296,10 @@ class ConsoleChannel(Channel):
             # Wrap callback to match output_func signature
             def callback_wrapper(text: str) -> None:
                 callback("permission", text, "append")
-            self._output_func = callback_wrapper
+            self._callback_output_func = callback_wrapper
         else:
             # Restore default output function
-            self._output_func = self._default_output_func
+            self._callback_output_func = None
 
     def _c(self, text: str, *codes: str) -> str:
         """Apply ANSI color codes to text if colors are enabled."""
@@ -346,31 +378,88 @@ class ConsoleChannel(Channel):
             once      -> ALLOW_ONCE (don't remember)
             all       -> ALLOW_ALL (pre-approve all future requests in session)
         """
-        from ..base import PermissionDisplayInfo  # Import here to avoid circular
-
         # Format the request for display
         self._output_func("")
         self._output_func(self._c("=" * 60, self.ANSI_BOLD))
+        self._output_func(self._requester_line(request, "requesting tool execution:"))
+        self._output_request_details(request)
+        self._output_func(self._c("=" * 60, self.ANSI_BOLD))
+        self._output_func("")
+        self._output_func(self._options_line())
+
+        try:
+            response = self._read_input().strip().lower()
+        except (EOFError, KeyboardInterrupt):
+            return ChannelResponse(
+                request_id=request.request_id,
+                decision=ChannelDecision.DENY,
+                reason="User cancelled input",
+            )
+
+        return self._parse_answer(response, request)
+
+    def request_permissions(
+        self, permission_requests: List[PermissionRequest]
+    ) -> List[ChannelResponse]:
+        """Prompt once for several tool calls.
+
+        Lists every request, numbered, then reads one line: a single
+        answer applies to all requests, or one answer per request in
+        order (e.g. "y n a"). Anything else denies all of them.
+        """
+        if len(permission_requests) < 2:
+            return [self.request_permission(r) for r in permission_requests]
+
+        count = len(permission_requests)
+        self._output_func("")
+        self._output_func(self._c("=" * 60, self.ANSI_BOLD))
+        self._output_func(self._requester_line(
+            permission_requests[0], f"requesting {count} tool executions:"
+        ))
+        for number, request in enumerate(permission_requests, 1):
+            self._output_func("")
+            self._output_func(self._c(f"[{number}/{count}]", self.ANSI_BOLD))
+            self._output_request_details(request)
+        self._output_func(self._c("=" * 60, self.ANSI_BOLD))
+        self._output_func("")
+        self._output_func(self._options_line())
+        self._output_func(f"One answer for all, or {count} answers in order (e.g. \"y n\")")
 
+        try:
+            answers = self._read_input().strip().lower().split()
+        except (EOFError, KeyboardInterrupt):
+            answers = None
+
+        if answers is None or len(answers) not in (1, count):
+            reason = "User cancelled input" if answers is None else (
+                f"Expected 1 or {count} answers, got {len(answers)}"
+            )
+            return [
+                ChannelResponse(request_id=r.request_id, decision=ChannelDecision.DENY, reason=reason)
+                for r in permission_requests
+            ]
+        if len(answers) == 1:
+            answers = answers * count
+        return [
+            self._parse_answer(answer, request)
+            for answer, request in zip(answers, permission_requests)
+        ]
+
+    def _requester_line(self, request: PermissionRequest, action: str) -> str:
+        """Header naming the agent asking for permission."""
         # Display agent type to clarify who is asking for permission
         agent_type = request.context.get("agent_type") if request.context else None
         agent_name = request.context.get("agent_name") if request.context else None
+        label = self._c('[askPermission]', self.ANSI_YELLOW)
         if agent_type == "subagent":
             if agent_name:
-                self._output_func(
-                    f"{self._c('[askPermission]', self.ANSI_YELLOW)} "
-                    f"Subagent '{agent_name}' requesting tool execution:"
-                )
-            else:
-                self._output_func(
-                    f"{self._c('[askPermission]', self.ANSI_YELLOW)} "
-                    "Subagent requesting tool execution:"
-                )
-        else:
-            self._output_func(
-                f"{self._c('[askPermission]', self.ANSI_YELLOW)} "
-                "Main agent requesting tool execution:"
-            )
+                return f"{label} Subagent '{agent_name}' {action}"
+            return f"{label} Subagent {action}"
+        return f"{label} Main agent {action}"
+
+    def _output_request_details(self, request: PermissionRequest) -> None:
+        """Output the intent, and the custom display info or tool and arguments."""
+        from ..base import PermissionDisplayInfo  # Import here to avoid circular
 
         # Display intent prominently if provided
         intent = request.context.get("intent") if request.context else None
@@ -387,11 +476,9 @@ class ConsoleChannel(Channel):
             self._output_func(f"  {self._c('Tool:', self.ANSI_BOLD)} {request.tool_name}")
             self._output_func(f"  Arguments: {json.dumps(request.arguments, indent=4)}")
 
-        self._output_func(self._c("=" * 60, self.ANSI_BOLD))
-        self._output_func("")
-
-        # Colorized options line
-        options = (
+    def _options_line(self) -> str:
+        """Colorized options line."""
+        return (
             f"Options: "
             f"[{self._c('y', self.ANSI_GREEN)}]es, "
             f"[{self._c('n', self.ANSI_RED)}]o, "
@@ -400,18 +487,9 @@ class ConsoleChannel(Channel):
             f"[once], "
             f"[all]"
         )
-        self._output_func(options)
-
-        try:
-            response = self._read_input().strip().lower()
-        except (EOFError, KeyboardInterrupt):
-            return ChannelResponse(
-                request_id=request.request_id,
-                decision=ChannelDecision.DENY,
-                reason="User cancelled input",
-            )
 
-        # Parse response
+    def _parse_answer(self, response: str, request: PermissionRequest) -> ChannelResponse:
+        """Turn a (lowercase) answer into the response to a request."""
         if response in ("y", "yes"):
             return ChannelResponse(
                 request_id=request.request_id,
@@ -483,7 +561,15 @@ class WebhookChannel(Channel):
     """Channel that sends permission requests to an HTTP webhook.
 
     This channel is designed for integration with external approval systems,
-    such as Slack bots, approval workflows, or custom dashboards.
+    such as Slack bots, approval workflows, or custom dashboards. Requests
+    go through the shared HTTP transport, which keeps connections to the
+    endpoint alive between requests.
+
+    With "batch" enabled, the calls of one model response that need approval
+    are sent in a single POST:
+        {"batch_id": "...", "requests": [<request>, ...]}
+    and the endpoint answers with:
+        {"responses": [<response>, ...]}  (matched by request_id)
     """
 
     def __init__(self):
@@ -491,6 +577,8 @@ class WebhookChannel(Channel):
         self._timeout: int = 30
         self._headers: Dict[str, str] = {}
         self._auth_token: Optional[str] = None
+        self._batch: bool = False
+        self._transport = None
 
     @property
     def name(self) -> str:
@@ -504,6 +592,7 @@ class WebhookChannel(Channel):
             timeout: Request timeout in seconds
             headers: Additional headers to include
             auth_token: Bearer token for authorization
+            batch: Send several requests in one POST (endpoint must support it)
         """
         if not HAS_REQUESTS:
             raise RuntimeError("requests library required for WebhookChannel")
@@ -518,6 +607,18 @@ class WebhookChannel(Channel):
         self._timeout = config.get("timeout", 30)
         self._headers = config.get("headers", {})
         self._auth_token = config.get("auth_token") or os.environ.get("PERMISSION_WEBHOOK_TOKEN")
+        self._batch = config.get("batch", False)
+        self._transport = get_transport()
+
+    def _request_headers(self) -> Dict[str, str]:
+        headers = {
+            "Content-Type": "application/json",
+            **self._headers,
+        }
+
+        if self._auth_token:
+            headers["Authorization"] = f"Bearer {self._auth_token}"
+        return headers
 
     def request_permission(self, request: PermissionRequest) -> ChannelResponse:
         """Send permission request to webhook and wait for response."""
@@ -528,19 +629,11 @@ class WebhookChannel(Channel):
                 reason="Webhook endpoint not configured",
             )
 
-        headers = {
-            "Content-Type": "application/json",
-            **self._headers,
-        }
-
-        if self._auth_token:
-            headers["Authorization"] = f"Bearer {self._auth_token}"
-
         try:
-            response = requests.post(
+            response = self._transport.post(
                 self._endpoint,
                 json=request.to_dict(),
-                headers=headers,
+                headers=self._request_headers(),
                 timeout=self._timeout,
             )
 
@@ -572,20 +665,72 @@ class WebhookChannel(Channel):
                 reason=f"Webhook request failed: {e}",
             )
 
+    def request_permissions(
+        self, permission_requests: List[PermissionRequest]
+    ) -> List[ChannelResponse]:
+        """Send several permission requests in one POST (if batch is enabled)."""
+        if not self._batch or not self._endpoint or len(permission_requests) < 2:
+            return super().request_permissions(permission_requests)
+
+        def deny_all(reason: str, on_timeout: bool = False) -> List[ChannelResponse]:
+            return [
+                ChannelResponse(
+                    request_id=r.request_id,
+                    decision=(ChannelDecision.ALLOW
+                              if on_timeout and r.default_on_timeout == "allow"
+                              else ChannelDecision.DENY),
+                    reason=reason,
+                )
+                for r in permission_requests
+            ]
+
+        try:
+            response = self._transport.post(
+                self._endpoint,
+                json={
+                    "batch_id": str(uuid.uuid4()),
+                    "requests": [r.to_dict() for r in permission_requests],
+                },
+                headers=self._request_headers(),
+                timeout=self._timeout,
+            )
+            if response.status_code != 200:
+                return deny_all(f"Webhook returned status {response.status_code}")
+            data = response.json()
+        except requests.Timeout:
+            return deny_all(f"Webhook timeout after {self._timeout}s", on_timeout=True)
+        except (requests.RequestException, ValueError) as e:
+            return deny_all(f"Webhook request failed: {e}")
+
+        return _match_batch_responses(permission_requests, data, "webhook")
+
 
 class FileChannel(Channel):
-    """Channel that writes requests to a file and polls for responses.
+    """Channel that writes requests to a file and waits for responses.
 
     This channel is designed for scenarios where a separate process handles
     approval, such as a background service or manual file editing.
 
     Request files: {base_path}/requests/{request_id}.json
     Response files: {base_path}/responses/{request_id}.json
+
+    Responses are noticed by the shared file watcher (inotify on Linux,
+    polling elsewhere or with "watch": "poll") and claimed by renaming,
+    so only one reader consumes each response. Request files are renamed
+    into place once complete; responders should do the same.
+
+    With "batch" enabled, the calls of one model response that need approval
+    are written to one file, {base_path}/requests/{batch_id}.json:
+        {"batch_id": "...", "requests": [<request>, ...]}
+    answered by {base_path}/responses/{batch_id}.json:
+        {"responses": [<response>, ...]}  (matched by request_id)
     """
 
     def __init__(self):
         self._base_path: Optional[Path] = None
         self._poll_interval: float = 0.5  # seconds between polls
+        self._batch: bool = False
+        self._watcher = None
 
     @property
     def name(self) -> str:
@@ -596,7 +741,11 @@ class FileChannel(Channel):
 
         Config options:
             base_path: Directory for request/response files (required)
-            poll_interval: Seconds between polling attempts
+            poll_interval: Seconds between polling attempts (when polling)
+            batch: Write several requests to one file (the responding
+                process must support it)
+            watch: "auto" (inotify where available) or "poll" (needed
+                when responses are written from another host, e.g. NFS)
         """
         if not config:
             raise ValueError("FileChannel requires configuration with 'base_path'")
@@ -607,13 +756,36 @@ class FileChannel(Channel):
 
         self._base_path = Path(base_path)
         self._poll_interval = config.get("poll_interval", 0.5)
+        self._batch = config.get("batch", False)
+        self._watcher = get_watcher(use_inotify=config.get("watch", "auto") != "poll")
 
         # Create directories
         (self._base_path / "requests").mkdir(parents=True, exist_ok=True)
         (self._base_path / "responses").mkdir(parents=True, exist_ok=True)
 
+    def _wait_for_response(self, response_file: Path, timeout: float) -> Any:
+        """Wait for a response file and claim it.
+
+        Returns:
+            The parsed response, or None on timeout.
+
+        Raises:
+            json.JSONDecodeError, OSError: If the response cannot be read.
+        """
+        deadline = time.monotonic() + timeout
+        while True:
+            remaining = deadline - time.monotonic()
+            if remaining <= 0 or not self._watcher.wait_for(
+                response_file, remaining, self._poll_interval
+            ):
+                return None
+            try:
+                return claim_json(response_file)
+            except FileNotFoundError:
+                continue  # Claimed by another reader
+
     def request_permission(self, request: PermissionRequest) -> ChannelResponse:
-        """Write request file and poll for response file."""
+        """Write request file and wait for response file."""
         if not self._base_path:
             return ChannelResponse(
                 request_id=request.request_id,
@@ -623,34 +795,25 @@ class FileChannel(Channel):
 
         # Write request file
         request_file = self._base_path / "requests" / f"{request.request_id}.json"
-        with open(request_file, 'w', encoding='utf-8') as f:
-            json.dump(request.to_dict(), f, indent=2)
+        write_json_atomic(request_file, request.to_dict())
 
-        # Poll for response
+        # Wait for response
         response_file = self._base_path / "responses" / f"{request.request_id}.json"
-        start_time = time.time()
-
-        while time.time() - start_time < request.timeout_seconds:
-            if response_file.exists():
-                try:
-                    with open(response_file, 'r', encoding='utf-8') as f:
-                        data = json.load(f)
-                    # Clean up files
-                    request_file.unlink(missing_ok=True)
-                    response_file.unlink(missing_ok=True)
-                    return ChannelResponse.from_dict(data)
-                except (json.JSONDecodeError, IOError) as e:
-                    return ChannelResponse(
-                        request_id=request.request_id,
-                        decision=ChannelDecision.DENY,
-                        reason=f"Failed to read response file: {e}",
-                    )
-
-            time.sleep(self._poll_interval)
+        try:
+            data = self._wait_for_response(response_file, request.timeout_seconds)
+        except (json.JSONDecodeError, OSError) as e:
+            request_file.unlink(missing_ok=True)
+            return ChannelResponse(
+                request_id=request.request_id,
+                decision=ChannelDecision.DENY,
+                reason=f"Failed to read response file: {e}",
+            )
 
-        # Timeout - clean up request file
         request_file.unlink(missing_ok=True)
+        if data is not None:
+            return ChannelResponse.from_dict(data)
 
+        # Timeout
         default_decision = ChannelDecision.DENY
         if request.default_on_timeout == "allow":
             default_decision = ChannelDecision.ALLOW
@@ -661,6 +824,50 @@ class FileChannel(Channel):
             reason=f"Timeout after {request.timeout_seconds}s waiting for response",
         )
 
+    def request_permissions(
+        self, permission_requests: List[PermissionRequest]
+    ) -> List[ChannelResponse]:
+        """Write several requests to one file (if batch is enabled) and wait for the answer."""
+        if not self._batch or not self._base_path or len(permission_requests) < 2:
+            return super().request_permissions(permission_requests)
+
+        batch_id = str(uuid.uuid4())
+        request_file = self._base_path / "requests" / f"{batch_id}.json"
+        write_json_atomic(request_file, {
+            "batch_id": batch_id,
+            "requests": [r.to_dict() for r in permission_requests],
+        })
+
+        response_file = self._base_path / "responses" / f"{batch_id}.json"
+        timeout = max(r.timeout_seconds for r in permission_requests)
+        try:
+            data = self._wait_for_response(response_file, timeout)
+        except (json.JSONDecodeError, OSError) as e:
+            request_file.unlink(missing_ok=True)
+            return [
+                ChannelResponse(
+                    request_id=r.request_id,
+                    decision=ChannelDecision.DENY,
+                    reason=f"Failed to read response file: {e}",
+                )
+                for r in permission_requests
+            ]
+
+        request_file.unlink(missing_ok=True)
+        if data is not None:
+            return _match_batch_responses(permission_requests, data, "response file")
+
+        # Timeout
+        return [
+            ChannelResponse(
+                request_id=r.request_id,
+                decision=(ChannelDecision.ALLOW if r.default_on_timeout == "allow"
+                          else ChannelDecision.DENY),
+                reason=f"Timeout after {timeout}s waiting for response",
+            )
+            for r in permission_requests
+        ]
+
     def shutdown(self) -> None:
         """Clean up any pending request files."""
         if self._base_path:
@@ -709,6 +916,12 @@ class QueueChannel(ConsoleChannel):
         """Check if channel is waiting for user input."""
         return self._waiting_for_input
 
+    def request_permissions(
+        self, permission_requests: List[PermissionRequest]
+    ) -> List[ChannelResponse]:
+        """Prompt for each request in turn (the queue carries one answer per prompt)."""
+        return Channel.request_permissions(self, permission_requests)
+
     def _output(self, text: str, mode: str = "append") -> None:
         """Output text via callback."""
         if self._output_callback:
@@ -891,6 +1104,37 @@ class QueueChannel(ConsoleChannel):
                 self._prompt_callback(False)
 
 
+def _match_batch_responses(
+    permission_requests: List[PermissionRequest],
+    data: Any,
+    source: str
+) -> List[ChannelResponse]:
+    """Pair the responses of a batch answer with their requests.
+
+    Args:
+        permission_requests: Requests of the batch, in order.
+        data: Decoded answer, {"responses": [<response>, ...]}.
+        source: Where the answer came from, for the reason of missing ones.
+
+    Returns:
+        One response per request, in order; requests without a response
+        (matched by request_id) are denied.
+    """
+    entries = data.get("responses", []) if isinstance(data, dict) else []
+    by_id = {
+        entry.get("request_id"): ChannelResponse.from_dict(entry)
+        for entry in entries if isinstance(entry, dict)
+    }
+    return [
+        by_id.get(r.request_id) or ChannelResponse(
+            request_id=r.request_id,
+            decision=ChannelDecision.DENY,
+            reason=f"No response for this request in {source}",
+        )
+        for r in permission_requests
+    ]
+
+
 def create_channel(channel_type: str, config: Optional[Dict[str, Any]] = None) -> Channel:
     """Factory function to create an channel by type.
 
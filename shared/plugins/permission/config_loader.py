@@ -32,6 +32,11 @@ class PermissionConfig:
     channel_endpoint: Optional[str] = None
     channel_timeout: int = 30  # seconds
 
+    # Approvals remembered across sessions (see approvals.py)
+    approvals_enabled: bool = False
+    approvals_path: Optional[str] = None  # Default: ~/.config/jaato/approvals.json
+    approvals_ttl_days: Optional[float] = 30.0
+
     def to_policy_dict(self) -> Dict[str, Any]:
         """Convert to dict format expected by PermissionPolicy.from_config()."""
         return {
@@ -108,6 +113,18 @@ def validate_config(config: Dict[str, Any]) -> Tuple[bool, List[str]]:
         if timeout is not None and (not isinstance(timeout, (int, float)) or timeout <= 0):
             errors.append("Channel timeout must be a positive number")
 
+    # Validate remembered approvals configuration
+    approvals = config.get("approvals", {})
+    if not isinstance(approvals, dict):
+        errors.append("'approvals' must be an object")
+    elif approvals:
+        ttl_days = approvals.get("ttlDays")
+        if ttl_days is not None and (not isinstance(ttl_days, (int, float)) or ttl_days < 0):
+            errors.append("'approvals.ttlDays' must be a non-negative number")
+        path = approvals.get("path")
+        if path is not None and not isinstance(path, str):
+            errors.append("'approvals.path' must be a string")
+
     # Check for blacklist/whitelist conflicts (warning, not error)
     _check_conflicts(config, errors)
 
@@ -238,6 +255,7 @@ def load_config(
     blacklist = raw_config.get("blacklist", {})
     whitelist = raw_config.get("whitelist", {})
     channel = raw_config.get("channel", {})
+    approvals = raw_config.get("approvals", {})
 
     return PermissionConfig(
         version=str(raw_config.get("version", "1.0")),
@@ -251,6 +269,9 @@ def load_config(
         channel_type=channel.get("type", "console"),
         channel_endpoint=channel.get("endpoint"),
         channel_timeout=channel.get("timeout", 30),
+        approvals_enabled=approvals.get("enabled", False),
+        approvals_path=approvals.get("path"),
+        approvals_ttl_days=approvals.get("ttlDays", 30.0),
     )
 
 
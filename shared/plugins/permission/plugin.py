@@ -6,11 +6,12 @@ through blacklist/whitelist rules and interactive channel approval.
 
 import fnmatch
 import os
-from typing import Any, Callable, Dict, List, Optional, Tuple
+from typing import Any, Callable, Dict, List, Optional, Tuple, Union
 from ..model_provider.types import ToolSchema
 
 from .policy import PermissionPolicy, PermissionDecision, PolicyMatch
 from .config_loader import load_config, PermissionConfig
+from .approvals import Approval, ApprovalStore, DEFAULT_APPROVAL_TTL_DAYS
 from .channels import (
     Channel,
     ChannelDecision,
@@ -61,6 +62,8 @@ class PermissionPlugin:
         self._original_executors: Dict[str, Callable] = {}
         self._execution_log: List[Dict[str, Any]] = []
         self._allow_all: bool = False  # When True, auto-approve all requests
+        self._approvals: Optional[ApprovalStore] = None  # Approvals remembered across sessions
+        self._project: str = os.getcwd()  # Scope of remembered approvals
 
     def set_registry(self, registry: 'PluginRegistry') -> None:
         """Set the plugin registry for tool-to-plugin lookups.
@@ -102,6 +105,9 @@ class PermissionPlugin:
                    - channel_type: Type of channel ("console", "webhook", "file")
                    - channel_config: Configuration for the channel
                    - policy: Inline policy dict (overrides file)
+                   - approvals: Remember "always" approvals across sessions
+                     (overrides file): {"enabled": bool, "path": str,
+                     "ttl_days": float, "project": str}
         """
         # Load configuration
         config = config or {}
@@ -141,6 +147,22 @@ class PermissionPlugin:
             print("Falling back to console channel")
             self._channel = ConsoleChannel()
 
+        # Persistent approvals (opt-in)
+        approvals_config = config.get("approvals")
+        if approvals_config is None and self._config.approvals_enabled:
+            approvals_config = {
+                "path": self._config.approvals_path,
+                "ttl_days": self._config.approvals_ttl_days,
+            }
+        if approvals_config and approvals_config.get("enabled", True):
+            self._approvals = ApprovalStore(
+                approvals_config.get("path"),
+                approvals_config.get("ttl_days", DEFAULT_APPROVAL_TTL_DAYS),
+            )
+            self._project = approvals_config.get("project") or os.getcwd()
+        else:
+            self._approvals = None
+
         self._initialized = True
 
     def shutdown(self) -> None:
@@ -150,6 +172,7 @@ class PermissionPlugin:
         self._policy = None
         self._channel = None
         self._registry = None
+        self._approvals = None
         self._initialized = False
         self._wrapped_executors.clear()
         self._original_executors.clear()
@@ -165,8 +188,8 @@ class PermissionPlugin:
             tools: List of tool names to whitelist.
         """
         if self._policy and tools:
-            for tool in tools:
-                self._policy.whitelist_tools.add(tool)
+            self._policy.whitelist_tools.update(tools)
+            self._policy.invalidate()
 
     def get_tool_schemas(self) -> List[ToolSchema]:
         """Return function declarations for the askPermission tool.
@@ -247,7 +270,7 @@ If a tool is denied, do not attempt to execute it."""
         return [
             UserCommand(
                 name="permissions",
-                description="Manage session permissions: show, allow <pattern>, deny <pattern>, default <policy>, clear",
+                description="Manage session permissions: show, allow <pattern>, deny <pattern>, default <policy>, clear, approvals, revoke <pattern>",
                 share_with_model=False,
             )
         ]
@@ -273,6 +296,8 @@ If a tool is denied, do not attempt to execute it."""
             CommandCompletion("deny", "Add tool/pattern to session blacklist"),
             CommandCompletion("default", "Set session default policy"),
             CommandCompletion("clear", "Reset all session modifications"),
+            CommandCompletion("approvals", "List approvals remembered across sessions"),
+            CommandCompletion("revoke", "Forget a remembered approval"),
         ]
 
         # Policy options for "default" subcommand
@@ -308,6 +333,14 @@ If a tool is denied, do not attempt to execute it."""
                 # "permissions check <partial>" - provide all tool names
                 return self._get_tool_completions(partial)
 
+            if subcommand == "revoke" and self._approvals:
+                # "permissions revoke <partial>" - remembered patterns
+                return [
+                    CommandCompletion(a.pattern, f"Approved {a.created_at[:10]}")
+                    for a in self._approvals.list(self._project)
+                    if a.pattern.lower().startswith(partial)
+                ]
+
         return []
 
     def _get_tool_completions(
@@ -373,6 +406,8 @@ If a tool is denied, do not attempt to execute it."""
             deny <pattern>    - Add tool/pattern to session blacklist
             default <policy>  - Set session default policy (allow|deny|ask)
             clear             - Reset all session modifications
+            approvals         - List approvals remembered across sessions
+            revoke <pattern>  - Forget a remembered approval
 
         Args:
             args: Dict with 'args' key containing list of command arguments
@@ -411,16 +446,25 @@ If a tool is denied, do not attempt to execute it."""
             return self._permissions_default(policy)
         elif subcommand == "clear":
             return self._permissions_clear()
+        elif subcommand == "approvals":
+            return self._permissions_approvals()
+        elif subcommand == "revoke":
+            if len(cmd_args) < 2:
+                return "Usage: permissions revoke <pattern>"
+            pattern = " ".join(cmd_args[1:])
+            return self._permissions_revoke(pattern)
         else:
             return (
                 f"Unknown subcommand: {subcommand}\n"
-                "Usage: permissions <show|check|allow|deny|default|clear>\n"
+                "Usage: permissions <show|check|allow|deny|default|clear|approvals|revoke>\n"
                 "  show              - Display current effective policy\n"
                 "  check <tool>      - Test what decision a tool would get\n"
                 "  allow <pattern>   - Add to session whitelist\n"
                 "  deny <pattern>    - Add to session blacklist\n"
                 "  default <policy>  - Set session default (allow|deny|ask)\n"
-                "  clear             - Reset session modifications"
+                "  clear             - Reset session modifications\n"
+                "  approvals         - List remembered approvals\n"
+                "  revoke <pattern>  - Forget a remembered approval"
             )
 
     def _permissions_show(self) -> str:
@@ -555,6 +599,32 @@ If a tool is denied, do not attempt to execute it."""
         self._policy.clear_session_rules()
         return "Session rules cleared.\nReverted to base config."
 
+    def _permissions_approvals(self) -> str:
+        """List the approvals remembered for this project."""
+        if not self._approvals:
+            return "Remembered approvals are disabled (see the 'approvals' config option)."
+
+        approvals = self._approvals.list(self._project)
+        if not approvals:
+            return f"No remembered approvals for {self._project}."
+
+        lines = [f"Remembered approvals for {self._project}:"]
+        for approval in approvals:
+            agent = approval.agent_name or approval.agent_type
+            expires = approval.expires_at or "never"
+            lines.append(f"  + {approval.pattern}  ({agent}, expires {expires})")
+        return "\n".join(lines)
+
+    def _permissions_revoke(self, pattern: str) -> str:
+        """Forget the remembered approvals with a pattern in this project."""
+        if not self._approvals:
+            return "Remembered approvals are disabled (see the 'approvals' config option)."
+
+        removed = self._approvals.revoke(pattern, self._project)
+        if not removed:
+            return f"No remembered approval for: {pattern}"
+        return f"- Revoked remembered approval: {pattern}"
+
     def _execute_ask_permission(self, args: Dict[str, Any]) -> Dict[str, Any]:
         """Execute the askPermission tool.
 
@@ -605,7 +675,73 @@ If a tool is denied, do not attempt to execute it."""
             - 'reason': Human-readable reason string
             - 'method': Decision method ('whitelist', 'blacklist', 'default',
                        'sanitization', 'session_whitelist', 'session_blacklist',
-                       'user_approved', 'user_denied', 'allow_all', 'timeout')
+                       'remembered_approval', 'user_approved', 'user_denied',
+                       'allow_all', 'timeout')
+        """
+        outcome = self._decide(tool_name, args, context)
+        if isinstance(outcome, PermissionRequest):
+            response = self._channel.request_permission(outcome)
+            return self._handle_channel_response(tool_name, args, response, context)
+        return outcome
+
+    def check_permissions(
+        self,
+        calls: List[Tuple[str, Dict[str, Any]]],
+        context: Optional[Dict[str, Any]] = None
+    ) -> List[Tuple[bool, Dict[str, Any]]]:
+        """Check several tool executions, asking the channel once for all.
+
+        For the function calls of one model response: calls the policy
+        cannot decide are sent to the channel together
+        (Channel.request_permissions), so a round costs one prompt or
+        round trip instead of one per call.
+
+        Args:
+            calls: (tool_name, args) of each tool execution
+            context: Optional context for channel (session_id, turn_number, etc.)
+
+        Returns:
+            One (is_allowed, metadata_dict) per call, in order, as returned
+            by check_permission().
+        """
+        results: List[Optional[Tuple[bool, Dict[str, Any]]]] = []
+        pending: List[Tuple[int, PermissionRequest]] = []
+        for tool_name, args in calls:
+            outcome = self._decide(tool_name, args, context)
+            if isinstance(outcome, PermissionRequest):
+                pending.append((len(results), outcome))
+                results.append(None)
+            else:
+                results.append(outcome)
+
+        if len(pending) == 1:
+            responses = [self._channel.request_permission(pending[0][1])]
+        elif pending:
+            responses = self._channel.request_permissions([request for _, request in pending])
+        else:
+            responses = []
+
+        for i, (index, request) in enumerate(pending):
+            if i < len(responses):
+                results[index] = self._handle_channel_response(
+                    request.tool_name, request.arguments, responses[i], context
+                )
+            else:
+                self._log_decision(request.tool_name, request.arguments, "deny", "No channel response")
+                results[index] = (False, {'reason': 'No channel response', 'method': 'unknown'})
+        return results
+
+    def _decide(
+        self,
+        tool_name: str,
+        args: Dict[str, Any],
+        context: Optional[Dict[str, Any]]
+    ) -> Union[Tuple[bool, Dict[str, Any]], PermissionRequest]:
+        """Decide a tool execution without the channel.
+
+        Returns:
+            The (is_allowed, metadata_dict) result, or the PermissionRequest
+            to send to the channel if the policy cannot decide.
         """
         # Check if user pre-approved all requests
         if self._allow_all:
@@ -627,6 +763,13 @@ If a tool is denied, do not attempt to execute it."""
             return False, {'reason': match.reason, 'method': match.rule_type or 'policy'}
 
         elif match.decision == PermissionDecision.ASK_CHANNEL:
+            # An approval remembered from an earlier session answers for the channel
+            approval = self._find_approval(tool_name, args, context)
+            if approval:
+                reason = f"Remembered approval: {approval.pattern}"
+                self._log_decision(tool_name, args, "allow", reason, approval)
+                return True, {'reason': reason, 'method': 'remembered_approval'}
+
             # Need to ask the channel
             if not self._channel:
                 self._log_decision(tool_name, args, "deny", "No channel configured")
@@ -641,16 +784,13 @@ If a tool is denied, do not attempt to execute it."""
             if display_info:
                 request_context["display_info"] = display_info
 
-            request = PermissionRequest.create(
+            return PermissionRequest.create(
                 tool_name=tool_name,
                 arguments=args,
                 timeout=self._config.channel_timeout if self._config else 30,
                 context=request_context,
             )
 
-            response = self._channel.request_permission(request)
-            return self._handle_channel_response(tool_name, args, response)
-
         # Unknown decision type, deny by default
         return False, {'reason': 'Unknown policy decision', 'method': 'unknown'}
 
@@ -658,11 +798,13 @@ If a tool is denied, do not attempt to execute it."""
         self,
         tool_name: str,
         args: Dict[str, Any],
-        response: ChannelResponse
+        response: ChannelResponse,
+        context: Optional[Dict[str, Any]] = None
     ) -> Tuple[bool, Dict[str, Any]]:
         """Handle response from an channel.
 
-        Updates session rules if channel requests it.
+        Updates session rules if channel requests it, and remembers
+        session approvals across sessions if an approval store is set.
 
         Returns:
             Tuple of (is_allowed, metadata_dict) with 'reason' and 'method'.
@@ -678,7 +820,8 @@ If a tool is denied, do not attempt to execute it."""
             pattern = response.remember_pattern or tool_name
             if self._policy:
                 self._policy.add_session_whitelist(pattern)
-            self._log_decision(tool_name, args, "allow", f"Session whitelist: {pattern}")
+            approval = self._remember_approval(pattern, response, context)
+            self._log_decision(tool_name, args, "allow", f"Session whitelist: {pattern}", approval)
             return True, {'reason': response.reason, 'method': 'session_whitelist'}
 
         elif decision == ChannelDecision.ALLOW_ALL:
@@ -707,20 +850,69 @@ If a tool is denied, do not attempt to execute it."""
         self._log_decision(tool_name, args, "deny", "Unknown channel decision")
         return False, {'reason': 'Unknown channel decision', 'method': 'unknown'}
 
+    def _approval_scope(self, context: Optional[Dict[str, Any]]) -> Dict[str, Any]:
+        """Scope of remembered approvals for a calling agent."""
+        context = context or {}
+        return {
+            "project": self._project,
+            "agent_type": context.get("agent_type", "main"),
+            "agent_name": context.get("agent_name"),
+        }
+
+    def _find_approval(
+        self,
+        tool_name: str,
+        args: Dict[str, Any],
+        context: Optional[Dict[str, Any]]
+    ) -> Optional[Approval]:
+        """Find a remembered approval covering a call, if approvals are enabled."""
+        if not self._approvals or not self._policy:
+            return None
+        signature = self._policy._build_signature(tool_name, args)
+        return self._approvals.find(tool_name, signature, **self._approval_scope(context))
+
+    def _remember_approval(
+        self,
+        pattern: str,
+        response: ChannelResponse,
+        context: Optional[Dict[str, Any]]
+    ) -> Optional[Approval]:
+        """Persist a session approval, if approvals are enabled."""
+        if not self._approvals:
+            return None
+        try:
+            return self._approvals.add(
+                pattern,
+                expires_at=response.expires_at,
+                reason=response.reason,
+                **self._approval_scope(context),
+            )
+        except OSError:
+            # The session whitelist still applies
+            return None
+
     def _log_decision(
         self,
         tool_name: str,
         args: Dict[str, Any],
         decision: str,
-        reason: str
+        reason: str,
+        approval: Optional[Approval] = None
     ) -> None:
-        """Log a permission decision for auditing."""
-        self._execution_log.append({
+        """Log a permission decision for auditing.
+
+        Decisions made or recorded through a remembered approval include
+        it under "approval".
+        """
+        entry = {
             "tool_name": tool_name,
             "arguments": args,
             "decision": decision,
             "reason": reason,
-        })
+        }
+        if approval:
+            entry["approval"] = approval.to_dict()
+        self._execution_log.append(entry)
 
     def _get_display_info(
         self,
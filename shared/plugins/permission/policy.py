@@ -7,13 +7,22 @@ Optionally includes sanitization checks for:
 - Shell injection prevention
 - Path scope validation
 - Dangerous command blocking
+
+Rules are compiled on first use: the glob patterns and argument values of
+each rule class are indexed by literal prefix, so a check only tries the
+rules that can match, even with thousands of them. Decisions are cached,
+so repeated calls cost a dictionary lookup.
 """
 
+import copy
 import fnmatch
+import os
 import re
-from dataclasses import dataclass, field
+import threading
+from collections import OrderedDict
+from dataclasses import dataclass, field, fields
 from enum import Enum
-from typing import Any, Dict, List, Optional, Set
+from typing import Any, Dict, Iterable, List, Optional, Set, Tuple
 
 from .sanitization import (
     SanitizationConfig,
@@ -40,6 +49,138 @@ class PolicyMatch:
     violations: Optional[List[str]] = None  # For sanitization failures
 
 
+# Default number of decisions remembered by PermissionPolicy.check
+DEFAULT_DECISION_CACHE_SIZE = 1024
+
+# Text of a glob pattern before its first wildcard
+_LITERAL_PREFIX = re.compile(r'[^*?[]*')
+
+# Fields the compiled rules and cached decisions depend on
+_RULE_FIELDS = frozenset({
+    "default_policy",
+    "blacklist_tools", "blacklist_patterns", "blacklist_arguments",
+    "whitelist_tools", "whitelist_patterns", "whitelist_arguments",
+    "session_blacklist", "session_whitelist", "session_default_policy",
+    "sanitization_config", "cwd",
+})
+
+
+class _GlobSet:
+    """Glob patterns indexed by their literal prefix.
+
+    match() gives the same answer as trying fnmatch.fnmatch() with each
+    pattern in turn, but only tries the patterns whose literal prefix (the
+    text before the first wildcard) starts the text: one dictionary lookup
+    per distinct prefix length instead of one match per pattern. Patterns
+    are compiled to regular expressions when first tried.
+    """
+
+    def __init__(self, patterns: Iterable[str]):
+        self.patterns = list(dict.fromkeys(patterns))
+        self._globs = [os.path.normcase(pattern) for pattern in self.patterns]
+        self._regexes: List[Optional[Any]] = [None] * len(self.patterns)
+        self._by_prefix: Dict[str, List[int]] = {}
+        for i, glob in enumerate(self._globs):
+            prefix = _LITERAL_PREFIX.match(glob).group()
+            self._by_prefix.setdefault(prefix, []).append(i)
+        self._lengths = sorted({len(prefix) for prefix in self._by_prefix})
+
+    def match(self, *texts: str) -> Optional[str]:
+        """Return the first pattern matching one of the texts, or None."""
+        for text in texts:
+            text = os.path.normcase(text)
+            candidates: List[int] = []
+            for length in self._lengths:
+                if length > len(text):
+                    break
+                candidates.extend(self._by_prefix.get(text[:length], ()))
+            for i in sorted(candidates):
+                regex = self._regexes[i]
+                if regex is None:
+                    regex = self._regexes[i] = re.compile(fnmatch.translate(self._globs[i]))
+                if regex.match(text):
+                    return self.patterns[i]
+        return None
+
+
+class _ValueSet:
+    """Argument rule values indexed for matching against an argument.
+
+    A value matches an argument that starts with it, or optionally that
+    contains it as a whitespace-separated word. match() returns the first
+    matching value in rule order, like checking each value in turn, with
+    one dictionary lookup per distinct value length (and word).
+    """
+
+    def __init__(self, values: Iterable[str], match_words: bool):
+        self.values = list(values)
+        self._match_words = match_words
+        self._first: Dict[str, int] = {}  # value -> index of its first occurrence
+        for i, value in enumerate(self.values):
+            self._first.setdefault(value, i)
+        self._lengths = sorted({len(value) for value in self._first})
+
+    def match(self, text: str) -> Optional[str]:
+        first = len(self.values)
+        for length in self._lengths:
+            if length > len(text):
+                break
+            first = min(first, self._first.get(text[:length], first))
+        if self._match_words:
+            for word in text.split():
+                first = min(first, self._first.get(word, first))
+        return self.values[first] if first < len(self.values) else None
+
+
+def _glob_set(patterns: Iterable[str], previous: Optional[_GlobSet]) -> _GlobSet:
+    """Compile patterns, reusing the previous set if they are unchanged."""
+    patterns = list(dict.fromkeys(patterns))
+    if previous is not None and previous.patterns == patterns:
+        return previous
+    return _GlobSet(patterns)
+
+
+class _CompiledRules:
+    """Matchers built from a PermissionPolicy's rules."""
+
+    def __init__(
+        self,
+        policy: 'PermissionPolicy',
+        version: int,
+        previous: Optional['_CompiledRules'] = None
+    ):
+        """Compile a policy's rules.
+
+        Args:
+            policy: The policy.
+            version: Rule version the policy is at.
+            previous: Rules compiled before the last change; pattern sets
+                that did not change are reused (a session rule does not
+                recompile a large static policy).
+        """
+        self.version = version
+        self.blacklist = _glob_set(policy.blacklist_patterns, previous and previous.blacklist)
+        self.whitelist = _glob_set(policy.whitelist_patterns, previous and previous.whitelist)
+        self.session_blacklist = _glob_set(
+            policy.session_blacklist, previous and previous.session_blacklist)
+        self.session_whitelist = _glob_set(
+            policy.session_whitelist, previous and previous.session_whitelist)
+        self.blacklist_arguments = {
+            tool: [(arg, _ValueSet(values, match_words=True)) for arg, values in rules.items()]
+            for tool, rules in policy.blacklist_arguments.items()
+        }
+        self.whitelist_arguments = {
+            tool: [(arg, _ValueSet(values, match_words=False)) for arg, values in rules.items()]
+            for tool, rules in policy.whitelist_arguments.items()
+        }
+        # Arguments read by each tool's argument rules (part of the cache key)
+        self.rule_arguments: Dict[str, Tuple[str, ...]] = {}
+        for rules in (policy.blacklist_arguments, policy.whitelist_arguments):
+            for tool, arg_rules in rules.items():
+                names = self.rule_arguments.get(tool, ())
+                self.rule_arguments[tool] = names + tuple(a for a in arg_rules if a not in names)
+
+
 @dataclass
 class PermissionPolicy:
     """Policy engine for evaluating tool execution permissions.
@@ -51,6 +192,15 @@ class PermissionPolicy:
     4. Apply default_policy
 
     Blacklist ALWAYS takes priority over whitelist.
+
+    Rules are compiled on the first check after they change, and the
+    decisions of steps 2-4 are cached by tool, signature and the arguments
+    the argument rules read. The session_* methods and from_config() keep
+    the compiled rules current, as does assigning a rule field; code that
+    modifies a rule collection in place must call invalidate().
+    Sanitization (step 1) is never cached, since path checks depend on
+    the file system. Copies (copy.copy, copy.deepcopy) start with their
+    own lock and an empty cache.
     """
 
     default_policy: str = "deny"  # "allow" or "deny"
@@ -74,6 +224,52 @@ class PermissionPolicy:
     sanitization_config: Optional[SanitizationConfig] = None
     cwd: Optional[str] = None  # Working directory for path checks
 
+    # Maximum number of cached decisions (0 disables the cache)
+    decision_cache_size: int = DEFAULT_DECISION_CACHE_SIZE
+
+    # Compiled rules and decision cache (declared last: assigning rule
+    # fields in __init__ must not invalidate before the lock exists)
+    _lock: threading.Lock = field(
+        default_factory=threading.Lock, init=False, repr=False, compare=False)
+    _version: int = field(default=0, init=False, repr=False, compare=False)
+    _compiled: Optional[_CompiledRules] = field(
+        default=None, init=False, repr=False, compare=False)
+    _decisions: "OrderedDict[tuple, PolicyMatch]" = field(
+        default_factory=OrderedDict, init=False, repr=False, compare=False)
+
+    def __setattr__(self, name: str, value: Any) -> None:
+        super().__setattr__(name, value)
+        if name in _RULE_FIELDS and "_lock" in self.__dict__:
+            self.invalidate()
+
+    def __copy__(self) -> 'PermissionPolicy':
+        return type(self)(**{f.name: getattr(self, f.name) for f in fields(self) if f.init})
+
+    def __deepcopy__(self, memo: Dict[int, Any]) -> 'PermissionPolicy':
+        return type(self)(**{
+            f.name: copy.deepcopy(getattr(self, f.name), memo) for f in fields(self) if f.init
+        })
+
+    def invalidate(self) -> None:
+        """Recompile the rules and drop cached decisions on the next check.
+
+        Needed after modifying a rule collection in place (e.g.
+        policy.whitelist_tools.add(...)).
+        """
+        with self._lock:
+            self._version += 1
+            self._decisions.clear()
+
+    def _rules(self) -> _CompiledRules:
+        compiled = self._compiled
+        if compiled is None or compiled.version != self._version:
+            with self._lock:
+                compiled = self._compiled
+                if compiled is None or compiled.version != self._version:
+                    compiled = _CompiledRules(self, self._version, compiled)
+                    self._compiled = compiled
+        return compiled
+
     def check(self, tool_name: str, args: Dict[str, Any]) -> PolicyMatch:
         """Evaluate permission for a tool call.
 
@@ -93,8 +289,31 @@ class PermissionPolicy:
             if sanitization_match:
                 return sanitization_match
 
+        rules = self._rules()
+        key = (rules.version, tool_name, signature) + tuple(
+            value if isinstance(value, str) else None
+            for value in (args.get(name, "") for name in rules.rule_arguments.get(tool_name, ()))
+        )
+        with self._lock:
+            match = self._decisions.get(key)
+            if match is not None:
+                self._decisions.move_to_end(key)
+                return match
+
+        match = self._evaluate(rules, tool_name, args, signature)
+        if match.decision != PermissionDecision.ASK_CHANNEL and self.decision_cache_size > 0:
+            with self._lock:
+                self._decisions[key] = match
+                if len(self._decisions) > self.decision_cache_size:
+                    self._decisions.popitem(last=False)
+        return match
+
+    def _evaluate(
+        self, rules: _CompiledRules, tool_name: str, args: Dict[str, Any], signature: str
+    ) -> PolicyMatch:
+        """Evaluate the blacklist, whitelist and default policy."""
         # 1. Check session blacklist first (highest priority)
-        if self._matches_session_blacklist(tool_name, signature):
+        if self._matches_session_blacklist(rules, tool_name, signature):
             return PolicyMatch(
                 decision=PermissionDecision.DENY,
                 reason=f"Tool '{tool_name}' is blacklisted for this session",
@@ -102,12 +321,12 @@ class PermissionPolicy:
             )
 
         # 2. Check static blacklist
-        blacklist_match = self._check_blacklist(tool_name, args, signature)
+        blacklist_match = self._check_blacklist(rules, tool_name, args, signature)
         if blacklist_match:
             return blacklist_match
 
         # 3. Check session whitelist
-        if self._matches_session_whitelist(tool_name, signature):
+        if rules.session_whitelist.match(tool_name, signature):
             return PolicyMatch(
                 decision=PermissionDecision.ALLOW,
                 reason=f"Tool '{tool_name}' is whitelisted for this session",
@@ -115,7 +334,7 @@ class PermissionPolicy:
             )
 
         # 4. Check static whitelist
-        whitelist_match = self._check_whitelist(tool_name, args, signature)
+        whitelist_match = self._check_whitelist(rules, tool_name, args, signature)
         if whitelist_match:
             return whitelist_match
 
@@ -193,7 +412,9 @@ class PermissionPolicy:
                 return f"{tool_name}()"
             return f"{tool_name}({', '.join(f'{k}={v}' for k, v in sorted(args.items()))})"
 
-    def _matches_session_blacklist(self, tool_name: str, signature: str) -> bool:
+    def _matches_session_blacklist(
+        self, rules: _CompiledRules, tool_name: str, signature: str
+    ) -> bool:
         """Check if tool matches any session blacklist entry.
 
         Note: If the tool name is an EXACT match in session_whitelist, pattern
@@ -201,34 +422,19 @@ class PermissionPolicy:
         entries to override blacklist patterns (e.g., allow "createPlan" to
         override "deny: create*").
         """
-        # Check if tool has explicit whitelist entry (not pattern) - if so, skip pattern blacklist
-        has_explicit_whitelist = tool_name in self.session_whitelist
+        # Exact matches in blacklist always apply
+        # (explicit blacklist beats explicit whitelist)
+        if tool_name in self.session_blacklist:
+            return True
 
-        for pattern in self.session_blacklist:
-            # Exact matches in blacklist always apply
-            is_exact_blacklist = (pattern == tool_name)
+        # Pattern match - but skip if there's an explicit whitelist entry
+        if tool_name in self.session_whitelist:
+            return False
 
-            if is_exact_blacklist:
-                # Explicit blacklist beats explicit whitelist
-                return True
-
-            # Pattern match - but skip if there's an explicit whitelist entry
-            if has_explicit_whitelist:
-                continue
-
-            if fnmatch.fnmatch(tool_name, pattern) or fnmatch.fnmatch(signature, pattern):
-                return True
-        return False
-
-    def _matches_session_whitelist(self, tool_name: str, signature: str) -> bool:
-        """Check if tool matches any session whitelist entry."""
-        for pattern in self.session_whitelist:
-            if fnmatch.fnmatch(tool_name, pattern) or fnmatch.fnmatch(signature, pattern):
-                return True
-        return False
+        return rules.session_blacklist.match(tool_name, signature) is not None
 
     def _check_blacklist(
-        self, tool_name: str, args: Dict[str, Any], signature: str
+        self, rules: _CompiledRules, tool_name: str, args: Dict[str, Any], signature: str
     ) -> Optional[PolicyMatch]:
         """Check blacklist rules. Returns match if blocked, None otherwise."""
 
@@ -242,35 +448,33 @@ class PermissionPolicy:
             )
 
         # Check pattern blacklist (glob-style matching)
-        for pattern in self.blacklist_patterns:
-            if fnmatch.fnmatch(signature, pattern):
-                return PolicyMatch(
-                    decision=PermissionDecision.DENY,
-                    reason=f"Command matches blacklist pattern: {pattern}",
-                    matched_rule=pattern,
-                    rule_type="blacklist"
-                )
+        pattern = rules.blacklist.match(signature)
+        if pattern is not None:
+            return PolicyMatch(
+                decision=PermissionDecision.DENY,
+                reason=f"Command matches blacklist pattern: {pattern}",
+                matched_rule=pattern,
+                rule_type="blacklist"
+            )
 
-        # Check argument blacklist
-        if tool_name in self.blacklist_arguments:
-            arg_rules = self.blacklist_arguments[tool_name]
-            for arg_name, blocked_values in arg_rules.items():
-                arg_value = args.get(arg_name, "")
-                # For string arguments, check if it starts with any blocked value
-                if isinstance(arg_value, str):
-                    for blocked in blocked_values:
-                        if arg_value.startswith(blocked) or blocked in arg_value.split():
-                            return PolicyMatch(
-                                decision=PermissionDecision.DENY,
-                                reason=f"Argument '{arg_name}' contains blocked value: {blocked}",
-                                matched_rule=f"{arg_name}={blocked}",
-                                rule_type="blacklist"
-                            )
+        # Check argument blacklist: a string argument that starts with a
+        # blocked value, or contains it as a word
+        for arg_name, blocked_values in rules.blacklist_arguments.get(tool_name, ()):
+            arg_value = args.get(arg_name, "")
+            if isinstance(arg_value, str):
+                blocked = blocked_values.match(arg_value)
+                if blocked is not None:
+                    return PolicyMatch(
+                        decision=PermissionDecision.DENY,
+                        reason=f"Argument '{arg_name}' contains blocked value: {blocked}",
+                        matched_rule=f"{arg_name}={blocked}",
+                        rule_type="blacklist"
+                    )
 
         return None
 
     def _check_whitelist(
-        self, tool_name: str, args: Dict[str, Any], signature: str
+        self, rules: _CompiledRules, tool_name: str, args: Dict[str, Any], signature: str
     ) -> Optional[PolicyMatch]:
         """Check whitelist rules. Returns match if allowed, None otherwise."""
 
@@ -284,35 +488,35 @@ class PermissionPolicy:
             )
 
         # Check pattern whitelist (glob-style matching)
-        for pattern in self.whitelist_patterns:
-            if fnmatch.fnmatch(signature, pattern):
-                return PolicyMatch(
-                    decision=PermissionDecision.ALLOW,
-                    reason=f"Command matches whitelist pattern: {pattern}",
-                    matched_rule=pattern,
-                    rule_type="whitelist"
-                )
+        pattern = rules.whitelist.match(signature)
+        if pattern is not None:
+            return PolicyMatch(
+                decision=PermissionDecision.ALLOW,
+                reason=f"Command matches whitelist pattern: {pattern}",
+                matched_rule=pattern,
+                rule_type="whitelist"
+            )
 
-        # Check argument whitelist
-        if tool_name in self.whitelist_arguments:
-            arg_rules = self.whitelist_arguments[tool_name]
-            for arg_name, allowed_values in arg_rules.items():
-                arg_value = args.get(arg_name, "")
-                if isinstance(arg_value, str):
-                    for allowed in allowed_values:
-                        if arg_value.startswith(allowed):
-                            return PolicyMatch(
-                                decision=PermissionDecision.ALLOW,
-                                reason=f"Argument '{arg_name}' matches allowed value: {allowed}",
-                                matched_rule=f"{arg_name}={allowed}",
-                                rule_type="whitelist"
-                            )
+        # Check argument whitelist: a string argument that starts with an
+        # allowed value
+        for arg_name, allowed_values in rules.whitelist_arguments.get(tool_name, ()):
+            arg_value = args.get(arg_name, "")
+            if isinstance(arg_value, str):
+                allowed = allowed_values.match(arg_value)
+                if allowed is not None:
+                    return PolicyMatch(
+                        decision=PermissionDecision.ALLOW,
+                        reason=f"Argument '{arg_name}' matches allowed value: {allowed}",
+                        matched_rule=f"{arg_name}={allowed}",
+                        rule_type="whitelist"
+                    )
 
         return None
 
     def add_session_blacklist(self, pattern: str) -> None:
         """Add a pattern to the session blacklist."""
         self.session_blacklist.add(pattern)
+        self.invalidate()
 
     def add_session_whitelist(self, pattern: str) -> None:
         """Add a pattern to the session whitelist.
@@ -320,12 +524,14 @@ class PermissionPolicy:
         Note: Session blacklist still takes priority over session whitelist.
         """
         self.session_whitelist.add(pattern)
+        self.invalidate()
 
     def clear_session_rules(self) -> None:
         """Clear all session-level rules."""
         self.session_blacklist.clear()
         self.session_whitelist.clear()
         self.session_default_policy = None
+        self.invalidate()
 
     def set_session_default_policy(self, policy: Optional[str]) -> None:
         """Set the session default policy override.
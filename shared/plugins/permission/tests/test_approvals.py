@@ -0,0 +1,194 @@
+"""Tests for approvals remembered across sessions."""
+
+import json
+import threading
+from datetime import datetime, timedelta, timezone
+from unittest.mock import Mock
+
+import pytest
+
+from ..approvals import ApprovalStore, normalize_pattern
+from ..channels import ChannelDecision, ChannelResponse
+from ..plugin import PermissionPlugin
+
+
+PROJECT = "/work/project"
+
+
+@pytest.fixture
+def store_path(tmp_path):
+    return tmp_path / "approvals.json"
+
+
+class TestApprovalStore:
+    """Tests for ApprovalStore."""
+
+    def test_find_matching_approval(self, store_path):
+        store = ApprovalStore(store_path)
+        store.add("git *", PROJECT, reason="User approved for session")
+
+        approval = store.find("cli_based_tool", "git status", PROJECT)
+        assert approval is not None
+        assert approval.pattern == "git *"
+        assert store.find("cli_based_tool", "rm file", PROJECT) is None
+
+    def test_tool_name_pattern(self, store_path):
+        store = ApprovalStore(store_path)
+        store.add("readFile", PROJECT)
+        assert store.find("readFile", "readFile(path=a.txt)", PROJECT) is not None
+
+    def test_scoped_to_project_and_agent(self, store_path):
+        store = ApprovalStore(store_path)
+        store.add("git *", PROJECT, agent_type="subagent", agent_name="reviewer")
+
+        assert store.find("cli_based_tool", "git log", PROJECT, "subagent", "reviewer")
+        assert store.find("cli_based_tool", "git log", PROJECT, "subagent", "coder") is None
+        assert store.find("cli_based_tool", "git log", PROJECT) is None
+        assert store.find("cli_based_tool", "git log", "/other", "subagent", "reviewer") is None
+
+    def test_persisted_across_instances(self, store_path):
+        ApprovalStore(store_path).add("npm *", PROJECT)
+        assert ApprovalStore(store_path).find("cli_based_tool", "npm test", PROJECT)
+
+    def test_sees_changes_of_other_instances(self, store_path):
+        first = ApprovalStore(store_path)
+        assert first.find("cli_based_tool", "npm test", PROJECT) is None
+        ApprovalStore(store_path).add("npm *", PROJECT)
+        assert first.find("cli_based_tool", "npm test", PROJECT) is not None
+
+    def test_expiry(self, store_path):
+        store = ApprovalStore(store_path)
+        past = (datetime.now(timezone.utc) - timedelta(minutes=1)).isoformat()
+        store.add("git *", PROJECT, expires_at=past)
+        assert store.find("cli_based_tool", "git status", PROJECT) is None
+        assert store.list() == []
+
+    def test_default_ttl(self, store_path):
+        store = ApprovalStore(store_path, ttl_days=1)
+        approval = store.add("git *", PROJECT)
+        expires = datetime.fromisoformat(approval.expires_at.replace("Z", "+00:00"))
+        assert timedelta(hours=23) < expires - datetime.now(timezone.utc) <= timedelta(days=1)
+
+        assert ApprovalStore(store_path, ttl_days=0).add("npm *", PROJECT).expires_at is None
+
+    def test_add_replaces_same_scope(self, store_path):
+        store = ApprovalStore(store_path)
+        store.add("git *", PROJECT, reason="first")
+        store.add("git  *", PROJECT, reason="second")
+        approvals = store.list(PROJECT)
+        assert len(approvals) == 1
+        assert approvals[0].reason == "second"
+
+    def test_revoke(self, store_path):
+        store = ApprovalStore(store_path)
+        store.add("git *", PROJECT)
+        store.add("git *", "/other")
+        assert store.revoke("git *", PROJECT) == 1
+        assert store.find("cli_based_tool", "git status", PROJECT) is None
+        assert store.find("cli_based_tool", "git status", "/other") is not None
+        assert store.revoke("git *", PROJECT) == 0
+
+    def test_corrupt_file_is_ignored(self, store_path):
+        store_path.write_text("{not json")
+        store = ApprovalStore(store_path)
+        assert store.list() == []
+        store.add("git *", PROJECT)
+        assert json.loads(store_path.read_text())["approvals"][0]["pattern"] == "git *"
+
+    def test_concurrent_adds_are_all_kept(self, store_path):
+        # One store per thread, like sessions in separate processes
+        barrier = threading.Barrier(8)
+
+        def add(n):
+            store = ApprovalStore(store_path)
+            barrier.wait()
+            for i in range(5):
+                store.add(f"tool_{n}_{i}", PROJECT)
+
+        threads = [threading.Thread(target=add, args=(n,)) for n in range(8)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        assert len(ApprovalStore(store_path).list(PROJECT)) == 40
+        assert sorted(p.name for p in store_path.parent.iterdir()) == ["approvals.json", "approvals.json.lock"]
+
+    def test_normalize_pattern(self):
+        assert normalize_pattern("  git   status *") == "git status *"
+
+
+def _plugin(store_path, **approvals):
+    plugin = PermissionPlugin()
+    plugin.initialize({
+        "policy": {"defaultPolicy": "ask"},
+        "approvals": {"path": str(store_path), "project": PROJECT, **approvals},
+    })
+    plugin._channel = Mock()
+    plugin._channel.name = "console"
+    plugin._channel.request_permission.return_value = ChannelResponse(
+        request_id="test",
+        decision=ChannelDecision.ALLOW_SESSION,
+        reason="User approved for session",
+        remember_pattern="git *",
+    )
+    return plugin
+
+
+class TestPermissionPluginApprovals:
+    """Tests for remembered approvals in PermissionPlugin."""
+
+    def test_always_is_remembered_across_sessions(self, store_path):
+        first = _plugin(store_path)
+        allowed, _ = first.check_permission("cli_based_tool", {"command": "git status"})
+        assert allowed is True
+        assert first.get_execution_log()[-1]["approval"]["pattern"] == "git *"
+
+        second = _plugin(store_path)
+        allowed, info = second.check_permission("cli_based_tool", {"command": "git log"})
+        assert allowed is True
+        assert info["method"] == "remembered_approval"
+        second._channel.request_permission.assert_not_called()
+
+        entry = second.get_execution_log()[-1]
+        assert entry["decision"] == "allow"
+        assert entry["approval"]["project"] == PROJECT
+
+    def test_approval_scoped_to_agent(self, store_path):
+        first = _plugin(store_path)
+        first.check_permission(
+            "cli_based_tool", {"command": "git status"},
+            {"agent_type": "subagent", "agent_name": "reviewer"}
+        )
+
+        second = _plugin(store_path)
+        second.check_permission("cli_based_tool", {"command": "git status"}, {"agent_type": "main"})
+        second._channel.request_permission.assert_called_once()
+
+    def test_blacklist_still_applies(self, store_path):
+        _plugin(store_path).check_permission("cli_based_tool", {"command": "git status"})
+
+        plugin = PermissionPlugin()
+        plugin.initialize({
+            "policy": {"defaultPolicy": "ask", "blacklist": {"patterns": ["git push*"]}},
+            "approvals": {"path": str(store_path), "project": PROJECT},
+        })
+        allowed, info = plugin.check_permission("cli_based_tool", {"command": "git push"})
+        assert allowed is False
+        assert info["method"] == "blacklist"
+
+    def test_disabled_by_default(self, store_path):
+        plugin = PermissionPlugin()
+        plugin.initialize({"policy": {"defaultPolicy": "ask"}})
+        assert plugin._approvals is None
+        assert "disabled" in plugin.execute_permissions({"args": ["approvals"]})
+
+    def test_approvals_and_revoke_commands(self, store_path):
+        plugin = _plugin(store_path)
+        plugin.check_permission("cli_based_tool", {"command": "git status"})
+
+        assert "git *" in plugin.execute_permissions({"args": ["approvals"]})
+        assert [c.value for c in plugin.get_command_completions("permissions", ["revoke", "g"])] == ["git *"]
+        assert "Revoked" in plugin.execute_permissions({"args": ["revoke", "git", "*"]})
+        assert "No remembered approvals" in plugin.execute_permissions({"args": ["approvals"]})
+        assert "No remembered approval" in plugin.execute_permissions({"args": ["revoke", "git *"]})
@@ -8,6 +8,7 @@ from pathlib import Path
 from unittest.mock import Mock, patch, MagicMock
 
 import pytest
+import requests
 
 from ..channels import (
     ChannelDecision,
@@ -348,8 +349,9 @@ class TestWebhookChannel:
         assert response.decision == ChannelDecision.DENY
         assert "not configured" in response.reason
 
-    @patch("shared.plugins.permission.channels.requests")
-    def test_successful_allow(self, mock_requests):
+    @patch("shared.plugins.permission.channels.get_transport")
+    def test_successful_allow(self, mock_get_transport):
+        mock_transport = mock_get_transport.return_value
         mock_response = Mock()
         mock_response.status_code = 200
         mock_response.json.return_value = {
@@ -357,9 +359,7 @@ class TestWebhookChannel:
             "decision": "allow",
             "reason": "Approved by webhook",
         }
-        mock_requests.post.return_value = mock_response
-        mock_requests.Timeout = Exception
-        mock_requests.RequestException = Exception
+        mock_transport.post.return_value = mock_response
 
         channel = WebhookChannel()
         channel.initialize({"endpoint": "http://example.com/webhook"})
@@ -370,8 +370,9 @@ class TestWebhookChannel:
         assert response.decision == ChannelDecision.ALLOW
         assert "Approved" in response.reason
 
-    @patch("shared.plugins.permission.channels.requests")
-    def test_successful_deny(self, mock_requests):
+    @patch("shared.plugins.permission.channels.get_transport")
+    def test_successful_deny(self, mock_get_transport):
+        mock_transport = mock_get_transport.return_value
         mock_response = Mock()
         mock_response.status_code = 200
         mock_response.json.return_value = {
@@ -379,9 +380,7 @@ class TestWebhookChannel:
             "decision": "deny",
             "reason": "Denied by policy",
         }
-        mock_requests.post.return_value = mock_response
-        mock_requests.Timeout = Exception
-        mock_requests.RequestException = Exception
+        mock_transport.post.return_value = mock_response
 
         channel = WebhookChannel()
         channel.initialize({"endpoint": "http://example.com/webhook"})
@@ -391,13 +390,12 @@ class TestWebhookChannel:
 
         assert response.decision == ChannelDecision.DENY
 
-    @patch("shared.plugins.permission.channels.requests")
-    def test_non_200_status(self, mock_requests):
+    @patch("shared.plugins.permission.channels.get_transport")
+    def test_non_200_status(self, mock_get_transport):
+        mock_transport = mock_get_transport.return_value
         mock_response = Mock()
         mock_response.status_code = 500
-        mock_requests.post.return_value = mock_response
-        mock_requests.Timeout = Exception
-        mock_requests.RequestException = Exception
+        mock_transport.post.return_value = mock_response
 
         channel = WebhookChannel()
         channel.initialize({"endpoint": "http://example.com/webhook"})
@@ -408,15 +406,10 @@ class TestWebhookChannel:
         assert response.decision == ChannelDecision.DENY
         assert "500" in response.reason
 
-    @patch("shared.plugins.permission.channels.requests")
-    def test_timeout_default_deny(self, mock_requests):
-        mock_requests.Timeout = Exception
-
-        def raise_timeout(*args, **kwargs):
-            raise mock_requests.Timeout()
-
-        mock_requests.post = raise_timeout
-        mock_requests.RequestException = Exception
+    @patch("shared.plugins.permission.channels.get_transport")
+    def test_timeout_default_deny(self, mock_get_transport):
+        mock_transport = mock_get_transport.return_value
+        mock_transport.post.side_effect = requests.Timeout()
 
         channel = WebhookChannel()
         channel.initialize({"endpoint": "http://example.com/webhook", "timeout": 5})
@@ -427,15 +420,10 @@ class TestWebhookChannel:
         assert response.decision == ChannelDecision.DENY
         assert "timeout" in response.reason.lower()
 
-    @patch("shared.plugins.permission.channels.requests")
-    def test_timeout_allow_on_timeout(self, mock_requests):
-        mock_requests.Timeout = Exception
-
-        def raise_timeout(*args, **kwargs):
-            raise mock_requests.Timeout()
-
-        mock_requests.post = raise_timeout
-        mock_requests.RequestException = Exception
+    @patch("shared.plugins.permission.channels.get_transport")
+    def test_timeout_allow_on_timeout(self, mock_get_transport):
+        mock_transport = mock_get_transport.return_value
+        mock_transport.post.side_effect = requests.Timeout()
 
         channel = WebhookChannel()
         channel.initialize({"endpoint": "http://example.com/webhook"})
@@ -451,22 +439,10 @@ class TestWebhookChannel:
 
         assert response.decision == ChannelDecision.ALLOW
 
-    @patch("shared.plugins.permission.channels.requests")
-    def test_request_exception(self, mock_requests):
-        # Create distinct exception classes for proper exception handling
-        class MockTimeout(Exception):
-            pass
-
-        class MockRequestException(Exception):
-            pass
-
-        mock_requests.Timeout = MockTimeout
-        mock_requests.RequestException = MockRequestException
-
-        def raise_error(*args, **kwargs):
-            raise MockRequestException("Connection refused")
-
-        mock_requests.post = raise_error
+    @patch("shared.plugins.permission.channels.get_transport")
+    def test_request_exception(self, mock_get_transport):
+        mock_transport = mock_get_transport.return_value
+        mock_transport.post.side_effect = requests.ConnectionError("Connection refused")
 
         channel = WebhookChannel()
         channel.initialize({"endpoint": "http://example.com/webhook"})
@@ -477,14 +453,13 @@ class TestWebhookChannel:
         assert response.decision == ChannelDecision.DENY
         assert "failed" in response.reason.lower() or "connection" in response.reason.lower()
 
-    @patch("shared.plugins.permission.channels.requests")
-    def test_auth_token_header(self, mock_requests):
+    @patch("shared.plugins.permission.channels.get_transport")
+    def test_auth_token_header(self, mock_get_transport):
+        mock_transport = mock_get_transport.return_value
         mock_response = Mock()
         mock_response.status_code = 200
         mock_response.json.return_value = {"decision": "allow"}
-        mock_requests.post.return_value = mock_response
-        mock_requests.Timeout = Exception
-        mock_requests.RequestException = Exception
+        mock_transport.post.return_value = mock_response
 
         channel = WebhookChannel()
         channel.initialize({
@@ -495,18 +470,17 @@ class TestWebhookChannel:
         request = PermissionRequest.create("test_tool", {})
         channel.request_permission(request)
 
-        call_kwargs = mock_requests.post.call_args.kwargs
+        call_kwargs = mock_transport.post.call_args.kwargs
         assert "Authorization" in call_kwargs["headers"]
         assert "Bearer secret123" in call_kwargs["headers"]["Authorization"]
 
-    @patch("shared.plugins.permission.channels.requests")
-    def test_custom_headers(self, mock_requests):
+    @patch("shared.plugins.permission.channels.get_transport")
+    def test_custom_headers(self, mock_get_transport):
+        mock_transport = mock_get_transport.return_value
         mock_response = Mock()
         mock_response.status_code = 200
         mock_response.json.return_value = {"decision": "allow"}
-        mock_requests.post.return_value = mock_response
-        mock_requests.Timeout = Exception
-        mock_requests.RequestException = Exception
+        mock_transport.post.return_value = mock_response
 
         channel = WebhookChannel()
         channel.initialize({
@@ -517,7 +491,7 @@ class TestWebhookChannel:
         request = PermissionRequest.create("test_tool", {})
         channel.request_permission(request)
 
-        call_kwargs = mock_requests.post.call_args.kwargs
+        call_kwargs = mock_transport.post.call_args.kwargs
         assert "X-Custom" in call_kwargs["headers"]
 
 
@@ -725,6 +699,58 @@ class TestFileChannel:
             request_file = os.path.join(tmpdir, "requests", "test_cleanup.json")
             assert not os.path.exists(request_file)
 
+    @pytest.mark.parametrize("watch", ["auto", "poll"])
+    def test_concurrent_requests(self, watch):
+        import threading
+
+        with tempfile.TemporaryDirectory() as tmpdir:
+            channel = FileChannel()
+            channel.initialize({"base_path": tmpdir, "poll_interval": 0.05, "watch": watch})
+            requests = [
+                PermissionRequest.create("test_tool", {"n": n}, timeout=5) for n in range(5)
+            ]
+            responses = {}
+
+            def ask(request):
+                responses[request.request_id] = channel.request_permission(request)
+
+            threads = [threading.Thread(target=ask, args=(r,)) for r in requests]
+            for thread in threads:
+                thread.start()
+
+            # Answer like a well-behaved responder: write, then rename into place
+            deadline = time.time() + 5
+            pending = {r.request_id for r in requests}
+            while pending and time.time() < deadline:
+                for name in os.listdir(os.path.join(tmpdir, "requests")):
+                    request_id = name[:-len(".json")]
+                    if name.endswith(".json") and request_id in pending:
+                        tmp = os.path.join(tmpdir, "responses", f".{name}.tmp")
+                        with open(tmp, "w") as f:
+                            json.dump({"request_id": request_id, "decision": "allow"}, f)
+                        os.rename(tmp, os.path.join(tmpdir, "responses", name))
+                        pending.discard(request_id)
+                time.sleep(0.01)
+            for thread in threads:
+                thread.join()
+
+            assert [responses[r.request_id].decision for r in requests] == [ChannelDecision.ALLOW] * 5
+            assert os.listdir(os.path.join(tmpdir, "responses")) == []
+
+    def test_invalid_response_denied(self):
+        with tempfile.TemporaryDirectory() as tmpdir:
+            channel = FileChannel()
+            channel.initialize({"base_path": tmpdir, "poll_interval": 0.05})
+            request = PermissionRequest.create("test_tool", {}, timeout=5)
+            with open(os.path.join(tmpdir, "responses", f"{request.request_id}.json"), "w") as f:
+                f.write("not json")
+
+            response = channel.request_permission(request)
+
+            assert response.decision == ChannelDecision.DENY
+            assert "Failed to read response file" in response.reason
+            assert os.listdir(os.path.join(tmpdir, "requests")) == []
+
     def test_shutdown_cleans_pending_requests(self):
         with tempfile.TemporaryDirectory() as tmpdir:
             channel = FileChannel()
@@ -743,6 +769,152 @@ class TestFileChannel:
             assert len(os.listdir(requests_dir)) == 0
 
 
+class TestBatchRequests:
+    """Tests for Channel.request_permissions."""
+
+    def _requests(self, count=2):
+        return [
+            PermissionRequest.create("cli_based_tool", {"command": f"cmd{i}"})
+            for i in range(count)
+        ]
+
+    def test_default_asks_each_in_turn(self):
+        class RecordingChannel(Channel):
+            name = "recording"
+
+            def __init__(self):
+                self.asked = []
+
+            def request_permission(self, request):
+                self.asked.append(request.request_id)
+                return ChannelResponse(request.request_id, ChannelDecision.ALLOW)
+
+        channel = RecordingChannel()
+        requests = self._requests(3)
+        responses = channel.request_permissions(requests)
+        assert channel.asked == [r.request_id for r in requests]
+        assert [r.decision for r in responses] == [ChannelDecision.ALLOW] * 3
+
+    def test_console_one_prompt_one_answer_for_all(self):
+        answers = iter(["y"])
+        outputs = []
+        channel = ConsoleChannel()
+        channel.initialize({
+            "input_func": lambda: next(answers),
+            "output_func": outputs.append,
+            "use_colors": False,
+        })
+
+        responses = channel.request_permissions(self._requests())
+
+        assert [r.decision for r in responses] == [ChannelDecision.ALLOW] * 2
+        text = "\n".join(outputs)
+        assert "requesting 2 tool executions" in text
+        assert "[1/2]" in text and "[2/2]" in text
+        assert "cmd0" in text and "cmd1" in text
+
+    def test_console_one_answer_per_request(self):
+        channel = ConsoleChannel()
+        channel.initialize({"input_func": lambda: "y a", "output_func": lambda text: None})
+
+        requests = self._requests()
+        responses = channel.request_permissions(requests)
+
+        assert [r.decision for r in responses] == [ChannelDecision.ALLOW, ChannelDecision.ALLOW_SESSION]
+        assert [r.request_id for r in responses] == [r.request_id for r in requests]
+        assert responses[1].remember_pattern == "cmd1 *"
+
+    def test_console_wrong_number_of_answers_denies_all(self):
+        channel = ConsoleChannel()
+        channel.initialize({"input_func": lambda: "y y", "output_func": lambda text: None})
+
+        responses = channel.request_permissions(self._requests(3))
+
+        assert [r.decision for r in responses] == [ChannelDecision.DENY] * 3
+        assert "Expected 1 or 3 answers" in responses[0].reason
+
+    @patch("shared.plugins.permission.channels.get_transport")
+    def test_webhook_batch_single_post(self, mock_get_transport):
+        mock_transport = mock_get_transport.return_value
+        requests = self._requests()
+        mock_response = Mock()
+        mock_response.status_code = 200
+        mock_response.json.return_value = {"responses": [
+            {"request_id": requests[1].request_id, "decision": "deny", "reason": "No"},
+            {"request_id": requests[0].request_id, "decision": "allow", "reason": "Yes"},
+        ]}
+        mock_transport.post.return_value = mock_response
+
+        channel = WebhookChannel()
+        channel.initialize({"endpoint": "http://example.com/webhook", "batch": True})
+        responses = channel.request_permissions(requests)
+
+        mock_transport.post.assert_called_once()
+        payload = mock_transport.post.call_args.kwargs["json"]
+        assert [r["request_id"] for r in payload["requests"]] == [r.request_id for r in requests]
+        assert [r.decision for r in responses] == [ChannelDecision.ALLOW, ChannelDecision.DENY]
+
+    @patch("shared.plugins.permission.channels.get_transport")
+    def test_webhook_batch_missing_response_denied(self, mock_get_transport):
+        mock_transport = mock_get_transport.return_value
+        requests = self._requests()
+        mock_response = Mock()
+        mock_response.status_code = 200
+        mock_response.json.return_value = {"responses": [
+            {"request_id": requests[0].request_id, "decision": "allow"},
+        ]}
+        mock_transport.post.return_value = mock_response
+
+        channel = WebhookChannel()
+        channel.initialize({"endpoint": "http://example.com/webhook", "batch": True})
+        responses = channel.request_permissions(requests)
+
+        assert [r.decision for r in responses] == [ChannelDecision.ALLOW, ChannelDecision.DENY]
+
+    @patch("shared.plugins.permission.channels.get_transport")
+    def test_webhook_without_batch_posts_each(self, mock_get_transport):
+        mock_transport = mock_get_transport.return_value
+        mock_response = Mock()
+        mock_response.status_code = 200
+        mock_response.json.return_value = {"decision": "allow"}
+        mock_transport.post.return_value = mock_response
+
+        channel = WebhookChannel()
+        channel.initialize({"endpoint": "http://example.com/webhook"})
+        channel.request_permissions(self._requests())
+
+        assert mock_transport.post.call_count == 2
+
+    def test_file_batch_single_file(self):
+        import threading
+
+        with tempfile.TemporaryDirectory() as tmpdir:
+            channel = FileChannel()
+            channel.initialize({"base_path": tmpdir, "poll_interval": 0.05, "batch": True})
+            requests = self._requests()
+
+            def respond():
+                requests_dir = Path(tmpdir) / "requests"
+                deadline = time.time() + 2
+                while time.time() < deadline and not list(requests_dir.glob("*.json")):
+                    time.sleep(0.02)
+                batch_file, = requests_dir.glob("*.json")
+                batch = json.loads(batch_file.read_text())
+                answer = {"responses": [
+                    {"request_id": r["request_id"], "decision": "allow"} for r in batch["requests"]
+                ]}
+                (Path(tmpdir) / "responses" / batch_file.name).write_text(json.dumps(answer))
+
+            thread = threading.Thread(target=respond)
+            thread.start()
+            responses = channel.request_permissions(requests)
+            thread.join()
+
+            assert [r.decision for r in responses] == [ChannelDecision.ALLOW] * 2
+            assert not os.listdir(os.path.join(tmpdir, "requests"))
+            assert not os.listdir(os.path.join(tmpdir, "responses"))
+
+
 class TestCreateChannel:
     """Tests for the create_channel factory function."""
 
@@ -187,6 +187,12 @@ class TestValidateConfig:
         assert not is_valid
         assert any("timeout" in e.lower() for e in errors)
 
+    def test_invalid_approvals_ttl(self):
+        config = {"approvals": {"enabled": True, "ttlDays": -1}}
+        is_valid, errors = validate_config(config)
+        assert not is_valid
+        assert any("ttlDays" in e for e in errors)
+
     def test_conflict_warning(self):
         config = {
             "blacklist": {"tools": ["conflict_tool"]},
@@ -297,6 +303,26 @@ class TestLoadConfig:
             finally:
                 os.unlink(f.name)
 
+    def test_load_with_approvals_config(self):
+        with tempfile.NamedTemporaryFile(mode='w', suffix='.json', delete=False) as f:
+            config_data = {
+                "approvals": {
+                    "enabled": True,
+                    "path": "/tmp/approvals.json",
+                    "ttlDays": 7
+                }
+            }
+            json.dump(config_data, f)
+            f.flush()
+
+            try:
+                config = load_config(f.name)
+                assert config.approvals_enabled is True
+                assert config.approvals_path == "/tmp/approvals.json"
+                assert config.approvals_ttl_days == 7
+            finally:
+                os.unlink(f.name)
+
     def test_load_with_arguments(self):
         with tempfile.NamedTemporaryFile(mode='w', suffix='.json', delete=False) as f:
             config_data = {
@@ -1157,3 +1157,92 @@ class TestPermissionPluginUserCommands:
         # Now should be denied
         allowed, _ = plugin.check_permission("some_tool", {})
         assert allowed is False
+
+
+class TestPermissionPluginBatchCheck:
+    """Tests for checking the permissions of several calls at once."""
+
+    def _plugin(self):
+        plugin = PermissionPlugin()
+        plugin.initialize({
+            "policy": {"defaultPolicy": "ask", "whitelist": {"tools": ["safe_tool"]}}
+        })
+        plugin._channel = Mock()
+        plugin._channel.name = "console"
+        plugin._channel.request_permissions.side_effect = lambda requests: [
+            ChannelResponse(request_id=r.request_id, decision=ChannelDecision.ALLOW, reason="User approved")
+            for r in requests
+        ]
+        return plugin
+
+    def test_undecided_calls_are_sent_together(self):
+        plugin = self._plugin()
+        results = plugin.check_permissions([
+            ("tool_a", {"x": 1}),
+            ("safe_tool", {}),
+            ("tool_b", {}),
+        ])
+
+        assert [allowed for allowed, _ in results] == [True, True, True]
+        assert results[1][1]["method"] == "whitelist"
+        plugin._channel.request_permissions.assert_called_once()
+        plugin._channel.request_permission.assert_not_called()
+        sent = plugin._channel.request_permissions.call_args.args[0]
+        assert [r.tool_name for r in sent] == ["tool_a", "tool_b"]
+
+    def test_single_undecided_call_uses_request_permission(self):
+        plugin = self._plugin()
+        plugin._channel.request_permission.return_value = ChannelResponse(
+            request_id="test", decision=ChannelDecision.DENY, reason="User denied"
+        )
+        results = plugin.check_permissions([("tool_a", {}), ("safe_tool", {})])
+
+        assert [allowed for allowed, _ in results] == [False, True]
+        plugin._channel.request_permissions.assert_not_called()
+
+    def test_missing_channel_responses_deny(self):
+        plugin = self._plugin()
+        plugin._channel.request_permissions.side_effect = None
+        plugin._channel.request_permissions.return_value = []
+        results = plugin.check_permissions([("tool_a", {}), ("tool_b", {})])
+        assert [allowed for allowed, _ in results] == [False, False]
+
+
+class TestToolExecutorPreauthorize:
+    """Tests for ToolExecutor.preauthorize with the permission plugin."""
+
+    def test_round_is_approved_in_one_request(self):
+        from shared.ai_tool_runner import ToolExecutor
+
+        plugin = TestPermissionPluginBatchCheck()._plugin()
+        executor = ToolExecutor(auto_background_enabled=False)
+        executor.register("tool_a", lambda args: {"ok": "a"})
+        executor.register("tool_b", lambda args: {"ok": "b"})
+        executor.set_permission_plugin(plugin)
+
+        args_a, args_b = {"n": 1}, {"n": 2}
+        executor.preauthorize([("tool_a", args_a), ("tool_b", args_b)])
+        ok_a, result_a = executor.execute("tool_a", args_a)
+        ok_b, result_b = executor.execute("tool_b", args_b)
+
+        assert ok_a and ok_b
+        assert result_a["_permission"]["method"] == "user_approved"
+        plugin._channel.request_permissions.assert_called_once()
+        plugin._channel.request_permission.assert_not_called()
+
+    def test_decisions_are_used_once(self):
+        from shared.ai_tool_runner import ToolExecutor
+
+        plugin = TestPermissionPluginBatchCheck()._plugin()
+        plugin._channel.request_permission.return_value = ChannelResponse(
+            request_id="test", decision=ChannelDecision.DENY, reason="User denied"
+        )
+        executor = ToolExecutor(auto_background_enabled=False)
+        executor.register("tool_a", lambda args: {"ok": "a"})
+        executor.set_permission_plugin(plugin)
+
+        args = {}
+        executor.preauthorize([("tool_a", args), ("tool_a", {})])
+        assert executor.execute("tool_a", args)[0] is True
+        # Not preauthorized any more: asked on its own
+        assert executor.execute("tool_a", args)[0] is False
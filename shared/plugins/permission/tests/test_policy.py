@@ -1,5 +1,7 @@
 """Tests for the permission policy evaluation engine."""
 
+import copy
+
 import pytest
 from ..policy import PermissionPolicy, PermissionDecision, PolicyMatch
 
@@ -395,3 +397,96 @@ class TestPermissionPolicySignatureBuilding:
         # The signature format is tool_name(arg1=val1, arg2=val2, ...)
         # Sorted alphabetically
         assert match.decision == PermissionDecision.ALLOW
+
+
+class TestPermissionPolicyCompiledRules:
+    """Tests for compiled rule matching and the decision cache."""
+
+    def test_first_matching_pattern_is_reported(self):
+        policy = PermissionPolicy(
+            blacklist_patterns=["rm *", "rm -rf *", "sudo [a-c]*"]
+        )
+        assert policy.check("cli_based_tool", {"command": "rm -rf /"}).matched_rule == "rm *"
+        assert policy.check("cli_based_tool", {"command": "sudo apt"}).matched_rule == "sudo [a-c]*"
+        assert policy.check("cli_based_tool", {"command": "sudo yum"}).rule_type == "default"
+
+    def test_many_patterns(self):
+        policy = PermissionPolicy(
+            whitelist_patterns=[f"tool{i} *" for i in range(2000)]
+        )
+        match = policy.check("cli_based_tool", {"command": "tool1999 run"})
+        assert match.decision == PermissionDecision.ALLOW
+        assert match.matched_rule == "tool1999 *"
+        assert policy.check("cli_based_tool", {"command": "tool2000 run"}).rule_type == "default"
+
+    def test_argument_rules_report_first_value_in_order(self):
+        policy = PermissionPolicy(
+            blacklist_arguments={"cli_based_tool": {"command": ["sudo", "rm"]}}
+        )
+        # "rm" is a prefix, "sudo" a later word; the first rule value wins
+        match = policy.check("cli_based_tool", {"command": "rm -f x; sudo"})
+        assert match.matched_rule == "command=sudo"
+
+    def test_decision_is_cached(self):
+        policy = PermissionPolicy(whitelist_patterns=["git *"])
+        first = policy.check("cli_based_tool", {"command": "git status"})
+        assert policy.check("cli_based_tool", {"command": "git status"}) is first
+
+    def test_ask_decision_is_not_cached(self):
+        policy = PermissionPolicy(default_policy="ask")
+        first = policy.check("some_tool", {})
+        assert first.decision == PermissionDecision.ASK_CHANNEL
+        assert policy.check("some_tool", {}) is not first
+
+    def test_session_rules_invalidate_cache(self):
+        policy = PermissionPolicy(default_policy="ask", whitelist_tools={"tool"})
+        assert policy.check("tool", {}).decision == PermissionDecision.ALLOW
+        policy.add_session_blacklist("to*")
+        assert policy.check("tool", {}).decision == PermissionDecision.DENY
+        policy.clear_session_rules()
+        assert policy.check("tool", {}).decision == PermissionDecision.ALLOW
+
+    def test_field_assignment_invalidates_cache(self):
+        policy = PermissionPolicy(default_policy="allow")
+        assert policy.check("tool", {}).decision == PermissionDecision.ALLOW
+        policy.default_policy = "deny"
+        assert policy.check("tool", {}).decision == PermissionDecision.DENY
+        policy.blacklist_patterns = ["other*"]
+        assert policy.check("other_tool", {}).rule_type == "blacklist"
+
+    def test_in_place_change_needs_invalidate(self):
+        policy = PermissionPolicy(default_policy="deny")
+        assert policy.check("tool", {}).decision == PermissionDecision.DENY
+        policy.whitelist_tools.add("tool")
+        policy.invalidate()
+        assert policy.check("tool", {}).decision == PermissionDecision.ALLOW
+
+    def test_cache_key_includes_rule_arguments(self):
+        """Arguments read by argument rules but absent from the signature."""
+        policy = PermissionPolicy(
+            default_policy="allow",
+            blacklist_arguments={"cli_based_tool": {"cwd": ["/etc"]}}
+        )
+        assert policy.check("cli_based_tool", {"command": "ls", "cwd": "/tmp"}).decision == PermissionDecision.ALLOW
+        assert policy.check("cli_based_tool", {"command": "ls", "cwd": "/etc"}).decision == PermissionDecision.DENY
+
+    def test_cache_is_bounded(self):
+        policy = PermissionPolicy(default_policy="allow", decision_cache_size=2)
+        first = policy.check("a", {})
+        policy.check("b", {})
+        policy.check("c", {})
+        assert policy.check("a", {}) is not first
+
+    @pytest.mark.parametrize("copier", [copy.copy, copy.deepcopy])
+    def test_copies_have_their_own_cache(self, copier):
+        policy = PermissionPolicy(default_policy="allow", blacklist_patterns=["rm *"])
+        first = policy.check("tool", {})
+
+        copied = copier(policy)
+        assert copied == policy
+        assert copied._lock is not policy._lock
+        assert copied.check("tool", {}) is not first
+        copied.default_policy = "deny"
+        assert copied.check("tool", {}).decision == PermissionDecision.DENY
+        assert policy.check("tool", {}) is first
+        assert copied.check("cli_based_tool", {"command": "rm -rf x"}).rule_type == "blacklist"
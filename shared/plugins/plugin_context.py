@@ -0,0 +1,187 @@
+"""Per-session plugin state.
+
+Plugin instances are shared by every session created from a JaatoRuntime
+(the main agent, subagents and forks). Attributes that belong to one
+conversation - the current TODO plan, images detected in the last prompt,
+the output callback of the running turn - are declared as SessionLocal
+descriptors, and each session reads and writes its own copy:
+
+    class TodoPlugin:
+        _current_plan_id = SessionLocal(default=None)
+
+        def _create_plan(self, args):
+            ...
+            self._current_plan_id = plan.plan_id  # Only for the calling session
+
+The copy in use is that of the active PluginContext. A session with its
+own context activates it while it runs (see use_plugin_context); code
+outside any session, and sessions created without isolation, use the root
+context. The active context is held in a contextvars.ContextVar, so it is
+per thread and per asyncio task: sessions running tool loops in parallel
+threads never see each other's values. Worker threads do not inherit it;
+tasks a session hands to a thread pool must be submitted with
+contextvars.copy_context().run to keep the session's state.
+
+Plugin-wide state (configuration, storage, caches) stays in plain
+attributes and must be safe for concurrent use - see "Per-Session State
+and Threading" in the plugins README.
+"""
+
+import contextvars
+import threading
+import weakref
+from contextlib import contextmanager
+from typing import Any, Callable, Dict, Iterator, Optional
+
+
+_MISSING = object()
+
+
+class PluginContext:
+    """The per-session values of SessionLocal attributes.
+
+    Values are held per plugin instance and released with it.
+    """
+
+    def __init__(self, agent_id: str = "main"):
+        """Initialize an empty context.
+
+        Args:
+            agent_id: ID of the agent (session) the context belongs to.
+        """
+        self.agent_id = agent_id
+        self._values: 'weakref.WeakKeyDictionary[Any, Dict[str, Any]]' = weakref.WeakKeyDictionary()
+        self._lock = threading.Lock()
+        _contexts.add(self)
+
+    def _get(self, owner: Any, name: str) -> Any:
+        values = self._values.get(owner)
+        return _MISSING if values is None else values.get(name, _MISSING)
+
+    def _values_of(self, owner: Any) -> Dict[str, Any]:
+        # Caller holds self._lock
+        values = self._values.get(owner)
+        if values is None:
+            values = self._values[owner] = {}
+        return values
+
+    def _set(self, owner: Any, name: str, value: Any) -> None:
+        with self._lock:
+            self._values_of(owner)[name] = value
+
+    def _setdefault(self, owner: Any, name: str, value: Any) -> Any:
+        with self._lock:
+            return self._values_of(owner).setdefault(name, value)
+
+    def _clear(self, owner: Any) -> None:
+        with self._lock:
+            self._values.pop(owner, None)
+
+    def copy(self, agent_id: str) -> 'PluginContext':
+        """Create a context starting with a copy of this one's values.
+
+        dict, list and set values are copied (shallow), so the contexts
+        do not share containers; other values are shared.
+
+        Args:
+            agent_id: ID of the agent the new context belongs to.
+        """
+        context = PluginContext(agent_id)
+        with self._lock:
+            items = [(owner, dict(values)) for owner, values in self._values.items()]
+        for owner, values in items:
+            context._values[owner] = {
+                name: value.copy() if isinstance(value, (dict, list, set)) else value
+                for name, value in values.items()
+            }
+        return context
+
+
+# Every live context, so a plugin's state can be cleared in all of them
+_contexts: 'weakref.WeakSet[PluginContext]' = weakref.WeakSet()
+
+# Context of code running outside isolated sessions
+ROOT_CONTEXT = PluginContext("main")
+
+_current: contextvars.ContextVar[Optional[PluginContext]] = contextvars.ContextVar(
+    'jaato_plugin_context', default=None
+)
+
+
+def current_plugin_context() -> PluginContext:
+    """Get the active plugin context (ROOT_CONTEXT outside sessions)."""
+    return _current.get() or ROOT_CONTEXT
+
+
+@contextmanager
+def use_plugin_context(context: Optional[PluginContext]) -> Iterator[PluginContext]:
+    """Make a plugin context active for the current thread or task.
+
+    Calls can nest; leaving the block restores the previous context.
+
+    Args:
+        context: Context to activate, or None for ROOT_CONTEXT.
+    """
+    token = _current.set(context)
+    try:
+        yield context or ROOT_CONTEXT
+    finally:
+        _current.reset(token)
+
+
+def clear_session_state(owner: Any) -> None:
+    """Drop an object's SessionLocal values in every context.
+
+    For plugin shutdown: the next access in any session starts again
+    from the attribute's default.
+    """
+    for context in list(_contexts):
+        context._clear(owner)
+
+
+class SessionLocal:
+    """Descriptor for an attribute with one value per plugin context.
+
+    Reading an attribute never set in the active context gives its
+    default. A factory default (e.g. dict) is created on first read and
+    stored, so mutating it in place is kept for that context only.
+    """
+
+    def __init__(self, default: Any = None, factory: Optional[Callable[[], Any]] = None):
+        """Declare a per-session attribute.
+
+        Args:
+            default: Value of the attribute until it is set.
+            factory: Called to create the initial value instead, for
+                mutable values.
+        """
+        self._default = default
+        self._factory = factory
+        self._name = ""
+
+    def __set_name__(self, owner: type, name: str) -> None:
+        self._name = name
+
+    def __get__(self, instance: Any, owner: Optional[type] = None) -> Any:
+        if instance is None:
+            return self
+        context = current_plugin_context()
+        value = context._get(instance, self._name)
+        if value is _MISSING:
+            if self._factory is None:
+                return self._default
+            value = context._setdefault(instance, self._name, self._factory())
+        return value
+
+    def __set__(self, instance: Any, value: Any) -> None:
+        current_plugin_context()._set(instance, self._name, value)
+
+
+__all__ = [
+    'PluginContext',
+    'ROOT_CONTEXT',
+    'SessionLocal',
+    'clear_session_state',
+    'current_plugin_context',
+    'use_plugin_context',
+]
@@ -29,6 +29,8 @@ try:
 except ImportError:
     HAS_REQUESTS = False
 
+from ...file_watcher import claim_json, get_watcher, write_json_atomic
+from ...http_transport import get_transport
 from .models import ReferenceSource, SelectionRequest, SelectionResponse
 
 
@@ -259,7 +261,7 @@ class WebhookSelectionChannel(SelectionChannel):
             headers["Authorization"] = f"Bearer {self._auth_token}"
 
         try:
-            response = requests.post(
+            response = get_transport().post(
                 self._endpoint,
                 json=request.to_dict(),
                 headers=headers,
@@ -289,7 +291,7 @@ class WebhookSelectionChannel(SelectionChannel):
             headers["Authorization"] = f"Bearer {self._auth_token}"
 
         try:
-            requests.post(
+            get_transport().post(
                 self._endpoint,
                 json={"type": "selection_result", "message": message},
                 headers=headers,
@@ -300,16 +302,20 @@ class WebhookSelectionChannel(SelectionChannel):
 
 
 class FileSelectionChannel(SelectionChannel):
-    """Channel that writes requests to a file and polls for responses.
+    """Channel that writes requests to a file and waits for responses.
 
     Designed for scenarios where a separate process handles selection,
     such as a background service, UI application, or manual file editing.
+
+    Responses are noticed by the shared file watcher (inotify on Linux,
+    polling elsewhere or with "watch": "poll") and claimed by renaming.
     """
 
     def __init__(self):
         self._base_path: Optional[Path] = None
         self._timeout: int = 300
         self._poll_interval: float = 0.5
+        self._watcher = None
 
     @property
     def name(self) -> str:
@@ -320,8 +326,10 @@ class FileSelectionChannel(SelectionChannel):
 
         Config options:
             base_path: Directory for request/response files (required)
-            timeout: Polling timeout in seconds (default: 300)
-            poll_interval: Seconds between polls (default: 0.5)
+            timeout: Seconds to wait for a response (default: 300)
+            poll_interval: Seconds between polls when polling (default: 0.5)
+            watch: "auto" (inotify where available) or "poll" (needed
+                when responses are written from another host, e.g. NFS)
         """
         if not config:
             raise ValueError("FileSelectionChannel requires configuration with 'base_path'")
@@ -333,6 +341,7 @@ class FileSelectionChannel(SelectionChannel):
         self._base_path = Path(base_path)
         self._timeout = config.get("timeout", 300)
         self._poll_interval = config.get("poll_interval", 0.5)
+        self._watcher = get_watcher(use_inotify=config.get("watch", "auto") != "poll")
 
         # Create directories
         (self._base_path / "requests").mkdir(parents=True, exist_ok=True)
@@ -343,7 +352,7 @@ class FileSelectionChannel(SelectionChannel):
         available_sources: List[ReferenceSource],
         context: Optional[str] = None
     ) -> List[str]:
-        """Write request file and poll for response file."""
+        """Write request file and wait for response file."""
         if not self._base_path:
             return []
 
@@ -356,31 +365,28 @@ class FileSelectionChannel(SelectionChannel):
 
         # Write request file
         request_file = self._base_path / "requests" / f"{request.request_id}.json"
-        with open(request_file, 'w', encoding='utf-8') as f:
-            json.dump(request.to_dict(), f, indent=2)
+        write_json_atomic(request_file, request.to_dict())
 
-        # Poll for response
+        # Wait for response
         response_file = self._base_path / "responses" / f"{request.request_id}.json"
-        start_time = time.time()
+        deadline = time.monotonic() + self._timeout
 
-        while time.time() - start_time < self._timeout:
-            if response_file.exists():
+        try:
+            while True:
+                remaining = deadline - time.monotonic()
+                if remaining <= 0 or not self._watcher.wait_for(
+                    response_file, remaining, self._poll_interval
+                ):
+                    return []  # Timeout
                 try:
-                    with open(response_file, 'r', encoding='utf-8') as f:
-                        data = json.load(f)
-                    # Clean up files
-                    request_file.unlink(missing_ok=True)
-                    response_file.unlink(missing_ok=True)
-                    response = SelectionResponse.from_dict(data)
-                    return response.selected_ids
-                except (json.JSONDecodeError, IOError):
-                    return []
-
-            time.sleep(self._poll_interval)
-
-        # Timeout - clean up request file
-        request_file.unlink(missing_ok=True)
-        return []
+                    data = claim_json(response_file)
+                except FileNotFoundError:
+                    continue  # Claimed by another reader
+                return SelectionResponse.from_dict(data).selected_ids
+        except (json.JSONDecodeError, IOError):
+            return []
+        finally:
+            request_file.unlink(missing_ok=True)
 
     def notify_result(self, message: str) -> None:
         """Write result to results file."""
@@ -17,6 +17,7 @@ from .models import ReferenceSource, InjectionMode
 from .channels import SelectionChannel, ConsoleSelectionChannel, create_channel
 from .config_loader import load_config, ReferencesConfig
 from ..base import UserCommand, CommandCompletion
+from ..plugin_context import SessionLocal, clear_session_state
 
 
 class ReferencesPlugin:
@@ -30,12 +31,14 @@ class ReferencesPlugin:
     This plugin only provides metadata and handles user selection.
     """
 
+    # Sources the user selected during the calling session
+    _selected_source_ids = SessionLocal(factory=list)
+
     def __init__(self):
         self._name = "references"
         self._config: Optional[ReferencesConfig] = None
         self._sources: List[ReferenceSource] = []
         self._channel: Optional[SelectionChannel] = None
-        self._selected_source_ids: List[str] = []  # User-selected during session
         self._initialized = False
 
     @property
@@ -100,7 +103,7 @@ class ReferencesPlugin:
             self._channel = ConsoleSelectionChannel()
             self._channel.initialize({})
 
-        self._selected_source_ids = []
+        clear_session_state(self)
         self._initialized = True
 
     def shutdown(self) -> None:
@@ -109,7 +112,7 @@ class ReferencesPlugin:
             self._channel.shutdown()
         self._channel = None
         self._sources = []
-        self._selected_source_ids = []
+        clear_session_state(self)
         self._initialized = False
 
     def get_tool_schemas(self) -> List[ToolSchema]:
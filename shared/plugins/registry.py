@@ -4,6 +4,7 @@ import importlib
 import importlib.metadata
 import pkgutil
 import sys
+import threading
 from pathlib import Path
 from typing import Dict, List, Set, Callable, Any, Optional, Protocol, runtime_checkable
 
@@ -52,6 +53,9 @@ class PluginRegistry:
         self._configs: Dict[str, Dict[str, Any]] = {}
         self._model_name: Optional[str] = model_name
         self._skipped_plugins: Dict[str, List[str]] = {}  # name -> required patterns
+        # Guards registration and exposure; readers iterate over snapshots
+        # so sessions can look up tools while plugins are (un)exposed
+        self._lock = threading.RLock()
 
     def discover(
         self,
@@ -217,7 +221,8 @@ class PluginRegistry:
 
     def list_exposed(self) -> List[str]:
         """List currently exposed plugin names."""
-        return list(self._exposed)
+        with self._lock:
+            return list(self._exposed)
 
     def is_exposed(self, name: str) -> bool:
         """Check if a plugin's tools are currently exposed to the model."""
@@ -253,12 +258,13 @@ class PluginRegistry:
             # Register session plugin for prompt enrichment only
             registry.register_plugin(session_plugin, enrichment_only=True)
         """
-        self._plugins[plugin.name] = plugin
+        with self._lock:
+            self._plugins[plugin.name] = plugin
 
-        if enrichment_only:
-            self._enrichment_only.add(plugin.name)
-        elif expose:
-            self.expose_tool(plugin.name, config)
+            if enrichment_only:
+                self._enrichment_only.add(plugin.name)
+            elif expose:
+                self.expose_tool(plugin.name, config)
 
     def expose_tool(self, name: str, config: Optional[Dict[str, Any]] = None) -> bool:
         """Expose a plugin's tools to the model.
@@ -279,33 +285,34 @@ class PluginRegistry:
         Raises:
             ValueError: If the plugin is not found.
         """
-        if name not in self._plugins:
-            raise ValueError(f"Plugin '{name}' not found. Available: {self.list_available()}")
-
-        plugin = self._plugins[name]
-
-        # Check model requirements if model_name is set
-        if self._model_name and hasattr(plugin, 'get_model_requirements'):
-            requirements = plugin.get_model_requirements()
-            if requirements and not model_matches_requirements(self._model_name, requirements):
-                self._skipped_plugins[name] = requirements
-                print(f"[PluginRegistry] Plugin '{name}' skipped: "
-                      f"model '{self._model_name}' not in {requirements}")
-                return False
-
-        # Initialize if not already exposed, or if new config provided
-        if name not in self._exposed:
-            plugin.initialize(config)
-            if config:
+        with self._lock:
+            if name not in self._plugins:
+                raise ValueError(f"Plugin '{name}' not found. Available: {self.list_available()}")
+
+            plugin = self._plugins[name]
+
+            # Check model requirements if model_name is set
+            if self._model_name and hasattr(plugin, 'get_model_requirements'):
+                requirements = plugin.get_model_requirements()
+                if requirements and not model_matches_requirements(self._model_name, requirements):
+                    self._skipped_plugins[name] = requirements
+                    print(f"[PluginRegistry] Plugin '{name}' skipped: "
+                          f"model '{self._model_name}' not in {requirements}")
+                    return False
+
+            # Initialize if not already exposed, or if new config provided
+            if name not in self._exposed:
+                plugin.initialize(config)
+                if config:
+                    self._configs[name] = config
+                self._exposed.add(name)
+            elif config and config != self._configs.get(name):
+                # Re-initialize with new config
+                plugin.shutdown()
+                plugin.initialize(config)
                 self._configs[name] = config
-            self._exposed.add(name)
-        elif config and config != self._configs.get(name):
-            # Re-initialize with new config
-            plugin.shutdown()
-            plugin.initialize(config)
-            self._configs[name] = config
 
-        return True
+            return True
 
     def unexpose_tool(self, name: str) -> None:
         """Stop exposing a plugin's tools to the model.
@@ -315,10 +322,11 @@ class PluginRegistry:
         Args:
             name: Plugin name to unexpose.
         """
-        if name in self._exposed:
-            self._plugins[name].shutdown()
-            self._exposed.discard(name)
-            self._configs.pop(name, None)
+        with self._lock:
+            if name in self._exposed:
+                self._plugins[name].shutdown()
+                self._exposed.discard(name)
+                self._configs.pop(name, None)
 
     def expose_all(self, config: Optional[Dict[str, Dict[str, Any]]] = None) -> None:
         """Expose all discovered plugins' tools.
@@ -338,7 +346,7 @@ class PluginRegistry:
     def get_exposed_tool_schemas(self) -> List[ToolSchema]:
         """Get ToolSchemas from all exposed plugins."""
         schemas = []
-        for name in self._exposed:
+        for name in self.list_exposed():
             try:
                 schemas.extend(self._plugins[name].get_tool_schemas())
             except Exception as exc:
@@ -348,7 +356,7 @@ class PluginRegistry:
     def get_exposed_executors(self) -> Dict[str, Callable[[Dict[str, Any]], Any]]:
         """Get executor callables from all exposed plugins."""
         executors = {}
-        for name in self._exposed:
+        for name in self.list_exposed():
             try:
                 executors.update(self._plugins[name].get_executors())
             except Exception as exc:
@@ -363,7 +371,7 @@ class PluginRegistry:
             have instructions.
         """
         instructions = []
-        for name in self._exposed:
+        for name in self.list_exposed():
             try:
                 plugin_instructions = self._plugins[name].get_system_instructions()
                 if plugin_instructions:
@@ -383,7 +391,7 @@ class PluginRegistry:
             List of tool names that should be whitelisted for permission checks.
         """
         tools = []
-        for name in self._exposed:
+        for name in self.list_exposed():
             try:
                 if hasattr(self._plugins[name], 'get_auto_approved_tools'):
                     auto_approved = self._plugins[name].get_auto_approved_tools()
@@ -408,7 +416,7 @@ class PluginRegistry:
             List of UserCommand objects from all exposed plugins.
         """
         commands: List[UserCommand] = []
-        for name in self._exposed:
+        for name in self.list_exposed():
             try:
                 if hasattr(self._plugins[name], 'get_user_commands'):
                     user_commands = self._plugins[name].get_user_commands()
@@ -430,7 +438,7 @@ class PluginRegistry:
         Returns:
             The ToolPlugin instance that provides this tool, or None if not found.
         """
-        for name in self._exposed:
+        for name in self.list_exposed():
             try:
                 plugin = self._plugins[name]
                 if tool_name in plugin.get_executors():
@@ -459,7 +467,8 @@ class PluginRegistry:
         """
         subscribers = []
         # Include both exposed and enrichment-only plugins
-        all_enrichment_names = self._exposed | self._enrichment_only
+        with self._lock:
+            all_enrichment_names = self._exposed | self._enrichment_only
         for name in all_enrichment_names:
             try:
                 plugin = self._plugins[name]
@@ -25,6 +25,7 @@ from .base import (
     SessionConfig,
     SessionState,
     SessionInfo,
+    ForkPoint,
 )
 from .config_loader import load_session_config, save_session_config
 
@@ -47,6 +48,7 @@ __all__ = [
     'SessionConfig',
     'SessionState',
     'SessionInfo',
+    'ForkPoint',
     'create_plugin',
     'load_session_config',
     'save_session_config',
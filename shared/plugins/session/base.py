@@ -9,10 +9,32 @@ to save and resume sessions across client restarts.
 
 from dataclasses import dataclass, field
 from datetime import datetime
-from typing import Any, Dict, List, Optional, Protocol, runtime_checkable
+from typing import Any, Dict, List, Optional, Protocol, TYPE_CHECKING, runtime_checkable
 
 from ..model_provider.types import Message
 
+if TYPE_CHECKING:
+    from .paging import HistoryPager
+
+
+@dataclass
+class ForkPoint:
+    """Where a forked session branches off its parent.
+
+    A fork shares its first message_count messages with the parent session
+    and is stored as a delta: only the messages after the fork point.
+    """
+
+    session_id: str
+    """ID of the parent session."""
+
+    message_count: int
+    """Number of leading history messages shared with the parent."""
+
+    digest: str
+    """Digest of the shared messages (see fork.py), used to check that the
+    parent on disk still has the shared prefix."""
+
 
 @dataclass
 class SessionState:
@@ -58,6 +80,15 @@ class SessionState:
     model: Optional[str] = None
     """Model name used for this session."""
 
+    paged: Optional['HistoryPager'] = None
+    """Older messages left on disk by a paged resume (None = history is
+    complete). When set, history holds only the messages after them."""
+
+    fork: Optional[ForkPoint] = None
+    """Parent this session was forked from, if it is stored as a delta.
+    The history is always complete; the shared prefix is only omitted on
+    disk."""
+
 
 @dataclass
 class SessionInfo:
@@ -84,6 +115,9 @@ class SessionInfo:
     model: Optional[str] = None
     """Model name used for this session."""
 
+    parent_id: Optional[str] = None
+    """Session this one was forked from, if it is stored as a delta."""
+
     def display_name(self) -> str:
         """Return a display-friendly name for the session."""
         if self.description:
@@ -116,6 +150,10 @@ class SessionConfig:
     auto_resume_last: bool = False
     """Whether to automatically resume the last session on connect."""
 
+    resume_recent_turns: Optional[int] = None
+    """Paged resume: load only the last N turns, keeping older turns on disk
+    until needed (None = load the full history)."""
+
     # Naming settings
     request_description_after_turns: int = 3
     """Request model-generated description after this many turns."""
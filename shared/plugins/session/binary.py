@@ -0,0 +1,411 @@
+"""Binary session snapshots with out-of-line blobs.
+
+A binary snapshot is MAGIC followed by length-prefixed records:
+
+    [4-byte big-endian payload length][payload]
+
+The first record is the header: every session field except the history,
+as UTF-8 JSON, plus the list of blobs the snapshot references. Each
+following record is one message:
+
+    [4-byte skeleton length][skeleton][slot bytes...]
+
+The skeleton is the message's serialized form (see serializer.py) as
+compact JSON, minus its payloads: binary data (inline data, attachments),
+tool results and texts of TEXT_SLOT_MIN characters or more are moved to
+slots. A part (or attachment) with slots lists them under the "$" key as
+[field, kind, ref] entries, where kind is "str", "bytes" or "json" and
+ref is either the slot's length (the bytes follow the skeleton, in
+order) or a blob digest.
+
+Slots of blob_threshold bytes or more are stored out of line as
+content-addressed blobs (``.blobs/<xx>/<sha256>``) shared by all sessions
+in the storage directory, so a payload repeated across turns or sessions
+is stored once.
+
+Compared to JSON snapshots, binary data is stored raw instead of base64,
+and loading parses one small skeleton per message and reads payloads as
+plain byte ranges.
+
+Decoding yields the serialized form of serializer.py, with binary data
+kept as bytes (serialize_message(..., raw_bytes=True)). Tool results of
+LAZY_JSON_MIN bytes or more are left encoded as DeferredJSON; they
+deserialize to LazyToolResult and are written back without re-encoding.
+"""
+
+import base64
+import hashlib
+import os
+import struct
+import time
+from pathlib import Path
+from typing import Any, BinaryIO, Dict, Iterable, List, Optional, Set, Tuple
+
+from ... import json_codec
+from .journal import atomic_write
+
+
+MAGIC = b"JSNB\x01"
+
+# Subdirectory of the storage directory holding blobs
+BLOB_DIR = ".blobs"
+
+# Slots of at least this many bytes are stored as blobs
+DEFAULT_BLOB_THRESHOLD = 64 * 1024
+
+# Unreferenced blobs younger than this (seconds) are kept when pruning,
+# since a concurrent save may write them before its snapshot
+BLOB_PRUNE_MIN_AGE = 3600
+
+# Key listing the slots of a part or attachment in a skeleton
+SLOTS_KEY = "$"
+
+# Texts of at least this many characters are stored in slots as raw UTF-8
+# instead of JSON strings
+TEXT_SLOT_MIN = 256
+
+# Tool results of at least this many bytes are decoded on first access
+LAZY_JSON_MIN = 4096
+
+_LENGTH = struct.Struct(">I")
+
+
+def json_default(value: Any) -> Any:
+    """JSON fallback encoding raw inline data (bytes) as base64 text.
+
+    Values left encoded (DeferredJSON) are decoded.
+    """
+    if isinstance(value, (bytes, bytearray, memoryview)):
+        return base64.b64encode(bytes(value)).decode('ascii')
+    if isinstance(value, DeferredJSON):
+        return value()
+    raise TypeError(f"Object of type {type(value).__name__} is not JSON serializable")
+
+
+def _encode_json(value: Any) -> bytes:
+    return json_codec.dumps(value, default=json_default)
+
+
+_decode_json = json_codec.loads
+
+
+class DeferredJSON:
+    """A JSON value read from a snapshot, decoded when called.
+
+    Serves as the loader of a LazyToolResult. Compares equal to its
+    decoded value.
+    """
+
+    __slots__ = ('raw',)
+
+    def __init__(self, raw: bytes):
+        self.raw = raw
+
+    def __call__(self) -> Any:
+        return _decode_json(self.raw)
+
+    def __eq__(self, other: Any) -> bool:
+        if isinstance(other, DeferredJSON):
+            return self.raw == other.raw or self() == other()
+        return self() == other
+
+    __hash__ = None  # type: ignore[assignment]
+
+
+class BlobStore:
+    """Content-addressed blobs shared by the sessions of a storage directory."""
+
+    def __init__(self, storage_path: Path):
+        """Initialize the store.
+
+        Args:
+            storage_path: Session storage directory.
+        """
+        self._path = storage_path / BLOB_DIR
+
+    def _blob_path(self, digest: str) -> Path:
+        return self._path / digest[:2] / digest
+
+    def put(self, data: bytes, fsync: bool = False) -> str:
+        """Store a blob unless it is already stored.
+
+        An existing blob is touched instead, so a prune running in another
+        process leaves it alone (see min_age) while the snapshot that
+        references it is being written.
+
+        Returns:
+            The blob's hex SHA-256 digest.
+        """
+        digest = hashlib.sha256(data).hexdigest()
+        path = self._blob_path(digest)
+        try:
+            os.utime(path)
+        except FileNotFoundError:
+            path.parent.mkdir(parents=True, exist_ok=True)
+            atomic_write(path, data, fsync=fsync)
+        return digest
+
+    def get(self, digest: str) -> bytes:
+        """Read a blob.
+
+        Raises:
+            ValueError: If the blob is missing.
+        """
+        try:
+            return self._blob_path(digest).read_bytes()
+        except FileNotFoundError:
+            raise ValueError(f"Missing session blob {digest}") from None
+
+    def size(self, digest: str) -> int:
+        """Size of a blob in bytes (0 if it is missing)."""
+        try:
+            return self._blob_path(digest).stat().st_size
+        except OSError:
+            return 0
+
+    def prune(self, referenced: Set[str], min_age: float = BLOB_PRUNE_MIN_AGE) -> int:
+        """Delete blobs no snapshot references.
+
+        Args:
+            referenced: Digests still referenced.
+            min_age: Keep unreferenced blobs modified less than this many
+                seconds ago.
+
+        Returns:
+            Number of blobs deleted.
+        """
+        if not self._path.exists():
+            return 0
+        cutoff = time.time() - min_age
+        deleted = 0
+        for path in self._path.glob("*/*"):
+            if path.name in referenced:
+                continue
+            try:
+                if path.stat().st_mtime > cutoff:
+                    continue
+                path.unlink()
+            except FileNotFoundError:
+                continue
+            deleted += 1
+        return deleted
+
+
+class _Encoder:
+    """Encodes messages into records, moving payloads to slots and blobs."""
+
+    def __init__(self, blobs: BlobStore, threshold: int, fsync: bool):
+        self.blobs = blobs
+        self.threshold = threshold
+        self.fsync = fsync
+        self.digests: List[str] = []
+        self.blob_bytes = 0
+        self._seen: Set[str] = set()
+
+    def slot(self, slots: List[List[Any]], out: List[bytes], field: str, kind: str, payload: bytes) -> None:
+        if len(payload) >= self.threshold:
+            digest = self.blobs.put(payload, self.fsync)
+            if digest not in self._seen:
+                self._seen.add(digest)
+                self.digests.append(digest)
+                self.blob_bytes += len(payload)
+            slots.append([field, kind, digest])
+        else:
+            slots.append([field, kind, len(payload)])
+            out.append(payload)
+
+    def part(self, part: Dict[str, Any], out: List[bytes]) -> Dict[str, Any]:
+        slots: List[List[Any]] = []
+        part_type = part.get('type')
+
+        if part_type == 'text':
+            text = part.get('text')
+            if text and len(text) >= TEXT_SLOT_MIN:
+                part = dict(part, text=None)
+                self.slot(slots, out, 'text', 'str', text.encode('utf-8'))
+        elif part_type == 'function_response':
+            result = part.get('result')
+            part = dict(part, result=None)
+            if isinstance(result, DeferredJSON):
+                payload = result.raw
+            else:
+                payload = _encode_json(result)
+            self.slot(slots, out, 'result', 'json', payload)
+            if part.get('attachments'):
+                part['attachments'] = [self.data(a, out) for a in part['attachments']]
+        elif part_type == 'inline_data':
+            part = self.data(part, out)
+
+        if slots:
+            part[SLOTS_KEY] = slots
+        return part
+
+    def data(self, item: Dict[str, Any], out: List[bytes]) -> Dict[str, Any]:
+        """Move the 'data' field of an inline data part or attachment to a slot."""
+        if item.get('data') is None:
+            return item
+        slots: List[List[Any]] = []
+        self.slot(slots, out, 'data', 'bytes', _as_bytes(item['data']))
+        return dict(item, data=None, **{SLOTS_KEY: slots})
+
+    def message(self, message: Dict[str, Any]) -> bytes:
+        out: List[bytes] = []
+        skeleton = {
+            'role': message['role'],
+            'parts': [self.part(p, out) for p in (message.get('parts') or [])],
+        }
+        encoded = _encode_json(skeleton)
+        return b"".join([_LENGTH.pack(len(encoded)), encoded] + out)
+
+
+class _Decoder:
+    """Decodes message records, filling slots back in."""
+
+    def __init__(self, blobs: Optional[BlobStore]):
+        self.blobs = blobs
+
+    def fill(self, item: Dict[str, Any], slots: List[List[Any]], record: bytes, pos: int) -> int:
+        for field, kind, ref in slots:
+            if isinstance(ref, int):
+                raw = record[pos:pos + ref]
+                if len(raw) < ref:
+                    raise ValueError("truncated slot")
+                pos += ref
+            elif self.blobs is None:
+                raise ValueError("snapshot references blobs but no blob store was given")
+            else:
+                raw = self.blobs.get(ref)
+
+            if kind == 'str':
+                item[field] = raw.decode('utf-8')
+            elif kind == 'bytes':
+                item[field] = raw
+            elif kind == 'json':
+                item[field] = DeferredJSON(raw) if len(raw) >= LAZY_JSON_MIN else _decode_json(raw)
+            else:
+                raise ValueError(f"unknown slot kind {kind}")
+        return pos
+
+    def message(self, record: bytes) -> Dict[str, Any]:
+        (size,) = _LENGTH.unpack_from(record, 0)
+        pos = _LENGTH.size + size
+        message = _decode_json(record[_LENGTH.size:pos])
+
+        for part in message['parts']:
+            slots = part.pop(SLOTS_KEY, None)
+            if slots:
+                pos = self.fill(part, slots, record, pos)
+            for attachment in part.get('attachments') or ():
+                slots = attachment.pop(SLOTS_KEY, None)
+                if slots:
+                    pos = self.fill(attachment, slots, record, pos)
+
+        return message
+
+
+def _as_bytes(data: Any) -> bytes:
+    """Bytes of inline data given raw or as base64 text."""
+    if isinstance(data, str):
+        return base64.b64decode(data)
+    return bytes(data)
+
+
+def encode_snapshot(
+    data: Dict[str, Any],
+    blobs: BlobStore,
+    threshold: int = DEFAULT_BLOB_THRESHOLD,
+    fsync: bool = False
+) -> Tuple[bytes, int]:
+    """Encode serialized session data as a binary snapshot.
+
+    Blobs are written to the store before the snapshot is returned, so a
+    snapshot never references a blob that is not on disk.
+
+    Args:
+        data: Snapshot dict as produced by serialize_session_state
+            (inline data may be bytes or base64 text).
+        blobs: Store for values of threshold bytes or more.
+        threshold: Blob size threshold in bytes.
+        fsync: fsync newly written blobs.
+
+    Returns:
+        Tuple of (encoded bytes, logical size including blob payloads).
+    """
+    encoder = _Encoder(blobs, threshold, fsync)
+    records = [encoder.message(m) for m in data.get('history', [])]
+
+    header = {k: v for k, v in data.items() if k != 'history'}
+    header['blobs'] = encoder.digests
+    records.insert(0, json_codec.dumps(header))
+
+    chunks = [MAGIC]
+    for record in records:
+        chunks.append(_LENGTH.pack(len(record)))
+        chunks.append(record)
+    encoded = b"".join(chunks)
+    return encoded, len(encoded) + encoder.blob_bytes
+
+
+def _iter_records(f: BinaryIO, path: Path) -> Iterable[bytes]:
+    """Read length-prefixed records after the magic."""
+    if f.read(len(MAGIC)) != MAGIC:
+        raise ValueError(f"Not a binary session snapshot: {path}")
+    while True:
+        prefix = f.read(_LENGTH.size)
+        if not prefix:
+            return
+        if len(prefix) < _LENGTH.size:
+            raise ValueError(f"Corrupted session snapshot {path}: truncated record")
+        (size,) = _LENGTH.unpack(prefix)
+        record = f.read(size)
+        if len(record) < size:
+            raise ValueError(f"Corrupted session snapshot {path}: truncated record")
+        yield record
+
+
+def read_snapshot(path: Path, blobs: Optional[BlobStore] = None) -> Tuple[Dict[str, Any], int]:
+    """Read a binary snapshot, one record at a time.
+
+    Args:
+        path: Snapshot file path.
+        blobs: Store to read referenced blobs from.
+
+    Returns:
+        Tuple of (serialized session data, logical size including blob
+        payloads).
+
+    Raises:
+        ValueError: If the snapshot is corrupted or a blob is missing.
+    """
+    data: Optional[Dict[str, Any]] = None
+    history: List[Dict[str, Any]] = []
+    decoder = _Decoder(blobs)
+    size = len(MAGIC)
+
+    with open(path, 'rb') as f:
+        for record in _iter_records(f, path):
+            size += _LENGTH.size + len(record)
+            try:
+                if data is None:
+                    data = json_codec.loads(record)
+                else:
+                    history.append(decoder.message(record))
+            except (KeyError, TypeError, struct.error, ValueError) as e:
+                raise ValueError(f"Corrupted session snapshot {path}: {e}") from e
+
+    if data is None:
+        raise ValueError(f"Empty session snapshot {path}")
+
+    if blobs is not None:
+        size += sum(blobs.size(digest) for digest in data.get('blobs', []))
+    data.pop('blobs', None)
+    data['history'] = history
+    return data, size
+
+
+def read_blob_refs(path: Path) -> List[str]:
+    """Read the blobs a binary snapshot references (header record only)."""
+    with open(path, 'rb') as f:
+        for record in _iter_records(f, path):
+            return json_codec.loads(record).get('blobs', [])
+    return []
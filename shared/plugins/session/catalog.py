@@ -0,0 +1,195 @@
+"""Session catalog: a metadata index of the session directory.
+
+Listing sessions used to open and parse every session file (history
+included) just to read a few metadata fields. The catalog keeps those
+fields for all sessions in one small file, so list/latest/describe never
+read history payloads.
+
+Each entry records a stamp of the session's files (snapshot mtime and
+size, journal size). Listing stats the session files - a cheap directory
+operation - and only re-reads sessions whose stamp no longer matches,
+e.g. after a crash between a session write and the catalog update, or a
+write by another process. A missing or unreadable catalog is rebuilt from
+the session files.
+"""
+
+from pathlib import Path
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+from ... import json_codec
+from .base import SessionInfo
+from .journal import EPOCH_KEY, JOURNAL_SUFFIX, atomic_write
+from .serializer import deserialize_session_info
+
+
+# Catalog file name inside the storage directory (no .json suffix, so it
+# is never mistaken for a session file)
+CATALOG_FILE = ".catalog"
+
+# Catalog file format version
+CATALOG_VERSION = 1
+
+# Stamp identifying the on-disk version of a session
+Stamp = Tuple[int, int, int]
+
+
+class SessionCatalog:
+    """Metadata index of the sessions in a storage directory."""
+
+    def __init__(self, storage_path: Path):
+        """Initialize the catalog.
+
+        Args:
+            storage_path: Session storage directory.
+        """
+        self._storage_path = storage_path
+        self._path = storage_path / CATALOG_FILE
+
+    def stamp(self, session_id: str) -> Optional[Stamp]:
+        """Stamp of a session's files, or None if the session does not exist."""
+        try:
+            snapshot = (self._storage_path / f"{session_id}.json").stat()
+        except FileNotFoundError:
+            return None
+        try:
+            journal_size = (self._storage_path / f"{session_id}{JOURNAL_SUFFIX}").stat().st_size
+        except FileNotFoundError:
+            journal_size = 0
+        return (snapshot.st_mtime_ns, snapshot.st_size, journal_size)
+
+    def get(self, session_id: str) -> Optional[Dict[str, Any]]:
+        """Get a session's catalog entry if it is current.
+
+        Returns:
+            Entry dict (session info fields plus 'epoch'), or None if the
+            session is not cataloged or changed since.
+        """
+        entry = self._read().get(session_id)
+        if entry is None or tuple(entry.get('stamp', ())) != self.stamp(session_id):
+            return None
+        return entry
+
+    def update(
+        self,
+        session_id: str,
+        info: Dict[str, Any],
+        epoch: Optional[str] = None
+    ) -> None:
+        """Record a session's metadata after it was written.
+
+        Args:
+            session_id: The session ID.
+            info: Fields from serialize_session_info().
+            epoch: Journal epoch of the session's snapshot.
+        """
+        stamp = self.stamp(session_id)
+        if stamp is None:
+            return
+
+        entries = self._read()
+        entries[session_id] = {**info, 'epoch': epoch, 'stamp': list(stamp)}
+        self._write(entries)
+
+    def remove(self, session_id: str) -> None:
+        """Remove a session from the catalog."""
+        entries = self._read()
+        if entries.pop(session_id, None) is not None:
+            self._write(entries)
+
+    def list(self, read_session: Callable[[Path], Dict[str, Any]]) -> List[SessionInfo]:
+        """List all sessions, refreshing stale entries.
+
+        Args:
+            read_session: Reads a session file's serialized data (with
+                journal replayed); only called for sessions whose catalog
+                entry is missing or stale.
+
+        Returns:
+            List of SessionInfo, unsorted.
+        """
+        entries = self._read()
+        current: Dict[str, Dict[str, Any]] = {}
+        changed = False
+
+        for file_path in self._storage_path.glob("*.json"):
+            session_id = file_path.stem
+            stamp = self.stamp(session_id)
+            if stamp is None:
+                continue  # Deleted while listing
+
+            entry = entries.get(session_id)
+            if entry is None or tuple(entry.get('stamp', ())) != stamp:
+                try:
+                    entry = _entry_from_data(read_session(file_path), stamp)
+                    deserialize_session_info(entry)  # Validate
+                except (json_codec.JSONDecodeError, KeyError, ValueError) as e:
+                    # Skip corrupted files
+                    print(f"[SessionPlugin] Warning: skipping corrupted session file {file_path}: {e}")
+                    continue
+                changed = True
+
+            current[session_id] = entry
+
+        if changed or current.keys() != entries.keys():
+            self._write(current)
+
+        return [deserialize_session_info(entry) for entry in current.values()]
+
+    def forks_of(
+        self,
+        session_id: str,
+        read_session: Callable[[Path], Dict[str, Any]]
+    ) -> Dict[str, Dict[str, Any]]:
+        """Find the sessions stored as deltas against a session.
+
+        Args:
+            session_id: The parent session ID.
+            read_session: As for list(); used to refresh stale entries.
+
+        Returns:
+            Dict mapping fork session IDs to their serialized ForkPoint.
+        """
+        self.list(read_session)
+        return {
+            fork_id: entry['parent']
+            for fork_id, entry in self._read().items()
+            if (entry.get('parent') or {}).get('session_id') == session_id
+        }
+
+    def _read(self) -> Dict[str, Dict[str, Any]]:
+        """Read catalog entries, returning {} if missing or unreadable."""
+        try:
+            data = json_codec.loads(self._path.read_bytes())
+        except (OSError, json_codec.JSONDecodeError):
+            return {}
+
+        if not isinstance(data, dict) or data.get('version') != CATALOG_VERSION:
+            return {}
+        return data.get('sessions', {})
+
+    def _write(self, entries: Dict[str, Dict[str, Any]]) -> None:
+        """Atomically write catalog entries.
+
+        A catalog that cannot be written is only a cache; listing falls
+        back to reading session files.
+        """
+        data = {'version': CATALOG_VERSION, 'sessions': entries}
+        try:
+            atomic_write(self._path, json_codec.dumps(data))
+        except OSError:
+            pass
+
+
+def _entry_from_data(data: Dict[str, Any], stamp: Stamp) -> Dict[str, Any]:
+    """Build a catalog entry from serialized session data."""
+    return {
+        'session_id': data['session_id'],
+        'description': data.get('description'),
+        'created_at': data['created_at'],
+        'updated_at': data['updated_at'],
+        'turn_count': data.get('turn_count', 0),
+        'model': data.get('connection', {}).get('model'),
+        'parent': data.get('parent'),
+        'epoch': data.get(EPOCH_KEY),
+        'stamp': list(stamp),
+    }
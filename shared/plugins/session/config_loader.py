@@ -44,6 +44,7 @@ def load_session_config(
         "auto_save_interval": null,
         "checkpoint_after_turns": 10,
         "auto_resume_last": false,
+        "resume_recent_turns": null,
         "request_description_after_turns": 3,
         "max_sessions": 20
     }
@@ -98,6 +99,7 @@ def _parse_config(data: Dict[str, Any], base_path: str) -> SessionConfig:
         auto_save_interval=data.get("auto_save_interval"),
         checkpoint_after_turns=data.get("checkpoint_after_turns"),
         auto_resume_last=data.get("auto_resume_last", False),
+        resume_recent_turns=data.get("resume_recent_turns"),
         request_description_after_turns=data.get("request_description_after_turns", 3),
         max_sessions=data.get("max_sessions", 20),
         plugin_config=data.get("plugin_config", {}),
@@ -135,6 +137,7 @@ def save_session_config(
         "auto_save_interval": config.auto_save_interval,
         "checkpoint_after_turns": config.checkpoint_after_turns,
         "auto_resume_last": config.auto_resume_last,
+        "resume_recent_turns": config.resume_recent_turns,
         "request_description_after_turns": config.request_description_after_turns,
         "max_sessions": config.max_sessions,
     }
@@ -4,23 +4,57 @@ This plugin saves sessions to JSON files in a configurable directory,
 with support for model-generated session descriptions.
 """
 
-import json
+import itertools
 import os
+import threading
+import uuid
+from dataclasses import dataclass, replace
 from datetime import datetime
 from pathlib import Path
-from typing import Any, Callable, Dict, List, Optional
+from typing import Any, Callable, Dict, List, Optional, Tuple
 
 from ..base import ToolPlugin, UserCommand, CommandParameter, CommandCompletion, PromptEnrichmentResult
-from ..model_provider.types import ToolSchema
-from .base import SessionPlugin, SessionConfig, SessionState, SessionInfo
+from ..model_provider.types import Message, ToolSchema
+from ..plugin_context import SessionLocal
+from .base import ForkPoint, SessionPlugin, SessionConfig, SessionState, SessionInfo
+from . import binary, journal
+from .catalog import SessionCatalog
+from .fork import MAX_FORK_DEPTH, PARENT_KEY, has_prefix
+from .paging import split_recent
+from .snapshot import (
+    SNAPSHOT_FORMATS,
+    DictionaryStore,
+    detect_encoding,
+    encode_snapshot,
+    read_snapshot,
+    resolve_compression,
+)
+from .writer import CheckpointWriter, snapshot_state
 from .serializer import (
+    serialize_history,
+    serialize_session_fields,
     serialize_session_state,
+    deserialize_fork_point,
+    deserialize_message,
     deserialize_session_state,
     serialize_session_info,
-    deserialize_session_info,
 )
 
 
+# Compact when the journal grows beyond this fraction of the snapshot size
+DEFAULT_JOURNAL_COMPACT_RATIO = 1.0
+
+# Compact after this many journal updates regardless of size
+DEFAULT_JOURNAL_MAX_RECORDS = 1000
+
+# Durability policies: which writes are fsynced before a save returns
+# - none: rely on the OS to write back (a power loss may drop recent saves)
+# - snapshot: fsync snapshots, so a compaction never loses the session
+# - always: also fsync every journal append
+DURABILITY_POLICIES = ("none", "snapshot", "always")
+DEFAULT_DURABILITY = "snapshot"
+
+
 def generate_session_id() -> str:
     """Generate a timestamp-based session ID.
 
@@ -30,6 +64,41 @@ def generate_session_id() -> str:
     return datetime.now().strftime("%Y%m%d_%H%M%S")
 
 
+@dataclass
+class _JournalCursor:
+    """What is already persisted for a session (snapshot + journal)."""
+
+    epoch: str
+    """Epoch shared by the snapshot and its journal."""
+
+    history_len: int
+    """Number of persisted history messages."""
+
+    first_message: Optional[Message]
+    """First persisted message, to detect a rewritten history prefix."""
+
+    last_message: Optional[Message]
+    """Last persisted message, to detect a rewritten history prefix."""
+
+    accounting_len: int
+    """Number of persisted turn accounting entries."""
+
+    inputs_len: int
+    """Number of persisted user inputs."""
+
+    snapshot_bytes: int
+    """Uncompressed size of the snapshot."""
+
+    journal_bytes: int = 0
+    """Size of the journal file."""
+
+    records: int = 0
+    """Number of update records in the journal."""
+
+    fork: Optional[ForkPoint] = None
+    """Parent reference the snapshot was stored with (delta snapshots)."""
+
+
 class FileSessionPlugin:
     """File-based session persistence plugin.
 
@@ -39,25 +108,73 @@ class FileSessionPlugin:
     Sessions are stored as JSON files named by their timestamp-based ID:
         .jaato/sessions/20251207_143022.json
 
+    With journaling enabled (the default), saves after the first append
+    only the new turns to 20251207_143022.journal and the JSON snapshot is
+    rewritten only when the journal is compacted (see journal.py).
+
+    Snapshots can be stored gzip- or zstd-compressed (see snapshot.py) or
+    in a binary format with large payloads in shared blobs (see
+    binary.py); files in every encoding remain readable.
+
+    load_recent() resumes only the last turns of a session; the older
+    messages stay on disk behind a pager (see paging.py).
+
+    Session metadata is indexed in a catalog file (see catalog.py), so
+    listing sessions does not read session histories.
+
+    Turn checkpoints are written by a background writer thread (see
+    writer.py). All file and cursor access goes through self._lock, since
+    saves run on both the writer thread and the caller's thread.
+
     The plugin uses prompt enrichment to request a description from the model
     after a configurable number of turns.
+
+    The current session, its turn count and description, and the client
+    are kept per calling session (see plugin_context), so one plugin can
+    serve several sessions.
     """
 
+    # Current session state
+    _current_session_id = SessionLocal(default=None)
+    _description_requested = SessionLocal(default=False)
+
+    # Track session for prompt enrichment
+    _turn_count = SessionLocal(default=0)
+    _session_description = SessionLocal(default=None)
+
+    # Reference to JaatoClient for user command execution (set via set_client())
+    _client = SessionLocal(default=None)
+
     def __init__(self):
         self._name = "session"
         self._storage_path: Path = Path(".jaato/sessions")
         self._config: Optional[Dict[str, Any]] = None
 
-        # Current session state
-        self._current_session_id: Optional[str] = None
-        self._description_requested: bool = False
-
-        # Track session for prompt enrichment
-        self._turn_count: int = 0
-        self._session_description: Optional[str] = None
-
-        # Reference to JaatoClient for user command execution
-        self._client = None  # Set via set_client()
+        # Journaling: per-session record of what is already on disk
+        self._journal_enabled: bool = True
+        self._journal_compact_ratio: float = DEFAULT_JOURNAL_COMPACT_RATIO
+        self._journal_max_records: int = DEFAULT_JOURNAL_MAX_RECORDS
+        self._journals: Dict[str, _JournalCursor] = {}
+        self._catalog = SessionCatalog(self._storage_path)
+
+        # Snapshot compression ('none', 'gzip' or 'zstd')
+        self._compression: str = "none"
+        self._compression_dictionary: bool = True
+        self._dictionaries = DictionaryStore(self._storage_path)
+
+        # Snapshot format ('json' or 'binary') and binary snapshot blobs
+        self._snapshot_format: str = "json"
+        self._blob_threshold: int = binary.DEFAULT_BLOB_THRESHOLD
+        self._blobs = binary.BlobStore(self._storage_path)
+
+        # Background checkpoints; saves are ordered by sequence number so a
+        # checkpoint finishing late never overwrites a newer save
+        self._background_writes: bool = True
+        self._durability: str = DEFAULT_DURABILITY
+        self._writer = CheckpointWriter()
+        self._lock = threading.RLock()
+        self._save_seq = itertools.count()
+        self._saved_seq: Dict[str, int] = {}
 
     @property
     def name(self) -> str:
@@ -82,10 +199,71 @@ class FileSessionPlugin:
         Args:
             config: Configuration dict. Supports:
                 - storage_path: Directory for session files (default: .jaato/sessions)
+                - journal: Append incremental updates instead of rewriting
+                  the session file on every save (default: True)
+                - journal_compact_ratio: Rewrite the snapshot once the journal
+                  exceeds this fraction of its size (default: 1.0)
+                - journal_max_records: Rewrite the snapshot after this many
+                  journal updates (default: 1000)
+                - background_writes: Write turn checkpoints on a background
+                  thread instead of the turn thread (default: True)
+                - durability: 'none', 'snapshot' or 'always'; which writes
+                  are fsynced (default: 'snapshot')
+                - compression: 'none', 'gzip', 'zstd' or 'auto' (zstd if the
+                  zstandard package is installed, else gzip) for snapshots
+                  (default: 'none')
+                - compression_dictionary: Compress zstd snapshots with a
+                  dictionary trained on stored sessions (default: True)
+                - snapshot_format: 'json' or 'binary' (length-prefixed
+                  records, large payloads stored once as shared blobs)
+                  (default: 'json')
+                - blob_threshold: Size in bytes from which binary snapshot
+                  values are stored as blobs (default: 65536)
+
+        Raises:
+            ValueError: If durability, compression or snapshot_format is
+                not a known value, zstd is requested without the zstandard
+                package, or binary snapshots are combined with compression.
         """
+        # Finish checkpoints queued against the previous configuration
+        self._writer.close()
+        self._writer = CheckpointWriter()
+
         self._config = config or {}
+        durability = self._config.get('durability', DEFAULT_DURABILITY)
+        if durability not in DURABILITY_POLICIES:
+            raise ValueError(
+                f"Unknown durability policy: {durability}. "
+                f"Available: {', '.join(DURABILITY_POLICIES)}"
+            )
+        self._durability = durability
+        self._background_writes = self._config.get('background_writes', True)
+        self._compression = resolve_compression(self._config.get('compression'))
+        self._compression_dictionary = self._config.get('compression_dictionary', True)
+        snapshot_format = self._config.get('snapshot_format', 'json')
+        if snapshot_format not in SNAPSHOT_FORMATS:
+            raise ValueError(
+                f"Unknown snapshot format: {snapshot_format}. "
+                f"Available: {', '.join(SNAPSHOT_FORMATS)}"
+            )
+        if snapshot_format == 'binary' and self._compression != 'none':
+            raise ValueError("Binary snapshots cannot be compressed; use compression 'none'")
+        self._snapshot_format = snapshot_format
+        self._blob_threshold = self._config.get('blob_threshold', binary.DEFAULT_BLOB_THRESHOLD)
+
         storage = self._config.get('storage_path', '.jaato/sessions')
         self._storage_path = Path(storage)
+        self._journal_enabled = self._config.get('journal', True)
+        self._journal_compact_ratio = self._config.get(
+            'journal_compact_ratio', DEFAULT_JOURNAL_COMPACT_RATIO
+        )
+        self._journal_max_records = self._config.get(
+            'journal_max_records', DEFAULT_JOURNAL_MAX_RECORDS
+        )
+        self._journals = {}
+        self._catalog = SessionCatalog(self._storage_path)
+        self._dictionaries = DictionaryStore(self._storage_path)
+        self._blobs = binary.BlobStore(self._storage_path)
 
         # Ensure storage directory exists
         self._storage_path.mkdir(parents=True, exist_ok=True)
@@ -97,28 +275,76 @@ class FileSessionPlugin:
         self._session_description = None
 
     def shutdown(self) -> None:
-        """Clean up resources."""
-        pass
+        """Write pending checkpoints and stop the writer thread."""
+        self._writer.close()
+
+    def flush(self, timeout: Optional[float] = None) -> bool:
+        """Wait until pending background checkpoints are written.
+
+        Args:
+            timeout: Maximum seconds to wait (None = no limit).
+
+        Returns:
+            True if all checkpoints were written, False on timeout.
+        """
+        return self._writer.flush(timeout)
 
     # ==================== SessionPlugin: Core Persistence ====================
 
     def save(self, state: SessionState) -> None:
-        """Save session state to a JSON file.
+        """Save session state.
+
+        If the session was saved or loaded before and its history only grew
+        since, the new messages are appended to the journal. Otherwise (first
+        save, history rewritten by GC or revert, or journal due for
+        compaction) a full snapshot is written atomically.
+
+        The save supersedes any background checkpoint still pending for
+        the session.
 
         Args:
             state: The complete session state to persist.
         """
+        seq = next(self._save_seq)
+        self._writer.discard(state.session_id)
+        with self._lock:
+            self._save(state, seq)
+
+    def _save(self, state: SessionState, seq: int) -> bool:
+        """Persist a state unless a newer one was already saved.
+
+        Must be called with self._lock held.
+
+        Args:
+            state: The session state to persist.
+            seq: Sequence number taken when the state was captured.
+
+        Returns:
+            True if the state was written.
+        """
+        if seq < self._saved_seq.get(state.session_id, -1):
+            return False
+        self._saved_seq[state.session_id] = seq
+
         # Update with current description if we have one
         if self._session_description and not state.description:
             state.description = self._session_description
 
-        file_path = self._storage_path / f"{state.session_id}.json"
-        data = serialize_session_state(state)
-
-        with open(file_path, 'w', encoding='utf-8') as f:
-            json.dump(data, f, indent=2, ensure_ascii=False)
+        cursor = self._journals.get(state.session_id)
+        if (
+            self._journal_enabled and
+            cursor is not None and
+            self._can_append(cursor, state) and
+            not self._needs_compaction(cursor)
+        ):
+            self._append_update(state, cursor)
+            epoch = cursor.epoch
+        else:
+            epoch = self._write_snapshot(state)
 
+        self._catalog.update(state.session_id, serialize_session_info(state), epoch)
         self._current_session_id = state.session_id
+        return True
 
     def load(self, session_id: str) -> SessionState:
         """Load session state from a JSON file.
@@ -133,15 +359,80 @@ class FileSessionPlugin:
             FileNotFoundError: If the session file doesn't exist.
             ValueError: If the session data is corrupted.
         """
+        # A checkpoint of this session may still be queued
+        self._writer.flush()
+        with self._lock:
+            return self._load(session_id)
+
+    def load_recent(self, session_id: str, turns: int) -> SessionState:
+        """Load a session with only its last turns in memory (paged resume).
+
+        Older messages are not deserialized; they stay on disk behind
+        state.paged and are read back when paged in (see paging.py).
+
+        Args:
+            session_id: The session ID to load.
+            turns: Number of recent turns to load.
+
+        Returns:
+            The loaded SessionState. If the session has more than turns
+            turns, its history holds only the last ones and state.paged is
+            set.
+
+        Raises:
+            FileNotFoundError: If the session file doesn't exist.
+            ValueError: If the session data is corrupted.
+        """
+        self._writer.flush()
+        with self._lock:
+            return self._load(session_id, recent_turns=turns)
+
+    def _load(self, session_id: str, recent_turns: Optional[int] = None) -> SessionState:
+        """Load a session; must be called with self._lock held."""
         file_path = self._storage_path / f"{session_id}.json"
 
         if not file_path.exists():
             raise FileNotFoundError(f"Session not found: {session_id}")
 
-        with open(file_path, 'r', encoding='utf-8') as f:
-            data = json.load(f)
+        data, snapshot_bytes, journal_bytes, records = self._read_session_data(
+            file_path, repair=True
+        )
+        history = data.setdefault('history', [])
+        history_len = len(history)
+        first_message = deserialize_message(history[0]) if history else None
+
+        pager = None
+        if recent_turns:
+            pager = split_recent(
+                session_id, history, recent_turns,
+                lambda: self._read_history(session_id)
+            )
 
         state = deserialize_session_state(data)
+        state.paged = pager
+
+        # Later saves append to the journal only if it belongs to this
+        # snapshot; legacy files without an epoch get a snapshot first
+        epoch = data.get(journal.EPOCH_KEY)
+        if epoch is None or journal.read_epoch(self._journal_path(session_id)) != epoch:
+            self._journals.pop(state.session_id, None)
+        else:
+            self._journals[state.session_id] = _JournalCursor(
+                epoch=epoch,
+                history_len=history_len,
+                first_message=first_message,
+                last_message=state.history[-1] if state.history else None,
+                accounting_len=len(state.turn_accounting),
+                inputs_len=len(state.user_inputs),
+                snapshot_bytes=snapshot_bytes,
+                journal_bytes=journal_bytes,
+                records=records,
+                fork=state.fork,
+            )
+
+        # Loading may have repaired a torn journal, changing its stamp
+        if self._catalog.get(session_id) is None:
+            self._catalog.update(session_id, serialize_session_info(state), epoch)
 
         # Update internal state
         self._current_session_id = state.session_id
@@ -157,18 +448,8 @@ class FileSessionPlugin:
         Returns:
             List of SessionInfo objects, sorted by updated_at descending.
         """
-        sessions = []
-
-        for file_path in self._storage_path.glob("*.json"):
-            try:
-                with open(file_path, 'r', encoding='utf-8') as f:
-                    data = json.load(f)
-                info = deserialize_session_info(data)
-                sessions.append(info)
-            except (json.JSONDecodeError, KeyError, ValueError) as e:
-                # Skip corrupted files
-                print(f"[SessionPlugin] Warning: skipping corrupted session file {file_path}: {e}")
-                continue
+        with self._lock:
+            sessions = self._catalog.list(lambda path: self._read_session_data(path)[0])
 
         # Sort by updated_at descending (most recent first)
         sessions.sort(key=lambda s: s.updated_at, reverse=True)
@@ -183,14 +464,52 @@ class FileSessionPlugin:
         Returns:
             True if deleted, False if session didn't exist.
         """
-        file_path = self._storage_path / f"{session_id}.json"
+        seq = next(self._save_seq)
+        self._writer.discard(session_id)
+        with self._lock:
+            # A checkpoint already running must not recreate the session
+            self._saved_seq[session_id] = seq
+
+            file_path = self._storage_path / f"{session_id}.json"
+            if file_path.exists():
+                self._detach_forks(session_id)
+            self._journals.pop(session_id, None)
+            self._catalog.remove(session_id)
+
+            if file_path.exists():
+                had_blobs = detect_encoding(file_path) == "binary"
+                file_path.unlink()
+                self._journal_path(session_id).unlink(missing_ok=True)
+                if self._current_session_id == session_id:
+                    self._current_session_id = None
+                if had_blobs:
+                    self.prune_blobs()
+                return True
+            return False
+
+    def prune_blobs(self, min_age: float = binary.BLOB_PRUNE_MIN_AGE) -> int:
+        """Delete blobs no binary snapshot references any more.
+
+        Called when a binary session is deleted.
+
+        Args:
+            min_age: Keep blobs written less than this many seconds ago,
+                since another process may be about to reference them.
 
-        if file_path.exists():
-            file_path.unlink()
-            if self._current_session_id == session_id:
-                self._current_session_id = None
-            return True
-        return False
+        Returns:
+            Number of blobs deleted.
+        """
+        with self._lock:
+            referenced = set()
+            for path in self._storage_path.glob("*.json"):
+                try:
+                    if detect_encoding(path) == "binary":
+                        referenced.update(binary.read_blob_refs(path))
+                except (OSError, ValueError) as e:
+                    # Keep everything rather than lose blobs of a session
+                    print(f"[SessionPlugin] Warning: not pruning blobs, cannot read {path}: {e}")
+                    return 0
+            return self._blobs.prune(referenced, min_age)
 
     def get_latest(self) -> Optional[SessionInfo]:
         """Get the most recently updated session.
@@ -210,7 +529,10 @@ class FileSessionPlugin:
     ) -> None:
         """Called after each conversation turn completes.
 
-        Handles checkpoint saves if configured.
+        Handles checkpoint saves if configured. With background writes the
+        checkpoint is queued for the writer thread and this returns without
+        touching the disk; old sessions are cleaned up after the checkpoint
+        is written rather than on every turn.
 
         Args:
             state: Current session state.
@@ -219,12 +541,21 @@ class FileSessionPlugin:
         self._turn_count = state.turn_count
 
         # Checkpoint save if configured
-        if config.checkpoint_after_turns:
-            if self._turn_count > 0 and self._turn_count % config.checkpoint_after_turns == 0:
-                self.save(state)
-
-        # Cleanup old sessions if we have too many
-        self._cleanup_old_sessions(config.max_sessions)
+        if not config.checkpoint_after_turns:
+            return
+        if self._turn_count <= 0 or self._turn_count % config.checkpoint_after_turns != 0:
+            return
+
+        seq = next(self._save_seq)
+        if not self._background_writes:
+            self._checkpoint(state, seq, config.max_sessions)
+            return
+
+        snapshot = snapshot_state(state)
+        self._writer.submit(
+            state.session_id,
+            lambda: self._checkpoint(snapshot, seq, config.max_sessions)
+        )
 
     def on_session_start(
         self,
@@ -250,6 +581,8 @@ class FileSessionPlugin:
             latest = self.get_latest()
             if latest:
                 try:
+                    if config.resume_recent_turns:
+                        return self.load_recent(latest.session_id, config.resume_recent_turns)
                     return self.load(latest.session_id)
                 except (FileNotFoundError, ValueError):
                     pass
@@ -263,13 +596,16 @@ class FileSessionPlugin:
     ) -> None:
         """Called when the client session ends cleanly.
 
-        Saves the session if auto_save_on_exit is enabled and there's
-        actual content to save (at least one turn).
+        Waits for pending background checkpoints, then saves the session if
+        auto_save_on_exit is enabled and there's actual content to save (at
+        least one turn).
 
         Args:
             state: Current session state.
             config: Session configuration.
         """
+        self._writer.flush()
+
         if config.auto_save_on_exit:
             # Don't save empty sessions (no turns = nothing worth saving)
             if state.turn_count == 0:
@@ -278,6 +614,7 @@ class FileSessionPlugin:
             if not state.session_id:
                 state.session_id = generate_session_id()
             self.save(state)
+            self._cleanup_old_sessions(config.max_sessions)
 
     # ==================== SessionPlugin: Description Management ====================
 
@@ -293,16 +630,13 @@ class FileSessionPlugin:
         self._session_description = description
 
         # Update the file if it exists
-        file_path = self._storage_path / f"{session_id}.json"
-        if file_path.exists():
-            try:
-                with open(file_path, 'r', encoding='utf-8') as f:
-                    data = json.load(f)
-                data['description'] = description
-                with open(file_path, 'w', encoding='utf-8') as f:
-                    json.dump(data, f, indent=2, ensure_ascii=False)
-            except (json.JSONDecodeError, IOError):
-                pass
+        with self._lock:
+            file_path = self._storage_path / f"{session_id}.json"
+            if file_path.exists():
+                try:
+                    self._write_description(session_id, description)
+                except (ValueError, IOError):
+                    pass
 
     def needs_description(self, state: SessionState, config: SessionConfig) -> bool:
         """Check if the session needs a description.
@@ -544,7 +878,7 @@ class FileSessionPlugin:
             # Show current turn count and usage
             try:
                 boundaries = self._client.get_turn_boundaries()
-                total_turns = len(boundaries)
+                total_turns = self._client.get_paged_turn_count() + len(boundaries)
                 return {
                     "status": "info",
                     "message": (
@@ -725,6 +1059,294 @@ class FileSessionPlugin:
 
     # ==================== Internal Helpers ====================
 
+    def _journal_path(self, session_id: str) -> Path:
+        """Path of a session's journal file."""
+        return self._storage_path / f"{session_id}{journal.JOURNAL_SUFFIX}"
+
+    def _read_session_data(
+        self,
+        file_path: Path,
+        repair: bool = False,
+        depth: int = 0
+    ) -> Tuple[Dict[str, Any], int, int, int]:
+        """Read a session snapshot and replay its journal.
+
+        The history of a fork stored as a delta is completed with the
+        shared prefix read from its parent.
+
+        Args:
+            file_path: Path of the <session_id>.json snapshot.
+            repair: Truncate a torn final journal record.
+            depth: Number of forks already resolved to get here.
+
+        Returns:
+            Tuple of (serialized session data, uncompressed snapshot bytes,
+            journal bytes, update records applied).
+
+        Raises:
+            ValueError: If the snapshot is corrupted, or a fork's parent is
+                missing or no longer has the shared prefix.
+        """
+        data, snapshot_bytes = read_snapshot(file_path, self._dictionaries, self._blobs)
+
+        if data.get(PARENT_KEY):
+            # Journal history bases count the shared prefix
+            data['history'][:0] = self._read_fork_prefix(
+                file_path.stem, deserialize_fork_point(data[PARENT_KEY]), depth
+            )
+
+        journal_path = file_path.with_suffix(journal.JOURNAL_SUFFIX)
+        records, valid_bytes, torn = journal.read_records(journal_path)
+        if torn and repair:
+            journal.truncate(journal_path, valid_bytes)
+
+        applied = journal.replay(data, records)
+        return data, snapshot_bytes, valid_bytes, applied
+
+    def _read_fork_prefix(self, session_id: str, fork: ForkPoint, depth: int) -> List[Dict[str, Any]]:
+        """Read the serialized history a fork shares with its parent."""
+        if depth >= MAX_FORK_DEPTH:
+            raise ValueError(f"Session {session_id}: fork chain deeper than {MAX_FORK_DEPTH}")
+
+        parent_path = self._storage_path / f"{fork.session_id}.json"
+        if not parent_path.exists():
+            raise ValueError(f"Session {session_id}: parent session {fork.session_id} not found")
+
+        history = self._read_session_data(parent_path, depth=depth + 1)[0]['history']
+        if not has_prefix(history, fork):
+            raise ValueError(
+                f"Session {session_id}: parent session {fork.session_id} no longer has the shared history"
+            )
+        return history[:fork.message_count]
+
+    def _read_history(self, session_id: str) -> List[Dict[str, Any]]:
+        """Read a session's full serialized history (for paging in)."""
+        with self._lock:
+            data = self._read_session_data(self._storage_path / f"{session_id}.json")[0]
+        return data.get('history', [])
+
+    def _write_description(self, session_id: str, description: str) -> None:
+        """Persist a new description for an existing session.
+
+        Appends a journal update when the session has a valid journal and
+        only rewrites the snapshot otherwise. The catalog is updated in both
+        cases.
+        """
+        update = {"op": "update", "state": {"description": description}}
+        journal_path = self._journal_path(session_id)
+
+        # Read the catalog entry before the session files change
+        entry = self._catalog.get(session_id)
+
+        cursor = self._journals.get(session_id)
+        epoch = cursor.epoch if cursor else (entry or {}).get('epoch')
+
+        if self._journal_enabled and cursor is not None:
+            self._append_records(session_id, cursor, [update])
+        elif epoch is not None and journal.read_epoch(journal_path) == epoch:
+            journal.append_records(journal_path, [update], fsync=self._fsync_journal)
+        else:
+            file_path = self._storage_path / f"{session_id}.json"
+            data, _ = read_snapshot(file_path, self._dictionaries, self._blobs)
+            data['description'] = description
+            encoded, _ = self._encode_snapshot(data)
+            journal.atomic_write(file_path, encoded, fsync=self._fsync_snapshot)
+
+        if entry is not None:
+            self._catalog.update(session_id, {**entry, 'description': description}, entry.get('epoch'))
+
+    def _can_append(self, cursor: _JournalCursor, state: SessionState) -> bool:
+        """Check whether state only extends what is already persisted.
+
+        Histories are compared by length and by their first and last
+        persisted messages: GC replaces the start of the history, and
+        revert_to_turn shortens it or replaces its end. The messages a
+        paged resume left on disk are unchanged by definition.
+        """
+        history = state.history
+        offset = state.paged.message_count if state.paged else 0
+        n = cursor.history_len
+
+        if offset + len(history) < n:
+            return False
+        if offset and n <= offset:
+            return False
+        if not offset and n and history[0] != cursor.first_message:
+            return False
+        if n and history[n - 1 - offset] != cursor.last_message:
+            return False
+        if len(state.turn_accounting) < cursor.accounting_len:
+            return False
+        if len(state.user_inputs) < cursor.inputs_len:
+            return False
+        if state.fork != cursor.fork:
+            return False
+
+        return (self._storage_path / f"{state.session_id}.json").exists()
+
+    def _needs_compaction(self, cursor: _JournalCursor) -> bool:
+        """Check whether the journal should be folded into a new snapshot."""
+        return (
+            cursor.records >= self._journal_max_records or
+            cursor.journal_bytes > cursor.snapshot_bytes * self._journal_compact_ratio
+        )
+
+    def _write_snapshot(self, state: SessionState) -> str:
+        """Write a full snapshot and start an empty journal for it.
+
+        A fork (state.fork set) is stored as a delta against its parent if
+        the parent on disk still starts with the shared prefix; otherwise
+        it is stored in full and state.fork is cleared. Forks of this
+        session whose prefix the new snapshot no longer has are first
+        rewritten in full (see fork.py).
+
+        Returns:
+            The snapshot's journal epoch.
+        """
+        source = state
+        if state.paged is not None:
+            # A full snapshot needs the messages left on disk by a paged resume
+            state = replace(state, history=state.paged.load() + state.history, paged=None)
+
+        epoch = uuid.uuid4().hex
+        data = serialize_session_state(state, raw_bytes=self._snapshot_format == "binary")
+        self._detach_forks(state.session_id, data['history'])
+
+        if state.fork is not None:
+            if has_prefix(data['history'], state.fork) and self._parent_has_prefix(state.fork):
+                del data['history'][:state.fork.message_count]
+            else:
+                del data[PARENT_KEY]
+                state.fork = source.fork = None
+
+        data[journal.EPOCH_KEY] = epoch
+        encoded, snapshot_bytes = self._encode_snapshot(data)
+
+        file_path = self._storage_path / f"{state.session_id}.json"
+        journal.atomic_write(file_path, encoded, fsync=self._fsync_snapshot)
+
+        journal_path = self._journal_path(state.session_id)
+        if not self._journal_enabled:
+            journal_path.unlink(missing_ok=True)
+            return epoch
+
+        # The snapshot is in place first: if we crash before the journal
+        # is reset, the old journal's epoch no longer matches and is ignored
+        journal_bytes = journal.write_journal(journal_path, epoch, fsync=self._fsync_snapshot)
+
+        history = state.history
+        self._journals[state.session_id] = _JournalCursor(
+            epoch=epoch,
+            history_len=len(history),
+            first_message=history[0] if history else None,
+            last_message=history[-1] if history else None,
+            accounting_len=len(state.turn_accounting),
+            inputs_len=len(state.user_inputs),
+            snapshot_bytes=snapshot_bytes,
+            journal_bytes=journal_bytes,
+            fork=state.fork,
+        )
+        return epoch
+
+    def _parent_has_prefix(self, fork: ForkPoint) -> bool:
+        """Check whether a fork's parent is stored and starts with its prefix."""
+        file_path = self._storage_path / f"{fork.session_id}.json"
+        try:
+            return has_prefix(self._read_session_data(file_path)[0]['history'], fork)
+        except (OSError, ValueError):
+            return False
+
+    def _detach_forks(self, session_id: str, history: Optional[List[Dict[str, Any]]] = None) -> None:
+        """Rewrite forks of a session in full before its snapshot changes.
+
+        Must be called while the session's current files are still on disk.
+
+        Args:
+            session_id: The parent session ID.
+            history: The parent's new serialized history; forks whose prefix
+                it still has are kept as deltas. None (deletion) detaches
+                every fork.
+        """
+        forks = self._catalog.forks_of(session_id, lambda path: self._read_session_data(path)[0])
+        for fork_id, parent in forks.items():
+            if history is not None and has_prefix(history, deserialize_fork_point(parent)):
+                continue
+            try:
+                data = self._read_session_data(self._storage_path / f"{fork_id}.json")[0]
+            except (OSError, ValueError) as e:
+                print(f"[SessionPlugin] Warning: cannot detach fork {fork_id} of {session_id}: {e}")
+                continue
+            state = deserialize_session_state(data)
+            state.fork = None
+            epoch = self._write_snapshot(state)
+            self._catalog.update(fork_id, serialize_session_info(state), epoch)
+
+    def _append_update(self, state: SessionState, cursor: _JournalCursor) -> None:
+        """Append the changes since the last save to the journal."""
+        history = state.history
+        offset = state.paged.message_count if state.paged else 0
+        record: Dict[str, Any] = {
+            "op": "update",
+            "state": serialize_session_fields(state),
+        }
+
+        if offset + len(history) > cursor.history_len:
+            record["history_base"] = cursor.history_len
+            record["history"] = serialize_history(history[cursor.history_len - offset:])
+        if len(state.turn_accounting) > cursor.accounting_len:
+            record["turn_accounting_base"] = cursor.accounting_len
+            record["turn_accounting"] = state.turn_accounting[cursor.accounting_len:]
+        if len(state.user_inputs) > cursor.inputs_len:
+            record["user_inputs_base"] = cursor.inputs_len
+            record["user_inputs"] = state.user_inputs[cursor.inputs_len:]
+
+        self._append_records(state.session_id, cursor, [record])
+
+        cursor.history_len = offset + len(history)
+        if history:
+            if not offset:
+                cursor.first_message = history[0]
+            cursor.last_message = history[-1]
+        cursor.accounting_len = len(state.turn_accounting)
+        cursor.inputs_len = len(state.user_inputs)
+
+    def _append_records(
+        self,
+        session_id: str,
+        cursor: _JournalCursor,
+        records: List[Dict[str, Any]]
+    ) -> None:
+        """Append records to a session's journal and update its cursor."""
+        cursor.journal_bytes += journal.append_records(
+            self._journal_path(session_id), records, fsync=self._fsync_journal
+        )
+        cursor.records += len(records)
+
+    def _encode_snapshot(self, data: Dict[str, Any]) -> Tuple[bytes, int]:
+        """Encode snapshot data in the configured format and compression."""
+        if self._snapshot_format == "binary":
+            return binary.encode_snapshot(
+                data, self._blobs, self._blob_threshold, fsync=self._fsync_snapshot
+            )
+        dictionaries = self._dictionaries if self._compression_dictionary else None
+        return encode_snapshot(data, self._compression, dictionaries)
+
+    @property
+    def _fsync_snapshot(self) -> bool:
+        """Whether snapshot writes are fsynced."""
+        return self._durability != "none"
+
+    @property
+    def _fsync_journal(self) -> bool:
+        """Whether journal appends are fsynced."""
+        return self._durability == "always"
+
+    def _checkpoint(self, state: SessionState, seq: int, max_sessions: int) -> None:
+        """Write a turn checkpoint, then clean up old sessions."""
+        with self._lock:
+            if self._save(state, seq):
+                self._cleanup_old_sessions(max_sessions)
+
     def _cleanup_old_sessions(self, max_sessions: int) -> int:
         """Remove oldest sessions if we exceed the limit.
 
@@ -0,0 +1,72 @@
+"""Session forks stored as deltas.
+
+A fork (see JaatoSession.fork()) starts with the history of its parent
+session. On disk it stores only the messages after the fork point, plus a
+'parent' reference (see ForkPoint); loading reads the shared prefix from
+the parent, recursively for forks of forks.
+
+The reference carries a digest of all shared messages. FileSessionPlugin
+checks it on load, and when a parent's snapshot is rewritten (GC,
+revert) or deleted, and first rewrites affected forks with their full
+history, so a fork never depends on a prefix that is gone.
+"""
+
+import hashlib
+import json
+from typing import Any, Dict, List
+
+from ..model_provider.types import Message
+from .base import ForkPoint
+from .binary import json_default
+from .serializer import serialize_message
+
+
+# Snapshot key holding a fork's parent reference
+PARENT_KEY = "parent"
+
+# Forks of forks are resolved up to this depth (guards against cycles)
+MAX_FORK_DEPTH = 64
+
+
+def _canonical(message: Dict[str, Any]) -> bytes:
+    return json.dumps(
+        message, sort_keys=True, ensure_ascii=False, separators=(',', ':'), default=json_default
+    ).encode('utf-8')
+
+
+def prefix_digest(history: List[Dict[str, Any]], message_count: int) -> str:
+    """Digest of a serialized history's first message_count messages.
+
+    Every message counts, so a parent rewritten with other messages in
+    the middle of the prefix (eviction, edits) no longer matches.
+    Binary data may be given as bytes or as base64 text; both give the
+    same digest.
+    """
+    digest = hashlib.sha256()
+    for message in history[:message_count]:
+        encoded = _canonical(message)
+        digest.update(len(encoded).to_bytes(8, 'big'))
+        digest.update(encoded)
+    return digest.hexdigest()
+
+
+def make_fork_point(parent_id: str, history: List[Message]) -> ForkPoint:
+    """Build the fork point of a branch of history.
+
+    Args:
+        parent_id: Session the branch is forked from.
+        history: The (non-empty) history shared with the parent.
+    """
+    return ForkPoint(
+        session_id=parent_id,
+        message_count=len(history),
+        digest=prefix_digest([serialize_message(m) for m in history], len(history)),
+    )
+
+
+def has_prefix(history: List[Dict[str, Any]], fork: ForkPoint) -> bool:
+    """Check whether a serialized history starts with a fork's shared prefix."""
+    return (
+        len(history) >= fork.message_count > 0 and
+        prefix_digest(history, fork.message_count) == fork.digest
+    )
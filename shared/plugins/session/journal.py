@@ -0,0 +1,242 @@
+"""Append-only session journal.
+
+A session is stored as a snapshot (the regular ``<id>.json`` session file)
+plus a journal (``<id>.journal``) of updates made since that snapshot.
+Checkpoints append only what changed - new messages, new turn accounting
+entries, new user inputs and the small metadata fields - so their cost is
+proportional to the turn, not to the whole session.
+
+Journal file format: a sequence of framed records, each
+
+    [4-byte big-endian payload length][4-byte big-endian CRC32][payload]
+
+where the payload is a UTF-8 JSON object. The first record is a header
+carrying the epoch of the snapshot the journal applies to; a journal whose
+epoch does not match the snapshot is stale (e.g. a crash between writing a
+new snapshot and resetting the journal) and is ignored. A final record that
+is incomplete or fails its checksum (torn write) is detected and dropped.
+
+Update record:
+
+    {
+        "op": "update",
+        "history_base": 10, "history": [...],          # optional
+        "turn_accounting_base": 5, "turn_accounting": [...],  # optional
+        "user_inputs_base": 5, "user_inputs": [...],    # optional
+        "state": {"updated_at": ..., "turn_count": ...} # optional
+    }
+
+List tails replace everything from their base index onwards, so replaying
+a record twice is harmless.
+"""
+
+import os
+import struct
+import tempfile
+import zlib
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Tuple
+
+from ... import json_codec
+
+
+# Journal file suffix (next to the <session_id>.json snapshot)
+JOURNAL_SUFFIX = ".journal"
+
+# Snapshot key holding the epoch its journal must match
+EPOCH_KEY = "journal_epoch"
+
+# List fields journaled as tails
+LIST_FIELDS = ("history", "turn_accounting", "user_inputs")
+
+_FRAME = struct.Struct(">II")
+
+
+def _encode_record(record: Dict[str, Any]) -> bytes:
+    """Frame a record for appending."""
+    payload = json_codec.dumps(record)
+    return _FRAME.pack(len(payload), zlib.crc32(payload)) + payload
+
+
+def append_records(path: Path, records: List[Dict[str, Any]], fsync: bool = False) -> int:
+    """Append records to a journal.
+
+    Args:
+        path: Journal file path.
+        records: Records to append.
+        fsync: Whether to fsync after writing.
+
+    Returns:
+        Number of bytes written.
+    """
+    data = b"".join(_encode_record(r) for r in records)
+    with open(path, 'ab') as f:
+        f.write(data)
+        f.flush()
+        if fsync:
+            os.fsync(f.fileno())
+    return len(data)
+
+
+def write_journal(path: Path, epoch: str, fsync: bool = False) -> int:
+    """Atomically create (or reset) a journal containing only its header.
+
+    Args:
+        path: Journal file path.
+        epoch: Epoch of the snapshot this journal applies to.
+        fsync: Whether to fsync before replacing.
+
+    Returns:
+        Size of the new journal in bytes.
+    """
+    data = _encode_record({"op": "header", "epoch": epoch})
+    atomic_write(path, data, fsync=fsync)
+    return len(data)
+
+
+def read_records(path: Path) -> Tuple[List[Dict[str, Any]], int, bool]:
+    """Read records from a journal, stopping at the first invalid frame.
+
+    Args:
+        path: Journal file path.
+
+    Returns:
+        Tuple of (records, valid_bytes, torn). valid_bytes is the offset
+        just past the last valid record; torn is True if invalid trailing
+        data was found (and should be truncated before appending).
+    """
+    try:
+        with open(path, 'rb') as f:
+            data = f.read()
+    except FileNotFoundError:
+        return [], 0, False
+
+    records: List[Dict[str, Any]] = []
+    offset = 0
+
+    while offset < len(data):
+        if offset + _FRAME.size > len(data):
+            break
+        length, crc = _FRAME.unpack_from(data, offset)
+        start = offset + _FRAME.size
+        payload = data[start:start + length]
+        if len(payload) < length or zlib.crc32(payload) != crc:
+            break
+        try:
+            records.append(json_codec.loads(payload))
+        except (UnicodeDecodeError, json_codec.JSONDecodeError):
+            break
+        offset = start + length
+
+    return records, offset, offset < len(data)
+
+
+def read_epoch(path: Path) -> Optional[str]:
+    """Read the epoch from a journal's header record.
+
+    Returns:
+        The epoch, or None if the journal is missing or has no header.
+    """
+    try:
+        with open(path, 'rb') as f:
+            frame = f.read(_FRAME.size)
+            if len(frame) < _FRAME.size:
+                return None
+            length, crc = _FRAME.unpack(frame)
+            payload = f.read(length)
+    except FileNotFoundError:
+        return None
+
+    if len(payload) < length or zlib.crc32(payload) != crc:
+        return None
+    try:
+        header = json_codec.loads(payload)
+    except (UnicodeDecodeError, json_codec.JSONDecodeError):
+        return None
+    return header.get("epoch") if header.get("op") == "header" else None
+
+
+def truncate(path: Path, size: int) -> None:
+    """Drop a torn tail from a journal."""
+    with open(path, 'r+b') as f:
+        f.truncate(size)
+
+
+def replay(data: Dict[str, Any], records: List[Dict[str, Any]]) -> int:
+    """Apply journal records to serialized snapshot data in place.
+
+    Records are only applied if the journal header's epoch matches the
+    snapshot's. Replay stops at a record that would leave a gap in a list
+    (which indicates a journal from a different history).
+
+    Args:
+        data: Snapshot dict as produced by serialize_session_state.
+        records: Records from read_records().
+
+    Returns:
+        Number of update records applied.
+    """
+    if not records or records[0].get("op") != "header":
+        return 0
+    if records[0].get("epoch") != data.get(EPOCH_KEY):
+        return 0
+
+    applied = 0
+    for record in records[1:]:
+        if record.get("op") != "update":
+            continue
+
+        for field in LIST_FIELDS:
+            if field not in record:
+                continue
+            base = record.get(f"{field}_base", 0)
+            values = data.setdefault(field, [])
+            if base > len(values):
+                return applied
+            del values[base:]
+            values.extend(record[field])
+
+        data.update(record.get("state", {}))
+        applied += 1
+
+    return applied
+
+
+def atomic_write(path: Path, data: bytes, fsync: bool = False) -> None:
+    """Write a file atomically via a temporary file and rename.
+
+    A crash leaves either the old or the new file, never a partial one.
+    With fsync, the file and the directory entry are flushed to disk
+    before returning, so the new file also survives a power loss.
+    """
+    fd, tmp_path = tempfile.mkstemp(dir=path.parent, prefix=path.name, suffix=".tmp")
+    try:
+        with os.fdopen(fd, 'wb') as f:
+            f.write(data)
+            f.flush()
+            if fsync:
+                os.fsync(f.fileno())
+        os.replace(tmp_path, path)
+    except BaseException:
+        try:
+            os.unlink(tmp_path)
+        except OSError:
+            pass
+        raise
+
+    if fsync:
+        _fsync_dir(path.parent)
+
+
+def _fsync_dir(path: Path) -> None:
+    """Flush a directory's entries to disk (no-op where unsupported)."""
+    try:
+        fd = os.open(path, os.O_RDONLY)
+    except OSError:
+        return  # e.g. Windows, where directories cannot be opened
+    try:
+        os.fsync(fd)
+    except OSError:
+        pass
+    finally:
+        os.close(fd)
@@ -0,0 +1,168 @@
+"""Paged session resume.
+
+A paged resume deserializes only the last N turns of a saved session into
+the live chat. The older messages stay on disk; a HistoryPager indexes them
+(message count and turn start positions) and reads them back on demand,
+e.g. to revert to an older turn or to export the whole session.
+
+Saving a paged session only persists the loaded part: FileSessionPlugin
+treats the state's history as starting at pager.message_count and only
+pages the older messages in when it has to write a full snapshot.
+"""
+
+from typing import Any, Callable, Dict, List, Optional
+
+from ..model_provider.types import Message
+from .serializer import deserialize_history
+
+
+# Marker of GC context summary messages (see gc.utils.create_summary_message)
+_SUMMARY_MARKER = "[Context Summary"
+
+# Older user prompts listed in the resume summary
+_SUMMARY_PROMPTS = 10
+
+# Characters kept per listed prompt
+_SUMMARY_PROMPT_CHARS = 100
+
+
+def turn_starts(history: List[Dict[str, Any]]) -> List[int]:
+    """Find where turns start in a serialized history.
+
+    Uses the same rule as JaatoSession.get_turn_boundaries(): a turn
+    starts at a user message whose first part is text.
+
+    Args:
+        history: Serialized messages (see serialize_message).
+
+    Returns:
+        Indices of turn-starting messages.
+    """
+    starts = []
+    for i, message in enumerate(history):
+        parts = message.get('parts') or []
+        if message.get('role') == 'user' and parts and parts[0].get('type') == 'text' and parts[0].get('text'):
+            starts.append(i)
+    return starts
+
+
+def summarize_older(history: List[Dict[str, Any]], starts: List[int]) -> str:
+    """Build a short extractive summary of turns left on disk.
+
+    Keeps a GC context summary found at the start of the history and lists
+    the most recent older user prompts.
+
+    Args:
+        history: Serialized older messages.
+        starts: Turn start indices within history.
+
+    Returns:
+        Summary text (without the context summary delimiters).
+    """
+    lines = [f"{len(starts)} earlier turn(s) of this resumed session are not loaded."]
+    prompts = []
+
+    for i in starts:
+        text = history[i]['parts'][0]['text']
+        if text.startswith(_SUMMARY_MARKER):
+            lines.append(text)
+            continue
+        prompts.append(" ".join(text.split())[:_SUMMARY_PROMPT_CHARS])
+
+    if prompts:
+        lines.append("Most recent earlier requests:")
+        lines.extend(f"- {prompt}" for prompt in prompts[-_SUMMARY_PROMPTS:])
+
+    return "\n".join(lines)
+
+
+class HistoryPager:
+    """Index of the older messages of a paged session, kept on disk."""
+
+    def __init__(
+        self,
+        session_id: str,
+        message_count: int,
+        turn_starts: List[int],
+        summary: str,
+        last_message: Dict[str, Any],
+        read_history: Callable[[], List[Dict[str, Any]]]
+    ):
+        """Initialize the pager.
+
+        Args:
+            session_id: Session the older messages are read from.
+            message_count: Number of older messages.
+            turn_starts: Turn start indices among the older messages.
+            summary: Summary of the older turns (see summarize_older).
+            last_message: Last older message, serialized, used to check
+                that the session on disk still has the same prefix.
+            read_history: Reads the session's full serialized history.
+        """
+        self.session_id = session_id
+        self.message_count = message_count
+        self.turn_starts = turn_starts
+        self.summary = summary
+        self._last_message = last_message
+        self._read_history = read_history
+
+    @property
+    def turn_count(self) -> int:
+        """Number of older turns."""
+        return len(self.turn_starts)
+
+    def load(self) -> List[Message]:
+        """Read the older messages from disk.
+
+        Returns:
+            The messages preceding the loaded part of the history.
+
+        Raises:
+            ValueError: If the session on disk no longer starts with the
+                paged-out messages (e.g. it was rewritten elsewhere).
+        """
+        history = self._read_history()
+        older = history[:self.message_count]
+        if len(older) < self.message_count or older[-1] != self._last_message:
+            raise ValueError(
+                f"Session {self.session_id} changed on disk; its earlier turns cannot be paged in"
+            )
+        return deserialize_history(older)
+
+
+def split_recent(
+    session_id: str,
+    history: List[Dict[str, Any]],
+    turns: int,
+    read_history: Callable[[], List[Dict[str, Any]]]
+) -> Optional[HistoryPager]:
+    """Split a serialized history into older messages and its last turns.
+
+    Removes the older messages from history in place.
+
+    Args:
+        session_id: The session ID.
+        history: Full serialized history; left holding the last turns.
+        turns: Number of recent turns to keep.
+        read_history: Reads the session's full serialized history again.
+
+    Returns:
+        Pager for the removed messages, or None if the history has no
+        more than turns turns.
+    """
+    starts = turn_starts(history)
+    if turns < 1 or len(starts) <= turns:
+        return None
+
+    offset = starts[-turns]
+    older_starts = starts[:-turns]
+    pager = HistoryPager(
+        session_id=session_id,
+        message_count=offset,
+        turn_starts=older_starts,
+        summary=summarize_older(history[:offset], older_starts),
+        last_message=history[offset - 1],
+        read_history=read_history,
+    )
+    del history[:offset]
+    return pager
@@ -9,22 +9,47 @@ from datetime import datetime
 from typing import Any, Dict, List, Optional
 
 from ..model_provider.types import (
+    Attachment,
     Message,
     Part,
     Role,
     FunctionCall,
+    LazyToolResult,
     ToolResult,
 )
-from .base import SessionState, SessionInfo
+from .base import ForkPoint, SessionState, SessionInfo
+from .binary import DeferredJSON
 
 
-def serialize_part(part: Part) -> Dict[str, Any]:
+# Role lookup by value (faster than calling the enum)
+_ROLES = {role.value: role for role in Role}
+
+
+def _encode_data(data: Optional[bytes], raw_bytes: bool) -> Any:
+    """Encode binary data as base64 text, or keep it as bytes."""
+    if not data:
+        return None
+    return data if raw_bytes else base64.b64encode(data).decode('utf-8')
+
+
+def _decode_data(data: Any) -> Optional[bytes]:
+    """Decode binary data stored as base64 text or as bytes."""
+    if not data:
+        return None
+    return data if isinstance(data, bytes) else base64.b64decode(data)
+
+
+def serialize_part(part: Part, raw_bytes: bool = False) -> Dict[str, Any]:
     """Serialize a Part object to a dictionary.
 
-    Handles text, function calls, function responses, and inline data.
+    Handles text, function calls, function responses (with attachments),
+    and inline data.
 
     Args:
         part: A Part object.
+        raw_bytes: Keep binary data as bytes instead of base64 text (for
+            binary snapshots, see binary.py). A LazyToolResult not decoded
+            yet is then kept encoded too.
 
     Returns:
         Dictionary representation of the part.
@@ -49,22 +74,32 @@ def serialize_part(part: Part) -> Dict[str, Any]:
     # Function response part
     if part.function_response is not None:
         fr = part.function_response
-        return {
+        result = fr.pending if raw_bytes and isinstance(fr, LazyToolResult) else None
+        data = {
             'type': 'function_response',
             'call_id': fr.call_id,
             'name': fr.name,
-            'result': fr.result,
+            'result': result if result is not None else fr.result,
             'is_error': fr.is_error
         }
+        if fr.attachments:
+            data['attachments'] = [
+                {
+                    'mime_type': a.mime_type,
+                    'data': _encode_data(a.data, raw_bytes),
+                    'display_name': a.display_name,
+                }
+                for a in fr.attachments
+            ]
+        return data
 
     # Inline data (images, etc.)
     if part.inline_data is not None:
         inline = part.inline_data
-        data_bytes = inline.get('data')
         return {
             'type': 'inline_data',
             'mime_type': inline.get('mime_type'),
-            'data': base64.b64encode(data_bytes).decode('utf-8') if data_bytes else None
+            'data': _encode_data(inline.get('data'), raw_bytes)
         }
 
     # Unknown part type - try to capture what we can
@@ -99,20 +134,37 @@ def deserialize_part(data: Dict[str, Any]) -> Part:
         ))
 
     if part_type == 'function_response':
+        attachments = None
+        if data.get('attachments'):
+            attachments = [
+                Attachment(
+                    mime_type=a['mime_type'],
+                    data=_decode_data(a.get('data')) or b'',
+                    display_name=a.get('display_name'),
+                )
+                for a in data['attachments']
+            ]
+        result = data.get('result')
+        if isinstance(result, DeferredJSON):
+            return Part(function_response=LazyToolResult(
+                call_id=data.get('call_id', ''),
+                name=data['name'],
+                load=result,
+                is_error=data.get('is_error', False),
+                attachments=attachments
+            ))
         return Part(function_response=ToolResult(
             call_id=data.get('call_id', ''),
             name=data['name'],
-            result=data.get('result'),
-            is_error=data.get('is_error', False)
+            result=result,
+            is_error=data.get('is_error', False),
+            attachments=attachments
         ))
 
     if part_type == 'inline_data':
-        raw_data = None
-        if data.get('data'):
-            raw_data = base64.b64decode(data['data'])
         return Part(inline_data={
             'mime_type': data.get('mime_type'),
-            'data': raw_data
+            'data': _decode_data(data.get('data'))
         })
 
     if part_type == 'unknown':
@@ -122,18 +174,19 @@ def deserialize_part(data: Dict[str, Any]) -> Part:
     raise ValueError(f"Unknown part type: {part_type}")
 
 
-def serialize_message(message: Message) -> Dict[str, Any]:
+def serialize_message(message: Message, raw_bytes: bool = False) -> Dict[str, Any]:
     """Serialize a Message object to a dictionary.
 
     Args:
         message: A Message object.
+        raw_bytes: Keep binary data as bytes (see serialize_part).
 
     Returns:
         Dictionary representation of the message.
     """
     return {
         'role': message.role.value,
-        'parts': [serialize_part(p) for p in (message.parts or [])]
+        'parts': [serialize_part(p, raw_bytes) for p in (message.parts or [])]
     }
 
 
@@ -147,19 +200,21 @@ def deserialize_message(data: Dict[str, Any]) -> Message:
         Reconstructed Message object.
     """
     parts = [deserialize_part(p) for p in data.get('parts', [])]
-    return Message(role=Role(data['role']), parts=parts)
+    role = data['role']
+    return Message(role=_ROLES.get(role) or Role(role), parts=parts)
 
 
-def serialize_history(history: List[Message]) -> List[Dict[str, Any]]:
+def serialize_history(history: List[Message], raw_bytes: bool = False) -> List[Dict[str, Any]]:
     """Serialize a conversation history to a list of dictionaries.
 
     Args:
         history: List of Message objects.
+        raw_bytes: Keep binary data as bytes (see serialize_part).
 
     Returns:
         List of dictionary representations.
     """
-    return [serialize_message(m) for m in (history or [])]
+    return [serialize_message(m, raw_bytes) for m in (history or [])]
 
 
 def deserialize_history(data: List[Dict[str, Any]]) -> List[Message]:
@@ -174,31 +229,55 @@ def deserialize_history(data: List[Dict[str, Any]]) -> List[Message]:
     return [deserialize_message(d) for d in (data or [])]
 
 
-def serialize_session_state(state: SessionState) -> Dict[str, Any]:
+def serialize_session_state(state: SessionState, raw_bytes: bool = False) -> Dict[str, Any]:
     """Serialize a SessionState to a JSON-compatible dictionary.
 
     Args:
         state: The SessionState to serialize.
+        raw_bytes: Keep binary data as bytes (see serialize_part); the
+            result is then only JSON-compatible with a bytes fallback.
 
     Returns:
         JSON-compatible dictionary.
     """
-    return {
+    data = serialize_session_fields(state)
+    data.update({
         'version': '2.0',  # Bumped for Message type support
         'session_id': state.session_id,
-        'description': state.description,
         'created_at': state.created_at.isoformat(),
-        'updated_at': state.updated_at.isoformat(),
-        'turn_count': state.turn_count,
         'turn_accounting': state.turn_accounting,
         'user_inputs': state.user_inputs,
+        'history': serialize_history(state.history, raw_bytes),
+    })
+    if state.fork is not None:
+        data['parent'] = serialize_fork_point(state.fork)
+    return data
+
+
+def serialize_session_fields(state: SessionState) -> Dict[str, Any]:
+    """Serialize the small, mutable fields of a SessionState.
+
+    These are the fields rewritten by every journal update (see journal.py);
+    the growing lists (history, turn accounting, user inputs) are journaled
+    as tails instead.
+
+    Args:
+        state: The SessionState to serialize.
+
+    Returns:
+        JSON-compatible dictionary of description, updated_at, turn_count,
+        metadata and connection.
+    """
+    return {
+        'description': state.description,
+        'updated_at': state.updated_at.isoformat(),
+        'turn_count': state.turn_count,
         'metadata': state.metadata,
         'connection': {
             'project': state.project,
             'location': state.location,
             'model': state.model,
         },
-        'history': serialize_history(state.history),
     }
 
 
@@ -234,6 +313,25 @@ def deserialize_session_state(data: Dict[str, Any]) -> SessionState:
         project=connection.get('project'),
         location=connection.get('location'),
         model=connection.get('model'),
+        fork=deserialize_fork_point(data['parent']) if data.get('parent') else None,
+    )
+
+
+def serialize_fork_point(fork: ForkPoint) -> Dict[str, Any]:
+    """Serialize a fork point (see fork.py)."""
+    return {
+        'session_id': fork.session_id,
+        'message_count': fork.message_count,
+        'digest': fork.digest,
+    }
+
+
+def deserialize_fork_point(data: Dict[str, Any]) -> ForkPoint:
+    """Deserialize a fork point."""
+    return ForkPoint(
+        session_id=data['session_id'],
+        message_count=data['message_count'],
+        digest=data['digest'],
     )
 
 
@@ -255,6 +353,7 @@ def serialize_session_info(state: SessionState) -> Dict[str, Any]:
         'updated_at': state.updated_at.isoformat(),
         'turn_count': state.turn_count,
         'model': state.model,
+        'parent': serialize_fork_point(state.fork) if state.fork else None,
     }
 
 
@@ -274,4 +373,5 @@ def deserialize_session_info(data: Dict[str, Any]) -> SessionInfo:
         updated_at=datetime.fromisoformat(data['updated_at']),
         turn_count=data.get('turn_count', 0),
         model=data.get('model'),
+        parent_id=(data.get('parent') or {}).get('session_id'),
     )
@@ -0,0 +1,313 @@
+"""Session snapshot encodings.
+
+Snapshots (the ``<session_id>.json`` files) come in three encodings:
+
+- plain: a JSON document, the original format and still the default
+  (compact; indented with JAATO_JSON_PRETTY, see json_codec)
+- compressed: a gzip or zstd stream of JSON lines - a header line with
+  every session field except the history, then one line per message
+- binary: length-prefixed records with large payloads stored as shared
+  blobs (see binary.py)
+
+The encoding is detected from the file's first bytes, so every snapshot
+stays readable whatever compression is configured, including files
+written before compression existed. Compressed snapshots are decoded as
+a stream, one message line at a time, so loading never holds the whole
+file (compressed or decompressed) in memory.
+
+zstd needs the optional ``zstandard`` package. With zstd, a dictionary
+trained on session messages can be shared by all sessions in a storage
+directory (see DictionaryStore); each zstd frame records the ID of the
+dictionary it was compressed with.
+"""
+
+import gzip
+import zlib
+from pathlib import Path
+from typing import Any, Dict, Iterator, List, Optional, Tuple
+
+try:
+    import zstandard
+    HAS_ZSTD = True
+except ImportError:
+    HAS_ZSTD = False
+
+from ... import json_codec
+from . import binary
+from .journal import atomic_write
+
+
+# Supported values of the 'compression' option ('auto' = zstd if
+# available, otherwise gzip)
+COMPRESSION_MODES = ("none", "gzip", "zstd", "auto")
+
+# Supported values of the 'snapshot_format' option
+SNAPSHOT_FORMATS = ("json", "binary")
+
+# Header line marker of compressed snapshots
+STREAM_FORMAT = "jaato-session-lines"
+
+# Subdirectory of the storage directory holding zstd dictionaries
+DICTIONARY_DIR = ".dictionaries"
+
+# Size of trained zstd dictionaries in bytes
+DICTIONARY_SIZE = 64 * 1024
+
+# Minimum number of messages needed to train a dictionary
+DICTIONARY_MIN_SAMPLES = 100
+
+# Most recent messages used for training (bounds training time)
+DICTIONARY_MAX_SAMPLES = 2000
+
+GZIP_MAGIC = b"\x1f\x8b"
+ZSTD_MAGIC = b"\x28\xb5\x2f\xfd"
+
+_GZIP_LEVEL = 6
+_ZSTD_LEVEL = 3
+_READ_CHUNK = 1024 * 1024
+
+
+def resolve_compression(mode: Optional[str]) -> str:
+    """Resolve a 'compression' option value to the codec to write with.
+
+    Args:
+        mode: One of COMPRESSION_MODES, or None for 'none'.
+
+    Returns:
+        'none', 'gzip' or 'zstd'.
+
+    Raises:
+        ValueError: If the mode is unknown, or 'zstd' without zstandard.
+    """
+    mode = mode or "none"
+    if mode not in COMPRESSION_MODES:
+        raise ValueError(
+            f"Unknown compression: {mode}. Available: {', '.join(COMPRESSION_MODES)}"
+        )
+    if mode == "auto":
+        return "zstd" if HAS_ZSTD else "gzip"
+    if mode == "zstd" and not HAS_ZSTD:
+        raise ValueError("zstd compression requires the zstandard package (pip install zstandard)")
+    return mode
+
+
+def detect_encoding(path: Path) -> str:
+    """Detect a snapshot's encoding from its first bytes.
+
+    Returns:
+        'gzip', 'zstd', 'binary' or 'none' (plain JSON).
+    """
+    with open(path, 'rb') as f:
+        magic = f.read(len(binary.MAGIC))
+    if magic.startswith(GZIP_MAGIC):
+        return "gzip"
+    if magic.startswith(ZSTD_MAGIC):
+        return "zstd"
+    if magic == binary.MAGIC:
+        return "binary"
+    return "none"
+
+
+class DictionaryStore:
+    """zstd dictionaries shared by the sessions of a storage directory.
+
+    Dictionaries are stored as ``.dictionaries/<dict_id>.zdict`` and are
+    never removed: snapshots compressed with a dictionary cannot be read
+    without it.
+    """
+
+    def __init__(self, storage_path: Path):
+        """Initialize the store.
+
+        Args:
+            storage_path: Session storage directory.
+        """
+        self._path = storage_path / DICTIONARY_DIR
+        self._cache: Dict[int, Any] = {}
+        self._current: Optional[Any] = None
+
+    def get(self, dict_id: int) -> Optional[Any]:
+        """Get a dictionary by ID, or None if it is not stored."""
+        if dict_id not in self._cache:
+            try:
+                data = (self._path / f"{dict_id}.zdict").read_bytes()
+            except FileNotFoundError:
+                return None
+            self._cache[dict_id] = zstandard.ZstdCompressionDict(data)
+        return self._cache[dict_id]
+
+    def current(self) -> Optional[Any]:
+        """Get the dictionary new snapshots are compressed with, if any."""
+        if self._current is None:
+            files = sorted(self._path.glob("*.zdict"), key=lambda p: p.stat().st_mtime_ns)
+            if files:
+                self._current = self.get(int(files[-1].stem))
+        return self._current
+
+    def train(self, samples: List[bytes]) -> Optional[Any]:
+        """Train a dictionary from sample message lines and make it current.
+
+        Args:
+            samples: Encoded message lines.
+
+        Returns:
+            The new dictionary, or None if there are too few samples or
+            training failed (compression then proceeds without one).
+        """
+        if len(samples) < DICTIONARY_MIN_SAMPLES:
+            return None
+        try:
+            dictionary = zstandard.train_dictionary(
+                DICTIONARY_SIZE, samples[-DICTIONARY_MAX_SAMPLES:]
+            )
+        except zstandard.ZstdError:
+            return None
+
+        self._path.mkdir(parents=True, exist_ok=True)
+        atomic_write(self._path / f"{dictionary.dict_id()}.zdict", dictionary.as_bytes())
+        self._cache[dictionary.dict_id()] = dictionary
+        self._current = dictionary
+        return dictionary
+
+
+def _encode_lines(data: Dict[str, Any]) -> Iterator[bytes]:
+    """Encode serialized session data as JSON lines, header first."""
+    header = {k: v for k, v in data.items() if k != 'history'}
+    header['format'] = STREAM_FORMAT
+    yield json_codec.dumps(header) + b"\n"
+    for message in data.get('history', []):
+        yield json_codec.dumps(message, default=binary.json_default) + b"\n"
+
+
+def encode_snapshot(
+    data: Dict[str, Any],
+    compression: str,
+    dictionaries: Optional[DictionaryStore] = None
+) -> Tuple[bytes, int]:
+    """Encode serialized session data for writing.
+
+    Args:
+        data: Snapshot dict as produced by serialize_session_state
+            (inline data read from a binary snapshot may be bytes).
+        compression: 'none', 'gzip' or 'zstd' (see resolve_compression).
+        dictionaries: With zstd, compress with the current shared
+            dictionary, training one first if there is none yet.
+
+    Returns:
+        Tuple of (encoded bytes, uncompressed size).
+    """
+    if compression == "none":
+        encoded = json_codec.dumps_document(data, default=binary.json_default)
+        return encoded, len(encoded)
+
+    lines = list(_encode_lines(data))
+
+    if compression == "gzip":
+        compressor = zlib.compressobj(_GZIP_LEVEL, zlib.DEFLATED, 16 + zlib.MAX_WBITS)
+    else:
+        dictionary = None
+        if dictionaries is not None:
+            dictionary = dictionaries.current()
+            if dictionary is None:
+                dictionary = dictionaries.train(lines[1:])
+        compressor = zstandard.ZstdCompressor(
+            level=_ZSTD_LEVEL, dict_data=dictionary
+        ).compressobj()
+
+    chunks = [compressor.compress(line) for line in lines]
+    chunks.append(compressor.flush())
+    return b"".join(chunks), sum(len(line) for line in lines)
+
+
+def _iter_lines(reader: Any) -> Iterator[bytes]:
+    """Split a binary stream into lines, reading it in chunks."""
+    pending = b""
+    while True:
+        chunk = reader.read(_READ_CHUNK)
+        if not chunk:
+            break
+        lines = (pending + chunk).split(b"\n")
+        pending = lines.pop()
+        yield from lines
+    if pending:
+        yield pending
+
+
+def _read_lines(lines: Iterator[bytes]) -> Tuple[Dict[str, Any], int]:
+    """Rebuild serialized session data from decoded JSON lines."""
+    raw_bytes = 0
+    data: Optional[Dict[str, Any]] = None
+    history: List[Dict[str, Any]] = []
+
+    for line in lines:
+        raw_bytes += len(line) + 1
+        if not line.strip():
+            continue
+        if data is None:
+            data = json_codec.loads(line)
+            if data.pop('format', None) != STREAM_FORMAT:
+                raise ValueError("Not a compressed session snapshot")
+        else:
+            history.append(json_codec.loads(line))
+
+    if data is None:
+        raise ValueError("Empty session snapshot")
+    data['history'] = history
+    return data, raw_bytes
+
+
+def read_snapshot(
+    path: Path,
+    dictionaries: Optional[DictionaryStore] = None,
+    blobs: Optional[binary.BlobStore] = None
+) -> Tuple[Dict[str, Any], int]:
+    """Read a snapshot in any encoding.
+
+    Args:
+        path: Snapshot file path.
+        dictionaries: Store to look up zstd dictionaries in.
+        blobs: Store to read the blobs of binary snapshots from.
+
+    Returns:
+        Tuple of (serialized session data, uncompressed size).
+
+    Raises:
+        json.JSONDecodeError: If the JSON is corrupted.
+        ValueError: If a compressed or binary snapshot is corrupted or
+            cannot be decoded (e.g. zstd without zstandard installed).
+    """
+    encoding = detect_encoding(path)
+
+    if encoding == "binary":
+        return binary.read_snapshot(path, blobs)
+
+    if encoding == "none":
+        raw = path.read_bytes()
+        return json_codec.loads(raw), len(raw)
+
+    with open(path, 'rb') as f:
+        if encoding == "gzip":
+            try:
+                with gzip.GzipFile(fileobj=f) as reader:
+                    return _read_lines(_iter_lines(reader))
+            except (OSError, EOFError, zlib.error) as e:
+                raise ValueError(f"Corrupted session snapshot {path}: {e}") from e
+
+        if not HAS_ZSTD:
+            raise ValueError(
+                f"Session {path.stem} is zstd-compressed; install the zstandard package to read it"
+            )
+
+        dictionary = None
+        dict_id = zstandard.get_frame_parameters(f.read(18)).dict_id
+        f.seek(0)
+        if dict_id:
+            dictionary = dictionaries.get(dict_id) if dictionaries is not None else None
+            if dictionary is None:
+                raise ValueError(f"Missing zstd dictionary {dict_id} for session {path.stem}")
+
+        try:
+            with zstandard.ZstdDecompressor(dict_data=dictionary).stream_reader(f) as reader:
+                return _read_lines(_iter_lines(reader))
+        except zstandard.ZstdError as e:
+            raise ValueError(f"Corrupted session snapshot {path}: {e}") from e
@@ -0,0 +1,236 @@
+"""Tests for binary session snapshots."""
+
+import json
+import os
+import pytest
+import tempfile
+from datetime import datetime
+from pathlib import Path
+
+from .. import binary, snapshot
+from ..base import SessionState
+from ..file_session import FileSessionPlugin
+from ..serializer import deserialize_history, serialize_history, serialize_session_state
+from ...model_provider.types import (
+    Attachment, FunctionCall, LazyToolResult, Message, Part, Role, ToolResult
+)
+
+
+def make_history(payload: bytes = b"\x89PNG" * 10) -> list:
+    """History with every part type, including binary data."""
+    return [
+        Message(role=Role.USER, parts=[
+            Part(text="describe this"),
+            Part(inline_data={"mime_type": "image/png", "data": payload}),
+        ]),
+        Message(role=Role.MODEL, parts=[
+            Part(function_call=FunctionCall(id="c1", name="read", args={"path": "a.py", "n": [1, 2]}))
+        ]),
+        Message(role=Role.USER, parts=[
+            Part(function_response=ToolResult(
+                call_id="c1",
+                name="read",
+                result={"content": "line\n" * 100, "unicode": "héllo ☃"},
+                is_error=True,
+                attachments=[Attachment(mime_type="image/png", data=payload, display_name="p.png")],
+            ))
+        ]),
+        Message(role=Role.MODEL, parts=[Part(text="long answer " * 100)]),
+        Message(role=Role.TOOL, parts=[]),
+    ]
+
+
+def make_state(session_id: str, history=None) -> SessionState:
+    return SessionState(
+        session_id=session_id,
+        history=make_history() if history is None else history,
+        created_at=datetime(2025, 1, 1),
+        updated_at=datetime(2025, 1, 1, 0, 1),
+        turn_count=2,
+    )
+
+
+class TestBinaryEncoding:
+    """Tests for encode_snapshot/read_snapshot."""
+
+    @pytest.fixture
+    def temp_dir(self):
+        with tempfile.TemporaryDirectory() as tmpdir:
+            yield Path(tmpdir)
+
+    def write(self, temp_dir, data, threshold=binary.DEFAULT_BLOB_THRESHOLD, name="s1"):
+        blobs = binary.BlobStore(temp_dir)
+        encoded, size = binary.encode_snapshot(data, blobs, threshold)
+        path = temp_dir / f"{name}.json"
+        path.write_bytes(encoded)
+        return path, blobs, size
+
+    def test_round_trip(self, temp_dir):
+        history = make_history()
+        data = serialize_session_state(make_state("s1", history), raw_bytes=True)
+        path, blobs, size = self.write(temp_dir, data)
+
+        decoded, read_size = binary.read_snapshot(path, blobs)
+
+        assert snapshot.detect_encoding(path) == "binary"
+        assert deserialize_history(decoded.pop("history")) == history
+        assert decoded == {k: v for k, v in data.items() if k != "history"}
+        assert read_size == size == path.stat().st_size
+
+    def test_base64_input(self, temp_dir):
+        history = make_history()
+        path, blobs, _ = self.write(temp_dir, {"history": serialize_history(history)})
+
+        decoded, _ = binary.read_snapshot(path, blobs)
+
+        assert deserialize_history(decoded["history"]) == history
+
+    def test_binary_data_is_stored_raw(self, temp_dir):
+        payload = os.urandom(3000)
+        data = {"history": serialize_history(make_history(payload), raw_bytes=True)}
+        path, _, _ = self.write(temp_dir, data)
+
+        raw = path.read_bytes()
+        assert payload in raw
+        assert len(raw) < len(json.dumps(serialize_history(make_history(payload))))
+
+    def test_large_values_become_shared_blobs(self, temp_dir):
+        payload = os.urandom(2000)
+        data = {"history": serialize_history(make_history(payload), raw_bytes=True)}
+        path, blobs, size = self.write(temp_dir, data, threshold=500)
+        self.write(temp_dir, data, threshold=500, name="s2")
+
+        files = list((temp_dir / binary.BLOB_DIR).glob("*/*"))
+        # Image (shared by the part and the attachment), tool result, long answer
+        assert len(files) == 3
+        assert payload not in path.read_bytes()
+        assert binary.read_blob_refs(path) == binary.read_blob_refs(temp_dir / "s2.json")
+
+        decoded, read_size = binary.read_snapshot(path, blobs)
+        assert deserialize_history(decoded["history"]) == make_history(payload)
+        assert read_size == size
+
+    def test_missing_blob_raises(self, temp_dir):
+        data = {"history": serialize_history(make_history(os.urandom(2000)), raw_bytes=True)}
+        path, blobs, _ = self.write(temp_dir, data, threshold=1000)
+        next((temp_dir / binary.BLOB_DIR).glob("*/*")).unlink()
+
+        with pytest.raises(ValueError):
+            binary.read_snapshot(path, blobs)
+
+    def test_large_results_are_decoded_lazily(self, temp_dir):
+        result = {"content": "x" * binary.LAZY_JSON_MIN}
+        history = [Message(role=Role.USER, parts=[
+            Part(function_response=ToolResult(call_id="c1", name="read", result=result))
+        ])]
+        path, blobs, _ = self.write(temp_dir, {"history": serialize_history(history, raw_bytes=True)})
+
+        loaded = deserialize_history(binary.read_snapshot(path, blobs)[0]["history"])
+        response = loaded[0].parts[0].function_response
+
+        assert isinstance(response, LazyToolResult)
+        assert response.pending is not None
+        # Written back without decoding
+        again = serialize_history(loaded, raw_bytes=True)
+        assert isinstance(again[0]["parts"][0]["result"], binary.DeferredJSON)
+        assert response.pending is not None
+        assert self.write(temp_dir, {"history": again}, name="s2")[0].read_bytes() == path.read_bytes()
+
+        assert loaded == history
+        assert response.result == result
+        assert response.pending is None
+
+    def test_truncated_snapshot_raises(self, temp_dir):
+        data = {"history": serialize_history(make_history(), raw_bytes=True)}
+        path, blobs, _ = self.write(temp_dir, data)
+        path.write_bytes(path.read_bytes()[:-10])
+
+        with pytest.raises(ValueError):
+            binary.read_snapshot(path, blobs)
+
+    def test_prune_keeps_referenced_and_recent_blobs(self, temp_dir):
+        blobs = binary.BlobStore(temp_dir)
+        keep = blobs.put(b"keep")
+        drop = blobs.put(b"drop")
+
+        assert blobs.prune({keep}) == 0
+        assert blobs.prune({keep}, min_age=0) == 1
+        assert blobs.get(keep) == b"keep"
+        with pytest.raises(ValueError):
+            blobs.get(drop)
+
+    def test_put_rewrites_blob_pruned_elsewhere(self, temp_dir):
+        blobs = binary.BlobStore(temp_dir)
+        digest = blobs.put(b"shared")
+        # Another process pruned it meanwhile
+        binary.BlobStore(temp_dir).prune(set(), min_age=0)
+
+        assert blobs.put(b"shared") == digest
+        assert blobs.get(digest) == b"shared"
+
+
+class TestBinarySessions:
+    """Tests for FileSessionPlugin with snapshot_format 'binary'."""
+
+    @pytest.fixture
+    def temp_dir(self):
+        with tempfile.TemporaryDirectory() as tmpdir:
+            yield tmpdir
+
+    def make_plugin(self, temp_dir, **config):
+        plugin = FileSessionPlugin()
+        plugin.initialize({"storage_path": temp_dir, "background_writes": False, **config})
+        return plugin
+
+    def test_save_and_load(self, temp_dir):
+        state = make_state("s1")
+        self.make_plugin(temp_dir, snapshot_format="binary").save(state)
+
+        loaded = self.make_plugin(temp_dir).load("s1")
+
+        assert snapshot.detect_encoding(Path(temp_dir) / "s1.json") == "binary"
+        assert loaded.history == state.history
+        assert [s.session_id for s in self.make_plugin(temp_dir).list_sessions()] == ["s1"]
+
+    def test_journal_applies_to_binary_snapshot(self, temp_dir):
+        plugin = self.make_plugin(temp_dir, snapshot_format="binary")
+        state = make_state("s1")
+        plugin.save(state)
+        state.history.append(Message(role=Role.USER, parts=[
+            Part(inline_data={"mime_type": "image/png", "data": b"more"})
+        ]))
+        plugin.save(state)
+
+        assert self.make_plugin(temp_dir).load("s1").history == state.history
+
+    def test_json_plugin_rewrites_binary_snapshot(self, temp_dir):
+        self.make_plugin(temp_dir, snapshot_format="binary", journal=False).save(make_state("s1"))
+
+        plugin = self.make_plugin(temp_dir, journal=False)
+        plugin.set_description("s1", "Renamed")
+
+        assert snapshot.detect_encoding(Path(temp_dir) / "s1.json") == "none"
+        loaded = plugin.load("s1")
+        assert loaded.description == "Renamed"
+        assert loaded.history == make_history()
+
+    def test_delete_prunes_unreferenced_blobs(self, temp_dir):
+        plugin = self.make_plugin(temp_dir, snapshot_format="binary", blob_threshold=100)
+        plugin.save(make_state("s1"))
+        plugin.save(make_state("s2", make_history(b"other" * 100)))
+        blob_dir = Path(temp_dir) / binary.BLOB_DIR
+        before = {p.name for p in blob_dir.glob("*/*")}
+
+        plugin.delete("s2")
+        plugin.prune_blobs(min_age=0)
+
+        remaining = {p.name for p in blob_dir.glob("*/*")}
+        assert remaining == set(binary.read_blob_refs(Path(temp_dir) / "s1.json"))
+        assert remaining < before
+        assert plugin.load("s1").history == make_history()
+
+    def test_invalid_options(self, temp_dir):
+        with pytest.raises(ValueError):
+            self.make_plugin(temp_dir, snapshot_format="xml")
+        with pytest.raises(ValueError):
+            self.make_plugin(temp_dir, snapshot_format="binary", compression="gzip")
@@ -0,0 +1,138 @@
+"""Tests for the session catalog index."""
+
+import json
+import pytest
+import tempfile
+from datetime import datetime
+from pathlib import Path
+from unittest.mock import patch
+
+from ..catalog import CATALOG_FILE, SessionCatalog
+from ..base import SessionState
+from ..file_session import FileSessionPlugin
+from ...model_provider.types import Message, Part, Role
+
+
+def make_state(session_id: str, turns: int = 1, **kwargs) -> SessionState:
+    """Create a session state with one user+model pair per turn."""
+    history = []
+    for i in range(turns):
+        history.append(Message(role=Role.USER, parts=[Part(text=f"question {i}")]))
+        history.append(Message(role=Role.MODEL, parts=[Part(text=f"answer {i}")]))
+    return SessionState(
+        session_id=session_id,
+        history=history,
+        created_at=datetime(2025, 1, 1),
+        updated_at=datetime(2025, 1, 1, 0, turns),
+        turn_count=turns,
+        **kwargs
+    )
+
+
+class TestSessionCatalog:
+    """Tests for catalog-backed session listing."""
+
+    @pytest.fixture
+    def temp_dir(self):
+        with tempfile.TemporaryDirectory() as tmpdir:
+            yield tmpdir
+
+    @pytest.fixture
+    def plugin(self, temp_dir):
+        plugin = FileSessionPlugin()
+        plugin.initialize({"storage_path": temp_dir})
+        return plugin
+
+    def test_save_updates_catalog(self, plugin, temp_dir):
+        plugin.save(make_state("s1", 2, description="First", model="gemini-2.5-flash"))
+
+        with open(Path(temp_dir) / CATALOG_FILE) as f:
+            entry = json.load(f)["sessions"]["s1"]
+
+        assert entry["description"] == "First"
+        assert entry["turn_count"] == 2
+        assert entry["model"] == "gemini-2.5-flash"
+
+    def test_list_does_not_read_sessions(self, plugin):
+        for i in range(3):
+            plugin.save(make_state(f"s{i}", i + 1))
+
+        with patch.object(plugin, "_read_session_data", side_effect=AssertionError("read")):
+            sessions = plugin.list_sessions()
+            latest = plugin.get_latest()
+
+        assert len(sessions) == 3
+        assert latest.session_id == "s2"
+
+    def test_set_description_updates_catalog(self, plugin):
+        plugin.save(make_state("s1"))
+        plugin.set_description("s1", "Described")
+
+        with patch.object(plugin, "_read_session_data", side_effect=AssertionError("read")):
+            assert plugin.list_sessions()[0].description == "Described"
+
+    def test_delete_removes_entry(self, plugin, temp_dir):
+        plugin.save(make_state("s1"))
+        plugin.save(make_state("s2"))
+        plugin.delete("s1")
+
+        with open(Path(temp_dir) / CATALOG_FILE) as f:
+            assert list(json.load(f)["sessions"]) == ["s2"]
+
+    def test_rebuild_when_missing(self, plugin, temp_dir):
+        plugin.save(make_state("s1", 3, model="m"))
+        (Path(temp_dir) / CATALOG_FILE).unlink()
+
+        sessions = plugin.list_sessions()
+
+        assert [s.session_id for s in sessions] == ["s1"]
+        assert sessions[0].turn_count == 3
+        assert sessions[0].model == "m"
+        assert (Path(temp_dir) / CATALOG_FILE).exists()
+
+    def test_rebuild_when_corrupted(self, plugin, temp_dir):
+        plugin.save(make_state("s1"))
+        (Path(temp_dir) / CATALOG_FILE).write_text("{not json")
+
+        assert [s.session_id for s in plugin.list_sessions()] == ["s1"]
+
+    def test_corrupted_session_file_skipped(self, plugin, temp_dir, capsys):
+        plugin.save(make_state("s1"))
+        (Path(temp_dir) / "broken.json").write_text("{not json")
+
+        assert [s.session_id for s in plugin.list_sessions()] == ["s1"]
+        assert "skipping corrupted session file" in capsys.readouterr().out
+        assert plugin.get_latest().session_id == "s1"
+
+    def test_stale_entry_refreshed(self, plugin, temp_dir):
+        plugin.save(make_state("s1", 1))
+
+        # Another process writes the session without updating our catalog
+        other = FileSessionPlugin()
+        other.initialize({"storage_path": temp_dir})
+        catalog_before = (Path(temp_dir) / CATALOG_FILE).read_bytes()
+        other.save(make_state("s1", 5))
+        (Path(temp_dir) / CATALOG_FILE).write_bytes(catalog_before)
+
+        assert plugin.list_sessions()[0].turn_count == 5
+
+    def test_session_file_deleted_externally(self, plugin, temp_dir):
+        plugin.save(make_state("s1"))
+        plugin.save(make_state("s2"))
+        (Path(temp_dir) / "s1.json").unlink()
+
+        assert [s.session_id for s in plugin.list_sessions()] == ["s2"]
+
+    def test_catalog_file_not_listed_as_session(self, plugin):
+        plugin.save(make_state("s1"))
+        plugin.list_sessions()
+        assert len(plugin.list_sessions()) == 1
+
+    def test_get_returns_none_when_stale(self, plugin, temp_dir):
+        plugin.save(make_state("s1"))
+        catalog = SessionCatalog(Path(temp_dir))
+        assert catalog.get("s1") is not None
+
+        with open(Path(temp_dir) / "s1.journal", 'ab') as f:
+            f.write(b"x")
+        assert catalog.get("s1") is None
@@ -313,6 +313,7 @@ class TestFileSessionPluginWithClient:
         """Test backtoturn without turn ID shows info."""
         plugin, mock_client = plugin_with_client
         mock_client.get_turn_boundaries.return_value = [0, 5, 10]  # 3 turns
+        mock_client.get_paged_turn_count.return_value = 0
 
         result = plugin._execute_backtoturn({})
 
@@ -320,6 +321,16 @@ class TestFileSessionPluginWithClient:
         assert "3 turn(s)" in result["message"]
         assert "Usage" in result["message"]
 
+    def test_execute_backtoturn_no_turn_id_paged(self, plugin_with_client):
+        """Test backtoturn info counts turns left on disk by a paged resume."""
+        plugin, mock_client = plugin_with_client
+        mock_client.get_turn_boundaries.return_value = [0, 5, 10]
+        mock_client.get_paged_turn_count.return_value = 40
+
+        result = plugin._execute_backtoturn({})
+
+        assert "43 turn(s)" in result["message"]
+
     def test_execute_backtoturn_invalid_turn_id(self, plugin_with_client):
         """Test backtoturn with non-numeric turn ID."""
         plugin, _ = plugin_with_client
@@ -0,0 +1,197 @@
+"""Tests for session forks stored as deltas."""
+
+import json
+import pytest
+import tempfile
+from dataclasses import replace
+from datetime import datetime
+from pathlib import Path
+
+from ..base import SessionState
+from ..file_session import FileSessionPlugin
+from ..fork import has_prefix, make_fork_point
+from ..serializer import serialize_history
+from ...model_provider.types import Message, Part, Role
+
+
+def make_history(turns: int, prefix: str = "") -> list:
+    history = []
+    for i in range(turns):
+        history.append(Message(role=Role.USER, parts=[Part(text=f"{prefix}question {i}")]))
+        history.append(Message(role=Role.MODEL, parts=[Part(text=f"{prefix}answer {i}")]))
+    return history
+
+
+def make_state(session_id: str, history: list, **kwargs) -> SessionState:
+    return SessionState(
+        session_id=session_id,
+        history=history,
+        created_at=datetime(2025, 1, 1),
+        updated_at=datetime(2025, 1, 1),
+        turn_count=len(history) // 2,
+        **kwargs
+    )
+
+
+def make_fork(parent: SessionState, session_id: str, turns: int = 1) -> SessionState:
+    """Branch parent's history and add turns to the branch."""
+    fork = make_fork_point(parent.session_id, parent.history)
+    return make_state(
+        session_id, parent.history + make_history(turns, prefix=session_id), fork=fork
+    )
+
+
+class TestForkPoint:
+    """Tests for fork points and prefix checks."""
+
+    def test_has_prefix(self):
+        history = make_history(3)
+        fork = make_fork_point("p", history[:4])
+
+        assert fork.message_count == 4
+        assert has_prefix(serialize_history(history), fork)
+        assert has_prefix(serialize_history(history[:4]), fork)
+        assert not has_prefix(serialize_history(history[:3]), fork)
+        assert not has_prefix(serialize_history(make_history(3, "x")), fork)
+
+    def test_has_prefix_checks_middle_messages(self):
+        history = make_history(3)
+        fork = make_fork_point("p", history[:5])
+        changed = make_history(3)
+        changed[2] = make_history(3, "x")[2]
+
+        assert not has_prefix(serialize_history(changed), fork)
+
+    def test_digest_ignores_binary_encoding(self):
+        history = [Message(role=Role.USER, parts=[
+            Part(inline_data={"mime_type": "image/png", "data": b"\x89PNG"})
+        ])]
+        fork = make_fork_point("p", history)
+
+        assert has_prefix(serialize_history(history), fork)
+        assert has_prefix(serialize_history(history, raw_bytes=True), fork)
+
+
+class TestForkedSessions:
+    """Tests for FileSessionPlugin storing forks as deltas."""
+
+    @pytest.fixture
+    def temp_dir(self):
+        with tempfile.TemporaryDirectory() as tmpdir:
+            yield tmpdir
+
+    def make_plugin(self, temp_dir, **config):
+        plugin = FileSessionPlugin()
+        plugin.initialize({"storage_path": temp_dir, "background_writes": False, **config})
+        return plugin
+
+    def read_file(self, temp_dir, session_id):
+        return json.loads((Path(temp_dir) / f"{session_id}.json").read_text())
+
+    def test_fork_is_stored_as_delta(self, temp_dir):
+        plugin = self.make_plugin(temp_dir)
+        parent = make_state("p", make_history(5))
+        plugin.save(parent)
+        branch = make_fork(parent, "b")
+        plugin.save(branch)
+
+        data = self.read_file(temp_dir, "b")
+        assert len(data["history"]) == 2
+        assert data["parent"]["session_id"] == "p"
+
+        loaded = self.make_plugin(temp_dir).load("b")
+        assert loaded.history == branch.history
+        assert loaded.fork == branch.fork
+
+    def test_fork_appends_to_journal(self, temp_dir):
+        plugin = self.make_plugin(temp_dir)
+        parent = make_state("p", make_history(3))
+        plugin.save(parent)
+        branch = make_fork(parent, "b")
+        plugin.save(branch)
+        branch.history.extend(make_history(1, prefix="more "))
+        plugin.save(branch)
+
+        assert len(self.read_file(temp_dir, "b")["history"]) == 2
+        assert self.make_plugin(temp_dir).load("b").history == branch.history
+
+    def test_parent_growth_keeps_delta(self, temp_dir):
+        plugin = self.make_plugin(temp_dir, journal=False)
+        parent = make_state("p", make_history(3))
+        plugin.save(parent)
+        branch = make_fork(parent, "b")
+        plugin.save(branch)
+
+        parent.history = parent.history + make_history(2, prefix="parent ")
+        plugin.save(parent)
+
+        assert "parent" in self.read_file(temp_dir, "b")
+        assert self.make_plugin(temp_dir).load("b").history == branch.history
+
+    def test_parent_rewrite_detaches_fork(self, temp_dir):
+        plugin = self.make_plugin(temp_dir)
+        parent = make_state("p", make_history(5))
+        plugin.save(parent)
+        branch = make_fork(parent, "b")
+        plugin.save(branch)
+
+        # Revert the parent to before the fork point
+        plugin.save(replace(parent, history=parent.history[:4]))
+
+        data = self.read_file(temp_dir, "b")
+        assert "parent" not in data
+        assert len(data["history"]) == 12
+        reader = self.make_plugin(temp_dir)
+        assert reader.load("b").history == branch.history
+        assert {s.session_id: s.parent_id for s in reader.list_sessions()} == {"p": None, "b": None}
+
+    def test_delete_parent_detaches_forks(self, temp_dir):
+        plugin = self.make_plugin(temp_dir)
+        parent = make_state("p", make_history(3))
+        plugin.save(parent)
+        branch = make_fork(parent, "b")
+        plugin.save(branch)
+        nested = make_fork(branch, "n")
+        plugin.save(nested)
+
+        plugin.delete("p")
+
+        assert "parent" not in self.read_file(temp_dir, "b")
+        assert self.read_file(temp_dir, "n")["parent"]["session_id"] == "b"
+        reader = self.make_plugin(temp_dir)
+        assert reader.load("b").history == branch.history
+        assert reader.load("n").history == nested.history
+
+    def test_fork_of_changed_parent_is_stored_in_full(self, temp_dir):
+        plugin = self.make_plugin(temp_dir)
+        parent = make_state("p", make_history(3))
+        plugin.save(parent)
+        branch = make_fork(parent, "b")
+        plugin.save(make_state("p", make_history(3, prefix="other ")))
+
+        plugin.save(branch)
+
+        assert branch.fork is None
+        assert len(self.read_file(temp_dir, "b")["history"]) == 8
+
+    def test_list_sessions_shows_parent(self, temp_dir):
+        plugin = self.make_plugin(temp_dir)
+        parent = make_state("p", make_history(3))
+        plugin.save(parent)
+        plugin.save(make_fork(parent, "b"))
+
+        sessions = {s.session_id: s for s in self.make_plugin(temp_dir).list_sessions()}
+
+        assert sessions["b"].parent_id == "p"
+        assert sessions["p"].parent_id is None
+
+    def test_missing_parent_raises_value_error(self, temp_dir):
+        plugin = self.make_plugin(temp_dir)
+        parent = make_state("p", make_history(3))
+        plugin.save(parent)
+        plugin.save(make_fork(parent, "b"))
+
+        (Path(temp_dir) / "p.json").unlink()
+
+        with pytest.raises(ValueError):
+            self.make_plugin(temp_dir).load("b")
@@ -0,0 +1,287 @@
+"""Tests for the append-only session journal."""
+
+import json
+import pytest
+import tempfile
+from datetime import datetime
+from pathlib import Path
+
+from .. import journal
+from ..base import SessionState
+from ..file_session import FileSessionPlugin
+from ...model_provider.types import Message, Part, Role
+
+
+def make_state(session_id: str, turns: int, **kwargs) -> SessionState:
+    """Create a session state with one user+model pair per turn."""
+    history = []
+    for i in range(turns):
+        history.append(Message(role=Role.USER, parts=[Part(text=f"question {i}")]))
+        history.append(Message(role=Role.MODEL, parts=[Part(text=f"answer {i}")]))
+    return SessionState(
+        session_id=session_id,
+        history=history,
+        created_at=datetime(2025, 1, 1),
+        updated_at=datetime(2025, 1, 1, 0, turns),
+        turn_count=turns,
+        turn_accounting=[{"prompt": i, "output": i, "total": 2 * i} for i in range(turns)],
+        user_inputs=[f"question {i}" for i in range(turns)],
+        **kwargs
+    )
+
+
+def add_turn(state: SessionState) -> None:
+    """Append one turn to a session state."""
+    i = state.turn_count
+    state.history.append(Message(role=Role.USER, parts=[Part(text=f"question {i}")]))
+    state.history.append(Message(role=Role.MODEL, parts=[Part(text=f"answer {i}")]))
+    state.turn_count += 1
+    state.turn_accounting.append({"prompt": i, "output": i, "total": 2 * i})
+    state.user_inputs.append(f"question {i}")
+
+
+class TestJournalFormat:
+    """Tests for journal framing and replay."""
+
+    @pytest.fixture
+    def path(self):
+        with tempfile.TemporaryDirectory() as tmpdir:
+            yield Path(tmpdir) / "s.journal"
+
+    def test_write_and_read(self, path):
+        journal.write_journal(path, "e1")
+        journal.append_records(path, [{"op": "update", "state": {"turn_count": 1}}])
+
+        records, valid_bytes, torn = journal.read_records(path)
+
+        assert records[0] == {"op": "header", "epoch": "e1"}
+        assert records[1]["state"] == {"turn_count": 1}
+        assert valid_bytes == path.stat().st_size
+        assert not torn
+        assert journal.read_epoch(path) == "e1"
+
+    def test_missing_file(self, path):
+        assert journal.read_records(path) == ([], 0, False)
+        assert journal.read_epoch(path) is None
+
+    def test_torn_final_record_dropped(self, path):
+        journal.write_journal(path, "e1")
+        journal.append_records(path, [{"op": "update", "state": {"turn_count": 1}}])
+        good_size = path.stat().st_size
+        journal.append_records(path, [{"op": "update", "state": {"turn_count": 2}}])
+
+        # Simulate a crash mid-write
+        with open(path, 'r+b') as f:
+            f.truncate(path.stat().st_size - 3)
+
+        records, valid_bytes, torn = journal.read_records(path)
+        assert len(records) == 2
+        assert valid_bytes == good_size
+        assert torn
+
+    def test_corrupted_record_detected(self, path):
+        journal.write_journal(path, "e1")
+        journal.append_records(path, [{"op": "update", "state": {"turn_count": 1}}])
+
+        data = bytearray(path.read_bytes())
+        data[-2] ^= 0xFF
+        path.write_bytes(bytes(data))
+
+        records, _, torn = journal.read_records(path)
+        assert len(records) == 1
+        assert torn
+
+    def test_replay_appends_tails(self):
+        data = {journal.EPOCH_KEY: "e1", "history": [1, 2], "turn_count": 1}
+        records = [
+            {"op": "header", "epoch": "e1"},
+            {"op": "update", "history_base": 2, "history": [3, 4], "state": {"turn_count": 2}},
+        ]
+
+        assert journal.replay(data, records) == 1
+        assert data["history"] == [1, 2, 3, 4]
+        assert data["turn_count"] == 2
+
+    def test_replay_is_idempotent(self):
+        data = {journal.EPOCH_KEY: "e1", "history": [1, 2, 3]}
+        records = [
+            {"op": "header", "epoch": "e1"},
+            {"op": "update", "history_base": 2, "history": [3]},
+        ]
+        journal.replay(data, records)
+        assert data["history"] == [1, 2, 3]
+
+    def test_replay_ignores_stale_epoch(self):
+        data = {journal.EPOCH_KEY: "e2", "history": [1]}
+        records = [
+            {"op": "header", "epoch": "e1"},
+            {"op": "update", "history_base": 1, "history": [2]},
+        ]
+        assert journal.replay(data, records) == 0
+        assert data["history"] == [1]
+
+    def test_replay_stops_at_gap(self):
+        data = {journal.EPOCH_KEY: "e1", "history": [1]}
+        records = [
+            {"op": "header", "epoch": "e1"},
+            {"op": "update", "history_base": 5, "history": [6]},
+        ]
+        assert journal.replay(data, records) == 0
+        assert data["history"] == [1]
+
+
+class TestFileSessionJournal:
+    """Tests for journaled saves in FileSessionPlugin."""
+
+    @pytest.fixture
+    def temp_dir(self):
+        with tempfile.TemporaryDirectory() as tmpdir:
+            yield tmpdir
+
+    @pytest.fixture
+    def plugin(self, temp_dir):
+        plugin = FileSessionPlugin()
+        plugin.initialize({"storage_path": temp_dir})
+        return plugin
+
+    def _snapshot(self, temp_dir, session_id):
+        with open(Path(temp_dir) / f"{session_id}.json") as f:
+            return json.load(f)
+
+    def test_checkpoints_append_only_new_turns(self, plugin, temp_dir):
+        state = make_state("s1", 3)
+        plugin.save(state)
+        snapshot_mtime = (Path(temp_dir) / "s1.json").stat().st_mtime_ns
+
+        add_turn(state)
+        plugin.save(state)
+        add_turn(state)
+        plugin.save(state)
+
+        # Snapshot untouched, journal holds the two new turns
+        assert (Path(temp_dir) / "s1.json").stat().st_mtime_ns == snapshot_mtime
+        assert len(self._snapshot(temp_dir, "s1")["history"]) == 6
+        records, _, _ = journal.read_records(Path(temp_dir) / "s1.journal")
+        assert [len(r["history"]) for r in records[1:]] == [2, 2]
+
+    def test_load_replays_journal(self, plugin, temp_dir):
+        state = make_state("s1", 2)
+        plugin.save(state)
+        add_turn(state)
+        plugin.save(state)
+
+        fresh = FileSessionPlugin()
+        fresh.initialize({"storage_path": temp_dir})
+        loaded = fresh.load("s1")
+
+        assert loaded.history == state.history
+        assert loaded.turn_count == 3
+        assert loaded.turn_accounting == state.turn_accounting
+        assert loaded.user_inputs == state.user_inputs
+
+    def test_list_sessions_sees_journal_updates(self, plugin):
+        state = make_state("s1", 1)
+        plugin.save(state)
+        add_turn(state)
+        plugin.save(state)
+
+        info = plugin.list_sessions()[0]
+        assert info.turn_count == 2
+
+    def test_torn_record_dropped_on_load(self, temp_dir):
+        # Tiny sessions would otherwise be compacted by size
+        plugin = FileSessionPlugin()
+        plugin.initialize({"storage_path": temp_dir, "journal_compact_ratio": 10})
+        state = make_state("s1", 1)
+        plugin.save(state)
+        add_turn(state)
+        plugin.save(state)
+        add_turn(state)
+        plugin.save(state)
+
+        journal_path = Path(temp_dir) / "s1.journal"
+        with open(journal_path, 'r+b') as f:
+            f.truncate(journal_path.stat().st_size - 5)
+
+        loaded = plugin.load("s1")
+        assert loaded.turn_count == 2
+        assert len(loaded.history) == 4
+
+        # Appending after the repair keeps the journal readable
+        add_turn(loaded)
+        plugin.save(loaded)
+        assert len(plugin.load("s1").history) == 6
+
+    def test_rewritten_history_writes_snapshot(self, plugin, temp_dir):
+        state = make_state("s1", 3)
+        plugin.save(state)
+        epoch = self._snapshot(temp_dir, "s1")[journal.EPOCH_KEY]
+
+        # Simulate GC replacing old turns with a summary
+        state.history = [Message(role=Role.USER, parts=[Part(text="summary")])] + state.history[4:]
+        plugin.save(state)
+
+        snapshot = self._snapshot(temp_dir, "s1")
+        assert snapshot[journal.EPOCH_KEY] != epoch
+        assert snapshot["history"][0]["parts"][0]["text"] == "summary"
+        assert plugin.load("s1").history == state.history
+
+    def test_compaction(self, temp_dir):
+        plugin = FileSessionPlugin()
+        plugin.initialize({
+            "storage_path": temp_dir, "journal_max_records": 2, "journal_compact_ratio": 10
+        })
+        state = make_state("s1", 1)
+        plugin.save(state)
+
+        for _ in range(3):
+            add_turn(state)
+            plugin.save(state)
+
+        # Third checkpoint exceeded the record limit and was compacted
+        assert len(self._snapshot(temp_dir, "s1")["history"]) == 8
+        records, _, _ = journal.read_records(Path(temp_dir) / "s1.journal")
+        assert len(records) == 1
+        assert plugin.load("s1").history == state.history
+
+    def test_set_description_appends(self, plugin, temp_dir):
+        state = make_state("s1", 1)
+        plugin.save(state)
+
+        plugin.set_description("s1", "Journaled description")
+
+        assert self._snapshot(temp_dir, "s1")["description"] is None
+        assert plugin.load("s1").description == "Journaled description"
+
+    def test_legacy_file_without_epoch(self, plugin, temp_dir):
+        from ..serializer import serialize_session_state
+        state = make_state("legacy", 1)
+        with open(Path(temp_dir) / "legacy.json", 'w') as f:
+            json.dump(serialize_session_state(state), f)
+
+        loaded = plugin.load("legacy")
+        add_turn(loaded)
+        plugin.save(loaded)
+
+        assert journal.EPOCH_KEY in self._snapshot(temp_dir, "legacy")
+        assert plugin.load("legacy").turn_count == 2
+
+    def test_delete_removes_journal(self, plugin, temp_dir):
+        state = make_state("s1", 1)
+        plugin.save(state)
+        add_turn(state)
+        plugin.save(state)
+
+        assert plugin.delete("s1")
+        assert not (Path(temp_dir) / "s1.journal").exists()
+
+    def test_journal_disabled(self, temp_dir):
+        plugin = FileSessionPlugin()
+        plugin.initialize({"storage_path": temp_dir, "journal": False})
+        state = make_state("s1", 1)
+        plugin.save(state)
+        add_turn(state)
+        plugin.save(state)
+
+        assert not (Path(temp_dir) / "s1.journal").exists()
+        assert len(self._snapshot(temp_dir, "s1")["history"]) == 4
@@ -0,0 +1,171 @@
+"""Tests for paged session resume."""
+
+import json
+import pytest
+import tempfile
+from datetime import datetime
+from pathlib import Path
+
+from ..base import SessionConfig, SessionState
+from ..file_session import FileSessionPlugin
+from ..paging import split_recent, turn_starts
+from ..serializer import serialize_history
+from ...model_provider.types import FunctionCall, Message, Part, Role, ToolResult
+
+
+def make_state(session_id: str, turns: int = 1, **kwargs) -> SessionState:
+    """Create a session state with a prompt, tool call and answer per turn."""
+    history = []
+    for i in range(turns):
+        history.append(Message(role=Role.USER, parts=[Part(text=f"question {i}")]))
+        history.append(Message(role=Role.MODEL, parts=[
+            Part(function_call=FunctionCall(id=f"c{i}", name="search", args={"q": i}))
+        ]))
+        history.append(Message(role=Role.USER, parts=[
+            Part(function_response=ToolResult(call_id=f"c{i}", name="search", result={"hits": i}))
+        ]))
+        history.append(Message(role=Role.MODEL, parts=[Part(text=f"answer {i}")]))
+    return SessionState(
+        session_id=session_id,
+        history=history,
+        created_at=datetime(2025, 1, 1),
+        updated_at=datetime(2025, 1, 1, 0, turns % 60),
+        turn_count=turns,
+        turn_accounting=[{"prompt": i, "output": i, "total": 2 * i} for i in range(turns)],
+        **kwargs
+    )
+
+
+class TestSplitRecent:
+    """Tests for splitting a serialized history."""
+
+    def test_turn_starts_skip_tool_results(self):
+        history = serialize_history(make_state("s1", 3).history)
+
+        assert turn_starts(history) == [0, 4, 8]
+
+    def test_split(self):
+        history = serialize_history(make_state("s1", 5).history)
+        full = list(history)
+
+        pager = split_recent("s1", history, 2, lambda: full)
+
+        assert history == full[12:]
+        assert pager.message_count == 12
+        assert pager.turn_count == 3
+        assert "3 earlier turn(s)" in pager.summary
+        assert "- question 2" in pager.summary
+        assert [m.text for m in pager.load()[::4]] == ["question 0", "question 1", "question 2"]
+
+    def test_short_history_is_not_split(self):
+        history = serialize_history(make_state("s1", 2).history)
+
+        assert split_recent("s1", history, 2, lambda: history) is None
+        assert len(history) == 8
+
+    def test_load_detects_rewritten_history(self):
+        history = serialize_history(make_state("s1", 5).history)
+        pager = split_recent("s1", list(history), 2, lambda: history)
+
+        history[11] = {"role": "model", "parts": [{"type": "text", "text": "other"}]}
+
+        with pytest.raises(ValueError):
+            pager.load()
+
+
+class TestPagedSessions:
+    """Tests for FileSessionPlugin.load_recent and saving paged states."""
+
+    @pytest.fixture
+    def temp_dir(self):
+        with tempfile.TemporaryDirectory() as tmpdir:
+            yield tmpdir
+
+    def make_plugin(self, temp_dir, **config):
+        plugin = FileSessionPlugin()
+        plugin.initialize({"storage_path": temp_dir, "background_writes": False, **config})
+        return plugin
+
+    def test_load_recent(self, temp_dir):
+        state = make_state("s1", 10)
+        self.make_plugin(temp_dir).save(state)
+
+        loaded = self.make_plugin(temp_dir).load_recent("s1", 3)
+
+        assert loaded.history == state.history[28:]
+        assert loaded.paged.turn_count == 7
+        assert loaded.paged.load() == state.history[:28]
+        assert loaded.turn_count == 10
+        assert len(loaded.turn_accounting) == 10
+
+    def test_load_recent_short_session(self, temp_dir):
+        self.make_plugin(temp_dir).save(make_state("s1", 2))
+
+        loaded = self.make_plugin(temp_dir).load_recent("s1", 3)
+
+        assert len(loaded.history) == 8
+        assert loaded.paged is None
+
+    def test_save_paged_state_appends(self, temp_dir):
+        state = make_state("s1", 10)
+        self.make_plugin(temp_dir).save(state)
+
+        plugin = self.make_plugin(temp_dir)
+        loaded = plugin.load_recent("s1", 3)
+        snapshot = (Path(temp_dir) / "s1.json").read_bytes()
+        loaded.history.append(Message(role=Role.USER, parts=[Part(text="question 10")]))
+        loaded.turn_count = 11
+        plugin.save(loaded)
+
+        assert (Path(temp_dir) / "s1.json").read_bytes() == snapshot
+        reloaded = self.make_plugin(temp_dir).load("s1")
+        assert reloaded.history == state.history + [loaded.history[-1]]
+        assert reloaded.turn_count == 11
+
+    def test_snapshot_of_paged_state_pages_in(self, temp_dir):
+        state = make_state("s1", 10)
+        self.make_plugin(temp_dir).save(state)
+
+        plugin = self.make_plugin(temp_dir, journal_max_records=1)
+        loaded = plugin.load_recent("s1", 3)
+        for text in ("question 10", "question 11"):
+            loaded.history.append(Message(role=Role.USER, parts=[Part(text=text)]))
+            plugin.save(loaded)
+
+        data = json.loads((Path(temp_dir) / "s1.json").read_text())
+        assert len(data["history"]) == 42
+        assert self.make_plugin(temp_dir).load("s1").history[:40] == state.history
+
+    def test_save_paged_state_under_new_id(self, temp_dir):
+        state = make_state("s1", 10)
+        self.make_plugin(temp_dir).save(state)
+
+        plugin = self.make_plugin(temp_dir)
+        loaded = plugin.load_recent("s1", 3)
+        loaded.session_id = "s2"
+        plugin.save(loaded)
+
+        assert self.make_plugin(temp_dir).load("s2").history == state.history
+
+    def test_revert_of_paged_turns_is_snapshotted(self, temp_dir):
+        state = make_state("s1", 10)
+        self.make_plugin(temp_dir).save(state)
+
+        plugin = self.make_plugin(temp_dir)
+        loaded = plugin.load_recent("s1", 3)
+        loaded.history = loaded.history[:4]
+        loaded.turn_accounting = loaded.turn_accounting[:8]
+        plugin.save(loaded)
+
+        assert self.make_plugin(temp_dir).load("s1").history == state.history[:32]
+
+    def test_session_start_uses_resume_recent_turns(self, temp_dir):
+        self.make_plugin(temp_dir).save(make_state("s1", 10))
+
+        plugin = self.make_plugin(temp_dir)
+        state = plugin.on_session_start(
+            SessionConfig(auto_resume_last=True, resume_recent_turns=2)
+        )
+
+        assert len(state.history) == 8
+        assert state.paged.turn_count == 8
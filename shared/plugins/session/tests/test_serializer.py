@@ -15,7 +15,7 @@ from ..serializer import (
     deserialize_session_state,
 )
 from ..base import SessionState
-from ...model_provider.types import Message, Part, Role, FunctionCall, ToolResult
+from ...model_provider.types import Attachment, Message, Part, Role, FunctionCall, ToolResult
 
 
 class TestPartSerialization:
@@ -72,6 +72,27 @@ class TestPartSerialization:
 
         assert restored.text == original.text
 
+    def test_round_trip_attachments(self):
+        """Test that function response attachments survive serialization."""
+        original = Part.from_function_response(ToolResult(
+            call_id="c1",
+            name="screenshot",
+            result={"ok": True},
+            attachments=[Attachment(mime_type="image/png", data=b"\x89PNG", display_name="s.png")]
+        ))
+        data = serialize_part(original)
+
+        assert isinstance(data["attachments"][0]["data"], str)
+        assert deserialize_part(data) == original
+
+    def test_raw_bytes(self):
+        """Test keeping inline data as bytes (binary snapshots)."""
+        original = Part(inline_data={"mime_type": "image/png", "data": b"\x89PNG"})
+        data = serialize_part(original, raw_bytes=True)
+
+        assert data["data"] == b"\x89PNG"
+        assert deserialize_part(data) == original
+
 
 class TestMessageSerialization:
     """Tests for Message serialization/deserialization."""
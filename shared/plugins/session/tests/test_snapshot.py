@@ -0,0 +1,197 @@
+"""Tests for compressed session snapshots."""
+
+import gzip
+import json
+import pytest
+import tempfile
+from datetime import datetime
+from pathlib import Path
+from unittest.mock import patch
+
+from .. import snapshot
+from ..base import SessionState
+from ..file_session import FileSessionPlugin
+from ..serializer import serialize_session_state
+from ...model_provider.types import Message, Part, Role
+
+
+def make_state(session_id: str, turns: int = 1, **kwargs) -> SessionState:
+    """Create a session state with a repetitive tool-like payload per turn."""
+    history = []
+    for i in range(turns):
+        history.append(Message(role=Role.USER, parts=[Part(text=f"question {i}")]))
+        history.append(Message(role=Role.MODEL, parts=[Part(text=f"answer {i}\n" + "output line\n" * 50)]))
+    return SessionState(
+        session_id=session_id,
+        history=history,
+        created_at=datetime(2025, 1, 1),
+        updated_at=datetime(2025, 1, 1, 0, turns % 60),
+        turn_count=turns,
+        **kwargs
+    )
+
+
+class TestSnapshotEncoding:
+    """Tests for encoding and streaming decode."""
+
+    @pytest.fixture
+    def temp_dir(self):
+        with tempfile.TemporaryDirectory() as tmpdir:
+            yield Path(tmpdir)
+
+    def test_resolve_compression(self):
+        assert snapshot.resolve_compression(None) == "none"
+        assert snapshot.resolve_compression("gzip") == "gzip"
+        assert snapshot.resolve_compression("auto") == ("zstd" if snapshot.HAS_ZSTD else "gzip")
+        with pytest.raises(ValueError):
+            snapshot.resolve_compression("lz4")
+
+    @pytest.mark.parametrize("compression", ["none", "gzip"])
+    def test_roundtrip(self, temp_dir, compression):
+        data = serialize_session_state(make_state("s1", 3))
+        encoded, raw_bytes = snapshot.encode_snapshot(data, compression)
+        path = temp_dir / "s1.json"
+        path.write_bytes(encoded)
+
+        decoded, read_bytes = snapshot.read_snapshot(path)
+
+        assert snapshot.detect_encoding(path) == compression
+        assert decoded == data
+        assert read_bytes == raw_bytes
+
+    def test_gzip_is_json_lines(self, temp_dir):
+        data = serialize_session_state(make_state("s1", 2))
+        encoded, _ = snapshot.encode_snapshot(data, "gzip")
+
+        lines = gzip.decompress(encoded).decode('utf-8').splitlines()
+
+        assert json.loads(lines[0])["format"] == snapshot.STREAM_FORMAT
+        assert "history" not in json.loads(lines[0])
+        assert len(lines) == 1 + len(data["history"])
+
+    def test_streams_in_chunks(self, temp_dir):
+        data = serialize_session_state(make_state("s1", 5))
+        encoded, _ = snapshot.encode_snapshot(data, "gzip")
+        path = temp_dir / "s1.json"
+        path.write_bytes(encoded)
+
+        with patch.object(snapshot, "_READ_CHUNK", 7):
+            decoded, _ = snapshot.read_snapshot(path)
+
+        assert decoded == data
+
+    def test_corrupted_gzip_raises_value_error(self, temp_dir):
+        data = serialize_session_state(make_state("s1", 5))
+        encoded, _ = snapshot.encode_snapshot(data, "gzip")
+        path = temp_dir / "s1.json"
+        path.write_bytes(encoded[:len(encoded) // 2])
+
+        with pytest.raises(ValueError):
+            snapshot.read_snapshot(path)
+
+
+class TestCompressedSessions:
+    """Tests for FileSessionPlugin with compression enabled."""
+
+    @pytest.fixture
+    def temp_dir(self):
+        with tempfile.TemporaryDirectory() as tmpdir:
+            yield tmpdir
+
+    def make_plugin(self, temp_dir, **config):
+        plugin = FileSessionPlugin()
+        plugin.initialize({"storage_path": temp_dir, **config})
+        return plugin
+
+    def test_save_and_load(self, temp_dir):
+        plugin = self.make_plugin(temp_dir, compression="gzip")
+        state = make_state("s1", 20, description="Compressed")
+        plugin.save(state)
+
+        path = Path(temp_dir) / "s1.json"
+        plain_size = len(json.dumps(serialize_session_state(state), indent=2))
+        assert snapshot.detect_encoding(path) == "gzip"
+        assert path.stat().st_size * 10 < plain_size
+
+        loaded = self.make_plugin(temp_dir, compression="gzip").load("s1")
+        assert loaded.history == state.history
+        assert loaded.description == "Compressed"
+
+    def test_plain_files_stay_readable(self, temp_dir):
+        self.make_plugin(temp_dir).save(make_state("old", 2))
+
+        plugin = self.make_plugin(temp_dir, compression="gzip")
+        plugin.save(make_state("new", 2))
+
+        assert plugin.load("old").turn_count == 2
+        assert plugin.load("new").turn_count == 2
+        assert {s.session_id for s in plugin.list_sessions()} == {"old", "new"}
+
+    def test_compressed_files_readable_without_compression(self, temp_dir):
+        self.make_plugin(temp_dir, compression="gzip").save(make_state("s1", 2))
+
+        assert self.make_plugin(temp_dir).load("s1").turn_count == 2
+
+    def test_journal_applies_to_compressed_snapshot(self, temp_dir):
+        plugin = self.make_plugin(temp_dir, compression="gzip")
+        state = make_state("s1", 2)
+        plugin.save(state)
+        state.history.append(Message(role=Role.USER, parts=[Part(text="more")]))
+        state.turn_count = 3
+        plugin.save(state)
+
+        loaded = self.make_plugin(temp_dir, compression="gzip").load("s1")
+
+        assert loaded.history[-1].text == "more"
+        assert loaded.turn_count == 3
+
+    def test_compaction_uses_uncompressed_size(self, temp_dir):
+        plugin = self.make_plugin(temp_dir, compression="gzip")
+        state = make_state("s1", 20)
+        plugin.save(state)
+
+        cursor = plugin._journals["s1"]
+        assert cursor.snapshot_bytes > (Path(temp_dir) / "s1.json").stat().st_size
+
+    def test_set_description_rewrites_compressed_snapshot(self, temp_dir):
+        self.make_plugin(temp_dir, compression="gzip", journal=False).save(make_state("s1", 2))
+
+        plugin = self.make_plugin(temp_dir, compression="gzip", journal=False)
+        plugin.set_description("s1", "Renamed")
+
+        assert snapshot.detect_encoding(Path(temp_dir) / "s1.json") == "gzip"
+        assert plugin.load("s1").description == "Renamed"
+
+
+class TestZstdSessions:
+    """Tests for zstd snapshots (need the zstandard package)."""
+
+    @pytest.fixture
+    def temp_dir(self):
+        pytest.importorskip("zstandard")
+        with tempfile.TemporaryDirectory() as tmpdir:
+            yield tmpdir
+
+    def test_save_and_load(self, temp_dir):
+        plugin = FileSessionPlugin()
+        plugin.initialize({"storage_path": temp_dir, "compression": "zstd"})
+        state = make_state("s1", 5)
+        plugin.save(state)
+
+        assert snapshot.detect_encoding(Path(temp_dir) / "s1.json") == "zstd"
+        assert plugin.load("s1").history == state.history
+
+    def test_dictionary_is_trained_and_shared(self, temp_dir):
+        plugin = FileSessionPlugin()
+        plugin.initialize({"storage_path": temp_dir, "compression": "zstd"})
+        plugin.save(make_state("s1", snapshot.DICTIONARY_MIN_SAMPLES))
+        plugin.save(make_state("s2", 3))
+
+        dictionaries = list((Path(temp_dir) / snapshot.DICTIONARY_DIR).glob("*.zdict"))
+        assert len(dictionaries) == 1
+        header = (Path(temp_dir) / "s2.json").read_bytes()[:18]
+        assert snapshot.zstandard.get_frame_parameters(header).dict_id == int(dictionaries[0].stem)
+
+        reader = FileSessionPlugin()
+        reader.initialize({"storage_path": temp_dir})
+        assert reader.load("s2").turn_count == 3
@@ -0,0 +1,252 @@
+"""Tests for background session checkpoints."""
+
+import os
+import pytest
+import tempfile
+import threading
+from datetime import datetime
+from pathlib import Path
+from unittest.mock import patch
+
+from ..base import SessionConfig, SessionState
+from ..file_session import FileSessionPlugin
+from ..writer import CheckpointWriter, snapshot_state
+from ...model_provider.types import Message, Part, Role
+
+
+def make_state(session_id: str, turns: int = 1, **kwargs) -> SessionState:
+    """Create a session state with one user+model pair per turn."""
+    history = []
+    for i in range(turns):
+        history.append(Message(role=Role.USER, parts=[Part(text=f"question {i}")]))
+        history.append(Message(role=Role.MODEL, parts=[Part(text=f"answer {i}")]))
+    return SessionState(
+        session_id=session_id,
+        history=history,
+        created_at=datetime(2025, 1, 1),
+        updated_at=datetime(2025, 1, 1, 0, turns),
+        turn_count=turns,
+        turn_accounting=[{"prompt": i, "output": i, "total": 2 * i} for i in range(turns)],
+        **kwargs
+    )
+
+
+class TestCheckpointWriter:
+    """Tests for the coalescing writer thread."""
+
+    @pytest.fixture
+    def writer(self):
+        writer = CheckpointWriter()
+        yield writer
+        writer.close(timeout=5)
+
+    def test_runs_jobs(self, writer):
+        done = []
+        writer.submit("s1", lambda: done.append("s1"))
+        writer.submit("s2", lambda: done.append("s2"))
+
+        assert writer.flush(timeout=5)
+        assert done == ["s1", "s2"]
+        assert writer.written == 2
+
+    def test_coalesces_pending_jobs_per_session(self, writer):
+        started = threading.Event()
+        release = threading.Event()
+        done = []
+
+        def blocking():
+            started.set()
+            release.wait(5)
+            done.append("first")
+
+        writer.submit("s1", blocking)
+        assert started.wait(5)
+        writer.submit("s1", lambda: done.append("second"))
+        writer.submit("s1", lambda: done.append("third"))
+        release.set()
+
+        assert writer.flush(timeout=5)
+        assert done == ["first", "third"]
+        assert writer.coalesced == 1
+
+    def test_discard(self, writer):
+        release = threading.Event()
+        done = []
+        writer.submit("s1", lambda: release.wait(5))
+        writer.submit("s2", lambda: done.append("s2"))
+
+        assert writer.discard("s2")
+        release.set()
+        assert writer.flush(timeout=5)
+        assert done == []
+
+    def test_failed_job_does_not_stop_writer(self, writer):
+        done = []
+
+        def fail():
+            raise OSError("disk full")
+
+        writer.submit("s1", fail)
+        writer.submit("s2", lambda: done.append("s2"))
+
+        assert writer.flush(timeout=5)
+        assert done == ["s2"]
+        assert isinstance(writer.last_error, OSError)
+
+    def test_submit_after_close_raises(self, writer):
+        writer.close(timeout=5)
+        with pytest.raises(RuntimeError):
+            writer.submit("s1", lambda: None)
+
+    def test_snapshot_state_is_isolated(self):
+        state = make_state("s1", 2, metadata={"k": 1})
+        snapshot = snapshot_state(state)
+
+        state.history.append(Message(role=Role.USER, parts=[Part(text="later")]))
+        state.turn_accounting[0]["total"] = 99
+        state.metadata["k"] = 2
+
+        assert len(snapshot.history) == 4
+        assert snapshot.history[0] is state.history[0]
+        assert snapshot.turn_accounting[0]["total"] == 0
+        assert snapshot.metadata == {"k": 1}
+
+
+class TestBackgroundCheckpoints:
+    """Tests for FileSessionPlugin checkpointing on the writer thread."""
+
+    @pytest.fixture
+    def temp_dir(self):
+        with tempfile.TemporaryDirectory() as tmpdir:
+            yield tmpdir
+
+    @pytest.fixture
+    def plugin(self, temp_dir):
+        plugin = FileSessionPlugin()
+        plugin.initialize({"storage_path": temp_dir})
+        yield plugin
+        plugin.shutdown()
+
+    def test_checkpoint_does_not_block_turn(self, plugin, temp_dir):
+        config = SessionConfig(checkpoint_after_turns=1)
+        release = threading.Event()
+        original = plugin._checkpoint
+
+        def slow_checkpoint(*args):
+            release.wait(5)
+            original(*args)
+
+        with patch.object(plugin, "_checkpoint", side_effect=slow_checkpoint):
+            plugin.on_turn_complete(make_state("s1", 1), config)
+            assert not (Path(temp_dir) / "s1.json").exists()
+            release.set()
+            assert plugin.flush(timeout=5)
+
+        assert plugin.load("s1").turn_count == 1
+
+    def test_checkpoint_uses_state_at_turn_end(self, plugin):
+        config = SessionConfig(checkpoint_after_turns=1)
+        state = make_state("s1", 1)
+
+        plugin.on_turn_complete(state, config)
+        state.history.append(Message(role=Role.USER, parts=[Part(text="next")]))
+        plugin.flush(timeout=5)
+
+        assert len(plugin.load("s1").history) == 2
+
+    def test_late_checkpoint_does_not_overwrite_newer_save(self, plugin):
+        config = SessionConfig(checkpoint_after_turns=1)
+        started = threading.Event()
+        release = threading.Event()
+        original = plugin._checkpoint
+
+        def late_checkpoint(*args):
+            started.set()
+            release.wait(5)
+            original(*args)
+
+        with patch.object(plugin, "_checkpoint", side_effect=late_checkpoint):
+            plugin.on_turn_complete(make_state("s1", 1), config)
+            assert started.wait(5)
+            plugin.save(make_state("s1", 2))
+            release.set()
+            plugin.flush(timeout=5)
+
+        assert plugin.load("s1").turn_count == 2
+
+    def test_delete_cancels_pending_checkpoint(self, plugin, temp_dir):
+        config = SessionConfig(checkpoint_after_turns=1)
+        release = threading.Event()
+        plugin._writer.submit("blocker", lambda: release.wait(5))
+
+        plugin.on_turn_complete(make_state("s1", 1), config)
+        plugin.delete("s1")
+        release.set()
+        plugin.flush(timeout=5)
+
+        assert not (Path(temp_dir) / "s1.json").exists()
+
+    def test_session_end_flushes_checkpoints(self, plugin, temp_dir):
+        config = SessionConfig(checkpoint_after_turns=1, auto_save_on_exit=False)
+        plugin.on_turn_complete(make_state("s1", 1), config)
+        plugin.on_session_end(make_state("s1", 1), config)
+
+        assert plugin._writer.pending() == 0
+        assert (Path(temp_dir) / "s1.json").exists()
+
+    def test_cleanup_runs_only_after_checkpoint(self, plugin):
+        config = SessionConfig(checkpoint_after_turns=2, max_sessions=1)
+        plugin.save(make_state("old", 1))
+
+        with patch.object(plugin, "_cleanup_old_sessions") as cleanup:
+            plugin.on_turn_complete(make_state("s1", 1), config)
+            plugin.flush(timeout=5)
+            cleanup.assert_not_called()
+
+        plugin.on_turn_complete(make_state("s1", 2), config)
+        plugin.flush(timeout=5)
+
+        assert [s.session_id for s in plugin.list_sessions()] == ["s1"]
+
+    def test_synchronous_checkpoints(self, temp_dir):
+        plugin = FileSessionPlugin()
+        plugin.initialize({"storage_path": temp_dir, "background_writes": False})
+
+        plugin.on_turn_complete(make_state("s1", 1), SessionConfig(checkpoint_after_turns=1))
+
+        assert (Path(temp_dir) / "s1.json").exists()
+        assert plugin._writer.written == 0
+
+
+class TestDurability:
+    """Tests for the fsync policy."""
+
+    @pytest.fixture
+    def temp_dir(self):
+        with tempfile.TemporaryDirectory() as tmpdir:
+            yield tmpdir
+
+    def make_plugin(self, temp_dir, durability):
+        plugin = FileSessionPlugin()
+        plugin.initialize({"storage_path": temp_dir, "durability": durability})
+        return plugin
+
+    def test_unknown_policy_raises(self, temp_dir):
+        with pytest.raises(ValueError):
+            self.make_plugin(temp_dir, "sometimes")
+
+    @pytest.mark.parametrize("durability,snapshot_syncs,append_syncs", [
+        ("none", False, False),
+        ("snapshot", True, False),
+        ("always", True, True),
+    ])
+    def test_policy(self, temp_dir, durability, snapshot_syncs, append_syncs):
+        plugin = self.make_plugin(temp_dir, durability)
+
+        with patch("os.fsync", wraps=os.fsync) as fsync:
+            plugin.save(make_state("s1", 1))
+            assert fsync.called == snapshot_syncs
+
+            fsync.reset_mock()
+            plugin.save(make_state("s1", 2))
+            assert fsync.called == append_syncs
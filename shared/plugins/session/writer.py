@@ -0,0 +1,161 @@
+"""Background checkpoint writer.
+
+Checkpoint saves run on a dedicated writer thread so the turn thread never
+waits on disk. Pending checkpoints are coalesced per session: if a newer
+checkpoint is submitted before the previous one was written, only the
+newest is written.
+
+Submitted states are snapshotted first (see snapshot_state): the lists and
+dicts of the state are copied, while messages are shared. Messages are
+never mutated once they are in the history - GC and revert replace them -
+so sharing them is a cheap copy-on-write snapshot.
+"""
+
+import threading
+from collections import OrderedDict
+from dataclasses import replace
+from typing import Callable, Optional
+
+from .base import SessionState
+
+
+def snapshot_state(state: SessionState) -> SessionState:
+    """Copy a session state so later changes to the original don't leak in.
+
+    Args:
+        state: State to snapshot.
+
+    Returns:
+        A new SessionState with its own lists and dicts (messages shared).
+    """
+    return replace(
+        state,
+        history=list(state.history),
+        metadata=dict(state.metadata),
+        turn_accounting=[dict(entry) for entry in state.turn_accounting],
+        user_inputs=list(state.user_inputs),
+    )
+
+
+class CheckpointWriter:
+    """Runs checkpoint jobs on a background thread, newest job per session wins.
+
+    The thread is started on the first submit and is a daemon thread; call
+    flush() or close() to make sure pending checkpoints reach the disk.
+    flush() and close() must not be called while holding a lock that the
+    jobs acquire.
+    """
+
+    def __init__(self, name: str = "session-writer"):
+        """Initialize the writer.
+
+        Args:
+            name: Writer thread name.
+        """
+        self._name = name
+        self._pending: "OrderedDict[str, Callable[[], None]]" = OrderedDict()
+        self._cond = threading.Condition()
+        self._writing = False
+        self._closed = False
+        self._thread: Optional[threading.Thread] = None
+
+        self.written = 0
+        """Number of jobs run."""
+
+        self.coalesced = 0
+        """Number of jobs replaced by a newer one before they ran."""
+
+        self.last_error: Optional[Exception] = None
+        """Last exception raised by a job."""
+
+    def submit(self, session_id: str, job: Callable[[], None]) -> None:
+        """Queue a checkpoint job, replacing any pending job of the session.
+
+        Jobs must not depend on state the caller keeps modifying; capture a
+        snapshot_state() copy of live state.
+
+        Args:
+            session_id: Session the job writes.
+            job: Performs the write; runs on the writer thread.
+
+        Raises:
+            RuntimeError: If the writer was closed.
+        """
+        with self._cond:
+            if self._closed:
+                raise RuntimeError("Checkpoint writer is closed")
+            if self._pending.pop(session_id, None) is not None:
+                self.coalesced += 1
+            self._pending[session_id] = job
+            if self._thread is None:
+                self._thread = threading.Thread(target=self._run, name=self._name, daemon=True)
+                self._thread.start()
+            self._cond.notify_all()
+
+    def discard(self, session_id: str) -> bool:
+        """Drop a session's pending job, e.g. when it is superseded by a save.
+
+        Returns:
+            True if a pending job was dropped.
+        """
+        with self._cond:
+            dropped = self._pending.pop(session_id, None) is not None
+            self._cond.notify_all()
+            return dropped
+
+    def pending(self) -> int:
+        """Number of jobs waiting to run."""
+        with self._cond:
+            return len(self._pending)
+
+    def flush(self, timeout: Optional[float] = None) -> bool:
+        """Wait until all pending jobs have run.
+
+        Args:
+            timeout: Maximum seconds to wait (None = no limit).
+
+        Returns:
+            True if everything was written, False on timeout.
+        """
+        with self._cond:
+            if self._thread is threading.current_thread():
+                return not self._pending
+            return self._cond.wait_for(
+                lambda: not self._pending and not self._writing, timeout
+            )
+
+    def close(self, timeout: Optional[float] = None) -> bool:
+        """Flush pending jobs and stop the writer thread.
+
+        Returns:
+            True if everything was written, False on timeout.
+        """
+        flushed = self.flush(timeout)
+        with self._cond:
+            self._closed = True
+            self._cond.notify_all()
+            thread = self._thread
+        if thread is not None and thread is not threading.current_thread():
+            thread.join(timeout)
+        return flushed
+
+    def _run(self) -> None:
+        """Writer thread main loop."""
+        while True:
+            with self._cond:
+                self._cond.wait_for(lambda: self._pending or self._closed)
+                if not self._pending:
+                    return  # Closed with nothing left to write
+                session_id, job = self._pending.popitem(last=False)
+                self._writing = True
+
+            try:
+                job()
+                self.written += 1
+            except Exception as e:
+                self.last_error = e
+                print(f"[SessionPlugin] Warning: checkpoint of session {session_id} failed: {e}")
+            finally:
+                with self._cond:
+                    self._writing = False
+                    self._cond.notify_all()
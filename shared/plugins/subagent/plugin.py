@@ -9,12 +9,14 @@ for subagents, avoiding redundant provider connections.
 
 import logging
 import os
+import threading
 from typing import Any, Callable, Dict, List, Optional, TYPE_CHECKING
 from datetime import datetime
 
 from .config import SubagentConfig, SubagentProfile, SubagentResult
 from ..base import UserCommand, CommandCompletion
 from ..model_provider.types import ToolSchema
+from ..plugin_context import PluginContext, current_plugin_context
 
 if TYPE_CHECKING:
     from ...jaato_runtime import JaatoRuntime
@@ -90,9 +92,11 @@ class SubagentPlugin:
         # UI hooks for agent lifecycle integration
         self._ui_hooks: Optional['AgentUIHooks'] = None
         self._subagent_counter: int = 0  # Counter for generating unique subagent IDs
-        self._parent_agent_id: str = "main"  # Parent agent ID for nested subagents
         # Session registry for multi-turn conversations
         self._active_sessions: Dict[str, Dict[str, Any]] = {}  # agent_id -> session info
+        # Guards the counter and session registry (subagents can be
+        # spawned from sessions running in parallel)
+        self._lock = threading.Lock()
 
     @property
     def name(self) -> str:
@@ -687,8 +691,11 @@ class SubagentPlugin:
                 'message': 'No active subagent sessions'
             }
 
+        with self._lock:
+            active = list(self._active_sessions.items())
+
         sessions = []
-        for agent_id, info in self._active_sessions.items():
+        for agent_id, info in active:
             sessions.append({
                 'agent_id': agent_id,
                 'profile': info['profile'].name,
@@ -709,11 +716,11 @@ class SubagentPlugin:
         Args:
             agent_id: ID of the session to close.
         """
-        if agent_id not in self._active_sessions:
+        with self._lock:
+            session_info = self._active_sessions.pop(agent_id, None)
+        if session_info is None:
             return
 
-        session_info = self._active_sessions[agent_id]
-
         # Notify UI hooks of completion
         if self._ui_hooks:
             self._ui_hooks.on_agent_status_changed(
@@ -728,8 +735,6 @@ class SubagentPlugin:
                 turns_used=session_info['turn_count']
             )
 
-        # Remove from registry
-        del self._active_sessions[agent_id]
         logger.info(f"Closed subagent session: {agent_id}")
 
     def _execute_spawn_subagent(self, args: Dict[str, Any]) -> Dict[str, Any]:
@@ -891,13 +896,17 @@ class SubagentPlugin:
         # Use profile's model or default
         model = profile.model or self._config.default_model
 
-        # Generate agent ID (for nested subagents, use dotted notation)
-        self._subagent_counter += 1
-        if self._parent_agent_id == "main":
-            agent_id = f"subagent_{self._subagent_counter}"
+        # Generate agent ID (for nested subagents, use dotted notation);
+        # the parent is the session whose tool call is spawning this one
+        parent_agent_id = current_plugin_context().agent_id
+        with self._lock:
+            self._subagent_counter += 1
+            counter = self._subagent_counter
+        if parent_agent_id == "main":
+            agent_id = f"subagent_{counter}"
         else:
             # Nested subagent: parent.child
-            agent_id = f"{self._parent_agent_id}.{profile.name}"
+            agent_id = f"{parent_agent_id}.{profile.name}"
 
         # Determine icon (priority: profile.icon > profile.icon_name > default)
         icon_lines = profile.icon
@@ -912,7 +921,7 @@ class SubagentPlugin:
                 agent_name=profile.name,
                 agent_type="subagent",
                 profile_name=profile.name,
-                parent_agent_id=self._parent_agent_id,
+                parent_agent_id=parent_agent_id,
                 icon_lines=icon_lines,
                 created_at=datetime.now()
             )
@@ -922,11 +931,13 @@ class SubagentPlugin:
             )
 
         try:
-            # Create session from runtime with profile's configuration
+            # Create session from runtime with profile's configuration,
+            # with its own plugin state so it can run alongside other sessions
             session = self._runtime.create_session(
                 model=model,
                 tools=profile.plugins if profile.plugins else None,
-                system_instructions=profile.system_instructions
+                system_instructions=profile.system_instructions,
+                plugin_context=PluginContext(agent_id)
             )
 
             # Set agent context for permission checks
@@ -999,15 +1010,16 @@ class SubagentPlugin:
                 )
 
             # Store session in registry for multi-turn conversations
-            self._active_sessions[agent_id] = {
-                'session': session,
-                'profile': profile,
-                'agent_id': agent_id,
-                'created_at': datetime.now(),
-                'last_activity': datetime.now(),
-                'turn_count': usage.get('turns', 1),
-                'max_turns': profile.max_turns or 10,
-            }
+            with self._lock:
+                self._active_sessions[agent_id] = {
+                    'session': session,
+                    'profile': profile,
+                    'agent_id': agent_id,
+                    'created_at': datetime.now(),
+                    'last_activity': datetime.now(),
+                    'turn_count': usage.get('turns', 1),
+                    'max_turns': profile.max_turns or 10,
+                }
 
             return SubagentResult(
                 success=True,
@@ -6,7 +6,6 @@ Channels handle progress reporting through different transport protocols:
 - FileReporter: Writes progress to filesystem
 """
 
-import json
 import os
 import sys
 from abc import ABC, abstractmethod
@@ -27,6 +26,8 @@ try:
 except ImportError:
     HAS_RICH = False
 
+from ... import json_codec
+from ...http_transport import DEFAULT_QUEUE_SIZE, DEFAULT_RETRIES, EventSender, get_transport
 from .models import ProgressEvent, StepStatus, TodoPlan, TodoStep
 
 
@@ -301,6 +302,11 @@ class WebhookReporter(TodoReporter):
 
     Designed for integration with external systems like dashboards,
     notification services, or workflow automation.
+
+    Events are posted from a background thread (see EventSender), so a
+    slow or unreachable endpoint never delays the tool that reported
+    progress. With "batch_size" above 1, the events queued while a POST
+    is running are sent together as {"events": [<event>, ...]}.
     """
 
     def __init__(self):
@@ -308,6 +314,7 @@ class WebhookReporter(TodoReporter):
         self._timeout: int = 10
         self._headers: Dict[str, str] = {}
         self._auth_token: Optional[str] = None
+        self._sender: Optional[EventSender] = None
 
     @property
     def name(self) -> str:
@@ -321,6 +328,11 @@ class WebhookReporter(TodoReporter):
             timeout: Request timeout in seconds
             headers: Additional headers to include
             auth_token: Bearer token for authorization
+            async: Send events from a background thread (default True);
+                False posts each event before returning
+            batch_size: Events posted together, at most (default 1)
+            max_queue: Events waiting to be sent before new ones are dropped
+            retries: Delivery attempts after a failed POST
         """
         if not HAS_REQUESTS:
             raise RuntimeError("requests library required for WebhookReporter")
@@ -336,11 +348,24 @@ class WebhookReporter(TodoReporter):
         self._headers = config.get("headers", {})
         self._auth_token = config.get("auth_token") or os.environ.get("TODO_WEBHOOK_TOKEN")
 
-    def _send_event(self, event: ProgressEvent) -> bool:
-        """Send event to webhook endpoint."""
-        if not self._endpoint:
-            return False
+        self.shutdown()
+        if config.get("async", True):
+            self._sender = EventSender(
+                self._endpoint,
+                headers=self._request_headers(),
+                timeout=self._timeout,
+                batch_size=config.get("batch_size", 1),
+                max_queue=config.get("max_queue", DEFAULT_QUEUE_SIZE),
+                retries=config.get("retries", DEFAULT_RETRIES),
+            )
+
+    def shutdown(self) -> None:
+        """Send the events still queued and stop the sender thread."""
+        if self._sender:
+            self._sender.close()
+            self._sender = None
 
+    def _request_headers(self) -> Dict[str, str]:
         headers = {
             "Content-Type": "application/json",
             **self._headers,
@@ -348,12 +373,25 @@ class WebhookReporter(TodoReporter):
 
         if self._auth_token:
             headers["Authorization"] = f"Bearer {self._auth_token}"
+        return headers
+
+    def _send_event(self, event: ProgressEvent) -> bool:
+        """Send event to webhook endpoint.
+
+        Returns:
+            True if the event was queued (async) or delivered (sync).
+        """
+        if not self._endpoint:
+            return False
+
+        if self._sender:
+            return self._sender.send(event.to_dict())
 
         try:
-            response = requests.post(
+            response = get_transport().post(
                 self._endpoint,
                 json=event.to_dict(),
-                headers=headers,
+                headers=self._request_headers(),
                 timeout=self._timeout,
             )
             return response.status_code == 200
@@ -443,31 +481,31 @@ class FileReporter(TodoReporter):
 
         # Write event file
         event_file = plan_dir / "events" / f"{count:03d}_{event.event_type}.json"
-        with open(event_file, 'w', encoding='utf-8') as f:
-            json.dump(event.to_dict(), f, indent=2)
+        with open(event_file, 'wb') as f:
+            f.write(json_codec.dumps_document(event.to_dict()))
 
         # Update plan state
         plan_file = plan_dir / "plan.json"
-        with open(plan_file, 'w', encoding='utf-8') as f:
-            json.dump(plan.to_dict(), f, indent=2)
+        with open(plan_file, 'wb') as f:
+            f.write(json_codec.dumps_document(plan.to_dict()))
 
         # Update progress
         progress_file = plan_dir / "progress.json"
         progress = plan.get_progress()
         progress["status"] = plan.status.value
         progress["updated_at"] = datetime.utcnow().isoformat() + "Z"
-        with open(progress_file, 'w', encoding='utf-8') as f:
-            json.dump(progress, f, indent=2)
+        with open(progress_file, 'wb') as f:
+            f.write(json_codec.dumps_document(progress))
 
         # Update latest pointer
         latest_file = self._base_path / "latest.json"
-        with open(latest_file, 'w', encoding='utf-8') as f:
-            json.dump({
+        with open(latest_file, 'wb') as f:
+            f.write(json_codec.dumps_document({
                 "plan_id": plan.plan_id,
                 "title": plan.title,
                 "status": plan.status.value,
                 "progress": progress,
-            }, f, indent=2)
+            }))
 
     def report_plan_created(self, plan: TodoPlan) -> None:
         """Report new plan to filesystem."""
@@ -19,6 +19,7 @@ from .storage import TodoStorage, create_storage, InMemoryStorage
 from .channels import TodoReporter, ConsoleReporter, create_reporter
 from .config_loader import load_config, TodoConfig
 from ..base import UserCommand
+from ..plugin_context import SessionLocal, clear_session_state
 
 
 class TodoPlugin:
@@ -32,14 +33,18 @@ class TodoPlugin:
 
     Progress is reported through configurable reporters (console, webhook, file)
     using the same transport protocol patterns as the permissions plugin.
+
+    Each session has its own current plan (see plugin_context).
     """
 
+    # Plan the calling session is working on
+    _current_plan_id = SessionLocal(default=None)
+
     def __init__(self):
         self._config: Optional[TodoConfig] = None
         self._storage: Optional[TodoStorage] = None
         self._reporter: Optional[TodoReporter] = None
         self._initialized = False
-        self._current_plan_id: Optional[str] = None
 
     @property
     def name(self) -> str:
@@ -105,7 +110,7 @@ class TodoPlugin:
         self._storage = None
         self._reporter = None
         self._initialized = False
-        self._current_plan_id = None
+        clear_session_state(self)
 
     def get_tool_schemas(self) -> List[ToolSchema]:
         """Return tool schemas for TODO tools."""
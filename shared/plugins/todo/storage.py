@@ -3,13 +3,13 @@
 Provides in-memory and file-based persistence for plans.
 """
 
-import json
 import os
 from abc import ABC, abstractmethod
 from pathlib import Path
 from threading import Lock
 from typing import Dict, List, Optional
 
+from ... import json_codec
 from .models import TodoPlan
 
 
@@ -117,24 +117,23 @@ class FileStorage(TodoStorage):
     def _save_plan_to_file(self, plan: TodoPlan) -> None:
         """Save plan to individual file in directory."""
         plan_file = self._path / f"{plan.plan_id}.json"
-        with open(plan_file, 'w', encoding='utf-8') as f:
-            json.dump(plan.to_dict(), f, indent=2)
+        with open(plan_file, 'wb') as f:
+            f.write(json_codec.dumps_document(plan.to_dict()))
 
     def _save_plan_to_single_file(self, plan: TodoPlan) -> None:
         """Save plan to single JSON file."""
         plans = self._load_all_plans_from_file()
         plans[plan.plan_id] = plan.to_dict()
-        with open(self._path, 'w', encoding='utf-8') as f:
-            json.dump(plans, f, indent=2)
+        with open(self._path, 'wb') as f:
+            f.write(json_codec.dumps_document(plans))
 
     def _load_all_plans_from_file(self) -> Dict[str, dict]:
         """Load all plans from single file."""
         if not self._path.exists():
             return {}
         try:
-            with open(self._path, 'r', encoding='utf-8') as f:
-                return json.load(f)
-        except (json.JSONDecodeError, IOError):
+            return json_codec.loads(self._path.read_bytes())
+        except (json_codec.JSONDecodeError, IOError):
             return {}
 
     def get_plan(self, plan_id: str) -> Optional[TodoPlan]:
@@ -151,10 +150,9 @@ class FileStorage(TodoStorage):
         if not plan_file.exists():
             return None
         try:
-            with open(plan_file, 'r', encoding='utf-8') as f:
-                data = json.load(f)
+            data = json_codec.loads(plan_file.read_bytes())
             return TodoPlan.from_dict(data)
-        except (json.JSONDecodeError, IOError):
+        except (json_codec.JSONDecodeError, IOError):
             return None
 
     def _get_plan_from_single_file(self, plan_id: str) -> Optional[TodoPlan]:
@@ -179,10 +177,9 @@ class FileStorage(TodoStorage):
             return plans
         for plan_file in self._path.glob("*.json"):
             try:
-                with open(plan_file, 'r', encoding='utf-8') as f:
-                    data = json.load(f)
+                data = json_codec.loads(plan_file.read_bytes())
                 plans.append(TodoPlan.from_dict(data))
-            except (json.JSONDecodeError, IOError):
+            except (json_codec.JSONDecodeError, IOError):
                 continue
         return plans
 
@@ -213,8 +210,8 @@ class FileStorage(TodoStorage):
         if plan_id not in plans:
             return False
         del plans[plan_id]
-        with open(self._path, 'w', encoding='utf-8') as f:
-            json.dump(plans, f, indent=2)
+        with open(self._path, 'wb') as f:
+            f.write(json_codec.dumps_document(plans))
         return True
 
     def clear(self) -> None:
@@ -225,8 +222,8 @@ class FileStorage(TodoStorage):
                     plan_file.unlink()
             else:
                 if self._path.exists():
-                    with open(self._path, 'w', encoding='utf-8') as f:
-                        json.dump({}, f)
+                    with open(self._path, 'wb') as f:
+                        f.write(json_codec.dumps_document({}))
 
 
 class HybridStorage(TodoStorage):
@@ -4,11 +4,14 @@ import json
 import os
 import tempfile
 from pathlib import Path
-from unittest.mock import Mock, patch
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from unittest.mock import Mock
 
 import pytest
 
-from ..models import TodoPlan, StepStatus
+from ..models import ProgressEvent, TodoPlan, StepStatus
 from ..channels import (
     ConsoleReporter,
     WebhookReporter,
@@ -204,6 +207,34 @@ class TestFileReporter:
             reporter.initialize({})
 
 
+@pytest.fixture
+def webhook_server():
+    """Local HTTP server recording (path, headers, JSON body) of each POST."""
+    class Handler(BaseHTTPRequestHandler):
+        protocol_version = "HTTP/1.1"
+
+        def do_POST(self):
+            body = json.loads(self.rfile.read(int(self.headers["Content-Length"])))
+            time.sleep(server.delay)
+            server.requests.append((self.path, dict(self.headers), body))
+            self.send_response(200)
+            self.send_header("Content-Length", "0")
+            self.end_headers()
+
+        def log_message(self, *args):
+            pass
+
+    server = ThreadingHTTPServer(("127.0.0.1", 0), Handler)
+    server.daemon_threads = True
+    server.requests = []
+    server.delay = 0.0
+    server.url = f"http://127.0.0.1:{server.server_address[1]}/webhook"
+    threading.Thread(target=server.serve_forever, args=(0.05,), daemon=True).start()
+    yield server
+    server.shutdown()
+    server.server_close()
+
+
 class TestWebhookReporter:
     """Tests for WebhookReporter."""
 
@@ -216,60 +247,87 @@ class TestWebhookReporter:
         with pytest.raises(ValueError, match="endpoint"):
             reporter.initialize({})
 
-    @patch('shared.plugins.todo.channels.requests')
-    def test_report_plan_created(self, mock_requests):
-        mock_requests.post.return_value.status_code = 200
-
+    def test_report_plan_created(self, webhook_server):
         reporter = WebhookReporter()
         reporter.initialize({
-            "endpoint": "https://example.com/webhook",
+            "endpoint": webhook_server.url,
             "timeout": 5
         })
 
         plan = TodoPlan.create("Test", ["A"])
         reporter.report_plan_created(plan)
+        reporter.shutdown()
 
-        mock_requests.post.assert_called_once()
-        call_args = mock_requests.post.call_args
-        assert call_args[0][0] == "https://example.com/webhook"
-
-        # Check JSON payload
-        payload = call_args[1]["json"]
+        assert len(webhook_server.requests) == 1
+        path, _, payload = webhook_server.requests[0]
+        assert path == "/webhook"
         assert payload["event_type"] == "plan_created"
         assert payload["plan_id"] == plan.plan_id
 
-    @patch('shared.plugins.todo.channels.requests')
-    def test_report_with_auth_token(self, mock_requests):
-        mock_requests.post.return_value.status_code = 200
-
+    def test_report_with_auth_token(self, webhook_server):
         reporter = WebhookReporter()
         reporter.initialize({
-            "endpoint": "https://example.com/webhook",
+            "endpoint": webhook_server.url,
             "auth_token": "secret-token"
         })
 
         plan = TodoPlan.create("Test", ["A"])
         reporter.report_plan_created(plan)
+        reporter.shutdown()
 
-        headers = mock_requests.post.call_args[1]["headers"]
+        headers = webhook_server.requests[0][1]
         assert headers["Authorization"] == "Bearer secret-token"
 
-    @patch('shared.plugins.todo.channels.requests')
-    def test_report_with_custom_headers(self, mock_requests):
-        mock_requests.post.return_value.status_code = 200
-
+    def test_report_with_custom_headers(self, webhook_server):
         reporter = WebhookReporter()
         reporter.initialize({
-            "endpoint": "https://example.com/webhook",
+            "endpoint": webhook_server.url,
             "headers": {"X-Custom": "value"}
         })
 
         plan = TodoPlan.create("Test", ["A"])
         reporter.report_plan_created(plan)
+        reporter.shutdown()
 
-        headers = mock_requests.post.call_args[1]["headers"]
+        headers = webhook_server.requests[0][1]
         assert headers["X-Custom"] == "value"
 
+    def test_events_do_not_wait_for_endpoint(self, webhook_server):
+        webhook_server.delay = 0.3
+        reporter = WebhookReporter()
+        reporter.initialize({"endpoint": webhook_server.url})
+
+        plan = TodoPlan.create("Test", ["A", "B"])
+        started = time.monotonic()
+        reporter.report_plan_created(plan)
+        for step in plan.steps:
+            step.start()
+            reporter.report_step_update(plan, step)
+        assert time.monotonic() - started < 0.2
+
+        reporter.shutdown()
+        event_types = [payload["event_type"] for _, _, payload in webhook_server.requests]
+        assert event_types == ["plan_created", "step_in_progress", "step_in_progress"]
+
+    def test_batched_events(self, webhook_server):
+        reporter = WebhookReporter()
+        reporter.initialize({"endpoint": webhook_server.url, "batch_size": 10})
+
+        plan = TodoPlan.create("Test", ["A"])
+        reporter.report_plan_created(plan)
+        reporter.shutdown()
+
+        payload = webhook_server.requests[0][2]
+        assert [event["event_type"] for event in payload["events"]] == ["plan_created"]
+
+    def test_synchronous_delivery(self, webhook_server):
+        reporter = WebhookReporter()
+        reporter.initialize({"endpoint": webhook_server.url, "async": False})
+
+        plan = TodoPlan.create("Test", ["A"])
+        assert reporter._send_event(ProgressEvent.create("plan_created", plan)) is True
+        assert len(webhook_server.requests) == 1
+
 
 class TestMultiReporter:
     """Tests for MultiReporter."""
@@ -0,0 +1,172 @@
+"""Tests for file_watcher - shared waiting for response files."""
+
+import json
+import os
+import sys
+import threading
+import time
+
+import pytest
+
+from ..file_watcher import FileWatcher, _Inotify, claim_json, write_json_atomic
+
+
+HAS_INOTIFY = _Inotify.create() is not None
+
+MODES = [
+    pytest.param(True, id="inotify", marks=pytest.mark.skipif(not HAS_INOTIFY, reason="inotify unavailable")),
+    pytest.param(False, id="poll"),
+]
+
+
+def write_later(path, data, delay=0.1):
+    def write():
+        time.sleep(delay)
+        write_json_atomic(path, data)
+
+    thread = threading.Thread(target=write)
+    thread.start()
+    return thread
+
+
+class TestFileWatcher:
+    """Tests for waiting on files with inotify and by polling."""
+
+    @pytest.mark.parametrize("use_inotify", MODES)
+    def test_notices_new_file(self, tmp_path, use_inotify):
+        watcher = FileWatcher(use_inotify=use_inotify, poll_interval=0.05)
+        target = tmp_path / "response.json"
+        thread = write_later(target, {"ok": True})
+
+        assert watcher.wait_for(target, timeout=5)
+        thread.join()
+        assert watcher.mode == ("inotify" if use_inotify else "poll")
+
+    @pytest.mark.parametrize("use_inotify", MODES)
+    def test_timeout(self, tmp_path, use_inotify):
+        watcher = FileWatcher(use_inotify=use_inotify, poll_interval=0.05)
+
+        started = time.monotonic()
+        assert not watcher.wait_for(tmp_path / "missing.json", timeout=0.2)
+        assert 0.15 < time.monotonic() - started < 2
+
+    @pytest.mark.parametrize("use_inotify", MODES)
+    def test_existing_file(self, tmp_path, use_inotify):
+        watcher = FileWatcher(use_inotify=use_inotify, poll_interval=10)
+        target = tmp_path / "response.json"
+        target.write_text("{}")
+
+        assert watcher.wait_for(target, timeout=0)
+
+    @pytest.mark.skipif(not HAS_INOTIFY, reason="inotify unavailable")
+    def test_inotify_does_not_wait_for_poll_interval(self, tmp_path):
+        watcher = FileWatcher(poll_interval=10)
+        target = tmp_path / "response.json"
+        thread = write_later(target, {})
+
+        started = time.monotonic()
+        assert watcher.wait_for(target, timeout=5)
+        assert time.monotonic() - started < 2
+        thread.join()
+
+    @pytest.mark.skipif(not HAS_INOTIFY, reason="inotify unavailable")
+    def test_recreated_directory_is_watched_again(self, tmp_path):
+        watcher = FileWatcher(poll_interval=10)
+        directory = tmp_path / "responses"
+        directory.mkdir()
+        assert not watcher.wait_for(directory / "a.json", timeout=0.05)
+
+        directory.rmdir()
+        directory.mkdir()
+        time.sleep(0.1)  # Let the watcher see the old watch go
+        thread = write_later(directory / "b.json", {})
+
+        assert watcher.wait_for(directory / "b.json", timeout=3)
+        thread.join()
+
+    @pytest.mark.parametrize("use_inotify", MODES)
+    def test_one_thread_serves_all_waits(self, tmp_path, use_inotify):
+        watcher = FileWatcher(use_inotify=use_inotify, poll_interval=0.05)
+        before = threading.active_count()
+        results = {}
+
+        def wait(n):
+            results[n] = watcher.wait_for(tmp_path / f"{n}.json", timeout=5)
+
+        waiters = [threading.Thread(target=wait, args=(n,)) for n in range(20)]
+        for thread in waiters:
+            thread.start()
+        time.sleep(0.1)
+        assert threading.active_count() == before + 20 + 1
+
+        for n in range(20):
+            write_json_atomic(tmp_path / f"{n}.json", {"n": n})
+        for thread in waiters:
+            thread.join()
+        assert all(results[n] for n in range(20))
+
+
+class TestClaimJson:
+    """Tests for rename-based response pickup."""
+
+    def test_claim_consumes_file(self, tmp_path):
+        target = tmp_path / "response.json"
+        write_json_atomic(target, {"decision": "allow"})
+
+        assert claim_json(target) == {"decision": "allow"}
+        assert os.listdir(tmp_path) == []
+        with pytest.raises(FileNotFoundError):
+            claim_json(target)
+
+    def test_only_one_reader_gets_a_response(self, tmp_path):
+        target = tmp_path / "response.json"
+        write_json_atomic(target, {"n": 1})
+        results = []
+        barrier = threading.Barrier(8)
+
+        def claim():
+            barrier.wait()
+            try:
+                results.append(claim_json(target))
+            except FileNotFoundError:
+                pass
+
+        threads = [threading.Thread(target=claim) for _ in range(8)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        assert results == [{"n": 1}]
+
+    @pytest.mark.skipif(sys.platform == "win32", reason="open files cannot be renamed")
+    def test_waits_for_in_place_writer(self, tmp_path):
+        target = tmp_path / "response.json"
+        f = open(target, "w")
+        f.write('{"decision": ')
+        f.flush()
+
+        def finish():
+            time.sleep(0.1)
+            f.write('"allow"}')
+            f.close()
+
+        thread = threading.Thread(target=finish)
+        thread.start()
+        assert claim_json(target) == {"decision": "allow"}
+        thread.join()
+
+    def test_invalid_json_raises(self, tmp_path):
+        target = tmp_path / "response.json"
+        target.write_text("not json")
+
+        with pytest.raises(json.JSONDecodeError):
+            claim_json(target)
+        assert os.listdir(tmp_path) == []
+
+    def test_write_is_atomic(self, tmp_path):
+        target = tmp_path / "request.json"
+        write_json_atomic(target, {"a": [1, 2]})
+
+        assert json.loads(target.read_text()) == {"a": [1, 2]}
+        assert os.listdir(tmp_path) == ["request.json"]
@@ -0,0 +1,232 @@
+"""Tests for http_transport - pooled webhook transport and event sender."""
+
+import json
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+import pytest
+import requests
+
+from ..http_transport import EventSender, HttpTransport
+
+
+class StubServer:
+    """Local HTTP server recording the JSON bodies posted to it.
+
+    statuses: status codes to answer with, in turn (then 200).
+    delay: seconds each request takes.
+    gate: if set, requests wait for it before answering.
+    """
+
+    def __init__(self, statuses=(), delay=0.0, gate=None):
+        self.bodies = []
+        self.ports = []
+        self.received = threading.Event()
+        self.active = 0
+        self.max_active = 0
+        self._statuses = list(statuses)
+        self._lock = threading.Lock()
+        stub = self
+
+        class Handler(BaseHTTPRequestHandler):
+            protocol_version = "HTTP/1.1"  # Keep-alive
+
+            def do_POST(self):
+                body = json.loads(self.rfile.read(int(self.headers["Content-Length"])))
+                with stub._lock:
+                    stub.bodies.append(body)
+                    stub.ports.append(self.client_address[1])
+                    stub.active += 1
+                    stub.max_active = max(stub.max_active, stub.active)
+                    status = stub._statuses.pop(0) if stub._statuses else 200
+                stub.received.set()
+                if gate is not None:
+                    gate.wait(5)
+                time.sleep(delay)
+                with stub._lock:
+                    stub.active -= 1
+                self.send_response(status)
+                self.send_header("Content-Length", "2")
+                self.end_headers()
+                self.wfile.write(b"{}")
+
+            def log_message(self, *args):
+                pass
+
+        self._server = ThreadingHTTPServer(("127.0.0.1", 0), Handler)
+        self._server.daemon_threads = True
+        self.url = f"http://127.0.0.1:{self._server.server_address[1]}/hook"
+        threading.Thread(target=self._server.serve_forever, args=(0.05,), daemon=True).start()
+
+    def close(self):
+        self._server.shutdown()
+        self._server.server_close()
+
+
+@pytest.fixture
+def make_server():
+    servers = []
+
+    def make(**kwargs):
+        servers.append(StubServer(**kwargs))
+        return servers[-1]
+
+    yield make
+    for server in servers:
+        server.close()
+
+
+class TestHttpTransport:
+    """Tests for pooled, bounded posting."""
+
+    def test_post_reuses_connection(self, make_server):
+        server = make_server()
+        transport = HttpTransport()
+
+        for n in range(3):
+            response = transport.post(server.url, json={"n": n}, timeout=5)
+            assert response.status_code == 200
+
+        assert server.bodies == [{"n": 0}, {"n": 1}, {"n": 2}]
+        assert len(set(server.ports)) == 1
+        transport.close()
+
+    def test_in_flight_requests_are_bounded(self, make_server):
+        server = make_server(delay=0.1)
+        transport = HttpTransport(max_in_flight=2)
+
+        threads = [
+            threading.Thread(target=transport.post, args=(server.url,), kwargs={"json": {}, "timeout": 5})
+            for _ in range(6)
+        ]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        assert len(server.bodies) == 6
+        assert server.max_active <= 2
+        transport.close()
+
+    def test_waiting_for_a_slot_counts_against_timeout(self, make_server):
+        gate = threading.Event()
+        server = make_server(gate=gate)
+        transport = HttpTransport(max_in_flight=1)
+        thread = threading.Thread(target=transport.post, args=(server.url,), kwargs={"json": {}, "timeout": 5})
+        thread.start()
+        assert server.received.wait(5)
+
+        with pytest.raises(requests.Timeout):
+            transport.post(server.url, json={}, timeout=0.1)
+
+        gate.set()
+        thread.join()
+        transport.close()
+
+    def test_slot_wait_shortens_request_timeout(self, make_server):
+        server = make_server(delay=0.5)
+        transport = HttpTransport(max_in_flight=1)
+        thread = threading.Thread(target=transport.post, args=(server.url,), kwargs={"json": {}, "timeout": 5})
+        thread.start()
+        assert server.received.wait(5)
+
+        started = time.monotonic()
+        with pytest.raises(requests.Timeout):
+            transport.post(server.url, json={}, timeout=0.7)
+        assert time.monotonic() - started < 1.0
+
+        thread.join()
+        transport.close()
+
+
+class TestEventSender:
+    """Tests for background event delivery."""
+
+    def test_send_does_not_wait_for_endpoint(self, make_server):
+        server = make_server(delay=0.3)
+        sender = EventSender(server.url, transport=HttpTransport())
+
+        started = time.monotonic()
+        for n in range(3):
+            assert sender.send({"n": n})
+        assert time.monotonic() - started < 0.2
+
+        assert sender.flush(5)
+        assert server.bodies == [{"n": 0}, {"n": 1}, {"n": 2}]
+        assert sender.sent == 3
+        sender.close()
+
+    def test_events_queued_meanwhile_are_batched(self, make_server):
+        gate = threading.Event()
+        server = make_server(gate=gate)
+        sender = EventSender(server.url, transport=HttpTransport(), batch_size=10)
+
+        for n in range(5):
+            sender.send({"n": n})
+        gate.set()
+        assert sender.flush(5)
+
+        assert len(server.bodies) <= 2
+        events = [event for body in server.bodies for event in body["events"]]
+        assert events == [{"n": n} for n in range(5)]
+        sender.close()
+
+    def test_retries_server_errors(self, make_server):
+        server = make_server(statuses=[503, 500])
+        sender = EventSender(server.url, transport=HttpTransport(), retry_backoff=0.01)
+
+        sender.send({"n": 1})
+        assert sender.flush(5)
+
+        assert len(server.bodies) == 3
+        assert (sender.sent, sender.failed) == (1, 0)
+        sender.close()
+
+    def test_client_errors_are_not_retried(self, make_server):
+        server = make_server(statuses=[400])
+        sender = EventSender(server.url, transport=HttpTransport(), retry_backoff=0.01)
+
+        sender.send({"n": 1})
+        assert sender.flush(5)
+
+        assert len(server.bodies) == 1
+        assert (sender.sent, sender.failed) == (0, 1)
+        sender.close()
+
+    def test_unreachable_endpoint_gives_up(self, make_server):
+        server = make_server()
+        url = server.url
+        server.close()
+        sender = EventSender(url, transport=HttpTransport(), timeout=1, retries=1, retry_backoff=0.01)
+
+        sender.send({"n": 1})
+        assert sender.flush(5)
+        assert sender.failed == 1
+        sender.close()
+
+    def test_full_queue_drops_new_events(self, make_server):
+        gate = threading.Event()
+        server = make_server(gate=gate)
+        sender = EventSender(server.url, transport=HttpTransport(), max_queue=2)
+
+        sender.send({"n": 0})
+        assert server.received.wait(5)  # n=0 is being delivered
+        assert sender.send({"n": 1})
+        assert sender.send({"n": 2})
+        assert not sender.send({"n": 3})
+
+        gate.set()
+        assert sender.flush(5)
+        assert [body["n"] for body in server.bodies] == [0, 1, 2]
+        assert sender.dropped == 1
+        sender.close()
+
+    def test_closed_sender_drops_events(self, make_server):
+        server = make_server()
+        sender = EventSender(server.url, transport=HttpTransport())
+        sender.send({"n": 1})
+        sender.close()
+
+        assert server.bodies == [{"n": 1}]
+        assert not sender.send({"n": 2})
@@ -4,6 +4,7 @@ import pytest
 from unittest.mock import MagicMock, patch
 
 from ..jaato_session import JaatoSession
+from ..plugins.plugin_context import PluginContext, use_plugin_context
 
 
 class TestJaatoSessionInitialization:
@@ -33,6 +34,14 @@ class TestJaatoSessionInitialization:
         assert session._agent_name is None
 
 
+    def test_plugin_context(self):
+        """Test that the plugin context is stored (None for the root context)."""
+        context = PluginContext("sub")
+
+        assert JaatoSession(MagicMock(), "gemini-2.5-flash").plugin_context is None
+        assert JaatoSession(MagicMock(), "gemini-2.5-flash", context).plugin_context is context
+
+
 class TestJaatoSessionSetAgentContext:
     """Tests for JaatoSession.set_agent_context()."""
 
@@ -269,6 +278,120 @@ class TestJaatoSessionGCPlugin:
             session.manual_gc()
 
 
+class TestJaatoSessionToolLoopGC:
+    """Tests for GC checkpoints between tool-result rounds."""
+
+    def _make_session(self, history, gc_config):
+        from ..plugins.gc_truncate import create_plugin
+        from ..plugins.model_provider.types import FunctionCall, ProviderResponse, TokenUsage
+
+        mock_runtime = MagicMock()
+        mock_provider = MagicMock()
+        mock_provider.get_history.return_value = history
+        mock_provider.get_context_limit.return_value = 1000
+
+        tool_call = ProviderResponse(
+            function_calls=[FunctionCall(id="c9", name="readFile", args={})],
+            usage=TokenUsage(prompt_tokens=900, output_tokens=10, total_tokens=910),
+        )
+        final = ProviderResponse(
+            text="Done",
+            usage=TokenUsage(prompt_tokens=100, output_tokens=5, total_tokens=105),
+        )
+        mock_provider.send_message.return_value = tool_call
+        mock_provider.send_tool_results.return_value = final
+
+        mock_runtime.create_provider.return_value = mock_provider
+        mock_runtime.get_tool_schemas.return_value = []
+        mock_runtime.get_executors.return_value = {"readFile": lambda args: {"content": "y"}}
+        mock_runtime.get_system_instructions.return_value = None
+        mock_runtime.registry = None
+        mock_runtime.permission_plugin = None
+        mock_runtime.ledger = None
+
+        session = JaatoSession(mock_runtime, "gemini-2.5-flash")
+        session.configure()
+
+        plugin = create_plugin()
+        plugin.initialize()
+        session.set_gc_plugin(plugin, gc_config)
+        return session, mock_provider
+
+    def _make_history(self):
+        from ..plugins.model_provider.types import (
+            FunctionCall, Message, Part, Role, ToolResult
+        )
+
+        history = []
+        for i in range(3):
+            history.append(Message.from_text(Role.USER, f"Old question {i}"))
+            history.append(Message.from_text(Role.MODEL, f"Old answer {i}"))
+
+        history.append(Message.from_text(Role.USER, "Read all the files"))
+        for i in range(4):
+            history.append(Message(role=Role.MODEL, parts=[
+                Part.from_function_call(FunctionCall(id=f"c{i}", name="readFile", args={}))
+            ]))
+            history.append(Message(role=Role.USER, parts=[
+                Part.from_function_response(ToolResult(
+                    call_id=f"c{i}", name="readFile", result={"content": "x" * 2000}
+                ))
+            ]))
+        return history
+
+    def test_collects_between_rounds(self):
+        """GC runs before send_tool_results when the loop fills the context."""
+        from ..plugins.gc import GCConfig, GCTriggerReason
+
+        config = GCConfig(
+            threshold_percent=80.0,
+            preserve_recent_turns=1,
+            check_before_send=False,
+            preserve_recent_tool_rounds=1,
+        )
+        session, provider = self._make_session(self._make_history(), config)
+
+        assert session.send_message("Read all the files") == "Done"
+
+        gc_history = session.get_gc_history()
+        assert len(gc_history) == 1
+        result = gc_history[0]
+        assert result.trigger_reason == GCTriggerReason.TOOL_LOOP
+        assert result.items_collected == 3
+        assert result.details["tool_results_compacted"] == 3
+
+        # Provider chat re-created with compacted history before sending
+        new_history = provider.create_session.call_args.kwargs["history"]
+        assert new_history[0].text == "Read all the files"
+        provider.send_tool_results.assert_called_once()
+
+    def test_disabled(self):
+        """No checkpoint when check_during_tool_loop is False."""
+        from ..plugins.gc import GCConfig
+
+        config = GCConfig(
+            threshold_percent=80.0,
+            check_before_send=False,
+            check_during_tool_loop=False,
+        )
+        session, _ = self._make_session(self._make_history(), config)
+
+        session.send_message("Read all the files")
+
+        assert session.get_gc_history() == []
+
+    def test_below_threshold(self):
+        """No checkpoint when the in-flight context is below threshold."""
+        from ..plugins.gc import GCConfig
+
+        config = GCConfig(threshold_percent=99.0, check_before_send=False)
+        session, _ = self._make_session(self._make_history(), config)
+
+        session.send_message("Read all the files")
+
+        assert session.get_gc_history() == []
+
+
 class TestJaatoSessionPluginIntegration:
     """Tests for JaatoSession session plugin integration."""
 
@@ -333,3 +456,233 @@ class TestJaatoSessionGenerate:
         result = session.generate("Hello")
 
         assert result == "Generated text"
+
+
+class TestJaatoSessionPagedResume:
+    """Tests for resuming only the last turns of a saved session."""
+
+    @pytest.fixture
+    def storage(self, tmp_path):
+        return str(tmp_path)
+
+    def _make_session(self, storage, recent_turns=None):
+        from ..plugins.session import SessionConfig
+        from ..plugins.session.file_session import FileSessionPlugin
+
+        mock_runtime = MagicMock()
+        mock_provider = MagicMock()
+        live = {"history": []}
+        mock_provider.create_session.side_effect = (
+            lambda system_instruction=None, tools=None, history=None:
+            live.update(history=list(history or []))
+        )
+        mock_provider.get_history.side_effect = lambda: list(live["history"])
+        mock_runtime.create_provider.return_value = mock_provider
+        mock_runtime.get_tool_schemas.return_value = []
+        mock_runtime.get_executors.return_value = {}
+        mock_runtime.get_system_instructions.return_value = None
+        mock_runtime.registry = None
+        mock_runtime.permission_plugin = None
+        mock_runtime.project = "test-project"
+        mock_runtime.location = "us-central1"
+
+        session = JaatoSession(mock_runtime, "gemini-2.5-flash")
+        session.configure()
+
+        plugin = FileSessionPlugin()
+        plugin.initialize({"storage_path": storage, "background_writes": False})
+        session.set_session_plugin(plugin, SessionConfig(
+            storage_path=storage, resume_recent_turns=recent_turns
+        ))
+        return session, live
+
+    def _make_history(self, turns):
+        from ..plugins.model_provider.types import Message, Role
+
+        history = []
+        for i in range(turns):
+            history.append(Message.from_text(Role.USER, f"Question {i}"))
+            history.append(Message.from_text(Role.MODEL, f"Answer {i}"))
+        return history
+
+    def _save(self, storage, turns):
+        session, _ = self._make_session(storage)
+        history = self._make_history(turns)
+        session.reset_session(history)
+        session._turn_accounting = [{"prompt": 1, "output": 1, "total": 2}] * turns
+        session.save_session("s1")
+        return history
+
+    def test_resume_loads_recent_turns(self, storage):
+        history = self._save(storage, 10)
+        session, live = self._make_session(storage, recent_turns=3)
+
+        session.resume_session("s1")
+
+        assert len(live["history"]) == 6
+        assert "7 earlier turn(s)" in live["history"][0].parts[0].text
+        assert live["history"][0].parts[1].text == "Question 7"
+        assert session.get_paged_turn_count() == 7
+        assert session.get_full_history() == history
+        assert len(session.get_turn_accounting()) == 10
+
+    def test_save_keeps_paged_out_turns(self, storage):
+        from ..plugins.model_provider.types import Message, Role
+
+        history = self._save(storage, 10)
+        session, live = self._make_session(storage, recent_turns=3)
+        session.resume_session("s1")
+
+        live["history"].append(Message.from_text(Role.USER, "Question 10"))
+        session.save_session("s1")
+
+        reloaded, _ = self._make_session(storage)
+        state = reloaded._session_plugin.load("s1")
+        assert state.history[:20] == history
+        assert state.history[20].text == "Question 10"
+
+    def test_revert_within_loaded_turns(self, storage):
+        self._save(storage, 10)
+        session, live = self._make_session(storage, recent_turns=3)
+        session.resume_session("s1")
+
+        result = session.revert_to_turn(9)
+
+        assert result["turns_removed"] == 1
+        assert len(live["history"]) == 4
+        assert session.get_paged_turn_count() == 7
+
+    def test_revert_to_older_turn_pages_in(self, storage):
+        history = self._save(storage, 10)
+        session, live = self._make_session(storage, recent_turns=3)
+        session.resume_session("s1")
+
+        session.revert_to_turn(2)
+
+        assert live["history"] == history[:4]
+        assert session.get_paged_turn_count() == 0
+
+    def test_reset_ends_paging(self, storage):
+        self._save(storage, 10)
+        session, _ = self._make_session(storage, recent_turns=3)
+        session.resume_session("s1")
+
+        session.reset_session()
+
+        assert session.get_paged_turn_count() == 0
+        assert session.get_full_history() == []
+
+
+class TestJaatoSessionFork:
+    """Tests for branching a session with fork()."""
+
+    @pytest.fixture
+    def storage(self, tmp_path):
+        return str(tmp_path)
+
+    def _make_provider(self):
+        provider = MagicMock()
+        provider.live = []
+
+        def create_session(system_instruction=None, tools=None, history=None):
+            provider.live = list(history or [])
+
+        provider.create_session.side_effect = create_session
+        provider.get_history.side_effect = lambda: list(provider.live)
+        return provider
+
+    def _make_session(self, storage=None):
+        from ..plugins.model_provider.types import Message, Role
+        from ..plugins.session import SessionConfig
+        from ..plugins.session.file_session import FileSessionPlugin
+
+        mock_runtime = MagicMock()
+        mock_runtime.create_provider.side_effect = lambda model: self._make_provider()
+        mock_runtime.get_tool_schemas.return_value = []
+        mock_runtime.get_executors.return_value = {}
+        mock_runtime.get_system_instructions.return_value = "Be helpful."
+        mock_runtime.registry = None
+        mock_runtime.permission_plugin = None
+        mock_runtime.project = "test-project"
+        mock_runtime.location = "us-central1"
+
+        session = JaatoSession(mock_runtime, "gemini-2.5-flash")
+        session.configure()
+        if storage:
+            plugin = FileSessionPlugin()
+            plugin.initialize({"storage_path": storage, "background_writes": False})
+            session.set_session_plugin(plugin, SessionConfig(storage_path=storage))
+
+        history = []
+        for i in range(3):
+            history.append(Message.from_text(Role.USER, f"Question {i}"))
+            history.append(Message.from_text(Role.MODEL, f"Answer {i}"))
+        session.reset_session(history)
+        session._turn_accounting = [{"prompt": 1, "output": 1, "total": 2}] * 3
+        return session
+
+    def test_fork_requires_configured_session(self):
+        session = JaatoSession(MagicMock(), "gemini-2.5-flash")
+
+        with pytest.raises(RuntimeError):
+            session.fork()
+
+    def test_fork_shares_messages_and_diverges(self):
+        from ..plugins.model_provider.types import Message, Role
+
+        session = self._make_session()
+        branch = session.fork()
+
+        assert branch._provider is not session._provider
+        assert all(a is b for a, b in zip(branch.get_history(), session.get_history()))
+        assert branch._system_instruction == "Be helpful."
+
+        branch._provider.live.append(Message.from_text(Role.USER, "Branch question"))
+        branch._turn_accounting.append({"prompt": 5, "output": 5, "total": 10})
+        branch.revert_to_turn(1)
+
+        assert len(session.get_history()) == 6
+        assert len(session.get_turn_accounting()) == 3
+        assert len(branch.get_history()) == 2
+
+    def test_fork_is_saved_as_delta(self, storage):
+        from ..plugins.model_provider.types import Message, Role
+
+        session = self._make_session(storage)
+        branch = session.fork("branch")
+        branch._provider.live.append(Message.from_text(Role.USER, "Branch question"))
+
+        assert branch.save_session() == "branch"
+
+        plugin = session._session_plugin
+        parent_id = plugin.get_current_session_id()
+        assert parent_id != "branch"
+        state = plugin.load("branch")
+        assert state.fork.session_id == parent_id
+        assert state.history == branch.get_history()
+        assert plugin._journals["branch"].snapshot_bytes < plugin._journals[parent_id].snapshot_bytes
+
+    def test_fork_gets_copy_of_plugin_state(self, storage):
+        session = self._make_session(storage)
+        plugin = session._session_plugin
+
+        branch = session.fork("branch")
+        parent_id = plugin.get_current_session_id()
+        branch.save_session()
+
+        assert branch.plugin_context is not None
+        assert branch.plugin_context is not session.plugin_context
+        assert plugin.get_current_session_id() == parent_id
+        with use_plugin_context(branch.plugin_context):
+            assert plugin.get_current_session_id() == "branch"
+
+    def test_reverted_fork_is_saved_in_full(self, storage):
+        session = self._make_session(storage)
+        branch = session.fork("branch")
+
+        branch.revert_to_turn(1)
+        branch.save_session()
+
+        state = session._session_plugin.load("branch")
+        assert state.fork is None
+        assert len(state.history) == 2
@@ -0,0 +1,71 @@
+"""Tests for json_codec - JSON encoding for persistence paths."""
+
+import json
+import pytest
+
+from .. import json_codec
+
+
+@pytest.fixture(params=["fast", "json"])
+def backend(request, monkeypatch):
+    """Run a test with the installed backend and with the stdlib fallback."""
+    if request.param == "json":
+        monkeypatch.setattr(json_codec, "HAS_ORJSON", False)
+        monkeypatch.setattr(json_codec, "HAS_MSGSPEC", False)
+    return request.param
+
+
+class TestJsonCodec:
+    """Tests for encoding and decoding with every backend."""
+
+    def test_round_trip(self, backend):
+        value = {"text": "héllo ✓", "n": [1, 2.5, None, True], "nested": {"a": {}}}
+
+        encoded = json_codec.dumps(value)
+
+        assert isinstance(encoded, bytes)
+        assert json_codec.loads(encoded) == value
+        assert json.loads(encoded) == value
+
+    def test_output_matches_stdlib(self, backend):
+        value = {"b": "ü", "a": [1, {"c": None}]}
+
+        assert json_codec.dumps(value) == json.dumps(
+            value, ensure_ascii=False, separators=(',', ':')
+        ).encode('utf-8')
+        assert json_codec.dumps(value, sort_keys=True) == b'{"a":[1,{"c":null}],"b":"\xc3\xbc"}'
+
+    def test_non_string_keys(self, backend):
+        assert json_codec.loads(json_codec.dumps({1: "a"})) == {"1": "a"}
+
+    def test_default(self, backend):
+        encoded = json_codec.dumps({"s": {1}}, default=lambda o: sorted(o))
+
+        assert json_codec.loads(encoded) == {"s": [1]}
+
+    def test_unsupported_value_raises_type_error(self, backend):
+        with pytest.raises(TypeError):
+            json_codec.dumps({"s": object()})
+
+    def test_big_integers_fall_back_to_stdlib(self, backend):
+        value = {"n": 2 ** 70}
+
+        assert json_codec.loads(json_codec.dumps(value)) == value
+
+    def test_loads_accepts_str_and_memoryview(self, backend):
+        assert json_codec.loads('{"a":1}') == {"a": 1}
+        assert json_codec.loads(memoryview(b'{"a":1}')) == {"a": 1}
+
+    def test_invalid_json_raises_decode_error(self, backend):
+        with pytest.raises(json.JSONDecodeError):
+            json_codec.loads(b'{"a":')
+
+    def test_documents_are_compact_by_default(self, backend):
+        assert json_codec.dumps_document({"a": [1]}) == b'{"a":[1]}'
+
+    def test_pretty_documents(self, backend, monkeypatch):
+        monkeypatch.setattr(json_codec, "PRETTY", True)
+
+        encoded = json_codec.dumps_document({"a": [1]})
+
+        assert encoded == json.dumps({"a": [1]}, indent=2).encode('utf-8')
@@ -0,0 +1,134 @@
+"""Tests for plugin_context - per-session plugin state."""
+
+import threading
+
+from ..plugins.plugin_context import (
+    PluginContext,
+    ROOT_CONTEXT,
+    SessionLocal,
+    clear_session_state,
+    current_plugin_context,
+    use_plugin_context,
+)
+
+
+class Plugin:
+    plan_id = SessionLocal(default=None)
+    images = SessionLocal(factory=dict)
+
+
+class TestSessionLocal:
+    """Tests for SessionLocal attributes."""
+
+    def test_default_and_factory(self):
+        plugin = Plugin()
+
+        assert plugin.plan_id is None
+        assert plugin.images == {}
+        plugin.images["a"] = 1
+        assert plugin.images == {"a": 1}
+
+    def test_values_are_per_instance(self):
+        first, second = Plugin(), Plugin()
+
+        first.plan_id = "p1"
+
+        assert second.plan_id is None
+
+    def test_values_are_per_context(self):
+        plugin = Plugin()
+        plugin.plan_id = "root"
+        plugin.images["root"] = 1
+
+        with use_plugin_context(PluginContext("sub")):
+            assert plugin.plan_id is None
+            assert plugin.images == {}
+            plugin.plan_id = "sub"
+            plugin.images["sub"] = 1
+
+        assert plugin.plan_id == "root"
+        assert plugin.images == {"root": 1}
+
+    def test_context_is_per_thread(self):
+        plugin = Plugin()
+        barrier = threading.Barrier(2)
+        seen = {}
+
+        def run(name):
+            with use_plugin_context(PluginContext(name)):
+                plugin.plan_id = name
+                barrier.wait()
+                seen[name] = plugin.plan_id
+
+        threads = [threading.Thread(target=run, args=(n,)) for n in ("a", "b")]
+        for t in threads:
+            t.start()
+        for t in threads:
+            t.join()
+
+        assert seen == {"a": "a", "b": "b"}
+        assert plugin.plan_id is None
+
+    def test_clear_session_state(self):
+        plugin = Plugin()
+        context = PluginContext("sub")
+        plugin.plan_id = "root"
+        with use_plugin_context(context):
+            plugin.plan_id = "sub"
+
+        clear_session_state(plugin)
+
+        assert plugin.plan_id is None
+        with use_plugin_context(context):
+            assert plugin.plan_id is None
+
+
+class TestPluginContext:
+    """Tests for activating and copying contexts."""
+
+    def test_root_context_outside_sessions(self):
+        assert current_plugin_context() is ROOT_CONTEXT
+        with use_plugin_context(None) as context:
+            assert context is ROOT_CONTEXT
+
+    def test_nesting_restores_previous_context(self):
+        outer, inner = PluginContext("outer"), PluginContext("inner")
+
+        with use_plugin_context(outer):
+            with use_plugin_context(inner):
+                assert current_plugin_context() is inner
+            assert current_plugin_context() is outer
+        assert current_plugin_context() is ROOT_CONTEXT
+
+    def test_copy_does_not_share_containers(self):
+        plugin = Plugin()
+        parent = PluginContext("parent")
+        with use_plugin_context(parent):
+            plugin.plan_id = "p1"
+            plugin.images["a"] = 1
+
+        child = parent.copy("child")
+        with use_plugin_context(child):
+            assert child.agent_id == "child"
+            assert plugin.plan_id == "p1"
+            plugin.images["b"] = 2
+
+        with use_plugin_context(parent):
+            assert plugin.images == {"a": 1}
+
+
+class TestTodoPluginIsolation:
+    """Concurrent sessions keep their own current TODO plan."""
+
+    def test_current_plan_is_per_session(self):
+        from ..plugins.todo.plugin import TodoPlugin
+
+        plugin = TodoPlugin()
+        plugin.initialize({"storage_type": "memory"})
+        try:
+            with use_plugin_context(PluginContext("a")):
+                plugin._current_plan_id = "plan-a"
+            with use_plugin_context(PluginContext("b")):
+                assert plugin._current_plan_id is None
+        finally:
+            plugin.shutdown()
@@ -1,10 +1,10 @@
 import os
 import time
 import random
-import json
 import datetime
 from typing import List, Dict, Any, Optional, TYPE_CHECKING
 import ssl
+from . import json_codec
 from .ssl_helper import log_ssl_guidance, is_ssl_cert_failure
 
 from google.api_core import exceptions as google_exceptions
@@ -160,17 +160,19 @@ class TokenLedger:
     def write_ledger(self, filepath: str = "token_events_ledger.jsonl") -> Optional[str]:
         path = os.environ.get("LEDGER_PATH", filepath)
         try:
-            with open(path, "a", encoding="utf-8") as f:
-                for idx, ev in enumerate(self._events):
-                    enriched = dict(ev)
-                    enriched["iso_ts"] = datetime.datetime.utcfromtimestamp(ev.get("ts", time.time())).isoformat() + "Z"
-                    enriched["event_index"] = idx
-                    if "prompt_tokens" in ev and "output_tokens" in ev and "total_tokens" in ev:
-                        pt = ev.get("prompt_tokens") or 0
-                        ot = ev.get("output_tokens") or 0
-                        tt = ev.get("total_tokens") or 0
-                        enriched["internal_tokens"] = tt - (pt + ot) if (pt is not None and ot is not None and tt is not None) else None
-                    f.write(json.dumps(enriched) + "\n")
+            lines = []
+            for idx, ev in enumerate(self._events):
+                enriched = dict(ev)
+                enriched["iso_ts"] = datetime.datetime.utcfromtimestamp(ev.get("ts", time.time())).isoformat() + "Z"
+                enriched["event_index"] = idx
+                if "prompt_tokens" in ev and "output_tokens" in ev and "total_tokens" in ev:
+                    pt = ev.get("prompt_tokens") or 0
+                    ot = ev.get("output_tokens") or 0
+                    tt = ev.get("total_tokens") or 0
+                    enriched["internal_tokens"] = tt - (pt + ot) if (pt is not None and ot is not None and tt is not None) else None
+                lines.append(json_codec.dumps(enriched) + b"\n")
+            with open(path, "ab") as f:
+                f.write(b"".join(lines))
             return path
         except Exception as exc:
             print(f"(Ledger write failed: {exc})")
@@ -170,7 +170,8 @@ Keyboard shortcuts:
         self,
         history: List[Any],
         turn_accounting: List[Dict[str, Any]],
-        turn_boundaries: List[Any]
+        turn_boundaries: List[Any],
+        turn_offset: int = 0
     ) -> None:
         """Print full conversation history with token accounting and turn numbers.
 
@@ -178,9 +179,11 @@ Keyboard shortcuts:
             history: List of conversation content objects.
             turn_accounting: List of token accounting dicts per turn.
             turn_boundaries: List of turn boundary markers.
+            turn_offset: Turns before the history (left on disk by a paged
+                resume); turn numbers start after them.
         """
         count = len(history)
-        total_turns = len(turn_boundaries)
+        total_turns = turn_offset + len(turn_boundaries)
 
         print(f"\n{'=' * 60}")
         print(f"  Conversation History: {count} message(s), {total_turns} turn(s)")
@@ -193,7 +196,7 @@ Keyboard shortcuts:
             return
 
         # Track which turn we're in
-        current_turn = 0
+        current_turn = turn_offset
         turn_index = 0
 
         for i, content in enumerate(history):
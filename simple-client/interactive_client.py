@@ -254,7 +254,10 @@ class InteractiveClient:
         try:
             session_config = load_session_config()
             session_plugin = create_session_plugin()
-            session_plugin.initialize({'storage_path': session_config.storage_path})
+            session_plugin.initialize({
+                **session_config.plugin_config,
+                'storage_path': session_config.storage_path,
+            })
             self._jaato.set_session_plugin(session_plugin, session_config)
 
             if self.registry:
@@ -428,7 +431,7 @@ class InteractiveClient:
             print("\n[No session to export - client not initialized]")
             return
 
-        history = self._jaato.get_history()
+        history = self._jaato.get_full_history()
         result = self._exporter.export_to_yaml(history, self._original_inputs, filename)
 
         if result['success']:
@@ -486,7 +489,8 @@ class InteractiveClient:
                 history = self._jaato.get_history() if self._jaato else []
                 turn_accounting = self._jaato.get_turn_accounting() if self._jaato else []
                 turn_boundaries = self._jaato.get_turn_boundaries() if self._jaato else []
-                self._presenter.print_history(history, turn_accounting, turn_boundaries)
+                paged_turns = self._jaato.get_paged_turn_count() if self._jaato else 0
+                self._presenter.print_history(history, turn_accounting, turn_boundaries, paged_turns)
                 continue
 
             if user_input.lower() == 'context':